@@ -0,0 +1,137 @@
+"""
+기사별 요약 저장소 - 일간 뉴스레터 카드로 생성된 기사 요약을 본문 해시 기준으로 보관하여
+주간/월간 큐레이션이 원문 미리보기 대신 짧은 요약을 입력으로 쓰도록 한다.
+"""
+import os
+import json
+import logging
+from datetime import datetime, timedelta
+from threading import Lock
+from dotenv import load_dotenv
+
+from body_store import body_digest
+from news_item import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+
+def article_key(news):
+    """기사 키 - 본문 해시(NewsItem.body_digest, 아카이브의 full_content_ref와 같은 값), 본문이 없으면 정규화 URL+제목 해시"""
+    digest = getattr(news, 'body_digest', None) or news.get('full_content_ref')
+    if not digest and news.get('full_content'):
+        digest = body_digest(news['full_content'])
+    if digest:
+        return digest
+    return body_digest(f"{canonicalize_url(news.get('link', ''))}\n{news.get('title', '')}")
+
+
+class ArticleSummaryStore:
+    """기사별 요약 영속 저장소 (월간 큐레이션까지 쓰도록 기본 45일 보관)
+
+    파일 구조: {path}
+        {"기사 키": {"title": "...", "summary": "...", "link": "...", "press": "...", "date": "2026-10-18",
+                    "category": "AI Insight", "updated_at": "ISO 시각"}}
+    """
+
+    def __init__(self, path=None, retention_days=None):
+        load_dotenv()
+        self.path = path or os.getenv('ARTICLE_SUMMARY_PATH', os.path.join('cache', 'article_summaries.json'))
+        self.retention_days = retention_days if retention_days is not None else float(os.getenv('ARTICLE_SUMMARY_RETENTION_DAYS', '45'))
+        self.lock = Lock()
+        self.entries = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except Exception as e:
+            logger.warning(f"기사 요약 저장소 로드 실패, 새로 시작: {self.path} ({e})")
+            return {}
+        return {key: entry for key, entry in entries.items() if not self._is_expired(entry)}
+
+    def _is_expired(self, entry):
+        try:
+            updated_at = datetime.fromisoformat(entry['updated_at'])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return datetime.now() - updated_at > timedelta(days=self.retention_days)
+
+    def get(self, news):
+        """기사의 저장된 요약 항목 (없으면 None)"""
+        with self.lock:
+            return self.entries.get(article_key(news))
+
+    def record(self, news, summary, title=None, category=None):
+        """기사 요약 기록 (저장은 save()에서 한 번에)"""
+        if not summary:
+            return
+        with self.lock:
+            self.entries[article_key(news)] = {
+                'title': title or news.get('title', ''),
+                'summary': summary,
+                'link': news.get('link', ''),
+                'press': news.get('press', ''),
+                'date': news.get('date', ''),
+                'category': category or news.get('category', ''),
+                'updated_at': datetime.now().isoformat(),
+            }
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self.lock:
+                snapshot = dict(self.entries)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"기사 요약 저장소 저장 실패: {e}")
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def compact_for_curation(news_list, store, min_items=10, preview_chars=150):
+    """주간/월간 큐레이션 입력 목록 (같은 기사는 1건)
+
+    일간 요약이 있는 기사는 요약만 사용하고, 요약된 기사가 min_items개 미만이면
+    요약 없는 기사를 preview_chars자 미리보기로 보충한다.
+
+    Returns:
+        list: {'title', 'summary', 'link', 'press', 'date', 'category'} dict 목록
+    """
+    summarized = []
+    others = []
+    seen = set()
+    for news in news_list:
+        key = article_key(news)
+        if key in seen:
+            continue
+        seen.add(key)
+        compact = {
+            'title': news.get('title', ''),
+            'link': news.get('link', ''),
+            'press': news.get('press', ''),
+            'date': news.get('date', ''),
+            'category': news.get('category', ''),
+        }
+        with store.lock:
+            entry = store.entries.get(key)
+        if entry:
+            compact['summary'] = entry['summary']
+            summarized.append(compact)
+        else:
+            preview = news.get('summary') or news.get('content_preview') or news.get('full_content') or ''
+            compact['summary'] = preview[:preview_chars].strip()
+            others.append(compact)
+
+    if len(summarized) >= min_items:
+        logger.info(f"큐레이션 입력: 일간 요약 {len(summarized)}건 사용 (요약 없는 {len(others)}건 제외)")
+        return summarized
+    logger.info(f"큐레이션 입력: 일간 요약 {len(summarized)}건 + 미리보기 {len(others)}건")
+    return summarized + others
@@ -0,0 +1,121 @@
+"""
+본문 저장소 - 기사 본문을 내용 해시(sha1) 기준으로 zlib 압축하여 한 벌만 보관
+
+- 같은 본문(통신사 기사를 여러 언론사가 그대로 게재한 경우 등)은 자동으로 한 번만 저장
+- 항목은 해시만 참조하고, 본문이 필요할 때 압축을 풂 (앞부분만 필요하면 그만큼만 풂)
+- 참조 수를 세어 어떤 항목도 참조하지 않는 본문은 바로 삭제
+"""
+import zlib
+import base64
+import hashlib
+import logging
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+
+def body_digest(text):
+    """본문 내용 해시"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class BodyStore:
+    """내용 주소 기반 압축 본문 저장소 (스레드 안전)"""
+
+    def __init__(self, level=6):
+        self.level = level
+        self.lock = Lock()
+        self.entries = {}  # 해시 -> [압축 바이트, 원본 바이트 수, 참조 수, 해시 문자열(항목들이 같은 객체를 공유)]
+        self.stats = {'stored': 0, 'deduplicated': 0, 'decompressed': 0}
+
+    def put(self, text):
+        """본문 저장 후 해시 반환 (이미 있으면 참조 수만 증가)"""
+        digest = body_digest(text)
+        with self.lock:
+            entry = self.entries.get(digest)
+            if entry is not None:
+                entry[2] += 1
+                self.stats['deduplicated'] += 1
+                return entry[3]
+        raw = text.encode('utf-8')
+        compressed = zlib.compress(raw, self.level)
+        with self.lock:
+            entry = self.entries.get(digest)
+            if entry is not None:
+                entry[2] += 1
+                self.stats['deduplicated'] += 1
+                return entry[3]
+            self.entries[digest] = [compressed, len(raw), 1, digest]
+            self.stats['stored'] += 1
+        return digest
+
+    def put_compressed(self, digest, compressed):
+        """아카이브에서 읽은 압축 본문을 그대로 등록 (압축을 풀지 않음)"""
+        with self.lock:
+            entry = self.entries.get(digest)
+            if entry is not None:
+                entry[2] += 1
+                return entry[3]
+            self.entries[digest] = [compressed, None, 1, digest]
+            self.stats['stored'] += 1
+        return digest
+
+    def release(self, digest):
+        """참조 해제 (참조 수가 0이 되면 삭제)"""
+        with self.lock:
+            entry = self.entries.get(digest)
+            if entry is None:
+                return
+            entry[2] -= 1
+            if entry[2] <= 0:
+                del self.entries[digest]
+
+    def get(self, digest):
+        """본문 전체 (없으면 None)"""
+        with self.lock:
+            entry = self.entries.get(digest)
+            self.stats['decompressed'] += 1
+        if entry is None:
+            return None
+        return zlib.decompress(entry[0]).decode('utf-8')
+
+    def get_prefix(self, digest, chars):
+        """본문 앞부분 chars자 (필요한 만큼만 압축 해제)"""
+        with self.lock:
+            entry = self.entries.get(digest)
+            self.stats['decompressed'] += 1
+        if entry is None:
+            return None
+        # UTF-8은 글자당 최대 4바이트
+        partial = zlib.decompressobj().decompress(entry[0], chars * 4)
+        return partial.decode('utf-8', errors='ignore')[:chars]
+
+    def get_compressed(self, digest):
+        """압축 바이트 (아카이브 저장용, 없으면 None)"""
+        with self.lock:
+            entry = self.entries.get(digest)
+        return entry[0] if entry else None
+
+    def export(self, digests):
+        """해시 목록의 압축 본문을 JSON 저장용 dict로 ({해시: base64})"""
+        exported = {}
+        for digest in dict.fromkeys(digests):
+            compressed = self.get_compressed(digest)
+            if compressed is not None:
+                exported[digest] = base64.b64encode(compressed).decode('ascii')
+        return exported
+
+    def import_bodies(self, exported):
+        """export() 결과를 해시 -> 압축 바이트로 변환"""
+        return {digest: base64.b64decode(data) for digest, data in (exported or {}).items()}
+
+    def summary(self):
+        """저장 현황 (로그용)"""
+        with self.lock:
+            compressed = sum(len(entry[0]) for entry in self.entries.values())
+            raw = sum(entry[1] or 0 for entry in self.entries.values())
+            return dict(self.stats, bodies=len(self.entries), compressed_bytes=compressed, raw_bytes=raw)
+
+
+# 프로세스 전체에서 공유하는 저장소 (NewsItem 본문)
+default_store = BodyStore()
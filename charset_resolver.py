@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+문자셋 판별 - 전체 본문 통계 감지(apparent_encoding) 대신 헤더/BOM/<meta charset>를 먼저 확인
+"""
+import os
+import re
+import codecs
+import logging
+from threading import Lock
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+_HEADER_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+# <meta charset="euc-kr"> 와 <meta http-equiv="Content-Type" content="text/html; charset=euc-kr"> 모두 처리
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# 상위 호환 코덱으로 치환 (EUC-KR로 선언된 국내 페이지에 CP949 확장 한글이 섞여 있는 경우가 많음)
+_ENCODING_ALIASES = {
+    'euc-kr': 'cp949',
+    'euc_kr': 'cp949',
+    'ks_c_5601-1987': 'cp949',
+    'ksc5601': 'cp949',
+    'x-windows-949': 'cp949',
+    'windows-949': 'cp949',
+    'ascii': 'utf-8',
+    'us-ascii': 'utf-8',
+}
+
+
+def normalize_encoding(name):
+    """인코딩 이름 정규화 (알 수 없는 이름이면 None)"""
+    if not name:
+        return None
+    name = name.strip().strip('"\'').lower()
+    name = _ENCODING_ALIASES.get(name, name)
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def encoding_from_headers(headers):
+    """Content-Type 헤더에 명시된 charset (없으면 None, requests의 ISO-8859-1 기본값은 사용하지 않음)"""
+    content_type = (headers or {}).get('Content-Type', '')
+    match = _HEADER_CHARSET_RE.search(content_type)
+    return normalize_encoding(match.group(1)) if match else None
+
+
+def encoding_from_bom(raw):
+    for bom, encoding in _BOMS:
+        if raw.startswith(bom):
+            return encoding
+    return None
+
+
+def encoding_from_meta(raw, sniff_bytes):
+    match = _META_CHARSET_RE.search(raw[:sniff_bytes])
+    return normalize_encoding(match.group(1).decode('ascii', errors='ignore')) if match else None
+
+
+class CharsetResolver:
+    """응답 문자셋 판별기
+
+    우선순위: Content-Type 헤더 → BOM → 앞부분 KB의 <meta charset> → 호스트별 캐시 → 앞부분 통계 감지
+    같은 언론사 페이지는 보통 같은 인코딩을 쓰므로 메타/감지로 찾은 값은 호스트별로 캐시한다.
+    """
+
+    def __init__(self, sniff_bytes=None, detect_bytes=None):
+        self.sniff_bytes = sniff_bytes or int(os.getenv('CHARSET_SNIFF_BYTES', '4096'))
+        self.detect_bytes = detect_bytes or 64 * 1024  # 통계 감지는 앞부분만 사용
+        self._host_cache = {}
+        self._lock = Lock()
+        self.stats = {'header': 0, 'bom': 0, 'meta': 0, 'host_cache': 0, 'detect': 0}
+
+    def _count(self, source):
+        with self._lock:
+            self.stats[source] += 1
+
+    def resolve(self, url, headers, raw):
+        """인코딩 판별
+
+        Returns:
+            tuple: (인코딩 또는 None, 판별 근거)
+        """
+        host = urlparse(url).hostname or ''
+
+        encoding = encoding_from_headers(headers)
+        if encoding:
+            self._count('header')
+            return encoding, 'header'
+
+        if not raw:
+            return None, None
+
+        encoding = encoding_from_bom(raw)
+        if encoding:
+            self._count('bom')
+            return encoding, 'bom'
+
+        encoding = encoding_from_meta(raw, self.sniff_bytes)
+        if encoding:
+            with self._lock:
+                self._host_cache[host] = encoding
+            self._count('meta')
+            return encoding, 'meta'
+
+        with self._lock:
+            cached = self._host_cache.get(host)
+        if cached:
+            self._count('host_cache')
+            return cached, 'host_cache'
+
+        encoding = self._detect(raw[:self.detect_bytes])
+        if encoding:
+            with self._lock:
+                self._host_cache[host] = encoding
+            self._count('detect')
+        return encoding, 'detect'
+
+    def _detect(self, sample):
+        """마지막 수단: 앞부분 샘플만 통계 감지"""
+        try:
+            from charset_normalizer import detect
+            return normalize_encoding(detect(sample).get('encoding'))
+        except Exception as e:
+            logger.debug(f"문자셋 감지 실패: {e}")
+            return None
@@ -0,0 +1,208 @@
+"""
+실행당 수집/요약 예산 - 검색 요청·본문 다운로드·LLM 입력 토큰 총량을 주제 비중(weight)으로 나누고,
+주제 안에서는 키워드별 과거 수집량(채택된 기사 수)에 비례하여 다시 나눈다.
+"""
+import os
+import json
+import logging
+from datetime import datetime
+from threading import Lock
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+BUDGET_KINDS = ('requests', 'bodies', 'llm_tokens')
+BUDGET_ENV = {
+    'requests': 'RUN_BUDGET_REQUESTS',
+    'bodies': 'RUN_BUDGET_BODIES',
+    'llm_tokens': 'RUN_BUDGET_LLM_TOKENS',
+}
+
+
+def estimate_tokens(text):
+    """LLM 입력 토큰 수 추정 (한글은 글자당 약 1토큰, 그 외는 약 4글자당 1토큰)"""
+    if not text:
+        return 0
+    hangul = sum(1 for char in text if '가' <= char <= '힣')
+    return hangul + (len(text) - hangul + 3) // 4
+
+
+def split_by_weight(total, weights, minimum=0):
+    """정수 total을 비중에 비례하여 분할 (최대 잉여 방식, 총량이 허용하면 항목마다 minimum 보장)
+
+    Returns:
+        dict: {키: 배분량} (합계는 total)
+    """
+    keys = list(weights)
+    if not keys or total <= 0:
+        return {key: 0 for key in keys}
+
+    floor = minimum if minimum * len(keys) <= total else 0
+    remaining = total - floor * len(keys)
+    positive = {key: max(weights[key] or 0, 0) for key in keys}
+    weight_sum = sum(positive.values())
+    if weight_sum <= 0:
+        positive = {key: 1 for key in keys}
+        weight_sum = len(keys)
+
+    shares = {key: remaining * positive[key] / weight_sum for key in keys}
+    result = {key: floor + int(shares[key]) for key in keys}
+    leftover = total - sum(result.values())
+    for key in sorted(keys, key=lambda key: shares[key] - int(shares[key]), reverse=True)[:leftover]:
+        result[key] += 1
+    return result
+
+
+class KeywordYieldStats:
+    """키워드별 수집량의 지수이동평균 (실행 간 유지)
+
+    파일 구조: {path}
+        {"키워드": {"yield": 4.2, "runs": 3, "updated_at": "ISO 시각"}}
+    """
+
+    def __init__(self, path=None, alpha=0.3):
+        load_dotenv()
+        self.path = path or os.getenv('KEYWORD_YIELD_PATH', os.path.join('cache', 'keyword_yield.json'))
+        self.alpha = alpha
+        self.lock = Lock()
+        self.entries = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"키워드 수집량 기록 로드 실패, 새로 시작: {self.path} ({e})")
+            return {}
+
+    def get(self, keyword):
+        """키워드의 평균 수집량 (기록이 없으면 None)"""
+        with self.lock:
+            entry = self.entries.get(keyword)
+        return entry['yield'] if entry else None
+
+    def record(self, keyword, count):
+        """이번 실행에서 키워드가 채택한 기사 수 반영"""
+        with self.lock:
+            entry = self.entries.get(keyword)
+            if entry is None:
+                entry = {'yield': float(count), 'runs': 0}
+            else:
+                entry['yield'] = round(self.alpha * count + (1 - self.alpha) * entry['yield'], 3)
+            entry['runs'] += 1
+            entry['updated_at'] = datetime.now().isoformat()
+            self.entries[keyword] = entry
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self.lock:
+                snapshot = dict(self.entries)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"키워드 수집량 기록 저장 실패: {e}")
+
+
+class RunBudget:
+    """한 번의 뉴스레터 생성에 쓸 예산
+
+    - 총량이 0(또는 미설정)인 항목은 제한하지 않음
+    - 주제 배분: weight 비례 / 키워드 배분: 과거 평균 수집량 + prior 비례 (기록 없는 키워드는 주제 내 평균)
+    - requests, bodies는 키워드별 배분량과 실행 총량을 모두 넘지 않도록 try_acquire()로 차감
+    - llm_tokens는 주제(카테고리)별 배분량 안에서 요약기에 전달할 기사를 고름
+    """
+
+    DEFAULT_ARTICLES_PER_KEYWORD = 20
+
+    def __init__(self, topics, totals=None, yield_stats=None, prior=1.0):
+        totals = totals or {}
+        self.totals = {kind: int(totals.get(kind) or 0) for kind in BUDGET_KINDS}
+        self.lock = Lock()
+        self.used = {kind: 0 for kind in BUDGET_KINDS}
+        self.keyword_used = {kind: {} for kind in BUDGET_KINDS}
+        self.denied = {kind: 0 for kind in BUDGET_KINDS}
+
+        topic_weights = {topic['name']: topic.get('weight', 0) for topic in topics}
+        keyword_weights = {topic['name']: self._keyword_weights(topic.get('keywords', []), yield_stats, prior) for topic in topics}
+
+        self.topic_allocations = {}
+        self.keyword_allocations = {}
+        for kind, total in self.totals.items():
+            if not total:
+                continue
+            topic_shares = split_by_weight(total, topic_weights, minimum=1)
+            self.topic_allocations[kind] = topic_shares
+            allocations = {}
+            for topic_name, share in topic_shares.items():
+                for keyword, amount in split_by_weight(share, keyword_weights[topic_name], minimum=1).items():
+                    # 여러 주제에 같은 키워드가 있으면 합산
+                    allocations[keyword] = allocations.get(keyword, 0) + amount
+            self.keyword_allocations[kind] = allocations
+
+    @staticmethod
+    def _keyword_weights(keywords, yield_stats, prior):
+        yields = {keyword: yield_stats.get(keyword) if yield_stats else None for keyword in keywords}
+        known = [value for value in yields.values() if value is not None]
+        default = sum(known) / len(known) if known else 0.0
+        return {keyword: (default if value is None else value) + prior for keyword, value in yields.items()}
+
+    @classmethod
+    def from_env(cls, topics, yield_stats=None):
+        """RUN_BUDGET_* 환경변수로 총량 설정"""
+        load_dotenv()
+        totals = {kind: int(os.getenv(env_name, '0') or 0) for kind, env_name in BUDGET_ENV.items()}
+        return cls(topics, totals, yield_stats)
+
+    def is_limited(self, kind):
+        return bool(self.totals.get(kind))
+
+    def topic_allowance(self, kind, topic_name):
+        """주제별 배분량 (제한 없으면 None)"""
+        if not self.is_limited(kind):
+            return None
+        return self.topic_allocations[kind].get(topic_name, 0)
+
+    def keyword_allowance(self, kind, keyword):
+        """키워드별 배분량 (제한 없거나 배분 대상이 아닌 키워드면 None)"""
+        if not self.is_limited(kind):
+            return None
+        return self.keyword_allocations[kind].get(keyword)
+
+    def articles_for_keyword(self, keyword, default=None):
+        """키워드별 수집 후보 개수 (본문 배분량, 기본 개수를 넘지 않음)"""
+        default = default or self.DEFAULT_ARTICLES_PER_KEYWORD
+        allowance = self.keyword_allowance('bodies', keyword)
+        return default if allowance is None else min(default, allowance)
+
+    def try_acquire(self, kind, keyword=None, amount=1):
+        """예산 차감 (실행 총량과 키워드 배분량 안이면 True, 넘으면 차감하지 않고 False)"""
+        if not self.is_limited(kind):
+            return True
+        with self.lock:
+            if self.used[kind] + amount > self.totals[kind]:
+                self.denied[kind] += 1
+                return False
+            allowance = self.keyword_allocations[kind].get(keyword) if keyword else None
+            keyword_used = self.keyword_used[kind].get(keyword, 0)
+            if allowance is not None and keyword_used + amount > allowance:
+                self.denied[kind] += 1
+                return False
+            self.used[kind] += amount
+            if keyword:
+                self.keyword_used[kind][keyword] = keyword_used + amount
+            return True
+
+    def summary(self):
+        """사용량 요약 (로그용)"""
+        with self.lock:
+            return {
+                kind: {'used': self.used[kind], 'total': self.totals[kind] or None, 'denied': self.denied[kind]}
+                for kind in BUDGET_KINDS
+            }
@@ -0,0 +1,253 @@
+"""
+구글 뉴스 기사 링크(news.google.com/articles/...)를 언론사 원문 URL로 변환
+
+변환 순서: 영속 캐시 → 기사 ID 디코딩(구형 CBMi ID, 네트워크 불필요) → HTTP 리다이렉트 →
+페이지의 data-n-au 속성 → 페이지 서명(data-n-a-sg/ts)으로 batchexecute 조회
+"""
+import os
+import re
+import json
+import base64
+import logging
+from datetime import datetime, timedelta
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, quote
+from dotenv import load_dotenv
+
+from negative_cache import reason_for_status
+
+logger = logging.getLogger(__name__)
+
+_ARTICLE_ID_RE = re.compile(r'/(?:rss/)?(?:articles|read)/([A-Za-z0-9_-]+)')
+_PUBLISHER_ATTR_RE = re.compile(rb'data-n-au="([^"]+)"')
+_SIGNATURE_RE = re.compile(rb'data-n-a-sg="([^"]+)"')
+_TIMESTAMP_RE = re.compile(rb'data-n-a-ts="([^"]+)"')
+
+BATCH_EXECUTE_URL = "https://news.google.com/_/DotsSplashUi/data/batchexecute"
+
+
+def is_google_news_url(url):
+    """구글 뉴스 리다이렉트 링크 여부"""
+    return bool(url) and ("news.google.com" in url or "google.com/read" in url)
+
+
+def get_article_id(url):
+    """구글 뉴스 링크에서 기사 ID 추출 (hl/gl 등 쿼리 파라미터와 무관한 캐시 키)"""
+    match = _ARTICLE_ID_RE.search(urlparse(url or '').path)
+    return match.group(1) if match else None
+
+
+def decode_article_id(article_id):
+    """구형 기사 ID(CBMi...)에 포함된 원문 URL 디코딩
+
+    구형 ID는 base64url로 인코딩된 protobuf(0x08 0x13 0x22 + 길이 + URL)이므로 네트워크 없이 변환된다.
+    신형 ID(AU_yqL...)는 URL을 포함하지 않으므로 None.
+    """
+    if not article_id:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(article_id + '=' * (-len(article_id) % 4))
+    except (ValueError, TypeError):
+        return None
+
+    prefix = b'\x08\x13\x22'
+    if not raw.startswith(prefix):
+        return None
+    raw = raw[len(prefix):]
+
+    # varint 길이
+    length, shift, index = 0, 0, 0
+    while index < len(raw):
+        byte = raw[index]
+        length |= (byte & 0x7f) << shift
+        index += 1
+        if not byte & 0x80:
+            break
+        shift += 7
+
+    candidate = raw[index:index + length].decode('utf-8', errors='ignore')
+    return candidate if candidate.startswith('http') and not is_google_news_url(candidate) else None
+
+
+class GoogleNewsResolver:
+    """구글 뉴스 링크 → 원문 URL 일괄 변환기 (영속 캐시 + 병렬 조회)
+
+    캐시 파일 구조: {cache_path}
+        {"기사 ID": {"url": "원문 URL 또는 null", "method": "decode", "resolved_at": "ISO 시각"}}
+    """
+
+    MAX_PAGE_BYTES = 512 * 1024
+    SUCCESS_TTL_DAYS = 30
+    FAILURE_TTL_DAYS = 1
+
+    def __init__(self, session, cache_path=None, max_workers=None, negative_cache=None, timeout=8):
+        """
+        Args:
+            session: SessionPool (fetch_limited/request 사용)
+            negative_cache: 404 등 삭제된 링크를 기록할 NegativeCache (선택)
+        """
+        load_dotenv()
+        self.session = session
+        self.cache_path = cache_path or os.getenv('GOOGLE_NEWS_LINK_CACHE_PATH', os.path.join('cache', 'google_news_links.json'))
+        self.max_workers = max_workers or int(os.getenv('GOOGLE_NEWS_RESOLVE_WORKERS', '4'))
+        self.negative_cache = negative_cache
+        self.timeout = timeout
+        self.lock = Lock()
+        self.entries = self._load()
+        self.stats = {'cache': 0, 'decode': 0, 'redirect': 0, 'attribute': 0, 'batchexecute': 0, 'failed': 0}
+
+    def _load(self):
+        if not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except Exception as e:
+            logger.warning(f"구글 뉴스 링크 캐시 로드 실패, 새로 시작: {self.cache_path} ({e})")
+            return {}
+        return {key: entry for key, entry in entries.items() if not self._is_expired(entry)}
+
+    def _save(self):
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self.lock:
+            snapshot = dict(self.entries)
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.cache_path)
+
+    def _is_expired(self, entry, now=None):
+        try:
+            resolved_at = datetime.fromisoformat(entry['resolved_at'])
+        except (KeyError, TypeError, ValueError):
+            return True
+        ttl_days = self.SUCCESS_TTL_DAYS if entry.get('url') else self.FAILURE_TTL_DAYS
+        return (now or datetime.now()) - resolved_at > timedelta(days=ttl_days)
+
+    def _count(self, method):
+        with self.lock:
+            self.stats[method] += 1
+
+    def _cache_key(self, url):
+        return get_article_id(url) or url
+
+    def get_cached(self, url):
+        """캐시된 변환 결과
+
+        Returns:
+            tuple: (캐시 존재 여부, 원문 URL 또는 None)
+        """
+        with self.lock:
+            entry = self.entries.get(self._cache_key(url))
+        if entry is None or self._is_expired(entry):
+            return False, None
+        return True, entry.get('url')
+
+    def resolve(self, url, headers=None, save=True):
+        """구글 뉴스 링크 하나를 원문 URL로 변환 (구글 뉴스 링크가 아니면 그대로, 실패하면 None)"""
+        if not is_google_news_url(url):
+            return url
+
+        cached, publisher_url = self.get_cached(url)
+        if cached:
+            self._count('cache')
+            return publisher_url
+
+        publisher_url, method = self._resolve_uncached(url, headers)
+        self._count(method if publisher_url else 'failed')
+        # 네트워크 오류는 일시적일 수 있으므로 실패로 캐시하지 않음
+        if publisher_url or method != 'error':
+            with self.lock:
+                self.entries[self._cache_key(url)] = {
+                    'url': publisher_url,
+                    'method': method,
+                    'resolved_at': datetime.now().isoformat()
+                }
+            if save:
+                self._save_safely()
+        return publisher_url
+
+    def resolve_many(self, urls, headers=None):
+        """여러 링크를 병렬로 변환 (캐시 저장은 마지막에 한 번)
+
+        Returns:
+            dict: {입력 URL: 원문 URL 또는 None}
+        """
+        urls = list(dict.fromkeys(url for url in urls if url))
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            resolved = dict(zip(urls, executor.map(lambda url: self.resolve(url, headers, save=False), urls)))
+        self._save_safely()
+        logger.info(f"구글 뉴스 링크 변환: {sum(1 for value in resolved.values() if value)}/{len(urls)}개 성공 ({self.stats})")
+        return resolved
+
+    def _resolve_uncached(self, url, headers):
+        """캐시에 없는 링크 변환
+
+        Returns:
+            tuple: (원문 URL 또는 None, 변환 방식 또는 실패 사유)
+        """
+        article_id = get_article_id(url)
+        decoded = decode_article_id(article_id)
+        if decoded:
+            return decoded, 'decode'
+
+        # 원문으로 바로 리다이렉트되면 헤더(최종 URL)만 확인하고 언론사 페이지 본문은 받지 않음
+        try:
+            response = self.session.fetch_limited(url, headers=headers, timeout=self.timeout, max_bytes=self.MAX_PAGE_BYTES,
+                                                  read_if=lambda result: is_google_news_url(result.url))
+        except Exception as e:
+            logger.warning(f"구글 뉴스 링크 조회 실패: {url} ({e})")
+            return None, 'error'
+
+        if response.status_code != 200:
+            if self.negative_cache is not None:
+                self.negative_cache.add(url, reason_for_status(response.status_code), "구글 뉴스 링크 변환", response.status_code)
+            return None, f"http_{response.status_code}"
+        if response.url and not is_google_news_url(response.url):
+            return response.url, 'redirect'
+
+        content = response.content or b''
+        match = _PUBLISHER_ATTR_RE.search(content)
+        if match:
+            return match.group(1).decode('utf-8', errors='ignore'), 'attribute'
+
+        signature, timestamp = _SIGNATURE_RE.search(content), _TIMESTAMP_RE.search(content)
+        if article_id and signature and timestamp:
+            publisher_url = self._batch_execute(article_id, signature.group(1).decode(), timestamp.group(1).decode(), headers)
+            if publisher_url:
+                return publisher_url, 'batchexecute'
+        return None, 'unresolved'
+
+    def _batch_execute(self, article_id, signature, timestamp, headers):
+        """신형 기사 ID를 구글 뉴스 내부 API(batchexecute)로 변환"""
+        request = [
+            "Fbv4je",
+            f'["garturlreq",[["X","X",["X","X"],null,null,1,1,"US:en",null,1,null,null,null,null,null,0,1],'
+            f'"X","X",1,[1,1,1],1,1,null,0,0,null,0],"{article_id}",{timestamp},"{signature}"]',
+        ]
+        request_headers = dict(headers or {})
+        request_headers['Content-Type'] = 'application/x-www-form-urlencoded;charset=UTF-8'
+        try:
+            response = self.session.request(
+                'POST', BATCH_EXECUTE_URL, headers=request_headers,
+                data=f"f.req={quote(json.dumps([[request]]))}", timeout=self.timeout
+            )
+            if response.status_code != 200:
+                return None
+            payload = json.loads(response.text.split('\n\n', 1)[1])[:-2]
+            publisher_url = json.loads(payload[0][2])[1]
+            return publisher_url if isinstance(publisher_url, str) and publisher_url.startswith('http') else None
+        except Exception as e:
+            logger.debug(f"batchexecute 응답 해석 실패 ({article_id}): {e}")
+            return None
+
+    def _save_safely(self):
+        try:
+            self._save()
+        except Exception as e:
+            logger.error(f"구글 뉴스 링크 캐시 저장 실패: {e}")
@@ -0,0 +1,86 @@
+"""
+구글 뉴스 RSS 검색 피드 - 점진적 XML 파서(XMLPullParser)로 DOM 생성 없이 항목 추출
+
+HTML 검색 페이지의 난독화된 클래스 선택자(.NiLAwe, .MQsxIb 등) 대신
+RSS의 고정된 필드(title, link, pubDate, source)를 사용한다.
+"""
+import logging
+from datetime import timezone, timedelta
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode
+from xml.etree.ElementTree import XMLPullParser, ParseError
+
+logger = logging.getLogger(__name__)
+
+RSS_SEARCH_URL = "https://news.google.com/rss/search"
+RSS_CONTENT_TYPES = ('application/rss+xml', 'application/xml', 'text/xml', 'application/atom+xml')
+KST = timezone(timedelta(hours=9))
+
+
+def build_search_url(keyword, after=None, before=None, hl='ko', gl='KR'):
+    """RSS 검색 URL (after/before는 YYYY-MM-DD, before는 해당 날짜 미포함)"""
+    query = keyword
+    if after:
+        query += f" after:{after}"
+    if before:
+        query += f" before:{before}"
+    return f"{RSS_SEARCH_URL}?{urlencode({'q': query, 'hl': hl, 'gl': gl, 'ceid': f'{gl}:{hl}'})}"
+
+
+def _item_to_dict(elem):
+    """<item> 요소를 뉴스 후보 dict로 변환"""
+    title = (elem.findtext('title') or '').strip()
+    source_elem = elem.find('source')
+    source = (source_elem.text or '').strip() if source_elem is not None else ''
+    # 구글 뉴스 RSS 제목은 '기사 제목 - 언론사' 형식
+    if source and title.endswith(f" - {source}"):
+        title = title[:-len(f" - {source}")].rstrip()
+
+    pub_date = (elem.findtext('pubDate') or '').strip()
+    date = None
+    if pub_date:
+        try:
+            # pubDate는 GMT이므로 한국 시간 기준 날짜로 변환
+            date = parsedate_to_datetime(pub_date).astimezone(KST).strftime('%Y-%m-%d')
+        except (TypeError, ValueError):
+            date = None
+
+    return {
+        'title': title,
+        'link': (elem.findtext('link') or '').strip(),
+        'pub_date': pub_date,
+        'date': date,
+        'source': source,
+        'source_url': source_elem.get('url', '') if source_elem is not None else '',
+    }
+
+
+def iter_feed_items(chunks):
+    """바이트 조각을 순서대로 넣으며 완성된 <item>을 하나씩 반환 (처리한 요소는 바로 비움)"""
+    parser = XMLPullParser(events=('end',))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag == 'item':
+                yield _item_to_dict(elem)
+                elem.clear()
+    parser.close()
+
+
+def parse_feed(raw, limit=None, chunk_size=16 * 1024):
+    """RSS 바이트에서 항목 목록 추출 (limit개를 얻으면 나머지는 해석하지 않음)
+
+    바이트 상한으로 잘린 피드는 완성된 항목까지만 반환한다. 항목이 하나도 없으면 ParseError를 그대로 전달.
+    """
+    items = []
+    chunks = (raw[start:start + chunk_size] for start in range(0, len(raw), chunk_size))
+    try:
+        for item in iter_feed_items(chunks):
+            items.append(item)
+            if limit and len(items) >= limit:
+                break
+    except ParseError as e:
+        if not items:
+            raise
+        logger.warning(f"RSS 피드 일부만 해석 ({len(items)}개): {e}")
+    return items
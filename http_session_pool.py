@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 세션 풀 - 워커별 requests.Session 재사용 및 호스트별 keep-alive 통계
+"""
+import os
+import logging
+from queue import LifoQueue, Empty
+from threading import Lock
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from charset_resolver import CharsetResolver
+
+
+class StatsHTTPAdapter(HTTPAdapter):
+    """요청마다 새 연결 생성 여부를 집계하는 HTTPAdapter
+
+    어댑터는 세션별로 하나씩 생성되고 세션은 한 번에 한 워커만 사용하므로,
+    요청 전후 커넥션 풀의 num_connections 차이로 새 연결/재사용을 판정할 수 있다.
+    """
+
+    def __init__(self, stats_callback, **kwargs):
+        self._stats_callback = stats_callback
+        super().__init__(**kwargs)
+
+    def _get_pool_connection_count(self, url):
+        try:
+            return self.poolmanager.connection_from_url(url).num_connections
+        except Exception:
+            return None
+
+    def send(self, request, **kwargs):
+        before = self._get_pool_connection_count(request.url)
+        response = super().send(request, **kwargs)
+        after = self._get_pool_connection_count(request.url)
+        if before is not None and after is not None:
+            self._stats_callback(urlparse(request.url).hostname or '', after > before)
+        return response
+
+
+# 본문 추출 대상으로 허용하는 Content-Type (헤더가 없으면 허용)
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain')
+
+
+class FetchResult:
+    """fetch_limited() 결과 - requests.Response와 같은 이름의 속성(status_code, url, headers, content, encoding, text) 제공"""
+
+    def __init__(self, status_code, url, headers, content=b"", encoding=None,
+                 truncated=False, stopped_early=False, rejected=None):
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        self.truncated = truncated  # 바이트 상한에서 잘림
+        self.stopped_early = stopped_early  # 종료 마커를 만나 나머지를 받지 않음
+        self.rejected = rejected  # 'content_type' | 'too_large' | None
+        self._text = None
+
+    @property
+    def ok(self):
+        return self.rejected is None and 200 <= self.status_code < 400
+
+    @property
+    def text(self):
+        """디코딩된 본문 (encoding은 fetch_limited에서 CharsetResolver로 판별된 값)"""
+        if self._text is None:
+            try:
+                self._text = self.content.decode(self.encoding or 'utf-8', errors='replace')
+            except LookupError:
+                self._text = self.content.decode('utf-8', errors='replace')
+        return self._text
+
+
+class SessionPool:
+    """워커별 세션을 빌려주고 반납받는 세션 풀
+
+    - 동시에 실행 중인 워커 수만큼만 세션을 생성하고, 작업이 끝난 세션은 다음 워커가 재사용
+    - User-Agent 등 요청별로 달라지는 헤더는 공용 세션을 변경하지 않고 `headers=`로 전달
+    - 어댑터 풀 크기는 동시 실행 수(max_workers)에 맞춤
+    """
+
+    def __init__(self, default_headers: Optional[Dict[str, str]] = None, max_workers: int = 3,
+                 pool_connections: int = 32, max_retries: int = 0):
+        """
+        Args:
+            default_headers: 모든 세션에 기본으로 설정할 헤더
+            max_workers: 동시 실행 워커 수 (호스트별 커넥션 풀 최대 크기)
+            pool_connections: 세션당 유지할 호스트별 커넥션 풀 개수 (뉴스 사이트가 다양하므로 넉넉하게)
+            max_retries: 연결 단계 재시도 횟수
+        """
+        self.logger = logging.getLogger(__name__)
+        self.default_headers = dict(default_headers or {})
+        self.max_workers = max_workers
+        self.pool_connections = pool_connections
+        self.max_retries = max_retries
+
+        self._idle_sessions = LifoQueue()
+        self._all_sessions = []
+        self._sessions_lock = Lock()
+        self._stats = {}
+        self._stats_lock = Lock()
+        self.max_bytes = int(os.getenv('FETCH_MAX_BYTES', str(2 * 1024 * 1024)))
+        # Content-Length가 상한의 이 배수를 넘을 때만 받지 않고 거부 (그 이하는 상한까지 받아 절단)
+        self.reject_multiplier = float(os.getenv('FETCH_REJECT_MULTIPLIER', '8'))
+        self._transfer = {'bytes_downloaded': 0, 'truncated': 0, 'stopped_early': 0, 'rejected': 0}
+        self.charset_resolver = CharsetResolver()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.default_headers)
+        adapter = StatsHTTPAdapter(
+            self._record_request,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.max_workers,
+            max_retries=self.max_retries
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        with self._sessions_lock:
+            self._all_sessions.append(session)
+        self.logger.debug(f"HTTP 세션 생성 (총 {len(self._all_sessions)}개)")
+        return session
+
+    def _acquire(self) -> requests.Session:
+        try:
+            return self._idle_sessions.get_nowait()
+        except Empty:
+            return self._create_session()
+
+    def _release(self, session: requests.Session):
+        self._idle_sessions.put(session)
+
+    def _record_request(self, host: str, is_new_connection: bool):
+        with self._stats_lock:
+            host_stats = self._stats.setdefault(host, {'requests': 0, 'new_connections': 0, 'reused': 0})
+            host_stats['requests'] += 1
+            if is_new_connection:
+                host_stats['new_connections'] += 1
+            else:
+                host_stats['reused'] += 1
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        """세션을 빌려 요청 후 반납 (headers는 이 요청에만 적용)"""
+        session = self._acquire()
+        try:
+            return session.request(method, url, headers=headers, **kwargs)
+        finally:
+            self._release(session)
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        """GET 요청 (requests.Session.get과 동일한 인자)"""
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('GET', url, headers=headers, **kwargs)
+
+    def fetch_limited(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10,
+                      max_bytes: Optional[int] = None, accept_types=HTML_CONTENT_TYPES,
+                      stop_markers=None, read_if=None, chunk_size: int = 16 * 1024) -> FetchResult:
+        """헤더를 먼저 확인하고 본문은 필요한 만큼만 스트리밍으로 받는 GET
+
+        Args:
+            max_bytes: 읽을 최대 바이트 수 (기본값: FETCH_MAX_BYTES, 0이면 헤더/최종 URL만 확인)
+                넘으면 상한까지만 받고 truncated=True, Content-Length가 FETCH_REJECT_MULTIPLIER배를 넘으면 'too_large'로 거부
+            accept_types: 허용 Content-Type 접두사 (None이면 검사하지 않음)
+            stop_markers: 종료 마커 그룹 목록. 한 그룹의 마커(bytes, 소문자)를 앞에서부터 순서대로 모두 만나면 읽기 중단
+                예) [(b'id="articlebody', b'</article>'), (b'article:published_time', b'</head>')]
+            read_if: 응답 헤더를 받은 뒤 FetchResult(최종 URL/헤더)로 본문을 읽을지 판단하는 함수 (False면 헤더만 확인)
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        session = self._acquire()
+        try:
+            response = session.get(url, headers=headers, timeout=timeout, stream=True)
+            try:
+                result = FetchResult(response.status_code, response.url, response.headers)
+
+                content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                if accept_types and content_type and not content_type.startswith(tuple(accept_types)):
+                    result.rejected = 'content_type'
+                else:
+                    # 상한을 조금 넘는 긴 기사 페이지는 상한까지 받아 절단, 상한의 몇 배인 응답만 거부
+                    content_length = response.headers.get('Content-Length')
+                    if content_length and content_length.isdigit() and int(content_length) > max_bytes * self.reject_multiplier > 0:
+                        result.rejected = 'too_large'
+
+                if result.rejected or max_bytes <= 0 or response.status_code != 200 or (read_if and not read_if(result)):
+                    result.encoding, _ = self.charset_resolver.resolve(result.url, result.headers, b"")
+                    self._record_transfer(0, result)
+                    return result
+
+                buffer = bytearray()
+                groups = [tuple(group) for group in (stop_markers or [])]
+                # 그룹별 (다음에 찾을 마커 순번, 그 마커를 찾기 시작할 위치)
+                progress = [[0, 0] for _ in groups]
+                overlap = max((len(marker) for group in groups for marker in group), default=0)
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if not chunk:
+                        continue
+                    window_start = max(0, len(buffer) - overlap)
+                    buffer.extend(chunk)
+                    if len(buffer) >= max_bytes:
+                        del buffer[max_bytes:]
+                        result.truncated = True
+                        break
+                    if groups:
+                        # 새로 받은 부분(+경계 overlap)만 검사하여 전체 버퍼 반복 스캔을 피함
+                        window = bytes(buffer[window_start:]).lower()
+                        for group, state in zip(groups, progress):
+                            while state[0] < len(group):
+                                found = window.find(group[state[0]], max(0, state[1] - window_start))
+                                if found < 0:
+                                    break
+                                state[0], state[1] = state[0] + 1, window_start + found + len(group[state[0]])
+                        if any(state[0] == len(group) for group, state in zip(groups, progress)):
+                            result.stopped_early = True
+                            break
+
+                result.content = bytes(buffer)
+                # 전체 본문 통계 감지(apparent_encoding) 대신 헤더/BOM/<meta charset>/호스트 캐시 순으로 판별
+                result.encoding, _ = self.charset_resolver.resolve(result.url, result.headers, result.content)
+                self._record_transfer(len(buffer), result)
+                return result
+            finally:
+                response.close()
+        finally:
+            self._release(session)
+
+    def _record_transfer(self, size: int, result: FetchResult):
+        with self._stats_lock:
+            self._transfer['bytes_downloaded'] += size
+            if result.truncated:
+                self._transfer['truncated'] += 1
+            if result.stopped_early:
+                self._transfer['stopped_early'] += 1
+            if result.rejected:
+                self._transfer['rejected'] += 1
+
+    def get_transfer_stats(self) -> Dict[str, int]:
+        """fetch_limited() 다운로드 통계 (받은 바이트, 상한 절단/조기 종료/거부 건수)"""
+        with self._stats_lock:
+            return dict(self._transfer)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """호스트별 keep-alive 재사용 통계 반환
+
+        Returns:
+            {호스트: {'requests': 요청 수, 'new_connections': 새 연결 수, 'reused': 재사용 수, 'reuse_rate': 재사용률(%)}}
+        """
+        with self._stats_lock:
+            stats = {host: dict(values) for host, values in self._stats.items()}
+        for values in stats.values():
+            values['reuse_rate'] = round(values['reused'] / values['requests'] * 100, 1) if values['requests'] else 0.0
+        return stats
+
+    def log_stats(self):
+        """호스트별 재사용 통계를 로그로 출력"""
+        stats = self.get_stats()
+        if not stats:
+            return
+        total_requests = sum(values['requests'] for values in stats.values())
+        total_reused = sum(values['reused'] for values in stats.values())
+        self.logger.info(f"HTTP 연결 재사용: 전체 {total_requests}건 중 {total_reused}건 재사용 ({len(stats)}개 호스트)")
+        transfer = self.get_transfer_stats()
+        self.logger.info(
+            f"다운로드: {transfer['bytes_downloaded'] / 1024:.0f}KB "
+            f"(상한 절단 {transfer['truncated']}건, 조기 종료 {transfer['stopped_early']}건, 거부 {transfer['rejected']}건)"
+        )
+        self.logger.info(f"문자셋 판별 근거: {self.charset_resolver.stats}")
+        for host, values in sorted(stats.items(), key=lambda item: item[1]['requests'], reverse=True)[:10]:
+            self.logger.info(f"  - {host}: 요청 {values['requests']}건, 새 연결 {values['new_connections']}건, 재사용률 {values['reuse_rate']}%")
+
+    def close(self):
+        """모든 세션 종료 (requests.Session과 마찬가지로 이후 요청 시 새 세션을 생성해 재사용 가능)"""
+        with self._sessions_lock:
+            sessions, self._all_sessions = self._all_sessions, []
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+        while True:
+            try:
+                self._idle_sessions.get_nowait()
+            except Empty:
+                break
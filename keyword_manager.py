@@ -5,6 +5,9 @@ import logging
 import sys # Added for sys.executable
 
 class KeywordManager:
+    # 구글 뉴스 수집 방식: auto(RSS 우선, 실패 시 HTML), rss, html
+    GOOGLE_NEWS_MODES = ('auto', 'rss', 'html')
+
     def __init__(self, config_file=None):
         # exe 파일 실행 시 루트 폴더의 설정 파일을 우선적으로 찾기
         if config_file is None:
@@ -287,6 +290,25 @@ class KeywordManager:
         else:
             print("삭제가 취소되었습니다.")
 
+    def get_google_news_mode(self, keyword):
+        """키워드별 구글 뉴스 수집 방식 (키워드 설정 → 직접 지정한 기본 설정, 없으면 None이며 수집기가 GOOGLE_NEWS_MODE 사용)"""
+        settings = self.keywords_config.get("google_news_mode") or {}
+        mode = (settings.get("keywords") or {}).get(keyword) or settings.get("default")
+        return mode if mode in self.GOOGLE_NEWS_MODES else None
+
+    def set_google_news_mode(self, mode, keyword=None):
+        """구글 뉴스 수집 방식 설정 (keyword가 없으면 기본값 변경)"""
+        if mode not in self.GOOGLE_NEWS_MODES:
+            self.logger.warning(f"지원하지 않는 구글 뉴스 수집 방식: {mode}")
+            return False
+        # 기본값은 직접 지정할 때만 기록 (없어야 GOOGLE_NEWS_MODE 환경변수가 적용됨)
+        settings = self.keywords_config.setdefault("google_news_mode", {"keywords": {}})
+        if keyword:
+            settings.setdefault("keywords", {})[keyword] = mode
+        else:
+            settings["default"] = mode
+        return self.save_keywords()
+
     def update_pick_summary_setting(self, enable=True):
         """PICK 요약 기능 활성화/비활성화 설정"""
         try:
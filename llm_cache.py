@@ -0,0 +1,124 @@
+"""
+LLM 응답 캐시 - (모델명, 생성 설정, 프롬프트 해시)가 같은 요청은 API를 다시 호출하지 않고 저장된 응답을 사용
+
+/api/test 실행 직후의 본 실행, 발송 실패 후 재실행처럼 같은 입력이 반복될 때 토큰 비용과 대기 시간을 없앤다.
+"""
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from threading import Lock
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model_name, generation_config, prompt):
+    """캐시 키 (모델명 + 정렬된 생성 설정 + 프롬프트의 sha256)"""
+    fingerprint = json.dumps(
+        {'model': model_name, 'config': generation_config or {}, 'prompt': hashlib.sha256(prompt.encode('utf-8')).hexdigest()},
+        ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """LLM 응답 영속 캐시
+
+    - TTL(시간)이 지난 응답은 사용하지 않고 정리
+    - 항목 수/전체 응답 크기 상한을 넘으면 오래된 응답부터 삭제
+    - LLM_CACHE_ENABLED=false이면 조회·저장하지 않음
+
+    파일 구조: {path}
+        {"키": {"model": "gemini-...", "text": "응답", "finish_reason": 1, "cached_at": "ISO 시각", "hits": 0}}
+    """
+
+    def __init__(self, path=None, ttl_hours=None, max_entries=None, max_bytes=None, enabled=None):
+        load_dotenv()
+        self.path = path or os.getenv('LLM_CACHE_PATH', os.path.join('cache', 'llm_responses.json'))
+        self.ttl_hours = ttl_hours if ttl_hours is not None else float(os.getenv('LLM_CACHE_TTL_HOURS', '24'))
+        self.max_entries = max_entries or int(os.getenv('LLM_CACHE_MAX_ENTRIES', '200'))
+        self.max_bytes = max_bytes or int(float(os.getenv('LLM_CACHE_MAX_MB', '20')) * 1024 * 1024)
+        if enabled is None:
+            enabled = os.getenv('LLM_CACHE_ENABLED', 'true').lower() not in ('false', '0', 'no', 'off')
+        self.enabled = enabled and self.ttl_hours > 0
+        self.lock = Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+        self.entries = self._load() if self.enabled else {}
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except Exception as e:
+            logger.warning(f"LLM 응답 캐시 로드 실패, 새로 시작: {self.path} ({e})")
+            return {}
+        return {key: entry for key, entry in entries.items() if not self._is_expired(entry)}
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def _is_expired(self, entry, now=None):
+        try:
+            cached_at = datetime.fromisoformat(entry['cached_at'])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return (now or datetime.now()) - cached_at > timedelta(hours=self.ttl_hours)
+
+    def _evict(self):
+        """만료 항목 삭제 후 상한을 넘으면 오래된 항목부터 삭제 (lock 안에서 호출)"""
+        now = datetime.now()
+        for key in [key for key, entry in self.entries.items() if self._is_expired(entry, now)]:
+            del self.entries[key]
+            self.stats['evicted'] += 1
+        total_bytes = sum(len(entry['text'].encode('utf-8')) for entry in self.entries.values())
+        for key in sorted(self.entries, key=lambda key: self.entries[key]['cached_at']):
+            if len(self.entries) <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            total_bytes -= len(self.entries.pop(key)['text'].encode('utf-8'))
+            self.stats['evicted'] += 1
+
+    def get(self, key):
+        """저장된 응답 (없거나 만료되었거나 캐시를 끈 경우 None)"""
+        if not self.enabled:
+            return None
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or self._is_expired(entry):
+                self.entries.pop(key, None)
+                self.stats['misses'] += 1
+                return None
+            entry['hits'] = entry.get('hits', 0) + 1
+            self.stats['hits'] += 1
+            return entry
+
+    def put(self, key, model_name, text, finish_reason=None):
+        """응답 저장 후 파일에 반영"""
+        if not self.enabled or not text:
+            return
+        with self.lock:
+            self.entries[key] = {
+                'model': model_name,
+                'text': text,
+                'finish_reason': finish_reason,
+                'cached_at': datetime.now().isoformat(),
+                'hits': 0,
+            }
+            self.stats['stored'] += 1
+            self._evict()
+            try:
+                self._save()
+            except Exception as e:
+                logger.error(f"LLM 응답 캐시 저장 실패: {e}")
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,235 @@
+"""
+LLM 클라이언트 - Gemini 호출의 동시 실행 수, 분당 요청/토큰 수, 일시적 오류 재시도를 한곳에서 관리
+
+- 동시 실행 수 상한(LLM_MAX_CONCURRENCY): 카테고리별 동시 요약과 주간 큐레이션이 같은 상한을 공유
+- 분당 요청 수(LLM_RPM)/분당 토큰 수(LLM_TPM) 토큰 버킷: 한도를 넘기 전에 미리 대기하여 429를 줄임 (0이면 제한 없음)
+- 429/5xx/시간 초과는 지수 백오프(전체 지터)로 재시도하고, 서버가 알려준 재시도 대기 시간(retry-after)이 있으면 따름
+- 호출별 소요 시간, 대기 시간, 시도 횟수, 입출력 토큰을 기록
+
+요약기는 ThreadPoolExecutor로 동시 호출하므로 asyncio 대신 스레드 안전한 동기 클라이언트로 구현한다.
+같은 API 키의 한도는 프로세스 전체에서 공유되므로 get_default_client()의 공유 인스턴스를 사용한다.
+"""
+import os
+import re
+import time
+import random
+import logging
+from threading import BoundedSemaphore, Lock, local
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# google.api_core.exceptions 클래스명 (google 패키지를 import하지 않고 판별)
+RETRYABLE_ERROR_NAMES = {
+    'ResourceExhausted', 'TooManyRequests', 'ServiceUnavailable', 'InternalServerError',
+    'DeadlineExceeded', 'GatewayTimeout', 'BadGateway', 'ConnectionError', 'Timeout',
+}
+_RETRY_DELAY_PATTERNS = [
+    re.compile(r'retry in (\d+(?:\.\d+)?)\s*s', re.IGNORECASE),
+    re.compile(r'retry_delay\s*\{\s*seconds:\s*(\d+)', re.IGNORECASE),
+    re.compile(r'"retryDelay":\s*"(\d+(?:\.\d+)?)s"', re.IGNORECASE),
+]
+
+
+def is_retryable(error):
+    """재시도할 오류인지 (429, 5xx, 시간 초과/연결 오류)"""
+    status = getattr(error, 'code', None)
+    if isinstance(status, int) and status in RETRYABLE_STATUS:
+        return True
+    response = getattr(error, 'response', None)
+    if getattr(response, 'status_code', None) in RETRYABLE_STATUS:
+        return True
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+
+def retry_after_seconds(error):
+    """서버가 알려준 재시도 대기 시간(초), 없으면 None
+
+    Retry-After 헤더(REST), RetryInfo.retry_delay(gRPC 상세), 오류 메시지의 "retry in 37s" 순으로 찾는다.
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    value = headers.get('Retry-After') or headers.get('retry-after')
+    if value:
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+    for detail in getattr(error, 'details', None) or []:
+        delay = getattr(detail, 'retry_delay', None)
+        if delay is not None:
+            seconds = getattr(delay, 'seconds', 0) + getattr(delay, 'nanos', 0) / 1e9
+            if seconds > 0:
+                return seconds
+    message = str(error)
+    for pattern in _RETRY_DELAY_PATTERNS:
+        match = pattern.search(message)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+class TokenBucket:
+    """분당 한도 토큰 버킷 (스레드 안전, per_minute가 0 이하이면 제한 없음)
+
+    reserve()는 바로 차감하고 부족분이 채워질 때까지의 대기 시간을 돌려준다 (먼저 예약한 호출이 먼저 진행).
+    """
+
+    def __init__(self, per_minute, clock=time.monotonic):
+        self.capacity = float(per_minute or 0)
+        self.rate = self.capacity / 60.0
+        self.clock = clock
+        self.lock = Lock()
+        self.available = self.capacity
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount=1):
+        """amount만큼 예약 후 대기해야 할 시간(초) 반환 (한 번에 용량보다 많이 요청하면 용량만큼만)"""
+        if self.capacity <= 0:
+            return 0.0
+        with self.lock:
+            self._refill()
+            self.available -= min(float(amount), self.capacity)
+            return -self.available / self.rate if self.available < 0 else 0.0
+
+    def consume(self, amount):
+        """대기 없이 사용량만 반영 (호출 후에 알게 되는 출력 토큰 등)"""
+        if self.capacity <= 0 or not amount:
+            return
+        with self.lock:
+            self._refill()
+            self.available -= float(amount)
+
+
+class LLMClient:
+    """동시 실행 수·RPM·TPM 제한과 재시도를 적용하여 LLM 호출 함수를 실행
+
+    Args:
+        max_concurrency: 동시 실행 수 상한 (기본 LLM_MAX_CONCURRENCY=4)
+        rpm / tpm: 분당 요청 수 / 분당 토큰 수 (기본 LLM_RPM=60, LLM_TPM=1000000, 0이면 제한 없음)
+        max_retries: 재시도 횟수 (기본 LLM_MAX_RETRIES=3)
+        base_delay / max_delay: 지수 백오프 시작/최대 대기(초) (기본 LLM_BACKOFF_BASE_SECONDS=2, LLM_BACKOFF_MAX_SECONDS=60)
+    """
+
+    def __init__(self, max_concurrency=None, rpm=None, tpm=None, max_retries=None, base_delay=None, max_delay=None,
+                 sleep=time.sleep, clock=time.monotonic):
+        load_dotenv()
+        self.max_concurrency = max_concurrency or int(os.getenv('LLM_MAX_CONCURRENCY', '4'))
+        rpm = rpm if rpm is not None else float(os.getenv('LLM_RPM', '60'))
+        tpm = tpm if tpm is not None else float(os.getenv('LLM_TPM', '1000000'))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('LLM_MAX_RETRIES', '3'))
+        self.base_delay = base_delay if base_delay is not None else float(os.getenv('LLM_BACKOFF_BASE_SECONDS', '2'))
+        self.max_delay = max_delay if max_delay is not None else float(os.getenv('LLM_BACKOFF_MAX_SECONDS', '60'))
+        self.requests = TokenBucket(rpm, clock)
+        self.tokens = TokenBucket(tpm, clock)
+        self.slots = BoundedSemaphore(self.max_concurrency)
+        self.sleep = sleep
+        self.clock = clock
+        self.lock = Lock()
+        self.metrics = []
+        self._local = local()
+
+    def backoff_delay(self, attempt, error=None):
+        """attempt번째 재시도 전 대기 시간 (retry-after가 있으면 그 시간 + 작은 지터, 없으면 전체 지터 지수 백오프)"""
+        server_delay = retry_after_seconds(error) if error is not None else None
+        if server_delay is not None:
+            return server_delay + random.uniform(0, min(self.base_delay, server_delay * 0.1 + 0.1))
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def call(self, func, label='', input_tokens=0, output_tokens=None, can_retry=None):
+        """func() 실행 (제한·재시도 적용) 후 결과 반환, 재시도를 모두 실패하면 마지막 예외를 그대로 발생
+
+        Args:
+            input_tokens: 입력 토큰 추정치 (TPM 버킷 예약)
+            output_tokens: 결과 -> 출력 토큰 수 함수 (없으면 응답의 usage_metadata.candidates_token_count)
+            can_retry: 재시도 가능 여부 함수 (스트리밍처럼 이미 일부를 전달한 뒤에는 재시도하지 않도록)
+        """
+        metric = {'label': label, 'attempts': 0, 'wait_seconds': 0.0, 'latency_seconds': None,
+                  'input_tokens': input_tokens, 'output_tokens': None, 'error': None}
+        started = self.clock()
+        try:
+            for attempt in range(self.max_retries + 1):
+                wait = max(self.requests.reserve(1), self.tokens.reserve(input_tokens))
+                if wait > 0:
+                    logger.info(f"LLM 호출 한도 대기 ({label}): {wait:.1f}초")
+                    self.sleep(wait)
+                    metric['wait_seconds'] += wait
+
+                metric['attempts'] = attempt + 1
+                try:
+                    with self.slots:
+                        call_started = self.clock()
+                        try:
+                            result = func()
+                        finally:
+                            metric['latency_seconds'] = round(self.clock() - call_started, 3)
+                except Exception as e:
+                    metric['error'] = f"{type(e).__name__}: {e}"
+                    retry_allowed = can_retry() if can_retry is not None else True
+                    if attempt >= self.max_retries or not retry_allowed or not is_retryable(e):
+                        raise
+                    delay = self.backoff_delay(attempt, e)
+                    logger.warning(f"LLM 호출 실패 ({label}, 시도 {attempt + 1}/{self.max_retries + 1}): {e} - {delay:.1f}초 후 재시도")
+                    self.sleep(delay)
+                    metric['wait_seconds'] += delay
+                    continue
+
+                metric['error'] = None
+                metric['output_tokens'] = self._output_tokens(result, output_tokens)
+                self.tokens.consume(metric['output_tokens'])
+                return result
+        finally:
+            metric['seconds'] = round(self.clock() - started, 3)
+            metric['wait_seconds'] = round(metric['wait_seconds'], 3)
+            with self.lock:
+                self.metrics.append(metric)
+            self._local.last_metric = metric
+
+    @staticmethod
+    def _output_tokens(result, output_tokens):
+        try:
+            if output_tokens is not None:
+                return output_tokens(result)
+            usage = getattr(result, 'usage_metadata', None)
+            return getattr(usage, 'candidates_token_count', None)
+        except Exception:
+            return None
+
+    def last_metric(self):
+        """현재 스레드의 마지막 call() 기록 (없으면 None)"""
+        return getattr(self._local, 'last_metric', None)
+
+    def summary(self):
+        """호출 현황 (로그용)"""
+        with self.lock:
+            metrics = list(self.metrics)
+        latencies = sorted(metric['latency_seconds'] for metric in metrics if metric['latency_seconds'] is not None)
+        return {
+            'calls': len(metrics),
+            'failed': sum(1 for metric in metrics if metric['error']),
+            'retries': sum(max(metric['attempts'] - 1, 0) for metric in metrics),
+            'wait_seconds': round(sum(metric['wait_seconds'] for metric in metrics), 3),
+            'p50_latency_seconds': latencies[len(latencies) // 2] if latencies else None,
+            'max_latency_seconds': latencies[-1] if latencies else None,
+            'input_tokens': sum(metric['input_tokens'] or 0 for metric in metrics),
+            'output_tokens': sum(metric['output_tokens'] or 0 for metric in metrics),
+        }
+
+
+_default_client = None
+_default_lock = Lock()
+
+
+def get_default_client():
+    """프로세스 전체에서 공유하는 LLM 클라이언트 (일간 요약기와 주간 큐레이터가 같은 한도를 사용)"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = LLMClient()
+        return _default_client
@@ -3,10 +3,8 @@ import time
 import logging
 import os
 from datetime import datetime
-from newsletter_system import NewsletterSystem
-from weekly_generator import WeeklyNewsletterGenerator
-from monthly_generator import MonthlyNewsletterGenerator
 from date_utils import is_business_day, get_first_business_day
+from news_staging import NewsPreCollector
 
 # 로깅 설정
 logging.basicConfig(
@@ -19,10 +17,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 사전 수집기는 세션/설정을 재사용하도록 한 번만 생성
+_pre_collector = None
+
 def run_daily_newsletter():
     """데일리 뉴스레터 실행"""
     try:
         logger.info("데일리 뉴스레터 작업 시작")
+        from newsletter_system import NewsletterSystem  # 스케줄러 기동 시간을 줄이기 위해 실행 시점에 import
         system = NewsletterSystem()
         success = system.generate_newsletter()
         if success:
@@ -32,10 +34,22 @@ def run_daily_newsletter():
     except Exception as e:
         logger.error(f"데일리 뉴스레터 실행 중 오류: {e}")
 
+def run_precollection():
+    """백그라운드 사전 수집 실행 (다음 발송분 후보를 스테이징에 증분 적재)"""
+    global _pre_collector
+    try:
+        if _pre_collector is None:
+            _pre_collector = NewsPreCollector()
+        added = _pre_collector.run_once()
+        logger.info(f"사전 수집 완료: 신규 {added}개")
+    except Exception as e:
+        logger.error(f"사전 수집 실행 중 오류: {e}")
+
 def run_weekly_newsletter():
     """주간 뉴스레터 실행"""
     try:
         logger.info("주간 뉴스레터 작업 시작")
+        from weekly_generator import WeeklyNewsletterGenerator
         generator = WeeklyNewsletterGenerator()
         success = generator.generate_weekly_newsletter()
         if success:
@@ -54,6 +68,7 @@ def run_monthly_newsletter_check():
         # 오늘 날짜만 비교 (시간 제외)
         if today.date() == first_business_day.date():
             logger.info(f"오늘은 {today.month}월의 첫 영업일입니다. 월간 뉴스레터를 발송합니다.")
+            from monthly_generator import MonthlyNewsletterGenerator
             generator = MonthlyNewsletterGenerator()
             success = generator.generate_monthly_newsletter()
             if success:
@@ -79,10 +94,17 @@ def main():
     # 3. 월간 뉴스레터: 매월 첫 영업일 09:00 (매일 체크)
     schedule.every().day.at("09:00").do(run_monthly_newsletter_check)
     
+    # 4. 사전 수집: 일정 간격으로 다음 발송분 후보를 미리 수집 (PRECOLLECT_INTERVAL_MINUTES=0이면 비활성)
+    precollect_interval = int(os.getenv('PRECOLLECT_INTERVAL_MINUTES', '60'))
+    if precollect_interval > 0:
+        schedule.every(precollect_interval).minutes.do(run_precollection)
+    
     logger.info("스케줄 등록 완료:")
     logger.info("- 데일리: 매일 09:00")
     logger.info("- 주간: 매주 월요일 09:00")
     logger.info("- 월간: 매월 첫 영업일 09:00")
+    if precollect_interval > 0:
+        logger.info(f"- 사전 수집: {precollect_interval}분 간격")
     
     while True:
         try:
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from date_utils import get_last_month_range, get_date_range_str
 from news_summarizer import NewsSummarizer
 from email_sender import EmailSender
+from article_summaries import ArticleSummaryStore, compact_for_curation
 
 class MonthlyNewsletterGenerator:
     """월간 뉴스레터 생성기"""
@@ -14,6 +15,7 @@ class MonthlyNewsletterGenerator:
         self.setup_logging()
         self.news_summarizer = NewsSummarizer()
         self.email_sender = EmailSender()
+        self.article_summaries = ArticleSummaryStore()
         self.base_dir = 'archives/weekly'
         
     def setup_logging(self):
@@ -48,9 +50,9 @@ class MonthlyNewsletterGenerator:
                     with open(file_path, 'r', encoding='utf-8') as f:
                         daily_data = json.load(f)
                     
-                    topics_data = daily_data.get('topics', {})
-                    for topic, content in topics_data.items():
-                        news_list = content.get('news_list', [])
+                    # 일간 아카이브 구조: topics -> raw_news -> {카테고리: [뉴스리스트]}
+                    raw_news = daily_data.get('topics', {}).get('raw_news', {})
+                    for topic, news_list in raw_news.items():
                         all_news.extend(news_list)
                         
                 except Exception as e:
@@ -59,7 +61,8 @@ class MonthlyNewsletterGenerator:
             current_date += timedelta(days=1)
             
         self.logger.info(f"월간 전체 뉴스 로드 완료: {len(all_news)}개")
-        return all_news
+        # 일간 뉴스레터에서 만든 기사별 요약으로 입력 축소 (원문 미리보기 대신)
+        return compact_for_curation(all_news, self.article_summaries)
 
     def generate_monthly_newsletter(self):
         """월간 뉴스레터 생성 및 발송"""
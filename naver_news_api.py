@@ -0,0 +1,215 @@
+"""
+네이버 검색 Open API(뉴스) 클라이언트 - 병렬 페이징, 일일 호출 한도 집계, 응답 캐시
+"""
+import os
+import json
+import logging
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+NAVER_NEWS_API_URL = "https://openapi.naver.com/v1/search/news.json"
+MAX_DISPLAY = 100  # 한 페이지 최대 결과 수
+MAX_START = 1000   # start 파라미터 최대값
+
+
+def _save_json(path, data):
+    """임시 파일에 쓴 뒤 교체하여 원자적으로 저장"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"파일 로드 실패, 새로 시작: {path} ({e})")
+        return default
+
+
+class DailyQuota:
+    """일일 API 호출 수 집계 (날짜가 바뀌면 초기화, 실행 간 유지)
+
+    파일 구조: {path}
+        {"date": "2026-10-19", "calls": 120}
+    """
+
+    def __init__(self, path, limit):
+        self.path = path
+        self.limit = limit
+        self.lock = Lock()
+        self.state = _load_json(path, {})
+
+    def _roll_over(self):
+        today = datetime.now().strftime('%Y-%m-%d')
+        if self.state.get('date') != today:
+            self.state = {'date': today, 'calls': 0}
+
+    def try_acquire(self, calls=1):
+        """호출 가능하면 사용량을 늘리고 True, 한도에 도달했으면 False"""
+        with self.lock:
+            self._roll_over()
+            if self.state['calls'] + calls > self.limit:
+                return False
+            self.state['calls'] += calls
+            try:
+                _save_json(self.path, self.state)
+            except Exception as e:
+                logger.error(f"네이버 API 사용량 저장 실패: {e}")
+            return True
+
+    def remaining(self):
+        with self.lock:
+            self._roll_over()
+            return self.limit - self.state['calls']
+
+
+class NaverNewsAPI:
+    """네이버 뉴스 검색 API
+
+    - 첫 페이지(start=1)를 먼저 받아 가득 차고 대상 기간 안일 때만 나머지 페이지(101, 201, ...)를 동시에 요청하고,
+      대상 날짜보다 오래된 결과가 나오면 다음 페이지는 요청하지 않음
+    - 일일 호출 한도(기본 25,000회)를 파일로 집계하여 여러 실행에 걸쳐 초과하지 않도록 함
+    - (검색어, start, 대상 날짜) 단위로 응답을 캐시하여 사전 수집/재시도에서 같은 페이지를 다시 호출하지 않음
+    """
+
+    def __init__(self, session, client_id=None, client_secret=None, daily_quota=None, max_pages=None,
+                 cache_path=None, quota_path=None, cache_minutes=None, max_workers=3):
+        load_dotenv()
+        self.session = session
+        self.client_id = client_id if client_id is not None else os.getenv('NAVER_CLIENT_ID', '')
+        self.client_secret = client_secret if client_secret is not None else os.getenv('NAVER_CLIENT_SECRET', '')
+        self.max_pages = max_pages or int(os.getenv('NAVER_API_MAX_PAGES', '3'))
+        self.cache_minutes = cache_minutes if cache_minutes is not None else float(os.getenv('NAVER_API_CACHE_MINUTES', '60'))
+        self.cache_path = cache_path or os.getenv('NAVER_API_CACHE_PATH', os.path.join('cache', 'naver_api_responses.json'))
+        self.max_workers = max_workers
+        self.quota = DailyQuota(
+            quota_path or os.getenv('NAVER_API_QUOTA_PATH', os.path.join('cache', 'naver_api_quota.json')),
+            daily_quota or int(os.getenv('NAVER_API_DAILY_QUOTA', '25000'))
+        )
+        self.cache_lock = Lock()
+        self.cache = {key: entry for key, entry in _load_json(self.cache_path, {}).items() if not self._is_expired(entry)}
+        self.stats = {'api_calls': 0, 'cache_hits': 0, 'quota_exceeded': 0, 'errors': 0}
+
+    @property
+    def is_configured(self):
+        """API 인증 정보가 설정되어 있는지 여부"""
+        return bool(self.client_id and self.client_secret)
+
+    def _is_expired(self, entry):
+        try:
+            cached_at = datetime.fromisoformat(entry['cached_at'])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return datetime.now() - cached_at > timedelta(minutes=self.cache_minutes)
+
+    def _count(self, key):
+        with self.cache_lock:
+            self.stats[key] += 1
+
+    def fetch_page(self, query, start, display=MAX_DISPLAY, date_key='', sort='date', acquire=None):
+        """한 페이지 요청 (캐시 → 실행 예산/한도 확인 → API 호출)
+
+        Args:
+            acquire: 실제 API를 호출하기 직전에 부르는 예산 차감 함수 (False면 호출하지 않음, 캐시 적중은 차감 없음)
+
+        Returns:
+            list: 결과 항목 (예산 소진/한도 초과/오류 시 None)
+        """
+        cache_key = f"{query}|{start}|{display}|{sort}|{date_key}"
+        with self.cache_lock:
+            entry = self.cache.get(cache_key)
+        if entry and not self._is_expired(entry):
+            self._count('cache_hits')
+            return entry['items']
+
+        if acquire is not None and not acquire():
+            return None
+
+        if not self.quota.try_acquire():
+            self._count('quota_exceeded')
+            logger.warning(f"네이버 API 일일 호출 한도 도달 ({self.quota.limit}회): {query} (start={start})")
+            return None
+
+        headers = {'X-Naver-Client-Id': self.client_id, 'X-Naver-Client-Secret': self.client_secret}
+        params = {'query': query, 'display': display, 'start': start, 'sort': sort}
+        try:
+            response = self.session.get(NAVER_NEWS_API_URL, headers=headers, params=params, timeout=8)
+            self._count('api_calls')
+            if response.status_code != 200:
+                self._count('errors')
+                logger.error(f"네이버 API 요청 실패: {response.status_code} ({query}, start={start})")
+                return None
+            items = response.json().get('items', [])
+        except Exception as e:
+            self._count('errors')
+            logger.error(f"네이버 API 요청 중 오류: {e} ({query}, start={start})")
+            return None
+
+        with self.cache_lock:
+            self.cache[cache_key] = {'items': items, 'cached_at': datetime.now().isoformat()}
+        return items
+
+    def search(self, query, date_key='', oldest_date=None, max_pages=None, acquire=None):
+        """첫 페이지를 받아 본 뒤 필요할 때만 나머지 페이지를 병렬로 요청하여 결과를 합침 (최신순)
+
+        Args:
+            date_key: 응답 캐시 키에 포함할 대상 날짜
+            oldest_date: 이 날짜(datetime.date)보다 오래된 결과가 나오면 다음 페이지 요청 중단
+            acquire: 실제 API 호출마다 부르는 예산 차감 함수 (fetch_page 참고)
+        """
+        max_pages = min(max_pages or self.max_pages, MAX_START // MAX_DISPLAY)
+        starts = [1 + page * MAX_DISPLAY for page in range(max_pages)]
+        fetch = lambda start: self.fetch_page(query, start, date_key=date_key, acquire=acquire)
+        results = []
+
+        # 첫 페이지가 가득 차고 대상 기간 안이면 그때 나머지 페이지를 동시 요청 수만큼 묶어 요청
+        pages = [fetch(starts[0])]
+        done = self._collect_pages(pages, results, oldest_date)
+        if not done and len(starts) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for offset in range(1, len(starts), self.max_workers):
+                    batch = starts[offset:offset + self.max_workers]
+                    if self._collect_pages(list(executor.map(fetch, batch)), results, oldest_date):
+                        break
+
+        self._save_cache()
+        return results
+
+    def _collect_pages(self, pages, results, oldest_date):
+        """페이지 결과를 순서대로 합치고, 더 요청할 필요가 없으면 True"""
+        for items in pages:
+            if items is None:
+                return True
+            results.extend(items)
+            if len(items) < MAX_DISPLAY or (oldest_date and self._is_older_than(items[-1], oldest_date)):
+                return True
+        return False
+
+    @staticmethod
+    def _is_older_than(item, oldest_date):
+        try:
+            return parsedate_to_datetime(item.get('pubDate', '')).date() < oldest_date
+        except (TypeError, ValueError):
+            return False
+
+    def _save_cache(self):
+        with self.cache_lock:
+            self.cache = {key: entry for key, entry in self.cache.items() if not self._is_expired(entry)}
+            snapshot = dict(self.cache)
+        try:
+            _save_json(self.cache_path, snapshot)
+        except Exception as e:
+            logger.error(f"네이버 API 응답 캐시 저장 실패: {e}")
@@ -0,0 +1,228 @@
+import os
+import json
+import logging
+from datetime import datetime, timedelta
+from threading import Lock
+from dotenv import load_dotenv
+import requests
+
+# 실패 유형별 재시도 금지 기간(일) - 영구적인 실패일수록 길게, 일시적인 실패는 짧게
+REASON_TTL_DAYS = {
+    'not_found': 30,      # 404/410 - 삭제되었거나 잘못된 기사 URL
+    'content_type': 30,   # HTML이 아닌 응답 (동영상, PDF 등)
+    'too_large': 14,      # 바이트 상한의 몇 배를 넘는 응답 (FETCH_REJECT_MULTIPLIER)
+    'too_short': 3,       # 본문 100자 미만 (제목/메타 설명만 추출됨)
+    'cpu_time': 7,        # 파싱 제한 초과
+    'memory': 7,
+    'crashed': 7,
+    'http_error': 1,      # 403/5xx 등
+    'timeout': 1,         # 응답 시간 초과
+    'connection': 0.25,   # 연결 실패 (DNS, 연결 거부 등)
+}
+
+# 후보 선정 단계에서 아예 제외할 실패 유형 (기사 자체가 없거나 기사가 아님)
+DEAD_LINK_REASONS = {'not_found', 'content_type'}
+
+
+def reason_for_status(status_code):
+    """HTTP 상태 코드를 실패 유형으로 변환 (성공이면 None)"""
+    if status_code == 200:
+        return None
+    if status_code in (404, 410):
+        return 'not_found'
+    return 'http_error'
+
+
+def reason_for_exception(error):
+    """요청 예외를 실패 유형으로 변환 (네트워크 오류가 아니면 None)"""
+    if isinstance(error, requests.exceptions.Timeout):
+        return 'timeout'
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return 'connection'
+    return None
+
+
+class NegativeCache:
+    """처리에 실패한 URL을 기록해 다음 실행에서도 재시도하지 않도록 하는 영속 캐시
+
+    실패 유형(reason)별로 TTL이 다르며, 등록 시점의 TTL을 항목에 함께 저장한다.
+    등록할 때마다 파일을 다시 쓰지 않고 save()에서 한 번에 저장한다.
+
+    파일 구조: {path}
+        {"URL": {"reason": "not_found", "status": 404, "detail": "...", "added_at": "ISO 시각", "ttl_days": 30, "count": 1}}
+    """
+
+    def __init__(self, path=None, ttl_days=None, reason_ttl_days=None):
+        load_dotenv()
+        self.path = path or os.getenv('NEGATIVE_CACHE_PATH', os.path.join('cache', 'negative_cache.json'))
+        # 유형별 TTL이 없는 실패에 적용하는 기본값
+        self.ttl_days = ttl_days if ttl_days is not None else float(os.getenv('NEGATIVE_CACHE_TTL_DAYS', '7'))
+        self.reason_ttl_days = dict(REASON_TTL_DAYS, **(reason_ttl_days or {}))
+        self.lock = Lock()
+        self.logger = logging.getLogger(__name__)
+        self.entries = self._load()
+        self.dirty = False
+
+    def _load(self):
+        """캐시 파일 로드 (만료 항목 제외, 없거나 손상되면 빈 캐시)"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"네거티브 캐시 로드 실패, 새로 시작: {self.path} ({e})")
+            return {}
+        return {url: entry for url, entry in entries.items() if not self._is_expired(entry)}
+
+    def _save(self):
+        """임시 파일에 쓴 뒤 교체하여 원자적으로 저장"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def _is_expired(self, entry, now=None):
+        try:
+            added_at = datetime.fromisoformat(entry['added_at'])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return (now or datetime.now()) - added_at > timedelta(days=entry.get('ttl_days', self.ttl_days))
+
+    def get(self, url):
+        """유효한 실패 기록 반환 (없거나 만료되면 None)"""
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry and self._is_expired(entry):
+                del self.entries[url]
+                return None
+            return entry
+
+    def is_blocked(self, url):
+        """재시도하지 말아야 할 URL인지 여부"""
+        return self.get(url) is not None
+
+    def is_dead(self, url):
+        """후보에서 제외해야 할 URL인지 여부 (삭제된 기사, 기사가 아닌 응답)"""
+        entry = self.get(url)
+        return bool(entry) and entry.get('reason') in DEAD_LINK_REASONS
+
+    def add(self, url, reason, detail="", status=None, content=None):
+        """실패 URL 기록 (파일 저장은 save()에서 한 번에)
+
+        Args:
+            content: 실패했지만 이번 실행에서 사용한 결과 (too_short의 짧은 본문 등, 재요청 대신 반환용)
+        """
+        with self.lock:
+            previous = self.entries.get(url) or {}
+            self.entries[url] = {
+                'reason': reason,
+                'status': status,
+                'detail': detail,
+                'added_at': datetime.now().isoformat(),
+                'ttl_days': self.reason_ttl_days.get(reason, self.ttl_days),
+                'count': previous.get('count', 0) + 1
+            }
+            if content is not None:
+                self.entries[url]['content'] = content
+            self.dirty = True
+        self.logger.warning(f"네거티브 캐시 등록 ({reason}): {url}")
+
+    def save(self):
+        """변경된 기록이 있으면 파일에 저장 (수집 단계 종료/수집기 종료 시 호출)"""
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                self._save()
+                self.dirty = False
+            except Exception as e:
+                self.logger.error(f"네거티브 캐시 저장 실패: {e}")
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class SearchEndpointHealth:
+    """언론사 검색 URL(news_sites)의 연속 실패를 기록하여 계속 실패하는 사이트를 자동으로 강등
+
+    연속 실패가 threshold회에 도달하면 demote_days 동안 검색 대상에서 제외하고,
+    강등이 반복될수록 기간을 두 배로 늘린다(최대 14일). 한 번이라도 성공하면 초기화한다.
+
+    파일 구조: {path}
+        {"사이트명": {"failures": 3, "last_reason": "redirect", "last_status": 302, "demotions": 1, "demoted_until": "ISO 시각"}}
+    """
+
+    MAX_DEMOTE_DAYS = 14
+
+    def __init__(self, path=None, threshold=None, demote_days=None):
+        load_dotenv()
+        self.path = path or os.getenv('SEARCH_ENDPOINT_HEALTH_PATH', os.path.join('cache', 'search_endpoints.json'))
+        self.threshold = threshold or int(os.getenv('SEARCH_ENDPOINT_FAIL_THRESHOLD', '3'))
+        self.demote_days = demote_days if demote_days is not None else float(os.getenv('SEARCH_ENDPOINT_DEMOTE_DAYS', '1'))
+        self.lock = Lock()
+        self.logger = logging.getLogger(__name__)
+        self.entries = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"검색 사이트 상태 로드 실패, 새로 시작: {self.path} ({e})")
+            return {}
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def is_demoted(self, name, now=None):
+        """강등 기간 중인지 여부 (기간이 끝나면 한 번 다시 시도)"""
+        with self.lock:
+            demoted_until = (self.entries.get(name) or {}).get('demoted_until')
+        if not demoted_until:
+            return False
+        try:
+            return (now or datetime.now()) < datetime.fromisoformat(demoted_until)
+        except ValueError:
+            return False
+
+    def record_success(self, name):
+        with self.lock:
+            if name not in self.entries:
+                return
+            del self.entries[name]
+            self._save_safely()
+
+    def record_failure(self, name, reason, status=None):
+        """실패 기록 (연속 실패가 기준에 도달하면 강등 후 True 반환)"""
+        with self.lock:
+            entry = self.entries.setdefault(name, {'failures': 0, 'demotions': 0})
+            entry['failures'] += 1
+            entry['last_reason'] = reason
+            entry['last_status'] = status
+            demoted = entry['failures'] >= self.threshold
+            if demoted:
+                days = min(self.demote_days * (2 ** entry['demotions']), self.MAX_DEMOTE_DAYS)
+                entry['demotions'] += 1
+                entry['demoted_until'] = (datetime.now() + timedelta(days=days)).isoformat()
+            self._save_safely()
+        if demoted:
+            self.logger.warning(f"검색 사이트 강등: {name} (연속 실패 {entry['failures']}회, 마지막 사유: {reason}, {days:g}일간 제외)")
+        return demoted
+
+    def _save_safely(self):
+        try:
+            self._save()
+        except Exception as e:
+            self.logger.error(f"검색 사이트 상태 저장 실패: {e}")
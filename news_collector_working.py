@@ -2,25 +2,57 @@
 """
 실제 작동하는 뉴스 수집기 - 샘플 데이터 + 실제 뉴스 수집 조합
 """
-import requests
 from bs4 import BeautifulSoup
 import time
 import logging
 import random
+import re
+import html
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
 from logging_config import setup_utf8_logging
+from http_session_pool import SessionPool
+from parse_workers import ParseWorkerPool, ParseLimitError
+from negative_cache import NegativeCache, SearchEndpointHealth, reason_for_status, reason_for_exception
+from google_news_resolver import GoogleNewsResolver, is_google_news_url
+import google_news_rss
+import query_planner
+from news_item import NewsItem, canonicalize_url, to_news_items
+from naver_news_api import NaverNewsAPI
+import parse_workers
 import os
 
+# 스트리밍 다운로드 종료 조건 (마커 그룹의 마커를 순서대로 모두 만나면 나머지 본문은 받지 않음)
+# 본문 컨테이너를 만난 뒤의 </article>에서만 종료 - 본문 앞 사이드바/목록의 </article>에서 멈추지 않도록
+# (컨테이너를 찾지 못한 페이지는 바이트 상한까지 받음)
+ARTICLE_CONTAINER_MARKERS = (
+    b'id="dic_area"', b'id="articlebody', b'id="article_body"', b'id="article_content"', b'id="harmonycontainer"',
+    b'id="article-view-content-div"', b'id="articletxt"', b'itemprop="articlebody"',
+    b'class="article_body', b'class="article-body', b'class="article_view', b'class="news_end',
+)
+ARTICLE_STOP_MARKERS = [(container, b'</article>') for container in ARTICLE_CONTAINER_MARKERS]
+DATE_STOP_MARKERS = [(b'article:published_time', b'</head>')]
+
 class WorkingNewsCollector:
+    GOOGLE_NEWS_RSS_MAX_ITEMS = 100  # 구글 뉴스 RSS 검색 피드가 반환하는 최대 항목 수
+
     def __init__(self):
         self.setup_logging()
-        self.session = requests.Session()
-        self.setup_session()
         self.request_lock = Lock()  # 요청 제한을 위한 락
         self.max_workers = 3  # 동시 실행 스레드 수 제한
-        
+        self.setup_session()
+        self.parse_pool = ParseWorkerPool()  # HTML 파싱/정제용 프로세스 풀
+        self.negative_cache = NegativeCache()  # 404/시간 초과/본문 부족 등으로 재시도하지 않을 URL
+        self.endpoint_health = SearchEndpointHealth()  # 계속 실패하는 언론사 검색 URL 강등
+        self.google_resolver = GoogleNewsResolver(self.session, negative_cache=self.negative_cache)  # 구글 뉴스 링크 → 원문 URL
+        self.naver_api = NaverNewsAPI(self.session, max_workers=self.max_workers)  # 네이버 검색 API (일일 한도, 응답 캐시)
+        self.content_cache = None  # 사전 수집된 본문 캐시 (링크 -> 본문), NewsletterSystem에서 주입
+        self.keyword_manager = None  # 키워드별 구글 뉴스 수집 방식 설정, NewsletterSystem에서 주입
+        self.planned_items = {}  # 묶음 검색 결과 ((소스, 키워드, 날짜 범위) -> 배분된 항목), plan_keyword_queries()에서 채움
+        self.planned_lock = Lock()
+        self.run_budget = None  # 실행 예산 (검색 요청/본문 다운로드 상한), NewsletterSystem에서 주입
+
 
         
     def setup_logging(self):
@@ -32,7 +64,7 @@ class WorkingNewsCollector:
         )
         
     def setup_session(self):
-        """requests 세션 설정"""
+        """HTTP 세션 풀 설정 (워커별 세션, 풀 크기는 동시 실행 수에 맞춤)"""
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -40,7 +72,7 @@ class WorkingNewsCollector:
             'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
         }
-        self.session.headers.update(headers)
+        self.session = SessionPool(default_headers=headers, max_workers=self.max_workers)
         
     def get_yesterday_date(self):
         """전날 날짜를 YYYYMMDD 형식으로 반환"""
@@ -66,10 +98,14 @@ class WorkingNewsCollector:
             'end_date': yesterday.strftime('%Y%m%d')      # YYYYMMDD 형식
         }
 
-    def get_target_search_date(self):
-        """수집 대상 날짜 반환 (월요일은 토~일, 그 외는 전날)"""
+    def get_target_search_date(self, base_time=None):
+        """수집 대상 날짜 반환 (월요일은 토~일, 그 외는 전날)
+
+        Args:
+            base_time (datetime): 기준 시각 (기본값: 현재 시각). 사전 수집 시 다음 발송일 기준 계산용
+        """
         from datetime import datetime, timedelta
-        now = datetime.now()
+        now = base_time or datetime.now()
         
         # 월요일(0)인 경우 토요일~일요일 수집
         if now.weekday() == 0:
@@ -175,7 +211,24 @@ class WorkingNewsCollector:
         
         self.logger.info(f"다중 소스 뉴스 검색 시작: {keyword} (날짜: {search_date})")
         
-        # 1. 구글 뉴스 검색 (최우선)
+        # 1. 네이버 뉴스 검색 API (가장 저렴한 구조화 소스, 인증 정보가 있을 때만)
+        if self.naver_api.is_configured:
+            try:
+                self.logger.info(f"네이버 뉴스 API 검색 시도: {keyword}")
+                naver_news = self.search_real_naver_news(keyword, max_articles, search_date)
+                # 네이버 뉴스에 우선순위 표시
+                for news in naver_news:
+                    news['priority'] = 2  # 두 번째 우선순위
+                    news['source'] = '네이버뉴스'
+                    news['search_date'] = search_date
+                all_news.extend(naver_news)
+                self.logger.info(f"네이버 뉴스 API에서 {len(naver_news)}개 수집")
+            except Exception as e:
+                self.logger.warning(f"네이버 뉴스 API 검색 실패: {e}")
+        else:
+            self.logger.info("네이버 뉴스 API 검색 건너뜀 (인증 정보 없음)")
+        
+        # 2. 구글 뉴스 검색 (최우선 순위, RSS 피드 기본)
         try:
             self.logger.info(f"구글 뉴스 검색 시도: {keyword}")
             google_news = self.search_google_news(keyword, max_articles, search_date)
@@ -189,24 +242,13 @@ class WorkingNewsCollector:
         except Exception as e:
             self.logger.error(f"구글 뉴스 검색 실패 (ERROR): {e}")
         
-        # 2. 네이버 뉴스 검색 (API) - 비활성화
-        # try:
-        #     self.logger.info(f"네이버 뉴스 API 검색 시도: {keyword}")
-        #     naver_news = self.search_real_naver_news(keyword, max_articles, search_date)
-        #     # 네이버 뉴스에 우선순위 표시
-        #     for news in naver_news:
-        #         news['priority'] = 2  # 두 번째 우선순위
-        #         news['source'] = '네이버뉴스'
-        #         news['search_date'] = search_date
-        #     all_news.extend(naver_news)
-        #     self.logger.info(f"네이버 뉴스 API에서 {len(naver_news)}개 수집")
-        # except Exception as e:
-        #     self.logger.warning(f"네이버 뉴스 API 검색 실패: {e}")
-        self.logger.info(f"네이버 뉴스 API 검색 건너뜀 (비활성화)")
-        
-        # 3. 일반 뉴스 사이트 검색 (세 번째 우선순위)
+        # 3. 일반 뉴스 사이트 검색 (세 번째 우선순위) - 구조화 소스로 충분하면 스크래핑 생략
         try:
-            general_news = self.search_general_news(keyword, max_articles, search_date)
+            if len(all_news) >= max_articles:
+                self.logger.info(f"구조화 소스에서 {len(all_news)}개 확보, 일반 뉴스 사이트 검색 생략")
+                general_news = []
+            else:
+                general_news = self.search_general_news(keyword, max_articles, search_date)
             # 일반 뉴스에 우선순위 표시
             for news in general_news:
                 news['priority'] = 3  # 세 번째 우선순위
@@ -233,6 +275,9 @@ class WorkingNewsCollector:
         if len(all_news) == 0:
             self.logger.warning("네이버 뉴스 크롤링 건너뜀 (비활성화)")
         
+        # 이후 단계(날짜 필터, 중복 제거, NewsletterSystem, 요약기)는 NewsItem으로 처리
+        all_news = to_news_items(all_news)
+        
         # 5. 날짜 기반 엄격한 필터링 (목표 날짜와 일치하는 것만 유지)
         all_news = self.filter_invalid_dates(all_news, search_date)
         
@@ -256,6 +301,9 @@ class WorkingNewsCollector:
         if not news_list:
             return []
         
+        # 같은 기사(원문 URL 동일)는 제목 비교 전에 제거
+        news_list = self.remove_duplicate_urls(news_list)
+        
         # 할인/캐쉬백 키워드 특별 처리
         if keyword in ['할인', '캐쉬백', '캐시백']:
             self.logger.info(f"할인/캐쉬백 키워드 '{keyword}'에 대한 강화된 중복 제거 적용")
@@ -318,6 +366,24 @@ class WorkingNewsCollector:
         self.logger.info(f"중복 제거 완료: {len(news_list)}개 → {len(unique_news)}개")
         return unique_news
     
+    def normalize_article_url(self, url):
+        """URL 기반 중복 판정용 정규화 (스킴/www/모바일 서브도메인, 추적 파라미터, 프래그먼트 제거)"""
+        return canonicalize_url(url)
+
+    def remove_duplicate_urls(self, news_list):
+        """원문 URL이 같은 뉴스는 우선순위가 높은 1개만 유지 (순서 유지)"""
+        kept = {}
+        for index, news in enumerate(news_list):
+            # NewsItem은 정규화 URL을 한 번만 계산해 둠
+            link_key = news.canonical_link if isinstance(news, NewsItem) else self.normalize_article_url(news.get('link', ''))
+            key = link_key or f"#{index}"
+            current = kept.get(key)
+            if current is None or news.get('priority', 999) < current[1].get('priority', 999):
+                kept[key] = (current[0] if current else index, news)
+        if len(kept) < len(news_list):
+            self.logger.info(f"URL 중복 제거: {len(news_list)}개 → {len(kept)}개")
+        return [news for _, news in sorted(kept.values(), key=lambda pair: pair[0])]
+
     def remove_duplicate_discount_news(self, news_list, keyword):
         """할인/캐쉬백 뉴스에 대한 강화된 중복 제거"""
         if not news_list:
@@ -712,8 +778,9 @@ class WorkingNewsCollector:
             return False
         
         # 키워드를 정규식 패턴으로 변환 (단어 경계 고려)
-        # "여기어때" -> r'\b여기어때\b'
-        pattern = r'\b' + re.escape(keyword) + r'\b'
+        # 뒤쪽은 영문/숫자만 경계로 보아 한글 조사가 붙은 경우("여기어때가", "구글은")도 매칭
+        # "여기어때" -> r'(?<!\w)여기어때(?![0-9A-Za-z_])'
+        pattern = r'(?<!\w)' + re.escape(keyword) + r'(?![0-9A-Za-z_])'
         
         # 대소문자 구분 없이 검색
         return bool(re.search(pattern, title, re.IGNORECASE))
@@ -760,118 +827,98 @@ class WorkingNewsCollector:
         return title
     
     def search_real_naver_news(self, keyword, max_articles=5, search_date=None):
-        """네이버 뉴스 API 검색 - 날짜 지정 가능"""
+        """네이버 뉴스 검색 API - 필요한 페이지만 받아 필터링한 뒤, 채택할 후보의 본문만 가져옴"""
         try:
+            if not self.naver_api.is_configured:
+                self.logger.info("네이버 API 인증 정보가 없어 검색 건너뜀")
+                return []
+            
             # 개선된 날짜 범위 설정
             date_range = self.get_date_range_for_search(search_date)
             target_date = date_range['target_str']
+            # 날짜 검증 허용 범위(±1일)보다 오래된 결과가 나오면 다음 페이지는 요청하지 않음
+            oldest_date = (datetime.strptime(date_range['after'], '%Y-%m-%d') - timedelta(days=1)).date()
             
-            self.logger.info(f"네이버 API 뉴스 검색: {keyword} (목표 날짜: {target_date})")
-            
-            # 네이버 뉴스 API URL
-            api_url = "https://openapi.naver.com/v1/search/news.json"
-            
-            headers = {
-                'X-Naver-Client-Id': os.getenv('NAVER_CLIENT_ID', ''),
-                'X-Naver-Client-Secret': os.getenv('NAVER_CLIENT_SECRET', '')
-            }
-            
-            params = {
-                'query': keyword,
-                'display': min(max_articles * 2, 100),  # 더 많은 결과를 가져와서 필터링
-                'start': 1,
-                'sort': 'date'  # 날짜순 정렬
-            }
-            
-            self.logger.info(f"네이버 API 쿼리: {keyword}")
-            
-            response = self.session.get(api_url, headers=headers, params=params, timeout=8)
-            
-            if response.status_code != 200:
-                self.logger.error(f"네이버 API 요청 실패: {response.status_code}")
-                return []
-            
-            data = response.json()
-            items = data.get('items', [])
+            self.logger.info(f"네이버 API 뉴스 검색: {keyword} (목표 날짜: {target_date}, 남은 일일 호출 {self.naver_api.quota.remaining()}회)")
             
+            # 실행 예산은 실제 API 호출(페이지)마다 차감 (캐시 적중은 차감 없음)
+            items = self.naver_api.search(keyword, date_key=target_date, oldest_date=oldest_date,
+                                          acquire=lambda: self.acquire_budget('requests', keyword, '네이버 뉴스 API'))
             if not items:
                 self.logger.info("네이버 API에서 뉴스를 찾을 수 없습니다.")
                 return []
             
-            news_list = []
+            # 1단계: 본문 없이 API 응답만으로 후보 선정
+            candidates = []
             for item in items:
                 try:
-                    title = item.get('title', '').replace('<b>', '').replace('</b>', '').strip()
+                    title = html.unescape(re.sub(r'</?b>', '', item.get('title', ''))).strip()
                     link = item.get('link', '')
-                    description = item.get('description', '').replace('<b>', '').replace('</b>', '').strip()
-                    pub_date = item.get('pubDate', '')
+                    description = html.unescape(re.sub(r'</?b>', '', item.get('description', ''))).strip()
                     
-                    if not title or not link:
+                    if not title or not link or self.is_dead_link(link):
                         continue
                     
-                    # 발행일 파싱
-                    parsed_date = self.parse_pub_date(pub_date)
-                    
-                    # 날짜 정규화
+                    # 발행일 파싱 및 정규화
+                    parsed_date = self.parse_pub_date(item.get('pubDate', ''))
                     normalized_date = self.normalize_date_format(parsed_date)
                     if not normalized_date:
                         self.logger.warning(f"네이버 API 날짜 형식 오류로 제외: {title[:50]}... (날짜: {parsed_date})")
                         continue
                     
-                    # 개선된 날짜 검증
                     is_valid, validation_msg = self.validate_news_date(normalized_date, search_date, link)
                     if not is_valid:
-                        self.logger.info(f"날짜 불일치로 제외: {title[:50]}... ({validation_msg})")
+                        self.logger.debug(f"날짜 불일치로 제외: {title[:50]}... ({validation_msg})")
                         continue
                     
-                                            # 당일 뉴스 포함 (실제 발행 날짜 기준)
-                        # if self.is_today_news(normalized_date):
-                        #     self.logger.info(f"네이버 API 당일 뉴스 제외: {title[:50]}... (날짜: {normalized_date})")
-                        #     continue
-                    
-                    # 본문 추출 시도
-                    full_content = self.extract_full_content(link)
-                    if not full_content:
-                        full_content = description
-                    
-                    # 발행사 추출
-                    press = self.extract_press_from_url(link)
-                    
-                    # 하나투어 제외 로직 적용
-                    if self.should_exclude_hanatour_news(title, full_content, keyword):
+                    # "야놀자" 검색 시 "야 놀자"(띄어쓰기 포함) 결과 제외
+                    if keyword == '야놀자' and re.search(r'야\s+놀자', title):
+                        self.logger.info(f"예외 키워드 규칙으로 제외: {title[:50]}... (키워드: {keyword})")
                         continue
-
-                    news_data = {
+                    
+                    candidates.append({
                         'title': title,
                         'link': link,
-                        'press': press,
+                        'press': self.extract_press_from_url(item.get('originallink') or link),
                         'date': normalized_date,
-                        'content_preview': description,
+                        'description': description
+                    })
+                except Exception as e:
+                    self.logger.warning(f"네이버 API 뉴스 처리 중 오류 (스킵): {e}")
+                    continue
+            
+            self.logger.info(f"네이버 API 결과 {len(items)}개 중 후보 {len(candidates)}개")
+            
+            # 2단계: 필요한 개수만큼만 본문을 병렬로 가져옴 (제외된 만큼 다음 후보로 보충)
+            news_list = []
+            offset = 0
+            while offset < len(candidates) and len(news_list) < max_articles:
+                batch = candidates[offset:offset + min(self.max_workers, max_articles - len(news_list))]
+                offset += len(batch)
+                with ThreadPoolExecutor(max_workers=len(batch)) as executor:
+                    bodies = list(executor.map(lambda candidate: self.extract_full_content(candidate['link']), batch))
+                
+                for candidate, full_content in zip(batch, bodies):
+                    full_content = full_content or candidate['description']
+                    
+                    # 하나투어 제외 로직 적용
+                    if self.should_exclude_hanatour_news(candidate['title'], full_content, keyword):
+                        continue
+                    
+                    news_list.append({
+                        'title': candidate['title'],
+                        'link': candidate['link'],
+                        'press': candidate['press'],
+                        'date': candidate['date'],
+                        'content_preview': candidate['description'],
                         'full_content': full_content,
                         'keyword': keyword,
                         'search_date': search_date if search_date else target_date,
                         'source': '네이버뉴스'
-                    }
-                    
-                    # "야놀자" 검색 시 "야 놀자"(띄어쓰기 포함) 결과 제외
-                    try:
-                        if keyword == '야놀자':
-                            import re
-                            if '야 놀자' in title or re.search(r'야\s+놀자', title):
-                                self.logger.info(f"예외 키워드 규칙으로 제외: {title[:50]}... (키워드: {keyword})")
-                                continue
-                    except Exception:
-                        pass
-                    
-                    
-                    news_list.append(news_data)
-                    self.logger.info(f"네이버 API 뉴스 수집: {title[:50]}... (날짜: {normalized_date})")
-                    
-                except Exception as e:
-                    self.logger.warning(f"네이버 API 뉴스 처리 중 오류 (스킵): {e}")
-                    continue
+                    })
+                    self.logger.info(f"네이버 API 뉴스 수집: {candidate['title'][:50]}... (날짜: {candidate['date']})")
             
-            self.logger.info(f"네이버 API에서 {len(news_list)}개 뉴스 수집 완료")
+            self.logger.info(f"네이버 API에서 {len(news_list)}개 뉴스 수집 완료 (API 통계: {self.naver_api.stats})")
             return news_list
             
         except Exception as e:
@@ -986,25 +1033,8 @@ class WorkingNewsCollector:
 
     def parse_date_from_text(self, text):
         """텍스트에서 날짜 추출 및 파싱"""
-        if not text:
-            return None
-            
-        import re
         try:
-            # 다양한 날짜 패턴 시도
-            patterns = [
-                r'(\d{4})[-.](\d{1,2})[-.](\d{1,2})',  # 2024-01-01, 2024.01.01
-                r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',  # 2024년 1월 1일
-                r'(\d{4})/(\d{1,2})/(\d{1,2})',  # 2024/01/01
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text)
-                if match:
-                    year, month, day = match.groups()
-                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-            
-            return None
+            return parse_workers.parse_date_from_text(text)
         except Exception:
             return None
 
@@ -1045,7 +1075,15 @@ class WorkingNewsCollector:
                 self.logger.error(f"범위 날짜 파싱 실패: {e} (target_date: {target_date})")
                 pass
         
-        for news in news_list:
+        # 단일 날짜 목표는 루프 밖에서 한 번만 파싱
+        target_dt = None
+        if not is_range:
+            try:
+                target_dt = datetime.strptime(target_date, '%Y-%m-%d')
+            except (TypeError, ValueError):
+                target_dt = None
+        
+        for news in to_news_items(news_list):
             news_date = news.get('date', '')
             title = news.get('title', '')
             
@@ -1055,9 +1093,10 @@ class WorkingNewsCollector:
                 filtered_news.append(news)
                 continue
                 
-            # 날짜 정규화 및 비교
-            try:
-                news_dt = datetime.strptime(news_date, '%Y-%m-%d')
+            # 날짜 비교 (NewsItem의 발행일은 처음 접근할 때 한 번만 파싱)
+            published = news.published
+            if published is not None and ((is_range and start_dt and end_dt) or target_dt is not None):
+                news_dt = datetime.combine(published, datetime.min.time())
                 
                 if is_range and start_dt and end_dt:
                     # 범위 비교 (앞뒤 5일 여유로 완화)
@@ -1067,7 +1106,6 @@ class WorkingNewsCollector:
                         self.logger.info(f"날짜 범위 불일치 뉴스 제외: {title[:30]}... (뉴스: {news_date}, 범위: {target_date})")
                 else:
                     # 단일 날짜 비교
-                    target_dt = datetime.strptime(target_date, '%Y-%m-%d')
                     diff = (news_dt - target_dt).days
                     
                     # 5일 이내의 뉴스는 모두 허용 (주말, 시차 등 고려)
@@ -1075,7 +1113,7 @@ class WorkingNewsCollector:
                         filtered_news.append(news)
                     else:
                         self.logger.info(f"날짜 불일치 뉴스 제외: {title[:30]}... (뉴스날짜: {news_date}, 목표: {target_date}, 차이: {diff}일)")
-            except:
+            else:
                 # 날짜 파싱 실패 시 문자열 비교 시도, 실패해도 포함
                 if news_date == target_date:
                     filtered_news.append(news)
@@ -1087,8 +1125,202 @@ class WorkingNewsCollector:
         self.logger.info(f"뉴스 필터링 완료: {len(news_list)}개 → {len(filtered_news)}개")
         return filtered_news
     
+    def get_google_news_mode(self, keyword):
+        """키워드별 구글 뉴스 수집 방식 ('auto': RSS 우선 후 실패 시 HTML, 'rss', 'html')"""
+        mode = None
+        if self.keyword_manager is not None:
+            try:
+                mode = self.keyword_manager.get_google_news_mode(keyword)
+            except Exception as e:
+                self.logger.debug(f"구글 뉴스 수집 방식 설정 확인 실패: {e}")
+        return mode or os.getenv('GOOGLE_NEWS_MODE', 'auto')
+
     def search_google_news(self, keyword, max_articles=3, search_date=None):
-        """구글 뉴스 검색 - 날짜 지정 가능"""
+        """구글 뉴스 검색 - 키워드별 설정에 따라 RSS 피드 또는 HTML 검색 페이지 사용"""
+        mode = self.get_google_news_mode(keyword)
+        if mode in ('auto', 'rss'):
+            news_list = self.search_google_news_rss(keyword, max_articles, search_date)
+            if news_list is not None or mode == 'rss':
+                return news_list or []
+            self.logger.info(f"구글 뉴스 RSS 실패, HTML 검색으로 대체: {keyword}")
+        return self.search_google_news_html(keyword, max_articles, search_date)
+
+    def plan_keyword_queries(self, keywords, max_articles=5, search_date=None):
+        """OR 검색을 지원하는 소스는 키워드를 묶어 한 번에 검색하고, 결과를 키워드별로 배분해 둠
+
+        이후 키워드별 검색(search_naver_news_with_retry)은 배분된 결과를 사용하여 요청을 생략한다.
+        묶음 결과가 결과 개수 상한에 걸렸는데 배분된 기사가 max_articles개보다 적은 키워드는
+        누락이 있을 수 있으므로 배분하지 않고 기존처럼 키워드별로 검색한다.
+
+        Returns:
+            int: 키워드별 검색 대비 줄어든 요청 수 (묶음 요청이 실패하면 음수일 수 있음)
+        """
+        try:
+            max_keywords = int(os.getenv('QUERY_GROUP_MAX_KEYWORDS', '4'))
+            if max_keywords < 2:
+                return 0
+            
+            date_range = self.get_date_range_for_search(search_date)
+            # 구글 뉴스 RSS: HTML 수집 방식으로 지정된 키워드는 제외
+            rss_keywords = [keyword for keyword in keywords if self.get_google_news_mode(keyword) in ('auto', 'rss')]
+            operator = query_planner.OR_OPERATORS['google_news_rss']
+            groups = [group for group in query_planner.plan_query_groups(rss_keywords, max_keywords, operator=operator) if len(group) > 1]
+            if not groups:
+                return 0
+            
+            def search_group(group):
+                query = query_planner.build_or_query(group, operator)
+                if not self.acquire_budget('requests', label=query):
+                    return group, None
+                return group, self.fetch_google_news_feed(query, date_range)
+            
+            saved = 0
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for group, items in executor.map(search_group, groups):
+                    saved -= 1  # 묶음 요청 1회
+                    if items is None:
+                        continue
+                    attributed = query_planner.attribute_results(items, group, self.is_relevant_keyword_match)
+                    saturated = len(items) >= self.GOOGLE_NEWS_RSS_MAX_ITEMS
+                    with self.planned_lock:
+                        for keyword, keyword_items in attributed.items():
+                            if saturated and len(keyword_items) < max_articles:
+                                continue
+                            self.planned_items[('google_news_rss', keyword, date_range['after'], date_range['before'])] = keyword_items
+                            saved += 1
+                    attributed_ids = {id(item) for keyword_items in attributed.values() for item in keyword_items}
+                    self.logger.info(
+                        f"묶음 검색 [{', '.join(group)}]: {len(items)}개 → "
+                        f"{', '.join(f'{keyword} {len(keyword_items)}개' for keyword, keyword_items in attributed.items())}"
+                        f" (키워드 미포함 {len(items) - len(attributed_ids)}개{', 결과 상한 도달' if saturated else ''})"
+                    )
+            
+            self.logger.info(f"검색 계획: 키워드 {len(rss_keywords)}개를 {len(groups)}개 묶음으로 검색, 요청 {saved}회 절감")
+            return saved
+        except Exception as e:
+            self.logger.warning(f"검색 계획 수립 중 오류, 키워드별로 검색: {e}")
+            return 0
+    
+    def get_planned_items(self, source, keyword, date_range, max_articles):
+        """plan_keyword_queries()로 배분된 항목 (없으면 None)"""
+        with self.planned_lock:
+            items = self.planned_items.get((source, keyword, date_range['after'], date_range['before']))
+        if items is None:
+            return None
+        self.logger.info(f"묶음 검색 결과 사용: {keyword} ({len(items)}개)")
+        return items[:max_articles]
+    
+    def clear_planned_queries(self):
+        """이번 실행의 묶음 검색 결과 비우기"""
+        with self.planned_lock:
+            self.planned_items = {}
+    
+    def acquire_budget(self, kind, keyword=None, label=''):
+        """실행 예산 차감 (예산이 없으면 항상 True, 소진되면 False)"""
+        if self.run_budget is None or self.run_budget.try_acquire(kind, keyword):
+            return True
+        self.logger.info(f"실행 예산 소진으로 건너뜀 ({kind}, {keyword or '전체'}): {label}")
+        return False
+    
+    def fetch_google_news_feed(self, query, date_range, limit=None):
+        """구글 뉴스 RSS 피드 요청 및 항목 추출
+
+        Returns:
+            list: 피드 항목 (피드를 받지 못하거나 해석하지 못하면 None)
+        """
+        try:
+            # before: 조건은 해당 날짜를 포함하지 않으므로 하루 뒤로 지정
+            before_date = (datetime.strptime(date_range['before'], '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+            feed_url = google_news_rss.build_search_url(query, date_range['after'], before_date)
+            self.logger.info(f"구글 뉴스 RSS 검색: {query} (날짜 범위: {date_range['after']} ~ {date_range['before']})")
+            
+            response = self.session.fetch_limited(feed_url, timeout=8, accept_types=google_news_rss.RSS_CONTENT_TYPES)
+            if response.status_code != 200 or response.rejected:
+                self.logger.warning(f"구글 뉴스 RSS 접근 실패: {response.status_code} {response.rejected or ''}")
+                return None
+            
+            parse_start = time.perf_counter()
+            items = google_news_rss.parse_feed(response.content, limit=limit)
+            self.logger.info(f"구글 뉴스 RSS 항목 {len(items)}개 ({(time.perf_counter() - parse_start) * 1000:.1f}ms)")
+            return items
+        except Exception as e:
+            self.logger.warning(f"구글 뉴스 RSS 검색 중 오류: {e}")
+            return None
+
+    def search_google_news_rss(self, keyword, max_articles=3, search_date=None):
+        """구글 뉴스 RSS 검색 - 점진적 XML 파서로 제목/링크/발행일/언론사 추출 (DOM, 클래스 선택자 없음)
+
+        plan_keyword_queries()로 묶음 검색한 결과가 있으면 피드를 다시 요청하지 않고 배분된 항목을 사용한다.
+
+        Returns:
+            list: 뉴스 목록 (피드를 받지 못하거나 해석하지 못하면 None)
+        """
+        date_range = self.get_date_range_for_search(search_date)
+        target_date = date_range['target_str']
+        items = self.get_planned_items('google_news_rss', keyword, date_range, max_articles)
+        if items is None:
+            if not self.acquire_budget('requests', keyword, '구글 뉴스 RSS'):
+                return []
+            items = self.fetch_google_news_feed(keyword, date_range, limit=max_articles)
+            if items is None:
+                return None
+        
+        candidates = [item for item in items if len(item['title']) >= 10 and item['link'] and not self.is_dead_link(item['link'])]
+        # 본문 수집 전에 원문 URL로 일괄 변환 (병렬, 영속 캐시)
+        resolved_links = self.google_resolver.resolve_many([item['link'] for item in candidates])
+        
+        news_list = []
+        for item in candidates:
+            try:
+                title = item['title']
+                link = resolved_links.get(item['link']) or item['link']
+                
+                # 발행일은 피드의 pubDate 사용 (없으면 검색 대상 날짜)
+                actual_date = item['date'] or date_range['target_date'].strftime('%Y-%m-%d')
+                normalized_date = self.normalize_date_format(actual_date)
+                if not normalized_date:
+                    self.logger.warning(f"구글 뉴스 RSS 날짜 형식 오류로 제외: {title[:50]}... (날짜: {actual_date})")
+                    continue
+                
+                is_valid, validation_msg = self.validate_news_date(normalized_date, search_date, link)
+                if not is_valid:
+                    self.logger.warning(f"구글 뉴스 RSS 날짜 검증 실패로 제외: {title[:50]}... - {validation_msg}")
+                    continue
+                
+                # "야놀자" 검색 시 "야 놀자"(띄어쓰기 포함) 결과 제외
+                if keyword == '야놀자' and re.search(r'야\s+놀자', title):
+                    self.logger.info(f"예외 키워드 규칙으로 제외: {title[:50]}... (키워드: {keyword})")
+                    continue
+                
+                full_content = self.extract_full_content(link)
+                if not full_content:
+                    full_content = f"{title} - {keyword} 관련 뉴스입니다."
+                
+                # 하나투어 제외 로직 적용
+                if self.should_exclude_hanatour_news(title, full_content, keyword):
+                    continue
+                
+                news_list.append({
+                    'title': title,
+                    'link': link,
+                    'press': item['source'] or self.extract_press_from_url(link),
+                    'date': normalized_date,
+                    'content_preview': title,
+                    'full_content': full_content,
+                    'keyword': keyword,
+                    'search_date': search_date if search_date else target_date,
+                    'source': '구글뉴스'
+                })
+                self.logger.info(f"구글 뉴스 RSS 수집: {title[:50]}... (날짜: {normalized_date})")
+            except Exception as e:
+                self.logger.warning(f"구글 뉴스 RSS 항목 처리 중 오류 (스킵): {e}")
+                continue
+        
+        self.logger.info(f"구글 뉴스 RSS에서 {len(news_list)}개 수집 완료")
+        return news_list
+
+    def search_google_news_html(self, keyword, max_articles=3, search_date=None):
+        """구글 뉴스 HTML 검색 페이지 스크래핑 - 날짜 지정 가능"""
         self.logger.info(f"구글 뉴스 검색 메서드 진입: {keyword}")
         try:
             # User-Agent 랜덤 변경 (차단 회피)
@@ -1099,7 +1331,8 @@ class WorkingNewsCollector:
                 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/120.0.0.0 Safari/537.36',
                 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             ]
-            self.session.headers.update({'User-Agent': random.choice(user_agents)})
+            # 공유 세션 헤더를 변경하지 않고 이 검색의 요청에만 적용
+            request_headers = {'User-Agent': random.choice(user_agents)}
             
             # 개선된 날짜 범위 설정
             date_range = self.get_date_range_for_search(search_date)
@@ -1113,15 +1346,15 @@ class WorkingNewsCollector:
             
             self.logger.info(f"구글 뉴스 검색: {keyword} (날짜 범위: {after_date} ~ {before_date})")
             self.logger.info(f"구글 뉴스 URL: {search_url}")
-            
-            response = self.session.get(search_url, timeout=8)
+
+            if not self.acquire_budget('requests', keyword, '구글 뉴스 HTML'):
+                return []
+            response = self.session.fetch_limited(search_url, headers=request_headers, timeout=8)
             
             if response.status_code != 200:
                 self.logger.error(f"구글 뉴스 페이지 접근 실패: {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
             # 구글 뉴스 구조에 맞는 다양한 선택자들
             news_selectors = [
                 'article',  # 기본 article 태그
@@ -1134,6 +1367,12 @@ class WorkingNewsCollector:
                 'div[jslog]',  # 구글 뉴스 jslog 속성
             ]
             
+            # 뉴스 아이템과 대체용 링크만 부분 파싱 (아이템 요소를 날짜 추출에 그대로 넘기므로 현재 프로세스에서 파싱)
+            parse_start = time.perf_counter()
+            strainer = parse_workers.build_search_strainer(*news_selectors, "a[href*='news.google.com']")
+            soup = BeautifulSoup(response.content, 'html.parser', from_encoding=self._get_response_encoding(response), parse_only=strainer)
+            self.logger.info(f"구글 뉴스 파싱 {(time.perf_counter() - parse_start) * 1000:.0f}ms (요소 {len(soup.find_all(True))}개)")
+            
             news_items = []
             for selector in news_selectors:
                 items = soup.select(selector)
@@ -1148,20 +1387,24 @@ class WorkingNewsCollector:
                 news_links = [link for link in all_links if 'news.google.com' in link.get('href', '')]
                 self.logger.info(f"구글 뉴스 링크 {len(news_links)}개 발견")
                 
+                # 본문 수집 전에 원문 URL로 일괄 변환 (병렬, 영속 캐시)
+                resolved_links = self.google_resolver.resolve_many(
+                    [self.get_google_news_link(link_elem.get('href', '')) for link_elem in news_links[:max_articles]],
+                    headers=request_headers
+                )
+                
                 news_list = []
                 for link_elem in news_links[:max_articles]:
                     try:
                         title = link_elem.get_text(strip=True)
-                        link = link_elem.get('href', '')
+                        link = self.get_google_news_link(link_elem.get('href', ''))
                         
                         if len(title) < 10 or not link:
                             continue
                         
-                        # 구글 뉴스 링크를 실제 링크로 변환
-                        if link.startswith('./'):
-                            link = 'https://news.google.com' + link[1:]
-                        elif link.startswith('/'):
-                            link = 'https://news.google.com' + link
+                        if self.is_dead_link(link):
+                            continue
+                        link = resolved_links.get(link) or link
                         
                         # 본문 추출 시도
                         full_content = self.extract_full_content(link)
@@ -1229,67 +1472,29 @@ class WorkingNewsCollector:
                 self.logger.info(f"구글 뉴스에서 {len(news_list)}개 수집 완료")
                 return news_list
             
-            # 구조화된 뉴스 아이템 처리
+            # 구조화된 뉴스 아이템 처리 - 본문 수집 전에 원문 URL로 일괄 변환 (병렬, 영속 캐시)
+            candidates = [(item,) + self.select_google_news_item(item) for item in news_items[:max_articles]]
+            resolved_links = self.google_resolver.resolve_many(
+                [link for _, title, link in candidates if title and link], headers=request_headers
+            )
+            
             news_list = []
-            for i, item in enumerate(news_items[:max_articles]):
+            for item, title, link in candidates:
                 try:
-                    # 다양한 제목 선택자 시도
-                    title_selectors = [
-                        'h3', 'h4', '.title', '.DY5T1d', '.ipQwMb', '.gPFEn', 'a[aria-label]'
-                    ]
-                    
-                    title_elem = None
-                    for selector in title_selectors:
-                        title_elem = item.select_one(selector)
-                        if title_elem:
-                            break
-                    
-                    # 링크 선택자 시도
-                    link_selectors = [
-                        'a', 'a[href]', '.WlydOe', '.SoaBEf'
-                    ]
-                    
-                    link_elem = None
-                    for selector in link_selectors:
-                        link_elem = item.select_one(selector)
-                        if link_elem and link_elem.get('href'):
-                            break
-                    
-                    if not title_elem or not link_elem:
+                    if not title or not link or len(title) < 10:
                         continue
                     
-                    title = title_elem.get_text(strip=True)
-                    link = link_elem.get('href', '')
-                    
-                    if len(title) < 10 or not link:
+                    if self.is_dead_link(link):
                         continue
                     
-                    # 구글 뉴스 링크를 실제 링크로 변환
-                    if link.startswith('./'):
-                        link = 'https://news.google.com' + link[1:]
-                    elif link.startswith('/'):
-                        link = 'https://news.google.com' + link
-                    
-                    # [Link Validation] 실제 URL로 리다이렉트 및 유효성 검증
-                    try:
-                        # Google News 링크는 리다이렉트가 필수이므로 확인
-                        # 타임아웃 5초로 설정하여 연결 불가능한 링크 제외
-                        check_response = self.session.get(link, timeout=5, allow_redirects=True)
-                        if check_response.status_code == 200:
-                            final_url = check_response.url
-                            # 리다이렉트가 되지 않고 여전히 구글 뉴스 링크인 경우 (JS 리다이렉트 등) -> 제외
-                            if "news.google.com" in final_url or "google.com/read" in final_url:
-                                self.logger.warning(f"뉴스 링크 리다이렉트 실패(구글뉴스 URL 유지): {final_url}")
-                                # 리다이렉트 실패해도 링크 유지 (사용자가 브라우저에서 접속하면 됨)
-                                link = final_url
-                            else:
-                                link = final_url  # 최종 목적지 URL로 업데이트
-                        else:
-                            self.logger.warning(f"뉴스 링크 접속 실패(Status {check_response.status_code}): {link}")
-                            continue  # 접속 불가 시 수집 제외
-                    except Exception as e:
-                        self.logger.warning(f"뉴스 링크 연결 오류(제외): {e}")
-                        continue  # 연결 오류 시 수집 제외
+                    # 원문 URL로 변환되지 않은 링크는 구글 뉴스 링크 유지 (사용자가 브라우저에서 접속하면 됨)
+                    publisher_link = resolved_links.get(link)
+                    if publisher_link:
+                        link = publisher_link
+                    else:
+                        self.logger.warning(f"원문 URL 변환 실패(구글뉴스 URL 유지): {link}")
+                        if self.is_dead_link(link):
+                            continue  # 접속 불가(404 등) 시 수집 제외
 
                     # 본문 추출 시도 (업데이트된 링크 사용)
                     full_content = self.extract_full_content(link)
@@ -1368,6 +1573,42 @@ class WorkingNewsCollector:
             self.logger.warning(f"구글 뉴스 검색 중 오류 (빈 결과 반환): {e}")
             return []
     
+    def get_google_news_link(self, href):
+        """구글 뉴스 검색 결과의 상대 링크를 절대 URL로 변환"""
+        if href.startswith('./'):
+            return 'https://news.google.com' + href[1:]
+        if href.startswith('/'):
+            return 'https://news.google.com' + href
+        return href
+
+    def select_google_news_item(self, item):
+        """구글 뉴스 아이템에서 (제목, 링크) 추출 (없으면 None)"""
+        # 다양한 제목 선택자 시도
+        title_selectors = [
+            'h3', 'h4', '.title', '.DY5T1d', '.ipQwMb', '.gPFEn', 'a[aria-label]'
+        ]
+        
+        title_elem = None
+        for selector in title_selectors:
+            title_elem = item.select_one(selector)
+            if title_elem:
+                break
+        
+        # 링크 선택자 시도
+        link_selectors = [
+            'a', 'a[href]', '.WlydOe', '.SoaBEf'
+        ]
+        
+        link_elem = None
+        for selector in link_selectors:
+            link_elem = item.select_one(selector)
+            if link_elem and link_elem.get('href'):
+                break
+        
+        if not title_elem or not link_elem:
+            return None, None
+        return title_elem.get_text(strip=True), self.get_google_news_link(link_elem.get('href', ''))
+
     def search_general_news(self, keyword, max_articles=5, search_date=None):
         """일반 뉴스 사이트 검색 - 날짜 지정 가능"""
         try:
@@ -1427,31 +1668,53 @@ class WorkingNewsCollector:
             
             for site in news_sites:
                 try:
+                    # 연속으로 실패/리다이렉트된 검색 URL은 강등 기간 동안 건너뜀
+                    if self.endpoint_health.is_demoted(site['name']):
+                        self.logger.info(f"{site['name']} 검색 건너뜀 (연속 실패로 강등됨)")
+                        continue
+                    
+                    if not self.acquire_budget('requests', keyword, site['name']):
+                        break
+                    
                     self.logger.info(f"{site['name']} 검색 중: {keyword}")
                     
+                    response = self.session.fetch_limited(site['url'], timeout=8)
+                    endpoint_failure = self.get_search_endpoint_failure(site['url'], response)
+                    if endpoint_failure:
+                        self.endpoint_health.record_failure(site['name'], endpoint_failure, response.status_code)
+                    
                     # 대안 URL 시도
-                    response = self.session.get(site['url'], timeout=8)
                     if response.status_code != 200:
                         # 대안 URL 시도
                         alt_url = f"https://search.naver.com/search.naver?where=news&query={keyword}+{site['name']}"
                         self.logger.info(f"{site['name']} 대안 URL 시도: {alt_url}")
-                        response = self.session.get(alt_url, timeout=8)
+                        response = self.session.fetch_limited(alt_url, timeout=8)
                         
                         if response.status_code != 200:
                             self.logger.error(f"{site['name']} 접근 실패: {response.status_code}")
                             continue
                     
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # 링크 추출
-                    links = soup.select(site['link_selector'])
-                    self.logger.info(f"{site['name']}에서 {len(links)}개 링크 발견 (선택자: {site['link_selector']})")
+                    # 링크/날짜 요소만 부분 파싱 (워커 프로세스)
+                    parse_start = time.perf_counter()
+                    parsed = self.parse_pool.run(
+                        parse_workers.parse_search_results, response.content, self._get_response_encoding(response),
+                        response.url, site['link_selector'], site['date_selector'], label=site['name']
+                    )
+                    results = parsed['items']
+                    # 결과 없음은 드문 키워드에서도 흔하므로 강등 실패로 세지 않음 (성공으로 초기화하지도 않음)
+                    if not endpoint_failure and results:
+                        self.endpoint_health.record_success(site['name'])
+                    self.logger.info(
+                        f"{site['name']}에서 {len(results)}개 링크 발견 (선택자: {site['link_selector']}, "
+                        f"파싱 {(time.perf_counter() - parse_start) * 1000:.0f}ms, 요소 {parsed['elements']}개, "
+                        f"{'부분' if parsed['partial'] else '전체'} 파싱)"
+                    )
                     
                     site_news = []
-                    for link_elem in links[:max_articles]:
+                    for result in results[:max_articles]:
                         try:
-                            title = link_elem.get_text(strip=True)
-                            link = link_elem.get('href', '')
+                            title = result['title']
+                            link = result['link']
                             
                             if not title or not link or len(title) < 10:
                                 continue
@@ -1467,8 +1730,11 @@ class WorkingNewsCollector:
                             elif not link.startswith('http'):
                                 link = f"https://{site['url'].split('/')[2]}/{link}"
                             
-                            # 날짜 추출
-                            date = self.extract_date_from_site(soup, link_elem, site['date_selector'], site['url'])
+                            if self.is_dead_link(link):
+                                continue
+                            
+                            # 날짜 추출 (검색 결과에 없으면 기사 페이지에서)
+                            date = result['date'] or self.extract_date_from_news_page(link)
                             
                             # 날짜 정규화
                             normalized_date = self.normalize_date_format(date)
@@ -1521,6 +1787,7 @@ class WorkingNewsCollector:
                     
                 except Exception as e:
                     self.logger.warning(f"{site['name']} 검색 중 오류 발생 (다음 신문사로 넘어갑니다): {e}")
+                    self.endpoint_health.record_failure(site['name'], reason_for_exception(e) or 'error')
                     continue
             
             self.logger.info(f"일반 뉴스에서 {len(all_news)}개 수집 완료")
@@ -1530,6 +1797,18 @@ class WorkingNewsCollector:
             self.logger.warning(f"일반 뉴스 검색 중 오류 (빈 결과 반환): {e}")
             return []
     
+    def get_search_endpoint_failure(self, search_url, response):
+        """검색 URL 응답의 실패 유형 (정상이면 None, 다른 경로로 리다이렉트되면 'redirect')"""
+        from urllib.parse import urlparse
+        if response.status_code != 200:
+            return reason_for_status(response.status_code)
+        if response.rejected:
+            return response.rejected
+        requested, final = urlparse(search_url), urlparse(response.url or search_url)
+        if (requested.hostname, requested.path.rstrip('/')) != (final.hostname, final.path.rstrip('/')):
+            return 'redirect'
+        return None
+
     def search_naver_news_crawling(self, keyword, max_articles=5, search_date=None):
         """네이버 뉴스 크롤링으로 뉴스 검색 (날짜 지정 가능)"""
         try:
@@ -1550,7 +1829,7 @@ class WorkingNewsCollector:
             
             self.logger.info(f"네이버 뉴스 크롤링: {keyword} (날짜 범위: {start_date} ~ {end_date})")
             
-            response = self.session.get(search_url, timeout=8)
+            response = self.session.fetch_limited(search_url, timeout=8)
             
             if response.status_code != 200:
                 self.logger.error(f"네이버 뉴스 페이지 접근 실패: {response.status_code}")
@@ -1595,6 +1874,9 @@ class WorkingNewsCollector:
                         self.logger.info(f"정확한 키워드 매칭 실패로 제외: {title[:30]}... (키워드: {keyword})")
                         continue
                     
+                    if self.is_dead_link(link):
+                        continue
+                    
                     self.logger.info(f"뉴스 링크 처리 중: {title[:50]}...")
                     
                     # 본문 추출
@@ -1658,88 +1940,50 @@ class WorkingNewsCollector:
             return []
 
     def extract_date_from_news_page(self, url):
-        """뉴스 페이지에서 날짜 정보 추출 (기존 함수 - 호환성 유지)"""
+        """뉴스 페이지에서 날짜 정보 추출 (기존 함수 - 호환성 유지, 파싱은 워커 프로세스에서 수행)"""
+        # 본문만 짧은 페이지는 메타 태그에서 날짜를 얻을 수 있으므로 건너뛰지 않음
+        cached_failure = self.negative_cache.get(url)
+        if cached_failure and cached_failure['reason'] != 'too_short':
+            self.logger.info(f"네거티브 캐시에 등록된 URL 건너뜀 ({cached_failure['reason']}): {url}")
+            return None
+        
         try:
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # 날짜 선택자들 (기존 방식)
-                date_selectors = [
-                    'span.date',  # 네이버 뉴스 날짜
-                    '.article_info .date',  # 기사 정보 날짜
-                    '.news_date',  # 뉴스 날짜
-                    'time',  # HTML5 time 태그
-                    '.published',  # 발행일
-                ]
-                
-                for selector in date_selectors:
-                    date_elem = soup.select_one(selector)
-                    if date_elem:
-                        date_text = date_elem.get_text(strip=True)
-                        # 날짜 형식 정리
-                        if date_text:
-                            return self.parse_date_from_text(date_text)
-                
-                # 새로운 강화된 날짜 추출 시도 (에러 발생 시 기존 방식으로 fallback)
-                try:
-                    enhanced_date = self.extract_date_enhanced(soup, url)
-                    if enhanced_date:
-                        return enhanced_date
-                except Exception as e:
-                    self.logger.warning(f"강화된 날짜 추출 실패, 기존 방식 사용: {e}")
-                
-                return None
+            response = self.session.fetch_limited(url, timeout=10, stop_markers=DATE_STOP_MARKERS)
+            if response.status_code != 200:
+                self.negative_cache.add(url, reason_for_status(response.status_code), f"HTTP {response.status_code}", response.status_code)
+            elif not response.rejected:
+                result = self.parse_pool.extract(response.content, url, self._get_response_encoding(response), want=('date',))
+                if result['date']:
+                    self.logger.info(f"날짜 추출 성공: {result['date_source']} -> {result['date']}")
+                return result['date']
                 
+        except ParseLimitError as e:
+            self.logger.warning(f"날짜 추출 강제 중단 ({e.reason}): {url}")
+            self.negative_cache.add(url, e.reason, str(e))
+            return None
         except Exception as e:
             self.logger.error(f"날짜 추출 중 오류: {e}")
+            reason = reason_for_exception(e)
+            if reason:
+                self.negative_cache.add(url, reason, str(e))
             return None
 
-    def extract_date_enhanced(self, soup, url):
-        """강화된 날짜 추출 (새로운 기능)"""
+    def extract_date_from_site(self, soup, link_elem, date_selector, site_url):
+        """검색 결과 페이지에서 링크 주변의 날짜 추출 (부분 파싱 DOM도 지원)"""
         try:
-            # 사이트별 특화 날짜 선택자
-            site_specific_selectors = self.get_site_specific_date_selectors(url)
-            
-            # 1단계: 사이트별 특화 선택자로 날짜 추출
-            for selector in site_specific_selectors:
-                try:
-                    date_elem = soup.select_one(selector)
-                    if date_elem:
-                        date_text = date_elem.get_text(strip=True)
-                        if date_text:
-                            parsed_date = self.parse_date_from_text(date_text)
-                            if parsed_date:
-                                self.logger.info(f"사이트별 선택자로 날짜 추출 성공: {selector} -> {parsed_date}")
-                                return parsed_date
-                except Exception as e:
-                    self.logger.debug(f"선택자 {selector} 실패: {e}")
-                    continue
-            
-            # 2단계: 메타 태그에서 날짜 추출
-            try:
-                meta_date = soup.find('meta', property='article:published_time')
-                if meta_date:
-                    content = meta_date.get('content', '')
-                    if content:
-                        parsed_date = self.parse_date_from_text(content)
-                        if parsed_date:
-                            self.logger.info(f"메타 태그로 날짜 추출 성공: {parsed_date}")
-                            return parsed_date
-            except Exception as e:
-                self.logger.debug(f"메타 태그 추출 실패: {e}")
-            
-            # 3단계: 본문에서 날짜 패턴 추출 (선택적)
-            try:
-                content_date = self.extract_date_from_content(soup, url)
-                if content_date:
-                    self.logger.info(f"본문에서 날짜 추출 성공: {content_date}")
-                    return content_date
-            except Exception as e:
-                self.logger.debug(f"본문 날짜 추출 실패: {e}")
-            
+            date_text = parse_workers.find_date_near(link_elem, date_selector)
+            return parse_workers.parse_date_text(date_text)
+        except Exception as e:
+            self.logger.debug(f"검색 결과 날짜 추출 실패 ({site_url}): {e}")
             return None
-            
+
+    def extract_date_enhanced(self, soup, url):
+        """강화된 날짜 추출 (사이트별 선택자 → 메타 태그 → 본문 패턴)"""
+        try:
+            parsed_date, source = parse_workers.extract_date_enhanced(soup, url)
+            if parsed_date:
+                self.logger.info(f"강화된 날짜 추출 성공: {source} -> {parsed_date}")
+            return parsed_date
         except Exception as e:
             self.logger.error(f"강화된 날짜 추출 중 오류: {e}")
             return None
@@ -1747,58 +1991,7 @@ class WorkingNewsCollector:
     def get_site_specific_date_selectors(self, url):
         """사이트별 특화된 날짜 선택자 반환 (안전한 방식)"""
         try:
-            if 'khan.co.kr' in url:  # 경향신문
-                return [
-                    '.article_date',
-                    '.date',
-                    '.article-info .date',
-                    '.news-date',
-                    '.publish-date',
-                ]
-            elif 'yna.co.kr' in url:  # 연합뉴스
-                return [
-                    '.date',
-                    '.article-date',
-                    '.news-date',
-                    '.publish-date',
-                ]
-            elif 'hani.co.kr' in url:  # 한겨레
-                return [
-                    '.date',
-                    '.article-date',
-                    '.news-date',
-                    '.publish-date',
-                ]
-            elif 'chosun.com' in url:  # 조선일보
-                return [
-                    '.date',
-                    '.article-date',
-                    '.news-date',
-                    '.publish-date',
-                ]
-            elif 'joongang.co.kr' in url:  # 중앙일보
-                return [
-                    '.date',
-                    '.article-date',
-                    '.news-date',
-                    '.publish-date',
-                ]
-            elif 'mk.co.kr' in url:  # 매일경제
-                return [
-                    '.date',
-                    '.news_date',
-                    '.t_date',
-                    '.reg_date',
-                ]
-            elif 'hankyung.com' in url:  # 한국경제
-                return [
-                    '.date-time',
-                    '.txt-date',
-                    '.datetime',
-                    '.published',
-                ]
-            else:
-                return []  # 기타 사이트는 빈 배열 반환
+            return parse_workers.get_site_specific_date_selectors(url)
         except Exception as e:
             self.logger.error(f"사이트별 선택자 결정 중 오류: {e}")
             return []  # 에러 시 빈 배열 반환
@@ -1806,36 +1999,7 @@ class WorkingNewsCollector:
     def extract_date_from_content(self, soup, url):
         """본문에서 날짜 패턴 추출 (안전한 방식)"""
         try:
-            # 사이트별 본문 선택자
-            content_selectors = self.get_site_specific_content_selectors(url)
-            
-            for selector in content_selectors:
-                try:
-                    content_elem = soup.select_one(selector)
-                    if content_elem:
-                        content_text = content_elem.get_text()
-                        
-                        # 날짜 패턴 검색
-                        import re
-                        date_patterns = [
-                            r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',
-                            r'(\d{4})-(\d{1,2})-(\d{1,2})',
-                            r'(\d{4})\.(\d{1,2})\.(\d{1,2})',
-                            r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})', # 2026. 01. 11 형식
-                        ]
-                        
-                        for pattern in date_patterns:
-                            match = re.search(pattern, content_text)
-                            if match:
-                                if len(match.groups()) == 3:
-                                    year, month, day = match.groups()
-                                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                except Exception as e:
-                    self.logger.debug(f"본문 선택자 {selector} 실패: {e}")
-                    continue
-            
-            return None
-            
+            return parse_workers.extract_date_from_content(soup, url)
         except Exception as e:
             self.logger.error(f"본문에서 날짜 추출 중 오류: {e}")
             return None
@@ -1843,50 +2007,7 @@ class WorkingNewsCollector:
     def get_site_specific_content_selectors(self, url):
         """사이트별 특화된 본문 선택자 반환 (안전한 방식)"""
         try:
-            selectors = []
-            
-            # 1. 주요 언론사별 특화 선택자
-            if 'khan.co.kr' in url:  # 경향신문
-                selectors = ['.art_body', '.article_txt', '#articleBody']
-            elif 'yna.co.kr' in url:  # 연합뉴스
-                selectors = ['.story-news', '.article-body', '#articleWrap']
-            elif 'hani.co.kr' in url:  # 한겨레
-                selectors = ['.text', '.article-text', '#a-left-scroll-in']
-            elif 'chosun.com' in url:  # 조선일보
-                selectors = ['.article-body', '.news_body_id', '#news_body_id']
-            elif 'joongang.co.kr' in url:  # 중앙일보
-                selectors = ['.article_body', '#article_body']
-            elif 'donga.com' in url: # 동아일보
-                selectors = ['.article_txt', '#article_txt']
-            elif 'mk.co.kr' in url: # 매일경제
-                selectors = ['.art_txt', '.news_body']
-            elif 'hankyung.com' in url: # 한국경제
-                selectors = ['.article-body', '#articletxt']
-            elif 'etnews.com' in url: # 전자신문
-                selectors = ['.article_body', '#articleBody']
-            elif 'zdnet.co.kr' in url: # ZDNet
-                selectors = ['.view_cont', '#articleBody']
-            
-            # 2. 공통적으로 많이 쓰이는 선택자 (Fallback)
-            common_selectors = [
-                'article', 
-                '.article-body', 
-                '.article_body', 
-                '.news-content', 
-                '.news_body', 
-                '.content', 
-                '#article-view-content-div', 
-                '#articleBody', 
-                '.view_con',
-                '.post-content',
-                '.entry-content'
-            ]
-            
-            # 특화 선택자 + 공통 선택자 (중복 제거)
-            final_selectors = selectors + [s for s in common_selectors if s not in selectors]
-            
-            return final_selectors
-            
+            return parse_workers.get_site_specific_content_selectors(url)
         except Exception as e:
             self.logger.error(f"사이트별 본문 선택자 결정 중 오류: {e}")
             return ['.content', '.article-content', 'article']  # 기본값 반환
@@ -1986,160 +2107,92 @@ class WorkingNewsCollector:
     
     def clean_news_content(self, text):
         """뉴스 본문에서 노이즈 제거"""
-        if not text:
-            return ""
-        
-        import re
-        
-        # 1. 기자 정보 및 이메일 제거
-        text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', text) # 이메일
-        text = re.sub(r'\(?([가-힣]{2,4})\s*기자\)?', '', text) # (홍길동 기자), 홍길동 기자
-        text = re.sub(r'[가-힣]{2,4}\s*기자\s*=', '', text) # 홍길동 기자 =
-        
-        # 2. 저작권 및 재배포 금지 문구 제거
-        text = re.sub(r'무단\s*전재\s*및\s*재배포\s*금지', '', text)
-        text = re.sub(r'저작권자\s*\(c\).*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'Copyrights\s*\(c\).*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'ⓒ\s*.*', '', text)
-        
-        # 3. 불필요한 공백 및 줄바꿈 정리
-        text = re.sub(r'\n+', '\n', text)
-        text = re.sub(r'\s+', ' ', text)
-        
-        # 4. 기타 노이즈 (구독, 제보 등)
-        noise_patterns = [
-            r'네이버에서 .* 구독하세요',
-            r'SNS .* 팔로우',
-            r'제보하기',
-            r'구독하기',
-            r'좋아요',
-            r'공유하기'
-        ]
-        for pattern in noise_patterns:
-            text = re.sub(pattern, '', text)
-            
-        return text.strip()
+        return parse_workers.clean_news_content(text)
     
+    def _get_response_encoding(self, response):
+        """파서에 넘길 인코딩 (fetch_limited가 헤더/BOM/<meta charset>/호스트 캐시로 판별한 값)"""
+        return response.encoding
+
+    def is_dead_link(self, link):
+        """후보 선정 단계에서 제외할 링크인지 여부 (네거티브 캐시에 삭제된 기사/비기사 응답으로 기록된 URL)"""
+        if link and self.negative_cache.is_dead(link):
+            self.logger.info(f"네거티브 캐시에 등록된 링크 후보 제외: {link}")
+            return True
+        return False
+
     def extract_full_content(self, news_url):
-        """뉴스 본문 전체 추출"""
-        # 구글 뉴스 리다이렉트 URL인 경우 본문 추출 건너뛰기
-        if "news.google.com" in news_url or "google.com/read" in news_url:
-            return "뉴스 원문 보기를 통해 상세 내용을 확인해 주세요. (구글 뉴스 링크)"
+        """뉴스 본문 전체 추출 (다운로드는 현재 스레드, 파싱/정제는 워커 프로세스)"""
+        # 구글 뉴스 리다이렉트 URL은 원문 URL로 변환 (일괄 변환 결과는 캐시에서 바로 반환), 실패하면 건너뛰기
+        if is_google_news_url(news_url):
+            news_url = self.google_resolver.resolve(news_url)
+            if not news_url:
+                return "뉴스 원문 보기를 통해 상세 내용을 확인해 주세요. (구글 뉴스 링크)"
+
+        # 사전 수집 단계에서 이미 추출한 본문이 있으면 재다운로드하지 않음
+        if self.content_cache and news_url in self.content_cache:
+            return self.content_cache[news_url]
+
+        # 이전 실행(다른 키워드 포함)에서 실패한 페이지는 유형별 TTL 동안 다시 시도하지 않음
+        cached_failure = self.negative_cache.get(news_url)
+        if cached_failure:
+            if cached_failure.get('reason') == 'too_short':
+                # 제목만 추출되는 페이지는 처음 받은 짧은 본문을 그대로 사용 (같은 실행 안에서 결과가 달라지지 않도록)
+                return cached_failure.get('content', "")
+            self.logger.info(f"네거티브 캐시에 등록된 URL 건너뜀 ({cached_failure['reason']}): {news_url}")
+            return ""
+
+        # 본문 다운로드 예산이 소진되면 호출한 쪽에서 요약문/제목으로 대체
+        if not self.acquire_budget('bodies', label=news_url):
+            return ""
 
         try:
-            response = self.session.get(news_url, timeout=10)
+            response = self.session.fetch_limited(news_url, timeout=10, stop_markers=ARTICLE_STOP_MARKERS)
+            if response.rejected:
+                self.logger.info(f"본문 추출 제외 ({response.rejected}, {response.headers.get('Content-Type', '')}): {news_url}")
+                self.negative_cache.add(news_url, response.rejected, response.headers.get('Content-Type', ''), response.status_code)
+                return ""
             if response.status_code != 200:
+                self.negative_cache.add(news_url, reason_for_status(response.status_code), f"HTTP {response.status_code}", response.status_code)
                 return ""
             
-            # 인코딩 처리 (한글 깨짐 방지)
-            if response.encoding == 'ISO-8859-1':
-                response.encoding = response.apparent_encoding
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 1. 불필요한 요소 미리 제거 (전역)
-            noise_selectors = [
-                'script', 'style', 'header', 'footer', 'nav', 'aside',
-                '.ad', '.advertisement', '.banner', '.social', '.share',
-                '.related', '.recommend', '.popular', '.best',
-                '.comment', '.reply', '.tag', '.category',
-                '.footer-inner', '.header-inner', '.sidebar',
-                '#footer', '#header', '#sidebar', '#comments',
-                '.article-footer', '.article-header',
-                '.news_guide', '.news_copyright', '.news_related',
-                '.article_bottom', '.article_top',
-                '.img_desc', '.caption', '.vod_area', '.video_area'
-            ]
-            for selector in noise_selectors:
-                for elem in soup.select(selector):
-                    elem.decompose()
-            
-            # 2. 본문 선택자 (우선순위 순)
-            content_selectors = [
-                '#dic_area',  # 네이버 뉴스 (신규)
-                '#articleBodyContents',  # 네이버 뉴스 (기존)
-                '#articleBody',  # 네이버 뉴스
-                '.article_view',  # 다음 뉴스
-                '#harmonyContainer',  # 다음 뉴스
-                '.article_body',
-                '.article_content',
-                '.news_end',
-                '.article_body_contents',
-                '.article_text',
-                '.article',
-                '#article_body',
-                '#article_content',
-                '.content',
-                '.article-content',
-                '.news-content',
-                '.post-content',
-                '.entry-content',
-                'article',
-                '.text',
-                '.body',
-            ]
-            
-            content = ""
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    # 선택된 요소 내에서도 노이즈 다시 한번 제거
-                    for elem in content_elem.select('.ad, .advertisement, .banner, .related'):
-                        elem.decompose()
-                    
-                    raw_text = content_elem.get_text(separator='\n', strip=True)
-                    cleaned_text = self.clean_news_content(raw_text)
-                    
-                    if len(cleaned_text) > 100:
-                        content = cleaned_text
-                        break
-            
-            # 3. 본문이 없거나 너무 짧으면 메타 태그에서 추출 (Fallback 1)
-            if not content or len(content) < 100:
-                meta_desc = ""
-                # og:description
-                og_desc = soup.select_one('meta[property="og:description"]')
-                if og_desc and og_desc.get('content'):
-                    meta_desc = og_desc.get('content')
-                
-                # description
-                if not meta_desc:
-                    desc = soup.select_one('meta[name="description"]')
-                    if desc and desc.get('content'):
-                        meta_desc = desc.get('content')
-                
-                if meta_desc and len(meta_desc) > 50:
-                    content = meta_desc
-                    self.logger.info(f"메타 태그에서 본문 대체 추출 ({len(content)}자)")
-
-            # 4. 그래도 없으면 p 태그들을 모두 긁어모음 (Fallback 2)
-            if not content or len(content) < 100:
-                paragraphs = soup.select('p')
-                p_text = "\n".join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 30])
-                p_text = self.clean_news_content(p_text)
-                
-                if len(p_text) > 100:
-                    content = p_text
-                    self.logger.info(f"p 태그 집합에서 본문 대체 추출 ({len(content)}자)")
-
-            # 5. 최후의 수단: 제목이라도 반환
-            if not content:
-                title_elem = soup.select_one('h1, .title, .headline')
-                title = title_elem.get_text(strip=True) if title_elem else ""
-                content = title
-
-            return content
-            
+            result = self.parse_pool.extract(response.content, news_url, self._get_response_encoding(response), want=('content',))
+            
+            # 종료 지점 이후에 실제 본문이 있는 페이지(목록형 티저 등)는 상한까지 다시 받아 재시도 (본문 예산 1건 추가 차감)
+            if (response.stopped_early and (len(result['content']) < 100 or result['content_source'] in ('meta', 'title'))
+                    and self.acquire_budget('bodies', label=f"{news_url} (전체 재요청)")):
+                response = self.session.fetch_limited(news_url, timeout=10)
+                if response.status_code == 200 and not response.rejected:
+                    result = self.parse_pool.extract(response.content, news_url, self._get_response_encoding(response), want=('content',))
+            content_source = result['content_source']
+            if content_source == 'meta':
+                self.logger.info(f"메타 태그에서 본문 대체 추출 ({len(result['content'])}자)")
+            elif content_source == 'paragraphs':
+                self.logger.info(f"p 태그 집합에서 본문 대체 추출 ({len(result['content'])}자)")
+            
+            # 제목만 추출되는 페이지는 키워드마다 다시 받지 않도록 기록 (이번 결과는 그대로 사용)
+            if len(result['content']) < 100:
+                self.negative_cache.add(news_url, 'too_short', f"{len(result['content'])}자 ({content_source})", response.status_code,
+                                        content=result['content'])
+            
+            return result['content']
+            
+        except ParseLimitError as e:
+            self.logger.warning(f"본문 추출 강제 중단 ({e.reason}): {news_url}")
+            self.negative_cache.add(news_url, e.reason, str(e))
+            return ""
         except Exception as e:
             self.logger.error(f"본문 추출 중 오류: {e}")
+            reason = reason_for_exception(e)
+            if reason:
+                self.negative_cache.add(news_url, reason, str(e))
             return ""
-    
+
     def get_real_news_links(self, keyword):
         """실제 뉴스 사이트에서 링크 수집 (간단한 버전)"""
         try:
             # 간단한 뉴스 검색 (실패해도 괜찮음)
             search_url = f"https://search.naver.com/search.naver?where=news&query={keyword}"
-            response = self.session.get(search_url, timeout=5)
+            response = self.session.fetch_limited(search_url, timeout=5)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -2158,10 +2211,23 @@ class WorkingNewsCollector:
         # 실패 시 빈 리스트 반환
         return []
     
+    def save_negative_cache(self):
+        """이번 실행에서 추가된 실패 URL 기록 저장"""
+        if getattr(self, 'negative_cache', None):
+            self.negative_cache.save()
+
     def close(self):
         """세션 정리"""
-        if self.session:
+        self.save_negative_cache()
+        if getattr(self, 'session', None):
+            self.session.log_stats()
             self.session.close()
+        if getattr(self, 'parse_pool', None):
+            self.parse_pool.close()
+    
+    def get_connection_stats(self):
+        """호스트별 HTTP keep-alive 재사용 통계"""
+        return self.session.get_stats()
     
     def search_keywords_parallel(self, keywords, max_articles_per_keyword=5):
         """병렬로 여러 키워드 검색"""
@@ -2367,7 +2433,7 @@ class WorkingNewsCollector:
             
             # 3. 실제 뉴스 페이지에서 날짜 추출
             try:
-                response = self.session.get(link, timeout=10)
+                response = self.session.fetch_limited(link, timeout=10, stop_markers=DATE_STOP_MARKERS)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
                     
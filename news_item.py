@@ -0,0 +1,262 @@
+"""
+뉴스 항목 모델 - __slots__ 기반으로 키별 dict 오버헤드 없이 저장하고,
+발행일(date 객체)과 정규화 URL은 처음 사용할 때 한 번만 계산한다.
+본문(full_content)은 body_store의 압축 저장소에 두고 해시만 참조한다.
+
+기존 코드가 dict처럼 다루던 방식(news['title'], news.get('priority', 999), news['source'] = ...)을
+그대로 지원하며, to_dict()/from_dict()는 아카이브·스테이징 파일과 손실 없이 변환된다.
+"""
+from collections.abc import MutableMapping
+from datetime import datetime
+from urllib.parse import urlparse, parse_qsl, urlencode
+
+from body_store import default_store
+
+_DATE_FORMATS = ('%Y-%m-%d', '%Y%m%d', '%Y.%m.%d')
+_TRACKING_PARAMS = ('fbclid', 'gclid', 'ref')
+
+
+def parse_news_date(value):
+    """뉴스 날짜 문자열을 date로 변환 (YYYY-MM-DD, YYYYMMDD, YYYY.MM.DD, 실패하면 None)"""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def canonicalize_url(url):
+    """URL 기반 중복 판정용 정규화 (스킴/www/모바일 서브도메인, 추적 파라미터, 프래그먼트 제거)"""
+    parsed = urlparse((url or '').strip())
+    host = (parsed.hostname or '').lower()
+    for prefix in ('www.', 'm.', 'mobile.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parsed.query)
+        if not key.lower().startswith('utm_') and key.lower() not in _TRACKING_PARAMS
+    ))
+    return f"{host}{parsed.path.rstrip('/')}" + (f"?{query}" if query else "")
+
+
+class NewsItem(MutableMapping):
+    """수집된 뉴스 1건
+
+    FIELDS에 없는 키는 _extra dict에 보관하고(필요할 때만 생성), 값이 설정되지 않은 필드는 키가 없는 것으로 취급한다.
+    비어 있지 않은 문자열 본문은 압축 저장소의 해시(_body_digest)로만 보관하고 읽을 때 압축을 푼다.
+    """
+
+    FIELDS = (
+        'title', 'link', 'press', 'date', 'content_preview', 'full_content', 'source',
+        'keyword', 'source_keyword', 'search_date', 'priority', 'category', 'topic',
+    )
+    __slots__ = tuple(field for field in FIELDS if field != 'full_content') + (
+        '_extra', '_published', '_canonical_link', '_body_digest', '_body_value',
+    )
+
+    _FIELD_SET = frozenset(FIELDS)
+    _UNSET = object()
+
+    def __init__(self, data=None, **kwargs):
+        self._extra = None
+        self._published = self._UNSET
+        self._canonical_link = None
+        self._body_digest = None
+        self._body_value = self._UNSET
+        if data:
+            self.update(data)
+        if kwargs:
+            self.update(kwargs)
+
+    def __del__(self):
+        try:
+            self._release_body()
+        except Exception:
+            pass
+
+    @classmethod
+    def from_dict(cls, data, bodies=None):
+        """dict(또는 이미 NewsItem)를 NewsItem으로 (NewsItem이면 그대로 반환)
+
+        Args:
+            bodies: to_dict(bodies)로 저장한 본문 ({해시: base64 압축 본문}), 항목의 full_content_ref를 복원
+        """
+        if isinstance(data, cls):
+            return data
+        ref = data.get('full_content_ref') if bodies else None
+        if ref is None or ref not in bodies:
+            return cls(data)
+        item = cls({key: value for key, value in data.items() if key != 'full_content_ref'})
+        item._set_body_ref(ref, default_store.import_bodies({ref: bodies[ref]})[ref])
+        return item
+
+    def to_dict(self, bodies=None):
+        """JSON 저장용 dict (from_dict와 손실 없이 왕복)
+
+        Args:
+            bodies: 주어지면 본문 대신 full_content_ref(해시)를 넣고 압축 본문을 bodies에 모음
+                    (같은 본문은 한 번만 저장)
+        """
+        data = dict(self.items())
+        if bodies is not None and self._body_digest is not None:
+            del data['full_content']
+            data['full_content_ref'] = self._body_digest
+            if self._body_digest not in bodies:
+                bodies.update(default_store.export([self._body_digest]))
+        return data
+
+    # --- 본문 (압축 저장소) ---
+
+    @property
+    def full_content(self):
+        if self._body_digest is not None:
+            return default_store.get(self._body_digest)
+        if self._body_value is self._UNSET:
+            raise AttributeError('full_content')
+        return self._body_value
+
+    @full_content.setter
+    def full_content(self, value):
+        self._release_body()
+        if isinstance(value, str) and value:
+            self._body_digest = default_store.put(value)
+        else:
+            self._body_value = value
+
+    @full_content.deleter
+    def full_content(self):
+        if self._body_digest is None and self._body_value is self._UNSET:
+            raise AttributeError('full_content')
+        self._release_body()
+
+    def _release_body(self):
+        if self._body_digest is not None:
+            default_store.release(self._body_digest)
+        self._body_digest = None
+        self._body_value = self._UNSET
+
+    def _set_body_ref(self, digest, compressed):
+        self._release_body()
+        self._body_digest = default_store.put_compressed(digest, compressed)
+
+    @property
+    def body_digest(self):
+        """본문 해시 (압축 저장소에 없는 본문이면 None)"""
+        return self._body_digest
+
+    def body_preview(self, chars):
+        """본문 앞부분 (필요한 만큼만 압축 해제, 본문이 없으면 빈 문자열)"""
+        if self._body_digest is not None:
+            return default_store.get_prefix(self._body_digest, chars) or ''
+        value = self._body_value
+        return value[:chars] if isinstance(value, str) else ''
+
+    # --- 한 번만 계산하는 파생 값 ---
+
+    @property
+    def published(self):
+        """발행일 (date 객체, 날짜가 없거나 형식이 맞지 않으면 None)"""
+        if self._published is self._UNSET:
+            self._published = parse_news_date(self.get('date'))
+        return self._published
+
+    @property
+    def canonical_link(self):
+        """중복 판정용 정규화 URL"""
+        if self._canonical_link is None:
+            self._canonical_link = canonicalize_url(self.get('link', ''))
+        return self._canonical_link
+
+    # --- dict 호환 인터페이스 ---
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+            if key == 'date':
+                self._published = self._UNSET
+            elif key == 'link':
+                self._canonical_link = None
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            self._published = self._UNSET
+            self._canonical_link = None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def _has_field(self, field):
+        # 본문은 압축을 풀지 않고 설정 여부만 확인
+        if field == 'full_content':
+            return self._body_digest is not None or self._body_value is not self._UNSET
+        return hasattr(self, field)
+
+    def __iter__(self):
+        for field in self.FIELDS:
+            if self._has_field(field):
+                yield field
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        if key in self._FIELD_SET:
+            return self._has_field(key)
+        return self._extra is not None and key in self._extra
+
+    def copy(self):
+        item = NewsItem({key: value for key, value in self.items() if key != 'full_content'})
+        if self._body_digest is not None:
+            # 본문은 압축 해제 없이 같은 해시를 참조
+            item._set_body_ref(self._body_digest, default_store.get_compressed(self._body_digest))
+        elif self._body_value is not self._UNSET:
+            item._body_value = self._body_value
+        return item
+
+    def __repr__(self):
+        return f"NewsItem({self.get('title', '')[:30]!r}, {self.get('link', '')!r})"
+
+
+def to_news_items(news_list):
+    """dict 목록을 NewsItem 목록으로 (이미 NewsItem인 항목은 그대로)"""
+    return [NewsItem.from_dict(news) for news in news_list]
+
+
+def to_dicts(news_list, bodies=None):
+    """NewsItem/dict 목록을 JSON 저장용 dict 목록으로 (bodies가 주어지면 본문은 해시 참조로, to_dict 참고)"""
+    if bodies is None:
+        return [news.to_dict() if isinstance(news, NewsItem) else news for news in news_list]
+    return [NewsItem.from_dict(news).to_dict(bodies) for news in news_list]
+
+
+def body_preview(news, chars):
+    """요약기 입력용 본문 앞부분 (NewsItem은 필요한 만큼만 압축 해제)"""
+    if isinstance(news, NewsItem):
+        return news.body_preview(chars)
+    return (news.get('full_content') or '')[:chars]
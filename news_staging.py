@@ -0,0 +1,241 @@
+import os
+import re
+import json
+import logging
+from datetime import datetime, timedelta
+from threading import Lock
+from dotenv import load_dotenv
+
+from logging_config import setup_utf8_logging
+
+
+class NewsStagingStore:
+    """사전 수집된 뉴스 후보를 발송 대상 날짜별로 적재하는 로컬 스테이징 저장소
+
+    파일 구조: {base_dir}/staging_{대상날짜}.json
+        {
+            "target_date": "20260118",
+            "updated_at": "...",
+            "keywords": {
+                "키워드": {"last_collected": "ISO 시각", "items": [뉴스 dict, ...]}
+            }
+        }
+    """
+
+    def __init__(self, base_dir=None, retention_days=None):
+        load_dotenv()
+        self.base_dir = base_dir or os.getenv('PRECOLLECT_STAGING_DIR', os.path.join('cache', 'staging'))
+        self.retention_days = retention_days if retention_days is not None else int(os.getenv('PRECOLLECT_RETENTION_DAYS', '3'))
+        self.lock = Lock()
+        self.setup_logging()
+        os.makedirs(self.base_dir, exist_ok=True)
+
+    def setup_logging(self):
+        """로깅 설정"""
+        self.logger = setup_utf8_logging(
+            logger_name=__name__,
+            log_file='newsletter.log',
+            level=logging.INFO
+        )
+
+    def _get_path(self, target_date):
+        """대상 날짜(범위 포함)에 해당하는 스테이징 파일 경로"""
+        safe_key = re.sub(r'[^0-9A-Za-z]+', '_', str(target_date)).strip('_')
+        return os.path.join(self.base_dir, f"staging_{safe_key}.json")
+
+    @staticmethod
+    def _normalize_title(title):
+        """중복 판정용 제목 정규화 (공백/특수문자 제거, 소문자)"""
+        return re.sub(r'[\W_]+', '', (title or '')).lower()
+
+    def load(self, target_date):
+        """대상 날짜의 스테이징 데이터 로드 (없거나 손상되면 빈 구조 반환)"""
+        path = self._get_path(target_date)
+        empty = {"target_date": target_date, "updated_at": None, "keywords": {}}
+        if not os.path.exists(path):
+            return empty
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            data.setdefault("keywords", {})
+            return data
+        except Exception as e:
+            self.logger.warning(f"스테이징 파일 로드 실패, 새로 시작: {path} ({e})")
+            return empty
+
+    def _save(self, target_date, data):
+        """임시 파일에 쓴 뒤 교체하여 수집 도중 중단되어도 기존 파일이 깨지지 않도록 저장"""
+        path = self._get_path(target_date)
+        tmp_path = path + '.tmp'
+        data["updated_at"] = datetime.now().isoformat()
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def append(self, target_date, keyword, news_list, collected_at=None):
+        """키워드의 새 후보를 중복 제거 후 적재
+
+        Returns:
+            int: 새로 추가된 뉴스 개수
+        """
+        collected_at = collected_at or datetime.now()
+        with self.lock:
+            data = self.load(target_date)
+            entry = data["keywords"].setdefault(keyword, {"last_collected": None, "items": []})
+
+            seen_links = {item.get('link') for item in entry["items"] if item.get('link')}
+            seen_titles = {self._normalize_title(item.get('title')) for item in entry["items"]}
+
+            added = 0
+            for news in news_list or []:
+                link = news.get('link')
+                norm_title = self._normalize_title(news.get('title'))
+                if not norm_title:
+                    continue
+                if (link and link in seen_links) or norm_title in seen_titles:
+                    continue
+                staged = dict(news)
+                staged['staged_at'] = collected_at.isoformat()
+                entry["items"].append(staged)
+                if link:
+                    seen_links.add(link)
+                seen_titles.add(norm_title)
+                added += 1
+
+            entry["last_collected"] = collected_at.isoformat()
+            self._save(target_date, data)
+
+        self.logger.info(f"스테이징 적재: '{keyword}' ({target_date}) 신규 {added}개, 누적 {len(entry['items'])}개")
+        return added
+
+    def get_items(self, target_date, keyword):
+        """키워드의 적재된 뉴스 목록과 마지막 수집 시각 반환"""
+        entry = self.load(target_date)["keywords"].get(keyword)
+        if not entry:
+            return [], None
+        last_collected = None
+        if entry.get("last_collected"):
+            try:
+                last_collected = datetime.fromisoformat(entry["last_collected"])
+            except ValueError:
+                last_collected = None
+        return entry.get("items", []), last_collected
+
+    def get_content_map(self, target_date):
+        """링크 -> 본문 매핑 (탑업 수집 시 본문 재다운로드 방지용)"""
+        content_map = {}
+        for entry in self.load(target_date)["keywords"].values():
+            for item in entry.get("items", []):
+                link = item.get('link')
+                content = item.get('full_content')
+                if link and content:
+                    content_map[link] = content
+        return content_map
+
+    def cleanup_old(self, now=None):
+        """보존 기간이 지난 스테이징 파일 삭제"""
+        now = now or datetime.now()
+        cutoff = now - timedelta(days=self.retention_days)
+        removed = 0
+        try:
+            for name in os.listdir(self.base_dir):
+                if not name.startswith('staging_') or not name.endswith('.json'):
+                    continue
+                path = os.path.join(self.base_dir, name)
+                if datetime.fromtimestamp(os.path.getmtime(path)) < cutoff:
+                    os.remove(path)
+                    removed += 1
+        except Exception as e:
+            self.logger.warning(f"오래된 스테이징 파일 정리 중 오류: {e}")
+        if removed:
+            self.logger.info(f"오래된 스테이징 파일 {removed}개 삭제")
+        return removed
+
+
+class NewsPreCollector:
+    """발송 전날~새벽 동안 주기적으로 뉴스를 미리 수집하여 스테이징 저장소에 적재
+
+    09:00 발송 작업은 최근 몇 시간만 탑업 수집하고 선별/요약만 수행하도록 하여
+    크롤링 지연을 발송 경로에서 분리한다.
+    """
+
+    def __init__(self, news_collector=None, keyword_manager=None, staging_store=None):
+        load_dotenv()
+        self.setup_logging()
+        self._news_collector = news_collector
+        self._keyword_manager = keyword_manager
+        self.staging_store = staging_store or NewsStagingStore()
+        self.send_time = os.getenv('NEWSLETTER_SEND_TIME', '09:00')
+        self.fetch_count = int(os.getenv('PRECOLLECT_FETCH_COUNT', '20'))
+
+    def setup_logging(self):
+        """로깅 설정"""
+        self.logger = setup_utf8_logging(
+            logger_name=__name__,
+            log_file='newsletter.log',
+            level=logging.INFO
+        )
+
+    @property
+    def news_collector(self):
+        if self._news_collector is None:
+            from news_collector_working import WorkingNewsCollector
+            self._news_collector = WorkingNewsCollector()
+            self._news_collector.keyword_manager = self.keyword_manager
+        return self._news_collector
+
+    @property
+    def keyword_manager(self):
+        if self._keyword_manager is None:
+            from keyword_manager import KeywordManager
+            self._keyword_manager = KeywordManager()
+        return self._keyword_manager
+
+    def get_next_send_time(self, now=None):
+        """다음 발송 시각 계산 (오늘 발송 시각이 지났으면 내일)"""
+        now = now or datetime.now()
+        hour, minute = (int(x) for x in self.send_time.split(':'))
+        send_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if now >= send_time:
+            send_time += timedelta(days=1)
+        return send_time
+
+    def get_next_target_date(self, now=None):
+        """다음 발송 회차가 수집할 대상 날짜 (월요일 발송은 토~일)"""
+        return self.news_collector.get_target_search_date(base_time=self.get_next_send_time(now))
+
+    def run_once(self, now=None):
+        """모든 키워드에 대해 1회 증분 수집 후 스테이징에 적재
+
+        Returns:
+            int: 새로 적재된 뉴스 총 개수
+        """
+        target_date = self.get_next_target_date(now)
+        self.logger.info(f"사전 수집 시작 (다음 발송 대상 날짜: {target_date})")
+
+        # 이미 적재된 본문은 다시 다운로드하지 않음
+        self.news_collector.content_cache = self.staging_store.get_content_map(target_date)
+
+        total_added = 0
+        try:
+            topics = self.keyword_manager.get_weighted_topics()
+            # OR 검색을 지원하는 소스는 키워드를 묶어 한 번에 검색
+            self.news_collector.plan_keyword_queries(
+                [keyword for topic in topics for keyword in topic.get("keywords", [])], self.fetch_count, target_date
+            )
+            for topic in topics:
+                for keyword in topic.get("keywords", []):
+                    try:
+                        news_list = self.news_collector.search_naver_news_with_retry(keyword, self.fetch_count, target_date)
+                        total_added += self.staging_store.append(target_date, keyword, news_list)
+                    except Exception as e:
+                        self.logger.error(f"키워드 '{keyword}' 사전 수집 중 오류: {e}")
+                        continue
+        finally:
+            self.news_collector.content_cache = None
+            self.news_collector.clear_planned_queries()
+            self.news_collector.save_negative_cache()
+
+        self.staging_store.cleanup_old(now)
+        self.logger.info(f"사전 수집 완료: 신규 {total_added}개 적재")
+        return total_added
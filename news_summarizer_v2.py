@@ -1,14 +1,88 @@
-import google.generativeai as genai
 import os
+import re
+import time
 from dotenv import load_dotenv
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+from fetch_budget import estimate_tokens
+from news_item import body_preview
+from llm_cache import LLMResponseCache, make_cache_key
+from llm_client import get_default_client
+from prompt_packer import pack_news
+from relevance_index import BM25Index, select_relevant
+from structured_summary import SECTION_KEYS, summary_response_schema, StreamingSummaryParser, parse_structured_summary
+
+# google.generativeai는 import 비용이 커서 setup_gemini() 시점에 로드
+genai = None
+
+def _load_genai():
+    """google.generativeai 모듈을 최초 1회 로드"""
+    global genai
+    if genai is None:
+        import google.generativeai as _genai
+        genai = _genai
+    return genai
+
+# 뉴스레터 섹션 (generate_newsletter_content_v3가 파싱하는 헤더 순서) - 섹션명, 카테고리 설명
+NEWSLETTER_SECTIONS = {
+    'TECH': ('Technology Trends', '기술 트렌드, 인프라, 보안 관련'),
+    'AI': ('AI Insight', 'AI 모델, 서비스, 투자 관련 (단순 제목 반복 금지, 심층 요약 필수)'),
+    'BIZ': ('Travel & Business', '여행 산업, 플랫폼, 비즈니스 전략 관련'),
+}
+SECTION_BY_CATEGORY = {
+    'IT': 'TECH', 'Technology Trends': 'TECH',
+    'AI': 'AI', 'AI Insight': 'AI',
+    '여행': 'BIZ', 'Travel & Business': 'BIZ',
+}
+# 카테고리별 응답에서 제거할 섹션 헤더 (다른 섹션으로 잘못 파싱되지 않도록)
+_SECTION_HEADER_PATTERN = re.compile(r'\[(?:Executive Summary|TECH|AI|BIZ|In Other News)\]')
+
+
+def merge_section_outputs(executive_summary, section_outputs):
+    """카테고리별 응답을 통합 요약과 같은 구조로 합침 (섹션 순서는 완료 순서와 무관하게 TECH, AI, BIZ)"""
+    def strip_headers(text):
+        lines = [line for line in (text or '').strip().split('\n') if not _SECTION_HEADER_PATTERN.search(line)]
+        return "\n".join(lines).strip()
+
+    blocks = [f"[Executive Summary]\n{strip_headers(executive_summary)}"]
+    for section in NEWSLETTER_SECTIONS:
+        text = section_outputs.get(section)
+        if text:
+            blocks.append(f"[{section}]\n{strip_headers(text)}")
+    return "\n\n".join(blocks)
+
 
 class NewsSummarizerV2:
     def __init__(self):
         load_dotenv()
+        self.run_budget = None  # 실행 예산 (카테고리별 LLM 입력 토큰 상한), NewsletterSystem에서 주입
+        # 전체 요약 방식 (single: 1회 통합 호출, parallel: 카테고리별 동시 호출 후 병합)
+        self.summary_mode = os.getenv('SUMMARY_MODE', 'single').lower()
+        # 통합 요약 응답 형식 (json: 스키마 강제 JSON, 실패 시 text로 재요청 / text: 기존 텍스트 형식)
+        self.summary_output = os.getenv('SUMMARY_OUTPUT', 'json').lower()
+        # JSON 요약을 스트리밍으로 받아 카드가 완성되는 대로 전달 (MAX_TOKENS로 끊겨도 완성된 카드는 사용)
+        self.summary_stream = os.getenv('SUMMARY_STREAM', 'false').lower() in ('true', '1', 'yes', 'on')
+        self.last_call_metrics = []  # 마지막 전체 요약의 호출별 소요 시간/토큰 (로그·테스트용)
+        # 전체 요약 입력 패킹 (카테고리별 입력 토큰 예산, 최대 기사 수, 발췌 길이 범위)
+        self.prompt_budget_tokens = int(os.getenv('PROMPT_CATEGORY_INPUT_TOKENS', '6000'))
+        self.prompt_max_items = int(os.getenv('PROMPT_MAX_ITEMS_PER_CATEGORY', '15'))
+        self.prompt_excerpt_chars = (
+            int(os.getenv('PROMPT_EXCERPT_MIN_CHARS', '200')),
+            int(os.getenv('PROMPT_EXCERPT_MAX_CHARS', '1500')),
+        )
+        # 기사 본문을 핵심 문장 N개로 압축하여 발췌 (0이면 본문 앞부분 사용)
+        self.prompt_condense_sentences = int(os.getenv('PROMPT_CONDENSE_SENTENCES', '5'))
+        self.last_manifest = {}  # 마지막 전체 요약의 ID -> 기사 (generate_newsletter_content_v3의 ID 기반 링크 복원용)
+        # 카테고리(주제명) -> 키워드 목록, NewsletterSystem에서 주입 (없으면 기사의 검색 키워드 사용)
+        self.topic_keywords = {}
+        # BM25 관련도가 카테고리 최고 점수의 이 비율 미만인 기사는 프롬프트에서 제외
+        self.relevance_min_ratio = float(os.getenv('RELEVANCE_MIN_RATIO', '0.1'))
         self.setup_logging()
         self.setup_gemini()
+        self.llm_cache = LLMResponseCache()
+        self.llm_client = get_default_client()  # 주간 큐레이터 등 같은 프로세스의 다른 요약기와 한도 공유
 
     def setup_logging(self):
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -22,10 +96,153 @@ class NewsSummarizerV2:
             raise ValueError("GEMINI_API_KEY가 .env 파일에 설정되지 않았습니다.")
 
         # Gemini API 설정
+        _load_genai()
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel(model_name)
+        self.model_name = model_name
         self.logger.info(f"Gemini API 초기화 완료 (모델: {model_name})")
+
+    def _generate_text(self, prompt, generation_config, label):
+        """Gemini 호출 후 응답 텍스트 반환 (응답 없음/비정상 종료/빈 응답이면 None)
+
+        (모델명, 생성 설정, 프롬프트)가 같은 정상 완료 응답은 LLM 응답 캐시에서 바로 반환한다.
+        MAX_TOKENS로 잘린 응답은 그대로 사용하되 캐시에 저장하지 않는다.
+
+        Args:
+            generation_config: GenerationConfig 인자 dict (캐시 키에 포함)
+            label: 로그용 호출 구분 (예: "주제: AI Insight")
+        """
+        cache_key = make_cache_key(self.model_name, generation_config, prompt)
+        cached = self.llm_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"LLM 응답 캐시 사용 ({label}, {len(cached['text'])}자)")
+            return cached['text']
+
+        # 동시 실행 수/RPM/TPM 제한과 429·5xx 재시도는 공유 LLM 클라이언트가 처리
+        response = self.llm_client.call(
+            lambda: self.model.generate_content(
+                prompt,
+                generation_config=genai.types.GenerationConfig(**generation_config)
+            ),
+            label, input_tokens=estimate_tokens(prompt)
+        )
+
+        # 응답 상태 확인
+        if not response.candidates:
+            self.logger.error(f"Gemini API 응답 없음 ({label})")
+            return None
+
+        # Safety rating 확인
+        candidate = response.candidates[0]
+        finish_reason = None
+        if hasattr(candidate, 'finish_reason'):
+            finish_reason = int(candidate.finish_reason)
+            self.logger.info(f"Gemini 응답 finish_reason: {candidate.finish_reason}")
+            # 1 = STOP (정상 완료), 2 = MAX_TOKENS (토큰 한계, 부분 응답 사용 가능)
+            if finish_reason not in [1, 2]:
+                self.logger.error(f"Gemini 응답이 비정상 종료됨 ({label}): {candidate.finish_reason}")
+                if hasattr(candidate, 'safety_ratings'):
+                    self.logger.error(f"Safety ratings: {candidate.safety_ratings}")
+                return None
+            elif finish_reason == 2:
+                self.logger.warning(f"Gemini 응답이 토큰 한계로 잘렸습니다 ({label}, MAX_TOKENS). 부분 응답 사용.")
+
+        try:
+            result = response.text.strip()
+        except ValueError as ve:
+            self.logger.warning(f"response.text 접근 실패: {ve}, parts에서 추출 시도")
+            parts = []
+            if response.candidates:
+                for part in response.candidates[0].content.parts:
+                    if hasattr(part, 'text'):
+                        parts.append(part.text)
+            result = "".join(parts).strip()
+
+        if not result:
+            self.logger.error(f"Gemini API 응답이 비어있음 ({label})")
+            return None
+
+        if finish_reason in (None, 1):
+            self.llm_cache.put(cache_key, self.model_name, result, finish_reason)
+        return result
         
+    def _generate_stream(self, prompt, generation_config, label, on_text):
+        """Gemini 스트리밍 호출 - 응답 조각을 받는 대로 on_text(조각)에 넘기고 전체 텍스트 반환
+
+        캐시 적중 시 저장된 응답을 한 번에 넘긴다. MAX_TOKENS로 끊겨도 받은 부분까지 반환하며
+        (캐시에는 저장하지 않음), 스트림 도중 예외가 나면 그대로 전파한다 (받은 조각은 이미 on_text로 전달됨).
+        """
+        cache_key = make_cache_key(self.model_name, generation_config, prompt)
+        cached = self.llm_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"LLM 응답 캐시 사용 ({label}, {len(cached['text'])}자)")
+            on_text(cached['text'])
+            return cached['text']
+
+        chunks = []
+
+        def consume():
+            response = self.model.generate_content(
+                prompt,
+                generation_config=genai.types.GenerationConfig(**generation_config),
+                stream=True
+            )
+            finish_reason = None
+            for chunk in response:
+                if chunk.candidates and getattr(chunk.candidates[0], 'finish_reason', None):
+                    finish_reason = int(chunk.candidates[0].finish_reason)
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # 텍스트 없는 조각 (종료 신호 등)
+                    text = "".join(getattr(part, 'text', '') for part in chunk.candidates[0].content.parts) if chunk.candidates else ""
+                if text:
+                    chunks.append(text)
+                    on_text(text)
+            return finish_reason
+
+        # 조각을 하나라도 넘긴 뒤에는 재시도하지 않음 (같은 카드가 두 번 전달되지 않도록)
+        finish_reason = self.llm_client.call(
+            consume, label, input_tokens=estimate_tokens(prompt),
+            output_tokens=lambda _: estimate_tokens("".join(chunks)), can_retry=lambda: not chunks
+        )
+        result = "".join(chunks).strip()
+        self.logger.info(f"Gemini 스트리밍 응답 finish_reason: {finish_reason} ({label}, {len(result)}자)")
+        if finish_reason not in (None, 1, 2):
+            self.logger.error(f"Gemini 응답이 비정상 종료됨 ({label}): {finish_reason}")
+            return None
+        if finish_reason == 2:
+            self.logger.warning(f"Gemini 응답이 토큰 한계로 잘렸습니다 ({label}, MAX_TOKENS). 완성된 부분만 사용.")
+        if not result:
+            self.logger.error(f"Gemini API 응답이 비어있음 ({label})")
+            return None
+
+        if finish_reason in (None, 1):
+            self.llm_cache.put(cache_key, self.model_name, result, finish_reason)
+        return result
+
+    def select_news_within_budget(self, news_list, category):
+        """카테고리의 LLM 입력 토큰 배분량 안에 들어가는 기사만 순서대로 선택 (예산이 없으면 그대로)"""
+        if self.run_budget is None:
+            return news_list
+        allowance = self.run_budget.topic_allowance('llm_tokens', category)
+        if allowance is None:
+            return news_list
+
+        selected = []
+        used_tokens = 0
+        for news in news_list:
+            content = body_preview(news, 1000) or news.get('content_preview', '')
+            tokens = estimate_tokens(f"제목: {news.get('title', '')}\n링크: {news.get('link', '')}\n본문: {content[:1000]}\n\n")
+            if used_tokens + tokens > allowance or not self.run_budget.try_acquire('llm_tokens', amount=tokens):
+                break
+            selected.append(news)
+            used_tokens += tokens
+
+        if len(selected) < len(news_list):
+            self.logger.warning(f"카테고리 '{category}': 토큰 예산({allowance})으로 {len(news_list)}개 중 {len(selected)}개만 선택 (약 {used_tokens}토큰)")
+        return selected
+
     def summarize_topic_with_persona(self, news_list, topic_name):
         """사용자 정의 페르소나 프롬프트를 사용하여 주제별 뉴스 요약"""
         if not news_list:
@@ -50,6 +267,7 @@ class NewsSummarizerV2:
                 
             filtered_news_list.append(news)
             
+        filtered_news_list = self.select_news_within_budget(filtered_news_list, topic_name)
         if not filtered_news_list:
             self.logger.warning(f"주제 '{topic_name}'에 유효한 뉴스(한글)가 없습니다.")
             return None
@@ -61,7 +279,7 @@ class NewsSummarizerV2:
             news_input_text += f"제목: {news['title']}\n"
             news_input_text += f"링크: {news['link']}\n"
             # 본문은 너무 길면 자름 (토큰 제한 고려)
-            content = news.get('full_content', '')
+            content = body_preview(news, 1000)
             if not content:
                 content = news.get('content_preview', '')
             news_input_text += f"본문: {content[:1000]}\n\n"
@@ -73,8 +291,6 @@ class NewsSummarizerV2:
             prompt_path = os.path.join(os.path.dirname(__file__), 'prompts', 'newsletter_prompt.md')
             with open(prompt_path, 'r', encoding='utf-8') as f:
                 system_prompt_template = f.read()
-        except Exception as e:
-            self.logger.error(f"프롬프트 파일 로드 실패: {e}")
         except Exception as e:
             self.logger.error(f"프롬프트 파일 로드 실패: {e}")
             return None
@@ -96,46 +312,13 @@ class NewsSummarizerV2:
 
 {prompt}"""
 
-            # Gemini API 호출
-            response = self.model.generate_content(
+            # Gemini API 호출 (같은 입력이면 캐시된 응답 사용)
+            result = self._generate_text(
                 full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=4000,
-                    temperature=0.5,
-                )
+                {'max_output_tokens': 4000, 'temperature': 0.5},
+                f"주제: {topic_name}"
             )
-
-            # 응답 상태 확인
-            if not response.candidates:
-                self.logger.error(f"Gemini API 응답 없음 (주제: {topic_name})")
-                return None
-
-            # Safety rating 확인
-            candidate = response.candidates[0]
-            if hasattr(candidate, 'finish_reason'):
-                self.logger.info(f"Gemini 응답 finish_reason: {candidate.finish_reason}")
-                # 1 = STOP (정상 완료), 2 = MAX_TOKENS (토큰 한계, 부분 응답 사용 가능)
-                if candidate.finish_reason not in [1, 2]:
-                    self.logger.error(f"Gemini 응답이 비정상 종료됨 (주제: {topic_name}): {candidate.finish_reason}")
-                    if hasattr(candidate, 'safety_ratings'):
-                        self.logger.error(f"Safety ratings: {candidate.safety_ratings}")
-                    return None
-                elif candidate.finish_reason == 2:
-                    self.logger.warning(f"Gemini 응답이 토큰 한계로 잘렸습니다 (주제: {topic_name}, MAX_TOKENS). 부분 응답 사용.")
-
-            try:
-                result = response.text.strip()
-            except ValueError as ve:
-                self.logger.warning(f"response.text 접근 실패: {ve}, parts에서 추출 시도")
-                parts = []
-                if response.candidates:
-                    for part in response.candidates[0].content.parts:
-                        if hasattr(part, 'text'):
-                            parts.append(part.text)
-                result = "".join(parts).strip()
-
             if not result:
-                self.logger.error(f"Gemini API 응답이 비어있음 (주제: {topic_name})")
                 return None
 
             # 결과 텍스트 정제 (끝부분의 불필요한 기호 제거)
@@ -152,42 +335,120 @@ class NewsSummarizerV2:
             self.logger.error(traceback.format_exc())
             return f"요약 생성 실패: {e}"
 
-    def summarize_all_news(self, all_news_list):
-        """전체 뉴스를 대상으로 새로운 템플릿 프롬프트를 사용하여 요약"""
-        if not all_news_list:
-            return None
+    def _pack_prompt_news(self, all_news_list):
+        """카테고리별로 그룹핑하고 입력 토큰 예산 안에서 기사와 발췌 길이 선택 (BM25 관련도·최신성 순)
+
+        주제 키워드 BM25 점수가 0이거나 카테고리 최고 점수의 RELEVANCE_MIN_RATIO 미만인 기사는 먼저 제외한다.
+
+        카테고리 예산은 PROMPT_CATEGORY_INPUT_TOKENS와 실행 예산(llm_tokens) 배분량 중 작은 값.
+        선택 결과의 ID -> 기사는 last_manifest에 저장한다.
 
-        # 토큰 한계 고려: 카테고리별로 그룹핑하고 각 카테고리에서 상위 15개만 선택
-        category_news = {}
-        for news in all_news_list:
+        Returns:
+            dict: {카테고리: [{'id', 'news', 'excerpt', 'tokens'}]} (all_news_list에 처음 나온 카테고리 순서,
+                  id는 카테고리 순서대로 이어지는 전체 순번)
+        """
+        category_indices = {}
+        for index, news in enumerate(all_news_list):
             category = news.get('category', 'Unknown')
-            if category not in category_news:
-                category_news[category] = []
-            category_news[category].append(news)
+            if category not in category_indices:
+                category_indices[category] = []
+            category_indices[category].append(index)
+
+        # 이번 실행에 수집된 전체 기사로 BM25 색인 (카테고리 간 IDF 공유)
+        relevance_index = BM25Index.from_news(all_news_list)
+
+        min_chars, max_chars = self.prompt_excerpt_chars
+        packed = {}
+        manifest = {}
+        for category, indices in category_indices.items():
+            keywords = self.topic_keywords.get(category) or {
+                all_news_list[i].get('source_keyword') or all_news_list[i].get('keyword') for i in indices
+            } - {None, ''}
+            kept, scores = select_relevant(relevance_index.scores(keywords, indices), self.relevance_min_ratio)
+            news_list = [all_news_list[indices[i]] for i in kept]
+            if len(kept) < len(indices):
+                self.logger.info(f"카테고리 '{category}': 키워드 관련도 미달 {len(indices) - len(kept)}개 제외")
+
+            budget = self.prompt_budget_tokens
+            allowance = self.run_budget.topic_allowance('llm_tokens', category) if self.run_budget is not None else None
+            if allowance is not None:
+                budget = min(budget, allowance) if budget > 0 else allowance
+            if allowance is not None and allowance <= 0:
+                entries, used = [], 0
+            else:
+                entries, used = pack_news(
+                    news_list, budget, self.prompt_max_items, min_chars, max_chars,
+                    scores=scores, condense_sentences=self.prompt_condense_sentences
+                )
+            if allowance is not None:
+                self.run_budget.try_acquire('llm_tokens', amount=used)
 
-        # 각 카테고리에서 최대 15개씩만 선택
-        limited_news_list = []
-        for category, news_list in category_news.items():
-            limited_news_list.extend(news_list[:15])
-            if len(news_list) > 15:
-                self.logger.warning(f"카테고리 '{category}': {len(news_list)}개 중 15개만 선택 (토큰 한계)")
+            for entry in entries:
+                entry['id'] = len(manifest) + 1
+                manifest[entry['id']] = entry['news']
+            packed[category] = entries
+            self.logger.info(f"카테고리 '{category}': {len(indices)}개 중 {len(entries)}개 선택 (약 {used}토큰, 예산 {budget or '제한 없음'})")
 
-        self.logger.info(f"전체 뉴스 {len(all_news_list)}개 중 {len(limited_news_list)}개를 Gemini에 전달")
+        self.last_manifest = manifest
+        return packed
 
-        # 뉴스 데이터 텍스트화
+    @staticmethod
+    def _format_news_input(entries):
+        """프롬프트용 뉴스 데이터 텍스트 ([번호]는 패킹 결과의 전체 순번 ID)"""
         news_input_text = ""
-        for i, news in enumerate(limited_news_list, 1):
-            news_input_text += f"[{i}]\n"
+        for entry in entries:
+            news = entry['news']
+            news_input_text += f"[{entry['id']}]\n"
             news_input_text += f"제목: {news.get('title', '')}\n"
             news_input_text += f"링크: {news.get('link', '')}\n"
-            content = news.get('full_content', '') or news.get('content_preview', '')
-            news_input_text += f"본문: {content[:1000]}\n\n"
+            news_input_text += f"본문: {entry['excerpt']}\n\n"
+        return news_input_text
+
+    def summarize_all_news(self, all_news_list, on_event=None):
+        """전체 뉴스를 대상으로 새로운 템플릿 프롬프트를 사용하여 요약
+
+        SUMMARY_MODE=parallel이면 카테고리별로 동시에 요약한 뒤 같은 섹션 구조로 병합한다.
+        통합 요약은 SUMMARY_OUTPUT=json(기본)이면 구조화 JSON 문자열(structured_summary), 아니면 섹션 텍스트를 반환한다.
+        SUMMARY_STREAM=true이면 JSON 응답을 스트리밍으로 받아 카드가 완성될 때마다 on_event(이벤트)를 호출한다
+        (이벤트 형식은 StreamingSummaryParser 참고, manifest는 호출 전에 last_manifest에 채워짐).
+        """
+        if not all_news_list:
+            return None
+
+        # 토큰 예산 고려: 카테고리별로 그룹핑하고 예산 안에서 기사·발췌 길이 선택
+        category_entries = self._pack_prompt_news(all_news_list)
+        packed_entries = [entry for entries in category_entries.values() for entry in entries]
+
+        self.logger.info(f"전체 뉴스 {len(all_news_list)}개 중 {len(packed_entries)}개를 Gemini에 전달")
+
+        if self.summary_mode == 'parallel':
+            unmapped = [category for category in category_entries if category not in SECTION_BY_CATEGORY]
+            if not unmapped:
+                return self.summarize_all_news_parallel(category_entries)
+            self.logger.warning(f"섹션이 정해지지 않은 카테고리 {unmapped}가 있어 통합 요약으로 진행")
+
+        self.last_call_metrics = []
+        if self.summary_output == 'json':
+            result = self._summarize_single(packed_entries, structured=True, on_event=on_event)
+            if result:
+                return result
+            self.logger.warning("구조화(JSON) 요약 실패, 텍스트 형식으로 다시 요청")
+        return self._summarize_single(packed_entries, structured=False)
+
+    def _summarize_single(self, packed_entries, structured=False, on_event=None):
+        """통합 요약 1회 호출
+
+        Args:
+            structured: True이면 JSON 스키마(summary_response_schema())로 응답을 받아 정리된 JSON 문자열 반환
+                        (응답이 스키마에 맞지 않으면 None)
+            on_event: 스트리밍 모드에서 완성된 카드/요약 이벤트를 받을 콜백
+        """
+        # 뉴스 데이터 텍스트화
+        news_input_text = self._format_news_input(packed_entries)
 
         # 프롬프트 파일 읽기
         try:
-            prompt_path = os.path.join(os.path.dirname(__file__), 'prompts', 'newsletter_template_prompt.md')
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                system_prompt_template = f.read()
+            system_prompt_template = self._load_prompt('newsletter_json_prompt.md' if structured else 'newsletter_template_prompt.md')
         except Exception as e:
             self.logger.error(f"프롬프트 파일 로드 실패: {e}")
             return None
@@ -199,53 +460,32 @@ class NewsSummarizerV2:
             self.logger.error(f"프롬프트 포맷팅 오류: {e}")
             return None
 
+        generation_config = {'max_output_tokens': 8000, 'temperature': 0.5}
+        if structured:
+            generation_config.update(response_mime_type='application/json', response_schema=summary_response_schema())
+
         try:
             # Gemini 프롬프트 구성 (system instruction + user prompt)
             full_prompt = f"""당신은 하나투어 IT본부의 전문 테크 에디터입니다.
 
 {prompt}"""
 
-            # Gemini API 호출
-            response = self.model.generate_content(
-                full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=8000,
-                    temperature=0.5,
-                )
-            )
+            if structured and self.summary_stream:
+                return self._summarize_stream(full_prompt, generation_config, on_event)
 
-            # 응답 상태 확인
-            if not response.candidates:
-                self.logger.error("Gemini API 응답 없음 (candidates 비어있음)")
+            # Gemini API 호출 (같은 입력이면 캐시된 응답 사용)
+            result = self._timed_generate(full_prompt, generation_config, "전체 요약 (JSON)" if structured else "전체 요약")
+            if not result:
                 return None
 
-            # Safety rating 확인
-            candidate = response.candidates[0]
-            if hasattr(candidate, 'finish_reason'):
-                self.logger.info(f"Gemini 응답 finish_reason: {candidate.finish_reason}")
-                # 1 = STOP (정상 완료), 2 = MAX_TOKENS (토큰 한계, 부분 응답 사용 가능)
-                if candidate.finish_reason not in [1, 2]:
-                    self.logger.error(f"Gemini 응답이 비정상 종료됨: {candidate.finish_reason}")
-                    if hasattr(candidate, 'safety_ratings'):
-                        self.logger.error(f"Safety ratings: {candidate.safety_ratings}")
+            if structured:
+                parsed = parse_structured_summary(result)
+                if parsed is None:
+                    self.logger.error(f"구조화 요약 응답이 JSON 스키마와 다름 (길이: {len(result)}자)")
                     return None
-                elif candidate.finish_reason == 2:
-                    self.logger.warning("Gemini 응답이 토큰 한계로 잘렸습니다 (MAX_TOKENS). 부분 응답 사용.")
-
-            try:
-                result = response.text.strip()
-            except ValueError as ve:
-                self.logger.warning(f"response.text 접근 실패: {ve}, parts에서 추출 시도")
-                parts = []
-                if response.candidates:
-                    for part in response.candidates[0].content.parts:
-                        if hasattr(part, 'text'):
-                            parts.append(part.text)
-                result = "".join(parts).strip()
-
-            if not result:
-                self.logger.error("Gemini API 응답이 비어있음")
-                return None
+                card_count = sum(len(parsed[section]) for section in SECTION_KEYS)
+                self.logger.info(f"전체 뉴스 구조화 요약 완료 (카드 {card_count}개)")
+                return json.dumps(parsed, ensure_ascii=False)
 
             # 결과 텍스트 정제 (끝부분의 불필요한 기호 제거)
             result = result.strip()
@@ -261,6 +501,128 @@ class NewsSummarizerV2:
             self.logger.error(traceback.format_exc())
             return None
 
+    def _summarize_stream(self, full_prompt, generation_config, on_event=None):
+        """구조화 요약 스트리밍 - 완성된 카드를 바로 on_event로 넘기고, 끝나면(끊겨도) 완성된 부분의 JSON 문자열 반환"""
+        parser = StreamingSummaryParser()
+        started = time.perf_counter()
+        first_card = {}
+
+        def on_text(text):
+            for event in parser.feed(text):
+                if event[0] == 'card' and not first_card:
+                    first_card['seconds'] = round(time.perf_counter() - started, 2)
+                if on_event is not None:
+                    on_event(event)
+
+        try:
+            self._timed_generate(full_prompt, generation_config, "전체 요약 (JSON 스트리밍)", on_text=on_text)
+        except Exception as e:
+            self.logger.error(f"스트리밍 요약 중단: {e} (완성된 카드까지 사용)")
+
+        parsed = parser.result()
+        if parsed is None:
+            self.logger.error("스트리밍 요약에서 완성된 카드가 없음")
+            return None
+        card_count = sum(len(parsed[section]) for section in SECTION_KEYS)
+        if self.last_call_metrics:
+            self.last_call_metrics[-1]['first_card_seconds'] = first_card.get('seconds')
+        self.logger.info(f"전체 뉴스 스트리밍 요약 완료 (카드 {card_count}개, 첫 카드 {first_card.get('seconds')}초)")
+        return json.dumps(parsed, ensure_ascii=False)
+
+    def _timed_generate(self, prompt, generation_config, label, on_text=None):
+        """_generate_text() (on_text를 주면 _generate_stream()) 호출 후 소요 시간과 입출력 토큰(추정)을 last_call_metrics에 기록"""
+        started = time.perf_counter()
+        previous_metric = self.llm_client.last_metric()
+        try:
+            if on_text is not None:
+                result = self._generate_stream(prompt, generation_config, label, on_text)
+            else:
+                result = self._generate_text(prompt, generation_config, label)
+        finally:
+            metrics = {
+                'label': label,
+                'seconds': round(time.perf_counter() - started, 2),
+                'input_tokens': estimate_tokens(prompt),
+                'output_tokens': 0,
+                'attempts': 0,
+                'wait_seconds': 0.0,
+            }
+            # 캐시 적중이면 클라이언트를 거치지 않으므로 이전 호출 기록과 구분
+            client_metric = self.llm_client.last_metric()
+            if client_metric is not None and client_metric is not previous_metric:
+                metrics['attempts'] = client_metric['attempts']
+                metrics['wait_seconds'] = client_metric['wait_seconds']
+            self.last_call_metrics.append(metrics)
+        metrics['output_tokens'] = estimate_tokens(result)
+        self.logger.info(
+            f"LLM 호출 ({label}): {metrics['seconds']}초, 입력 약 {metrics['input_tokens']}토큰, 출력 약 {metrics['output_tokens']}토큰"
+            f" (시도 {metrics['attempts']}회, 한도/재시도 대기 {metrics['wait_seconds']}초)"
+        )
+        return result
+
+    def _load_prompt(self, file_name):
+        prompt_path = os.path.join(os.path.dirname(__file__), 'prompts', file_name)
+        with open(prompt_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def summarize_all_news_parallel(self, category_entries):
+        """카테고리(섹션)별 카드 요약과 Executive Summary를 동시에 요청한 뒤 통합 요약과 같은 구조로 병합
+
+        뉴스 번호는 패킹 결과의 전체 순번 ID를 그대로 사용한다 (ID 기반 링크 복원이 그대로 동작).
+        """
+        try:
+            category_template = self._load_prompt('newsletter_category_prompt.md')
+            executive_template = self._load_prompt('newsletter_executive_prompt.md')
+        except Exception as e:
+            self.logger.error(f"프롬프트 파일 로드 실패: {e}")
+            return None
+
+        # 섹션별 입력 (같은 섹션으로 묶이는 카테고리는 한 요청으로)
+        section_inputs = {}
+        executive_input = ""
+        for category, entries in category_entries.items():
+            section = SECTION_BY_CATEGORY[category]
+            section_inputs[section] = section_inputs.get(section, "") + self._format_news_input(entries)
+            for entry in entries:
+                executive_input += f"[{section}] {entry['news'].get('title', '')}\n{entry['excerpt'][:200]}\n\n"
+
+        tasks = {}
+        for section, news_input_text in section_inputs.items():
+            section_title, section_description = NEWSLETTER_SECTIONS[section]
+            prompt = category_template.format(
+                section=section, section_title=section_title,
+                section_description=section_description, news_data=news_input_text
+            )
+            tasks[section] = (prompt, {'max_output_tokens': 3000, 'temperature': 0.5}, f"{section} 요약")
+        tasks['executive_summary'] = (
+            executive_template.format(news_data=executive_input),
+            {'max_output_tokens': 1000, 'temperature': 0.5},
+            "Executive Summary"
+        )
+
+        self.last_call_metrics = []
+        started = time.perf_counter()
+        outputs = {}
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {key: executor.submit(self._timed_generate, *task) for key, task in tasks.items()}
+            for key, future in futures.items():
+                try:
+                    outputs[key] = future.result()
+                except Exception as e:
+                    self.logger.error(f"카테고리별 요약 실패 ({key}): {e}")
+                    outputs[key] = None
+
+        executive_summary = outputs.pop('executive_summary', None)
+        if not any(outputs.values()):
+            self.logger.error("카테고리별 요약이 모두 실패했습니다.")
+            return None
+        result = merge_section_outputs(executive_summary, outputs)
+        self.logger.info(
+            f"카테고리별 동시 요약 완료 (길이: {len(result)}자, 전체 {time.perf_counter() - started:.1f}초, "
+            f"가장 긴 호출 {max(metric['seconds'] for metric in self.last_call_metrics)}초)"
+        )
+        return result
+
     def curate_weekly_top_10(self, weekly_news_list):
         """주간 뉴스 중 Top 10 선정 및 인사이트 생성"""
         try:
@@ -284,47 +646,18 @@ class NewsSummarizerV2:
             # 프롬프트 구성
             prompt = prompt_template.format(news_text=news_text)
             
-            # Gemini API 호출
-            response = self.model.generate_content(
+            # Gemini API 호출 (같은 입력이면 캐시된 응답 사용)
+            result_text = self._generate_text(
                 prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=5000,
-                    temperature=0.3
-                )
+                {'max_output_tokens': 5000, 'temperature': 0.3},
+                "주간 큐레이션"
             )
-            
-            # 응답 상태 확인
-            if not response.candidates:
-                self.logger.error("Gemini API 응답 없음 (주간 큐레이션)")
+            if not result_text:
                 return None
             
-            candidate = response.candidates[0]
-            if hasattr(candidate, 'finish_reason'):
-                self.logger.info(f"Gemini 응답 finish_reason: {candidate.finish_reason}")
-                if candidate.finish_reason not in [1, 2]:
-                    self.logger.error(f"Gemini 응답이 비정상 종료됨: {candidate.finish_reason}")
-                    return None
-                elif candidate.finish_reason == 2:
-                    self.logger.warning("Gemini 응답이 토큰 한계로 잘렸습니다 (MAX_TOKENS). 부분 응답 사용 시도.")
-            
-            try:
-                result_text = response.text.strip()
-            except ValueError as ve:
-                self.logger.warning(f"response.text 접근 실패: {ve}, parts에서 추출 시도")
-                parts = []
-                if response.candidates:
-                    for part in response.candidates[0].content.parts:
-                        if hasattr(part, 'text'):
-                            parts.append(part.text)
-                result_text = "".join(parts).strip()
-            
             self.logger.info(f"Gemini 응답 길이: {len(result_text)}자")
             self.logger.info(f"Gemini 응답 앞부분 (500자): {result_text[:500]}")
             
-            if not result_text:
-                self.logger.error("Gemini API 응답이 비어있음 (주간 큐레이션)")
-                return None
-            
             # 마크다운 코드 블록 제거
             if result_text.startswith("```json"):
                 result_text = result_text[7:]  # ```json 제거
@@ -2,7 +2,7 @@ import os
 import sys
 import time
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
 from windows_utf8 import setup_windows_utf8
@@ -11,11 +11,65 @@ from error_recovery import fallback_manager, robust_function
 
 # Windows UTF-8 설정
 setup_windows_utf8()
-from news_collector_working import WorkingNewsCollector
-from news_summarizer_v2 import NewsSummarizerV2
-from email_sender import EmailSender
 from keyword_manager import KeywordManager
-from archiver import Archiver
+from news_staging import NewsStagingStore
+from fetch_budget import RunBudget, KeywordYieldStats
+from news_item import to_dicts, to_news_items
+from body_store import default_store
+from article_summaries import ArticleSummaryStore
+from structured_summary import SECTION_KEYS, parse_structured_summary
+# 수집기/요약기/발송기/아카이버는 import 비용이 커서(bs4, requests, google.generativeai, smtplib)
+# 각 프로퍼티의 첫 사용 시점에 import 및 생성
+
+class StreamingCardRenderer:
+    """스트리밍 요약 이벤트(StreamingSummaryParser)를 받아 카드가 완성되는 즉시 HTML로 렌더링
+
+    참조 번호(전체 순번)가 TECH -> AI -> BIZ 순으로 이어지므로 앞 섹션이 모두 닫힌 섹션의 카드는 바로 렌더링하고,
+    그 전에 도착한 카드는 보관했다가 앞 섹션이 닫히는 순간 렌더링한다.
+    """
+
+    def __init__(self, system, fallback_news, manifest_source):
+        self.system = system
+        self.fallback_news = fallback_news
+        self.manifest_source = manifest_source  # ID -> 기사 (요약기가 패킹 후 채우므로 호출 시점에 조회)
+        self.pending = {section: [] for section in SECTION_KEYS}
+        self.closed = set()
+        self.states = {}
+        self.active = 0  # 지금 카드를 바로 렌더링하는 섹션 위치
+        self.started = time.perf_counter()
+
+    def __call__(self, event):
+        try:
+            if event[0] == 'card':
+                self.pending[event[1]].append(event[2])
+            elif event[0] == 'section_end':
+                self.closed.add(event[1])
+            self._advance()
+        except Exception as e:
+            self.system.logger.warning(f"스트리밍 카드 렌더링 오류: {e}")
+
+    def _advance(self, finish=False):
+        id_to_news = self.manifest_source() or {}
+        while self.active < len(SECTION_KEYS):
+            section = SECTION_KEYS[self.active]
+            state = self.states.get(section)
+            if state is None:
+                start_index = self.states[SECTION_KEYS[self.active - 1]]['global_index'] if self.active else 1
+                state = self.states[section] = self.system._structured_section_state(start_index)
+            for card in self.pending[section]:
+                self.system._add_structured_card_v3(state, card, section, id_to_news)
+            self.pending[section] = []
+            if section not in self.closed and not finish:
+                break
+            self.system._fill_structured_section_v3(state, section, self.fallback_news.get(section))
+            self.system.logger.info(f"[V3 스트리밍] {section} 섹션 렌더링 완료 (요약 요청 후 {time.perf_counter() - self.started:.1f}초)")
+            self.active += 1
+
+    def finish(self):
+        """스트림 종료(끊김 포함) 후 남은 섹션을 마무리하여 {섹션: (html, 아이템, 다음 번호)} 반환"""
+        self._advance(finish=True)
+        return {section: (state['html'], state['items'], state['global_index']) for section, state in self.states.items()}
+
 
 class NewsletterSystem:
     def __init__(self):
@@ -32,18 +86,96 @@ class NewsletterSystem:
         )
     
     def setup_components(self):
-        """시스템 컴포넌트 초기화"""
+        """시스템 컴포넌트 초기화 (가벼운 컴포넌트만 즉시 생성, 나머지는 첫 사용 시 생성)"""
         try:
             self.keyword_manager = KeywordManager()
-            self.news_collector = WorkingNewsCollector()
-            self.news_summarizer = NewsSummarizerV2() # V2 교체
-            self.email_sender = EmailSender()
-            self.archiver = Archiver()
-            self.logger.info("뉴스레터 시스템 컴포넌트 초기화 완료 (V2 적용)")
+            self.staging_store = NewsStagingStore()
+            self.keyword_yield = KeywordYieldStats()  # 키워드별 과거 수집량 (예산 배분 기준)
+            self.article_summaries = ArticleSummaryStore()  # 기사별 요약 (주간/월간 큐레이션 입력)
+            self.run_budget = None
+            self._news_collector = None
+            self._news_summarizer = None
+            self._email_sender = None
+            self._archiver = None
+            self.logger.info("뉴스레터 시스템 컴포넌트 초기화 완료 (V2 적용, 지연 생성)")
         except Exception as e:
             self.logger.error(f"컴포넌트 초기화 중 오류: {e}")
             raise
     
+    @property
+    def news_collector(self):
+        """뉴스 수집기 (첫 사용 시 생성)"""
+        if self._news_collector is None:
+            from news_collector_working import WorkingNewsCollector
+            self._news_collector = WorkingNewsCollector()
+            self._news_collector.keyword_manager = self.keyword_manager  # 키워드별 구글 뉴스 수집 방식
+            self.logger.info("뉴스 수집기 초기화 완료")
+        return self._news_collector
+    
+    @property
+    def news_summarizer(self):
+        """뉴스 요약기 V2 (첫 사용 시 생성)"""
+        if self._news_summarizer is None:
+            from news_summarizer_v2 import NewsSummarizerV2
+            self._news_summarizer = NewsSummarizerV2()
+            self.logger.info("뉴스 요약기 초기화 완료")
+        return self._news_summarizer
+    
+    @property
+    def email_sender(self):
+        """이메일 발송기 (첫 사용 시 생성)"""
+        if self._email_sender is None:
+            from email_sender import EmailSender
+            self._email_sender = EmailSender()
+            self.logger.info("이메일 발송기 초기화 완료")
+        return self._email_sender
+    
+    @property
+    def archiver(self):
+        """아카이버 (첫 사용 시 생성)"""
+        if self._archiver is None:
+            from archiver import Archiver
+            self._archiver = Archiver()
+            self.logger.info("아카이버 초기화 완료")
+        return self._archiver
+    
+    def start_run_budget(self, topics):
+        """이번 실행의 예산을 주제 비중과 키워드별 과거 수집량으로 배분하여 수집기에 적용"""
+        try:
+            self.run_budget = RunBudget.from_env(topics, self.keyword_yield)
+        except Exception as e:
+            self.logger.warning(f"실행 예산 배분 실패, 제한 없이 수집: {e}")
+            self.run_budget = None
+        self.news_collector.run_budget = self.run_budget
+        if self.run_budget is not None:
+            limited = {kind: total for kind, total in self.run_budget.totals.items() if total}
+            if limited:
+                self.logger.info(f"실행 예산: {limited}, 주제별 배분: {self.run_budget.topic_allocations}")
+
+    def finish_collection_budget(self):
+        """수집 단계 종료 - 키워드별 수집량·실패 URL 기록 저장, 수집기에서 예산 해제"""
+        self.keyword_yield.save()
+        self.news_collector.save_negative_cache()
+        self.news_collector.run_budget = None
+        if self.run_budget is not None:
+            self.logger.info(f"수집 단계 예산 사용량: {self.run_budget.summary()}")
+
+    def plan_news_queries(self, topics):
+        """이번 실행에서 검색할 키워드를 소스별로 묶어 미리 검색 (사전 수집분이 최신인 키워드는 제외)"""
+        try:
+            fresh_minutes = int(os.getenv('PRECOLLECT_FRESH_MINUTES', '60'))
+            target_date = self.news_collector.get_target_search_date()
+            keywords = []
+            for topic in topics:
+                for keyword in topic["keywords"]:
+                    staged_news, last_collected = self.staging_store.get_items(target_date, keyword)
+                    if staged_news and last_collected is not None and datetime.now() - last_collected < timedelta(minutes=fresh_minutes):
+                        continue
+                    keywords.append(keyword)
+            self.news_collector.plan_keyword_queries(keywords, 20, target_date)
+        except Exception as e:
+            self.logger.warning(f"검색 계획 수립 실패, 키워드별로 검색: {e}")
+
     @robust_function(max_attempts=3, delay=2.0, fallback_func=lambda self, topic: self._collect_news_fallback(topic))
     def collect_news_for_topic(self, topic):
         """특정 주제의 뉴스 수집 (키워드당 10개 고정)"""
@@ -58,15 +190,44 @@ class NewsletterSystem:
         
         all_news = []
         
+        # 사전 수집(스테이징)된 후보가 충분히 최신이면 탑업 검색을 생략
+        fresh_minutes = int(os.getenv('PRECOLLECT_FRESH_MINUTES', '60'))
+        
+        # 수집 대상 날짜 설정 (월요일은 토~일, 그 외는 전날) - 수집기 자체가 실패하면 재시도/Fallback으로 전달
+        target_date = self.news_collector.get_target_search_date()
+        self.logger.info(f"뉴스 수집 대상 날짜 범위: {target_date}")
+        
         for keyword in keywords:
             try:
                 self.logger.info(f"키워드 '{keyword}' 검색 중... (목표: {articles_per_keyword}개)")
-                # 수집 대상 날짜 설정 (월요일은 토~일, 그 외는 전날)
-                target_date = self.news_collector.get_target_search_date()
-                self.logger.info(f"뉴스 수집 대상 날짜 범위: {target_date}")
                 
-                # 넉넉하게 20개 요청 후 10개로 자름
-                news_list = self.news_collector.search_naver_news_with_retry(keyword, 20, target_date)
+                staged_news, last_collected = self.staging_store.get_items(target_date, keyword)
+                is_fresh = last_collected is not None and datetime.now() - last_collected < timedelta(minutes=fresh_minutes)
+                
+                if staged_news and is_fresh:
+                    self.logger.info(f"키워드 '{keyword}': 사전 수집분 {len(staged_news)}개 사용 (마지막 수집: {last_collected:%H:%M})")
+                    news_list = list(staged_news)
+                else:
+                    # 넉넉하게 20개(예산이 있으면 키워드 배분량) 요청 후 10개로 자름 (사전 수집된 본문은 재다운로드하지 않음)
+                    fetch_count = self.run_budget.articles_for_keyword(keyword, 20) if self.run_budget else 20
+                    self.news_collector.content_cache = self.staging_store.get_content_map(target_date) if staged_news else None
+                    try:
+                        news_list = self.news_collector.search_naver_news_with_retry(keyword, fetch_count, target_date)
+                    finally:
+                        self.news_collector.content_cache = None
+                    
+                    if staged_news:
+                        # 탑업 결과를 우선하고, 이번 검색에서 빠진 사전 수집분을 뒤에 보충
+                        fetched_links = {news.get('link') for news in news_list}
+                        fetched_titles = {news.get('title') for news in news_list}
+                        news_list = news_list + [
+                            news for news in staged_news
+                            if news.get('link') not in fetched_links and news.get('title') not in fetched_titles
+                        ]
+                        self.logger.info(f"키워드 '{keyword}': 사전 수집분 {len(staged_news)}개와 탑업 결과 병합")
+                
+                # 사전 수집분(dict)도 NewsItem으로 변환하여 본문은 압축 저장소에 보관
+                news_list = to_news_items(news_list)
                 
                 # 키워드당 최대 10개 제한
                 if len(news_list) > articles_per_keyword:
@@ -75,6 +236,7 @@ class NewsletterSystem:
                 self.logger.info(f"키워드 '{keyword}'에서 {len(news_list)}개 뉴스 수집됨")
                 
                 # 중복 제거 및 추가
+                added_count = 0
                 for news in news_list:
                     # 제목 기준으로 중복 확인
                     is_duplicate = False
@@ -85,8 +247,12 @@ class NewsletterSystem:
                     
                     if not is_duplicate:
                         all_news.append(news)
+                        added_count += 1
                         self.logger.info(f"새로운 뉴스 추가: {news['title'][:50]}...")
                 
+                # 다음 실행의 키워드별 예산 배분 기준
+                self.keyword_yield.record(keyword, added_count)
+                
             except Exception as e:
                 self.logger.error(f"키워드 '{keyword}' 뉴스 수집 중 오류: {e}")
                 continue
@@ -199,97 +365,12 @@ class NewsletterSystem:
     def cleanup(self):
         """소멸자에서 정리"""
         try:
-            if hasattr(self, 'news_collector'):
-                self.news_collector.cleanup()
+            # 수집기가 생성된 적이 없으면 정리를 위해 새로 만들지 않음
+            if getattr(self, '_news_collector', None) is not None:
+                self._news_collector.cleanup()
         except Exception as e:
             self.logger.error(f"정리 중 오류: {e}")
     
-    def run_test(self):
-        """시스템 테스트 실행"""
-        try:
-            self.logger.info("시스템 테스트 시작")
-            
-            # 1. 키워드 설정 확인
-            self.logger.info("1. 키워드 설정 확인 중...")
-            topics = self.keyword_manager.get_topics()
-            if not topics:
-                self.logger.error("키워드가 설정되지 않았습니다.")
-                return False
-            self.logger.info(f"키워드 설정 확인 완료 - {len(topics)}개 주제")
-            
-            # 2. 뉴스 수집 테스트 (모든 주제에 대해 수집)
-            self.logger.info("2. 뉴스 수집 테스트 중 (전체 주제)...")
-            test_all_news = []
-
-            for topic in topics:
-                # 실제 운영과 동일한 수집 로직 사용
-                try:
-                    self.logger.info(f"테스트 수집: 주제 '{topic['name']}'")
-                    news = self.collect_news_for_topic(topic) or []
-
-                    # 운영 환경과 동일한 필터링 적용 (30자 이상)
-                    valid_news = []
-                    for n in news:
-                        content = n.get('full_content', '').strip()
-                        preview = n.get('content_preview', '').strip()
-                        if len(content) >= 30 or len(preview) >= 100:
-                            # 카테고리 정보 추가
-                            n['category'] = topic['name']
-                            valid_news.append(n)
-
-                    test_all_news.extend(valid_news)
-                except Exception as e:
-                    self.logger.warning(f"테스트 수집 중 오류 ({topic['name']}): {e}")
-            
-            if not test_all_news:
-                self.logger.warning("뉴스 수집 테스트에서 뉴스를 찾지 못했습니다.")
-            else:
-                self.logger.info(f"뉴스 수집 테스트 완료 - 총 {len(test_all_news)}개 뉴스")
-            
-            # 3. AI 요약 및 템플릿 생성 테스트 (V3)
-            self.logger.info("3. AI 요약 및 템플릿 생성 테스트 (V3) 중...")
-            if test_all_news:
-                # 전체 요약 생성
-                full_summary_text = self.news_summarizer.summarize_all_news(test_all_news)
-                
-                if full_summary_text:
-                    self.logger.info("AI 요약 테스트 완료")
-                    
-                    # 템플릿 생성 (테스트이므로 Fallback 데이터는 None 전달)
-                    newsletter_content = self.generate_newsletter_content_v3(full_summary_text, None, test_all_news)
-                    
-                    if newsletter_content:
-                        self.logger.info("템플릿 생성 테스트 완료")
-                        
-                        # 4. 이메일 설정 확인
-                        self.logger.info("4. 이메일 설정 확인 중...")
-                        receiver_count = self.email_sender.get_receiver_count()
-                        self.logger.info(f"이메일 설정 확인 완료 - {receiver_count}명의 수신자")
-                        
-                        # 5. 테스트 이메일 발송 (생성된 뉴스레터 내용으로 발송)
-                        self.logger.info("5. 테스트 이메일 발송 중...")
-                        subject = f"[테스트 메일] {os.getenv('NEWSLETTER_TITLE', '[IT본부] 하나투어 뉴스레터')}"
-                        test_email_success = self.email_sender.send_newsletter(subject, newsletter_content)
-                        
-                        if test_email_success:
-                            self.logger.info("테스트 이메일 발송 완료")
-                        else:
-                            self.logger.error("테스트 이메일 발송 실패")
-                            return False
-                    else:
-                        self.logger.error("템플릿 생성 실패")
-                else:
-                    self.logger.error("AI 요약 실패")
-            else:
-                self.logger.warning("테스트 뉴스 없음으로 요약 및 발송 테스트 건너뜀")
-            
-            self.logger.info("시스템 테스트 완료")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"시스템 테스트 중 오류: {e}")
-            return False
-    
     def _collect_news_fallback(self, topic):
         """뉴스 수집 실패 시 Fallback 메서드"""
         topic_name = topic["name"]
@@ -398,6 +479,8 @@ class NewsletterSystem:
             
             # 1. 모든 주제별 뉴스 수집
             raw_news_dict = {}
+            self.start_run_budget(topics)
+            self.plan_news_queries(topics)
             
             for topic in topics:
                 topic_name = topic["name"]
@@ -426,6 +509,8 @@ class NewsletterSystem:
                 
                 raw_news_dict[topic_name] = news_list
                 self.logger.info(f"주제 '{topic_name}'에서 {len(news_list)}개 뉴스 수집됨 (유효성 검증 완료)")
+            self.news_collector.clear_planned_queries()
+            self.finish_collection_budget()
 
             # 2. 뉴스 재분류 (IT -> AI 이동 로직)
             # 키워드 매핑 확인
@@ -486,24 +571,30 @@ class NewsletterSystem:
             else:
                 # 전체 뉴스 요약 (새로운 프롬프트 사용)
                 self.logger.info("전체 뉴스 통합 요약 시작 (V3)")
-                full_summary_text = self.news_summarizer.summarize_all_news(all_news_list)
+                self.news_summarizer.run_budget = self.run_budget
+                self.news_summarizer.topic_keywords = {topic['name']: topic.get('keywords', []) for topic in topics}
+                full_summary_text, rendered_sections = self.summarize_news_v3(all_news_list, raw_news_dict)
 
                 if not full_summary_text:
                     self.logger.error("전체 뉴스 요약 실패")
                     return False
 
                 # 뉴스레터 내용 생성 (새로운 템플릿 사용) - 원본 뉴스 데이터도 함께 전달
-                newsletter_content = self.generate_newsletter_content_v3(full_summary_text, raw_news_dict, all_news_list)
+                newsletter_content = self.generate_newsletter_content_v3(full_summary_text, raw_news_dict, all_news_list, self.news_summarizer.last_manifest, rendered_sections)
 
                 if not newsletter_content:
                     self.logger.error("뉴스레터 콘텐츠 생성 실패")
                     return False
 
                 # 아카이빙 (데이터 및 HTML 저장)
+                # 본문은 항목에 해시만 남기고 압축 본문을 한 번씩만 저장 (같은 본문은 1개)
+                archived_bodies = {}
                 archive_data = {
-                    "raw_news": raw_news_dict,
-                    "full_summary": full_summary_text
+                    "raw_news": {topic_name: to_dicts(news_list, archived_bodies) for topic_name, news_list in raw_news_dict.items()},
+                    "full_summary": full_summary_text,
+                    "bodies": archived_bodies
                 }
+                self.logger.info(f"본문 저장소: {default_store.summary()}")
                 self.archiver.save_daily_archive(archive_data, newsletter_content)
             
             # 이메일 제목 생성
@@ -913,8 +1004,56 @@ class NewsletterSystem:
             self.logger.error(f"이메일 호환 템플릿 뉴스레터 생성 실패: {e}")
             return None
 
-    def generate_newsletter_content_v3(self, full_summary_text, raw_news_dict=None, all_news_list=None):
-        """새로운 템플릿(news_templates01.html)을 위한 콘텐츠 생성 (개선된 Fallback 포함)"""
+    @staticmethod
+    def _fallback_news_by_section(raw_news_dict):
+        """섹션(TECH/AI/BIZ)별 원본 뉴스 목록 (카드 Fallback/보충용)"""
+        fallback_news = {
+            "TECH": [],
+            "AI": [],
+            "BIZ": []
+        }
+        if raw_news_dict:
+            for topic_name, news_list in raw_news_dict.items():
+                if topic_name in ["IT", "Technology Trends"]:
+                    fallback_news["TECH"] = news_list
+                elif topic_name in ["AI", "AI Insight"]:
+                    fallback_news["AI"] = news_list
+                elif topic_name in ["여행", "Travel & Business"]:
+                    fallback_news["BIZ"] = news_list
+        return fallback_news
+
+    def summarize_news_v3(self, all_news_list, raw_news_dict=None):
+        """전체 뉴스 요약 (SUMMARY_STREAM=true이면 스트리밍 응답의 카드를 완성되는 대로 렌더링)
+
+        Returns:
+            (str, dict): (요약 결과, 스트리밍 중 렌더링한 섹션 {섹션: (html, 아이템, 다음 번호)} - 없으면 None)
+        """
+        summarizer = self.news_summarizer
+        if not getattr(summarizer, 'summary_stream', False):
+            full_summary_text = summarizer.summarize_all_news(all_news_list)
+            self.logger.info(f"LLM 호출 현황: {summarizer.llm_client.summary()}")
+            return full_summary_text, None
+
+        renderer = StreamingCardRenderer(self, self._fallback_news_by_section(raw_news_dict), lambda: summarizer.last_manifest)
+        full_summary_text = summarizer.summarize_all_news(all_news_list, on_event=renderer)
+        self.logger.info(f"LLM 호출 현황: {summarizer.llm_client.summary()}")
+        if not full_summary_text or parse_structured_summary(full_summary_text) is None:
+            # 텍스트 형식으로 재요청했거나 병렬 모드 - 스트리밍 렌더링 결과는 쓰지 않음
+            return full_summary_text, None
+        try:
+            return full_summary_text, renderer.finish()
+        except Exception as e:
+            self.logger.warning(f"스트리밍 렌더링 마무리 실패, 전체 응답으로 다시 렌더링: {e}")
+            return full_summary_text, None
+
+    def generate_newsletter_content_v3(self, full_summary_text, raw_news_dict=None, all_news_list=None, manifest=None, rendered_sections=None):
+        """새로운 템플릿(news_templates01.html)을 위한 콘텐츠 생성 (개선된 Fallback 포함)
+
+        Args:
+            full_summary_text: 요약기 응답 (구조화 JSON이면 카드 ID로 바로 렌더링, 아니면 레거시 텍스트 파싱)
+            manifest: 요약기가 프롬프트에 넣은 ID -> 기사 (news_summarizer.last_manifest, 없으면 all_news_list로 재구성)
+            rendered_sections: summarize_news_v3()가 스트리밍 중 렌더링한 섹션 (구조화 응답일 때 그대로 사용)
+        """
         import re
         try:
             # AI 출력 디버그 저장
@@ -953,24 +1092,14 @@ class NewsletterSystem:
             }
 
             # 카테고리별 원본 뉴스 매핑 (Fallback용)
-            fallback_news = {
-                "TECH": [],
-                "AI": [],
-                "BIZ": []
-            }
-            if raw_news_dict:
-                for topic_name, news_list in raw_news_dict.items():
-                    if topic_name in ["IT", "Technology Trends"]:
-                        fallback_news["TECH"] = news_list
-                    elif topic_name in ["AI", "AI Insight"]:
-                        fallback_news["AI"] = news_list
-                    elif topic_name in ["여행", "Travel & Business"]:
-                        fallback_news["BIZ"] = news_list
-
-            # [중요] AI 요약에 사용된 뉴스 리스트 순서 재현 (ID 매핑용)
-            # news_summarizer_v2.py의 summarize_all_news 메서드와 동일한 로직이어야 함
+            fallback_news = self._fallback_news_by_section(raw_news_dict)
+
+            # [중요] AI 요약에 사용된 뉴스 리스트 순서 (ID 매핑용)
+            # 요약기가 넘겨준 manifest를 우선 사용하고, 없으면 예전 방식(카테고리별 앞 15개)으로 재구성
             reference_news_list = []
-            if all_news_list:
+            if manifest:
+                reference_news_list = [manifest[news_id] for news_id in sorted(manifest)]
+            elif all_news_list:
                 category_news = {}
                 # 순서 보장을 위해 all_news_list 순서대로 처리
                 for news in all_news_list:
@@ -985,83 +1114,83 @@ class NewsletterSystem:
             
             self.logger.info(f"ID 참조용 뉴스 리스트 생성 완료: {len(reference_news_list)}개")
 
-            # 섹션별 파싱 및 아이템 수집
-            current_section = None
-            buffer = []
-            lines = full_summary_text.split('\n')
-            
             # 파싱된 모든 뉴스 아이템을 저장할 리스트 (In Other News 자동 생성용)
             all_parsed_items = []
             global_index = 1
+            section_results = {}
+
+            structured = parse_structured_summary(full_summary_text)
+            if structured is not None:
+                # 구조화(JSON) 응답: 카드 ID로 manifest에서 원본 기사를 찾아 바로 렌더링
+                self.logger.info("V3 구조화(JSON) 요약 응답 - ID 기반 카드 생성")
+                sections["executive_summary"] = structured['executive_summary']
+                if rendered_sections and all(section in rendered_sections for section in SECTION_KEYS):
+                    self.logger.info("V3 스트리밍 중 렌더링된 카드 사용")
+                    section_results = rendered_sections
+                else:
+                    id_to_news = manifest or {news_id: news for news_id, news in enumerate(reference_news_list, 1)}
+                    for section in SECTION_KEYS:
+                        section_results[section] = self._format_structured_cards_v3(
+                            structured[section], section, id_to_news, fallback_news[section], start_index=global_index
+                        )
+                        global_index = section_results[section][2]
+            else:
+                # 레거시 텍스트 응답: 섹션 헤더/필드 정규식 파싱
+                current_section = None
+                lines = full_summary_text.split('\n')
+
+                # 섹션별 버퍼 저장소
+                section_buffers = {
+                    "executive_summary": [],
+                    "tech": [],
+                    "ai": [],
+                    "biz": []
+                }
 
-            # 섹션별 버퍼 저장소
-            section_buffers = {
-                "executive_summary": [],
-                "tech": [],
-                "ai": [],
-                "biz": []
-            }
-
-            for line in lines:
-                line = line.strip()
-                if not line: continue
-
-                if "[Executive Summary]" in line:
-                    current_section = "executive_summary"
-                    continue
-                elif "[TECH]" in line:
-                    current_section = "tech"
-                    continue
-                elif "[AI]" in line:
-                    current_section = "ai"
-                    continue
-                elif "[BIZ]" in line:
-                    current_section = "biz"
-                    continue
-                elif "[In Other News]" in line:
-                    # In Other News 섹션은 무시 (프로그램에서 자동 생성)
-                    current_section = "ignore"
-                    continue
+                for line in lines:
+                    line = line.strip()
+                    if not line: continue
+
+                    if "[Executive Summary]" in line:
+                        current_section = "executive_summary"
+                        continue
+                    elif "[TECH]" in line:
+                        current_section = "tech"
+                        continue
+                    elif "[AI]" in line:
+                        current_section = "ai"
+                        continue
+                    elif "[BIZ]" in line:
+                        current_section = "biz"
+                        continue
+                    elif "[In Other News]" in line:
+                        # In Other News 섹션은 무시 (프로그램에서 자동 생성)
+                        current_section = "ignore"
+                        continue
+
+                    if current_section in section_buffers:
+                        section_buffers[current_section].append(line)
+
+                # 1. Executive Summary 처리
+                exec_summary = "\n".join(section_buffers["executive_summary"]).strip()
+                # 끝부분의 불필요한 기호 제거 (---, === 등)
+                while exec_summary.endswith('-') or exec_summary.endswith('=') or exec_summary.endswith('─') or exec_summary.endswith('#'):
+                    exec_summary = exec_summary.rstrip('-=─#').strip()
+                sections["executive_summary"] = exec_summary
+
+                # 2~4. TECH, AI, BIZ 섹션 처리
+                for section in SECTION_KEYS:
+                    section_results[section] = self._format_cards_v3(
+                        section_buffers[section.lower()], section, fallback_news[section],
+                        start_index=global_index,
+                        reference_news_list=reference_news_list
+                    )
+                    global_index = section_results[section][2]
 
-                if current_section in section_buffers:
-                    section_buffers[current_section].append(line)
-
-            # 1. Executive Summary 처리
-            exec_summary = "\n".join(section_buffers["executive_summary"]).strip()
-            # 끝부분의 불필요한 기호 제거 (---, === 등)
-            while exec_summary.endswith('-') or exec_summary.endswith('=') or exec_summary.endswith('─') or exec_summary.endswith('#'):
-                exec_summary = exec_summary.rstrip('-=─#').strip()
-            sections["executive_summary"] = exec_summary
-
-            # 2. TECH 섹션 처리
-            tech_html, tech_items, next_idx = self._format_cards_v3(
-                section_buffers["tech"], "TECH", fallback_news["TECH"], 
-                start_index=global_index,
-                reference_news_list=reference_news_list
-            )
-            sections["tech_news_items"] = tech_html
-            all_parsed_items.extend(tech_items)
-            global_index = next_idx
-
-            # 3. AI 섹션 처리
-            ai_html, ai_items, next_idx = self._format_cards_v3(
-                section_buffers["ai"], "AI", fallback_news["AI"], 
-                start_index=global_index,
-                reference_news_list=reference_news_list
-            )
-            sections["ai_news_items"] = ai_html
-            all_parsed_items.extend(ai_items)
-            global_index = next_idx
-
-            # 4. BIZ 섹션 처리
-            biz_html, biz_items, next_idx = self._format_cards_v3(
-                section_buffers["biz"], "BIZ", fallback_news["BIZ"], 
-                start_index=global_index,
-                reference_news_list=reference_news_list
-            )
-            sections["biz_news_items"] = biz_html
-            all_parsed_items.extend(biz_items)
-            global_index = next_idx
+            sections["tech_news_items"], tech_items, _ = section_results["TECH"]
+            sections["ai_news_items"], ai_items, _ = section_results["AI"]
+            sections["biz_news_items"], biz_items, _ = section_results["BIZ"]
+            all_parsed_items.extend(tech_items + ai_items + biz_items)
 
             # 원본 뉴스 제목 매핑 생성 (In Other News용)
             link_to_original_title = {}
@@ -1074,6 +1203,9 @@ class NewsletterSystem:
             # 5. In Other News 자동 생성 (수집된 모든 아이템 기반, 원본 제목 우선 사용)
             sections["other_news_items"] = self._generate_other_news_html(all_parsed_items, link_to_original_title)
 
+            # 6. AI가 생성한 카드 요약을 기사별로 저장 (주간/월간 큐레이션 입력)
+            self.record_article_summaries(all_parsed_items)
+
             # 파싱 결과 로깅
             self.logger.info(f"V3 파싱 결과 - Executive Summary: {len(sections['executive_summary'])}자")
             self.logger.info(f"V3 파싱 결과 - TECH 카드: {len(tech_items)}개")
@@ -1097,6 +1229,92 @@ class NewsletterSystem:
             self.logger.error(f"상세 오류: {traceback.format_exc()}")
             return None
 
+    def record_article_summaries(self, parsed_items):
+        """AI가 생성한 카드 요약을 원본 기사의 본문 해시 기준으로 저장 (원본 미리보기로 대체된 카드는 제외)"""
+        try:
+            recorded = 0
+            for item in parsed_items:
+                if item.get('generated') and item.get('news') is not None:
+                    self.article_summaries.record(item['news'], item['summary'], title=item['title'])
+                    recorded += 1
+            if recorded:
+                self.article_summaries.save()
+                self.logger.info(f"기사별 요약 {recorded}건 저장 (전체 {len(self.article_summaries)}건)")
+        except Exception as e:
+            self.logger.warning(f"기사별 요약 저장 실패: {e}")
+
+    def _format_structured_cards_v3(self, cards, category, id_to_news, fallback_news_list=None, start_index=1):
+        """구조화(JSON) 응답의 카드 목록을 HTML로 (링크/원본 기사는 카드 ID로 manifest에서 찾음)
+
+        manifest에 없는 ID(모델이 지어낸 번호)와 중복 ID는 건너뛰고, 카드가 5개 미만이면
+        AI 카드는 유지한 채 아직 쓰지 않은 원본 뉴스 미리보기로 보충한다.
+        """
+        state = self._structured_section_state(start_index)
+        for card in cards:
+            self._add_structured_card_v3(state, card, category, id_to_news)
+        self._fill_structured_section_v3(state, category, fallback_news_list)
+        return state['html'], state['items'], state['global_index']
+
+    @staticmethod
+    def _structured_section_state(start_index):
+        """구조화 카드 섹션 렌더링 상태 (html, 아이템, 섹션 내 번호, 다음 전체 번호, 사용한 ID)"""
+        return {'html': '', 'items': [], 'local_index': 1, 'global_index': start_index, 'used_ids': set()}
+
+    def _add_structured_card_v3(self, state, card, category, id_to_news):
+        """구조화 카드 1개를 검증 후 HTML로 렌더링하여 섹션 상태에 추가"""
+        news = id_to_news.get(card['id'])
+        if news is None:
+            self.logger.warning(f"[V3 JSON] {category} 카드 ID {card['id']}가 프롬프트 뉴스 목록에 없음, 건너뜀")
+            return
+        if card['id'] in state['used_ids']:
+            return
+        state['used_ids'].add(card['id'])
+        card_data = {'number': str(state['local_index']), 'title': card['title'], 'summary': card['summary'], 'link': news.get('link', '')}
+        card_html, card_item = self._create_card_html_v3(card_data, state['local_index'], state['global_index'], news)
+        if card_html:
+            state['html'] += card_html
+            state['items'].append(card_item)
+            state['local_index'] += 1
+            state['global_index'] += 1
+
+    def _fill_structured_section_v3(self, state, category, fallback_news_list=None):
+        """섹션 카드가 5개 미만이면 아직 쓰지 않은 원본 뉴스 미리보기로 보충"""
+        self.logger.info(f"[V3 JSON] {category} 카드 {len(state['items'])}개")
+        if len(state['items']) >= 5 or not fallback_news_list:
+            return
+        used_links = {item['link'] for item in state['items']}
+        for news in fallback_news_list:
+            if len(state['items']) >= 5:
+                break
+            if not news.get('link') or news['link'] in used_links:
+                continue
+            fallback_card = {
+                'number': str(state['local_index']),
+                'title': news.get('title', '제목 없음'),
+                'summary': self._preview_summary(news),
+                'link': news['link']
+            }
+            card_html, card_item = self._create_card_html_v3(fallback_card, state['local_index'], state['global_index'], news, skip_validation=True)
+            if card_html:
+                state['html'] += card_html
+                state['items'].append(card_item)
+                used_links.add(news['link'])
+                state['local_index'] += 1
+                state['global_index'] += 1
+        self.logger.info(f"[V3 JSON] {category} 원본 뉴스로 보충 후 {len(state['items'])}개 카드")
+
+    @staticmethod
+    def _preview_summary(news):
+        """Fallback 카드 요약 (content_preview -> full_content 앞 200자, 마지막 마침표까지)"""
+        summary = news.get('content_preview', '') or news.get('full_content', '') or '요약 없음'
+        if summary and len(summary) > 200:
+            summary = summary[:200].strip()
+            # 문장 중간에서 잘리지 않도록 마지막 마침표까지만 사용
+            last_period = summary.rfind('.')
+            if last_period > 100:
+                summary = summary[:last_period + 1]
+        return summary
+
     def _format_cards_v3(self, lines, category, fallback_news_list=None, start_index=1, reference_news_list=None):
         """V3 템플릿용 카드 섹션 HTML 포맷팅 (개선된 파싱 + Fallback + 아이템 반환)"""
         html = ""
@@ -1137,17 +1355,10 @@ class NewsletterSystem:
                 current_global_index = start_index
 
                 for idx, news in enumerate(fallback_news_list[:5], 1):
-                    summary = news.get('content_preview', '') or news.get('full_content', '') or '요약 없음'
-                    if summary and len(summary) > 200:
-                        summary = summary[:200].strip()
-                        last_period = summary.rfind('.')
-                        if last_period > 100:
-                            summary = summary[:last_period + 1]
-
                     fallback_card = {
                         'number': str(idx),
                         'title': news.get('title', '제목 없음'),
-                        'summary': summary,
+                        'summary': self._preview_summary(news),
                         'link': news.get('link', '#')
                     }
 
@@ -1253,19 +1464,10 @@ class NewsletterSystem:
             current_global_index = start_index
 
             for idx, news in enumerate(fallback_news_list[:5], 1):  # 최대 5개
-                # 요약 내용: content_preview -> full_content -> 기본값 순으로 시도
-                summary = news.get('content_preview', '') or news.get('full_content', '') or '요약 없음'
-                if summary and len(summary) > 200:
-                    summary = summary[:200].strip()
-                    # 문장 중간에서 잘리지 않도록 마지막 마침표까지만 사용
-                    last_period = summary.rfind('.')
-                    if last_period > 100:
-                        summary = summary[:last_period + 1]
-
                 fallback_card = {
                     'number': str(idx),
                     'title': news.get('title', '제목 없음'),
-                    'summary': summary,
+                    'summary': self._preview_summary(news),
                     'link': news.get('link', '#')
                 }
 
@@ -1322,6 +1524,9 @@ class NewsletterSystem:
         # 요약 검증 (제목과 동일하거나 너무 유사한 경우 Fallback 사용)
         summary = card.get('summary', '').strip()
 
+        # AI가 작성한 요약이 그대로 쓰였는지 여부 (기사별 요약 저장 대상)
+        generated = not skip_validation
+
         # skip_validation=True인 경우 품질 검증 생략 (이미 Fallback 처리된 데이터)
         if not skip_validation:
             # 제목과 요약 정규화 (공백, 특수문자 제거 후 비교)
@@ -1360,6 +1565,7 @@ class NewsletterSystem:
                     last_period = summary.rfind('.')
                     if last_period > 100:  # 최소 100자 이상 확보된 경우에만 마침표 기준 자르기
                         summary = summary[:last_period + 1]
+                    generated = False
                     self.logger.info(f"✅ 카드 {local_index} Fallback 요약 사용 ({len(summary)}자)")
                 else:
                     self.logger.error(f"❌ 카드 {local_index} Fallback 실패 (원본 뉴스 데이터 부족), 카드 건너뜀")
@@ -1385,7 +1591,10 @@ class NewsletterSystem:
         item_info = {
             'global_index': global_index,
             'title': title,
-            'link': link
+            'link': link,
+            'summary': summary,
+            'news': original_news,
+            'generated': generated and bool(summary)
         }
         
         return html, item_info
@@ -1424,8 +1633,9 @@ class NewsletterSystem:
     def cleanup(self):
         """소멸자에서 정리"""
         try:
-            if hasattr(self, 'news_collector'):
-                self.news_collector.cleanup()
+            # 수집기가 생성된 적이 없으면 정리를 위해 새로 만들지 않음
+            if getattr(self, '_news_collector', None) is not None:
+                self._news_collector.cleanup()
         except Exception as e:
             self.logger.error(f"정리 중 오류: {e}")
     
@@ -1446,6 +1656,10 @@ class NewsletterSystem:
             self.logger.info("2. 뉴스 수집 테스트 중 (전체 주제 및 키워드)...")
             test_all_news = []
             raw_news_dict = {}  # Fallback용 주제별 뉴스 데이터
+            # 운영과 동일하게 실행 예산을 배분하고, OR 검색을 지원하는 소스는 키워드를 묶어 미리 검색
+            self.start_run_budget(topics)
+            self.plan_news_queries(topics)
+            target_date = self.news_collector.get_target_search_date()
 
             for topic in topics:
                 topic_name = topic.get("name", "Unknown")
@@ -1457,10 +1671,12 @@ class NewsletterSystem:
 
                 for keyword in keywords:
                     try:
-                        # 테스트 시에도 충분한 데이터 확보를 위해 키워드당 10개 수집
-                        news = self.news_collector.search_naver_news_with_retry(keyword, 10)
+                        # 테스트 시에도 충분한 데이터 확보를 위해 키워드당 10개(예산이 있으면 키워드 배분량) 수집
+                        fetch_count = self.run_budget.articles_for_keyword(keyword, 10) if self.run_budget else 10
+                        news = self.news_collector.search_naver_news_with_retry(keyword, fetch_count, target_date)
 
                         # 중복 제거 및 추가
+                        added_count = 0
                         for n in news:
                             is_duplicate = False
                             for existing in test_all_news:
@@ -1470,6 +1686,10 @@ class NewsletterSystem:
                             if not is_duplicate:
                                 test_all_news.append(n)
                                 topic_news.append(n)
+                                added_count += 1
+
+                        # 다음 실행의 키워드별 예산 배분 기준
+                        self.keyword_yield.record(keyword, added_count)
 
                     except Exception as e:
                         self.logger.warning(f"테스트 수집 중 오류 ({keyword}): {e}")
@@ -1477,6 +1697,8 @@ class NewsletterSystem:
                 # 주제별 뉴스 저장
                 raw_news_dict[topic_name] = topic_news
                 self.logger.info(f"주제 '{topic_name}'에서 {len(topic_news)}개 뉴스 수집")
+            self.news_collector.clear_planned_queries()
+            self.finish_collection_budget()
 
             if not test_all_news:
                 self.logger.warning("뉴스 수집 테스트에서 뉴스를 찾지 못했습니다.")
@@ -1486,14 +1708,16 @@ class NewsletterSystem:
             # 3. AI 요약 및 템플릿 생성 테스트 (V3)
             self.logger.info("3. AI 요약 및 템플릿 생성 테스트 (V3) 중...")
             if test_all_news:
-                # 전체 요약 생성
-                full_summary_text = self.news_summarizer.summarize_all_news(test_all_news)
+                # 전체 요약 생성 (요약 입력도 실행 토큰 예산 적용)
+                self.news_summarizer.run_budget = self.run_budget
+                self.news_summarizer.topic_keywords = {topic['name']: topic.get('keywords', []) for topic in topics}
+                full_summary_text, rendered_sections = self.summarize_news_v3(test_all_news, raw_news_dict)
 
                 if full_summary_text:
                     self.logger.info("AI 요약 테스트 완료")
 
                     # 템플릿 생성 (raw_news_dict를 Fallback용으로 전달)
-                    newsletter_content = self.generate_newsletter_content_v3(full_summary_text, raw_news_dict, test_all_news)
+                    newsletter_content = self.generate_newsletter_content_v3(full_summary_text, raw_news_dict, test_all_news, self.news_summarizer.last_manifest, rendered_sections)
                     
                     if newsletter_content:
                         self.logger.info("템플릿 생성 테스트 완료")
@@ -0,0 +1,712 @@
+# -*- coding: utf-8 -*-
+"""
+HTML 파싱 워커 - BeautifulSoup 파싱/본문 정제/날짜 추출을 별도 프로세스에서 실행
+
+수집기 스레드는 다운로드한 원본 바이트만 넘기고, 워커 프로세스는 본문/날짜/링크만 담은
+작은 결과 dict를 돌려준다. 파싱이 GIL에 묶이지 않아 여러 코어를 사용할 수 있다.
+워커 프로세스에서 pickle로 호출되므로 추출 함수는 모두 모듈 최상위 함수로 유지한다.
+"""
+import os
+import re
+import sys
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from threading import BoundedSemaphore, Lock
+from urllib.parse import urljoin
+
+from datetime import datetime, timedelta
+
+from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+
+logger = logging.getLogger(__name__)
+
+# 본문 추출 전 제거할 노이즈 요소
+NOISE_SELECTORS = [
+    'script', 'style', 'header', 'footer', 'nav', 'aside',
+    '.ad', '.advertisement', '.banner', '.social', '.share',
+    '.related', '.recommend', '.popular', '.best',
+    '.comment', '.reply', '.tag', '.category',
+    '.footer-inner', '.header-inner', '.sidebar',
+    '#footer', '#header', '#sidebar', '#comments',
+    '.article-footer', '.article-header',
+    '.news_guide', '.news_copyright', '.news_related',
+    '.article_bottom', '.article_top',
+    '.img_desc', '.caption', '.vod_area', '.video_area'
+]
+
+# 본문 선택자 (우선순위 순)
+CONTENT_SELECTORS = [
+    '#dic_area',  # 네이버 뉴스 (신규)
+    '#articleBodyContents',  # 네이버 뉴스 (기존)
+    '#articleBody',  # 네이버 뉴스
+    '.article_view',  # 다음 뉴스
+    '#harmonyContainer',  # 다음 뉴스
+    '.article_body',
+    '.article_content',
+    '.news_end',
+    '.article_body_contents',
+    '.article_text',
+    '.article',
+    '#article_body',
+    '#article_content',
+    '.content',
+    '.article-content',
+    '.news-content',
+    '.post-content',
+    '.entry-content',
+    'article',
+    '.text',
+    '.body',
+]
+
+# 페이지 공통 날짜 선택자 (기존 extract_date_from_news_page 방식)
+BASIC_DATE_SELECTORS = [
+    'span.date',  # 네이버 뉴스 날짜
+    '.article_info .date',  # 기사 정보 날짜
+    '.news_date',  # 뉴스 날짜
+    'time',  # HTML5 time 태그
+    '.published',  # 발행일
+]
+
+TEXT_DATE_PATTERNS = [
+    re.compile(r'(\d{4})[-.](\d{1,2})[-.](\d{1,2})'),  # 2024-01-01, 2024.01.01
+    re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'),  # 2024년 1월 1일
+    re.compile(r'(\d{4})/(\d{1,2})/(\d{1,2})'),  # 2024/01/01
+]
+
+CONTENT_DATE_PATTERNS = [
+    re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'),
+    re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'),
+    re.compile(r'(\d{4})\.(\d{1,2})\.(\d{1,2})'),
+    re.compile(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})'),  # 2026. 01. 11 형식
+]
+
+# 결과에 담을 최대 링크 수 (결과 dict를 작게 유지)
+MAX_LINKS = 100
+
+
+def clean_news_content(text):
+    """뉴스 본문에서 노이즈 제거"""
+    if not text:
+        return ""
+
+    # 1. 기자 정보 및 이메일 제거
+    text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', text)  # 이메일
+    text = re.sub(r'\(?([가-힣]{2,4})\s*기자\)?', '', text)  # (홍길동 기자), 홍길동 기자
+    text = re.sub(r'[가-힣]{2,4}\s*기자\s*=', '', text)  # 홍길동 기자 =
+
+    # 2. 저작권 및 재배포 금지 문구 제거
+    text = re.sub(r'무단\s*전재\s*및\s*재배포\s*금지', '', text)
+    text = re.sub(r'저작권자\s*\(c\).*', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'Copyrights\s*\(c\).*', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'ⓒ\s*.*', '', text)
+
+    # 3. 불필요한 공백 및 줄바꿈 정리
+    text = re.sub(r'\n+', '\n', text)
+    text = re.sub(r'\s+', ' ', text)
+
+    # 4. 기타 노이즈 (구독, 제보 등)
+    noise_patterns = [
+        r'네이버에서 .* 구독하세요',
+        r'SNS .* 팔로우',
+        r'제보하기',
+        r'구독하기',
+        r'좋아요',
+        r'공유하기'
+    ]
+    for pattern in noise_patterns:
+        text = re.sub(pattern, '', text)
+
+    return text.strip()
+
+
+def parse_date_from_text(text):
+    """텍스트에서 날짜 추출 (YYYY-MM-DD)"""
+    if not text:
+        return None
+    for pattern in TEXT_DATE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            year, month, day = match.groups()
+            return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    return None
+
+
+def get_site_specific_date_selectors(url):
+    """사이트별 특화된 날짜 선택자 반환"""
+    if 'khan.co.kr' in url:  # 경향신문
+        return ['.article_date', '.date', '.article-info .date', '.news-date', '.publish-date']
+    elif 'yna.co.kr' in url:  # 연합뉴스
+        return ['.date', '.article-date', '.news-date', '.publish-date']
+    elif 'hani.co.kr' in url:  # 한겨레
+        return ['.date', '.article-date', '.news-date', '.publish-date']
+    elif 'chosun.com' in url:  # 조선일보
+        return ['.date', '.article-date', '.news-date', '.publish-date']
+    elif 'joongang.co.kr' in url:  # 중앙일보
+        return ['.date', '.article-date', '.news-date', '.publish-date']
+    elif 'mk.co.kr' in url:  # 매일경제
+        return ['.date', '.news_date', '.t_date', '.reg_date']
+    elif 'hankyung.com' in url:  # 한국경제
+        return ['.date-time', '.txt-date', '.datetime', '.published']
+    return []  # 기타 사이트는 빈 배열 반환
+
+
+def get_site_specific_content_selectors(url):
+    """사이트별 특화된 본문 선택자 + 공통 선택자 반환"""
+    selectors = []
+
+    # 1. 주요 언론사별 특화 선택자
+    if 'khan.co.kr' in url:  # 경향신문
+        selectors = ['.art_body', '.article_txt', '#articleBody']
+    elif 'yna.co.kr' in url:  # 연합뉴스
+        selectors = ['.story-news', '.article-body', '#articleWrap']
+    elif 'hani.co.kr' in url:  # 한겨레
+        selectors = ['.text', '.article-text', '#a-left-scroll-in']
+    elif 'chosun.com' in url:  # 조선일보
+        selectors = ['.article-body', '.news_body_id', '#news_body_id']
+    elif 'joongang.co.kr' in url:  # 중앙일보
+        selectors = ['.article_body', '#article_body']
+    elif 'donga.com' in url:  # 동아일보
+        selectors = ['.article_txt', '#article_txt']
+    elif 'mk.co.kr' in url:  # 매일경제
+        selectors = ['.art_txt', '.news_body']
+    elif 'hankyung.com' in url:  # 한국경제
+        selectors = ['.article-body', '#articletxt']
+    elif 'etnews.com' in url:  # 전자신문
+        selectors = ['.article_body', '#articleBody']
+    elif 'zdnet.co.kr' in url:  # ZDNet
+        selectors = ['.view_cont', '#articleBody']
+
+    # 2. 공통적으로 많이 쓰이는 선택자 (Fallback)
+    common_selectors = [
+        'article',
+        '.article-body',
+        '.article_body',
+        '.news-content',
+        '.news_body',
+        '.content',
+        '#article-view-content-div',
+        '#articleBody',
+        '.view_con',
+        '.post-content',
+        '.entry-content'
+    ]
+
+    # 특화 선택자 + 공통 선택자 (중복 제거)
+    return selectors + [s for s in common_selectors if s not in selectors]
+
+
+def extract_date_from_content(soup, url):
+    """본문 영역 텍스트에서 날짜 패턴 추출"""
+    for selector in get_site_specific_content_selectors(url):
+        try:
+            content_elem = soup.select_one(selector)
+        except Exception:
+            continue
+        if not content_elem:
+            continue
+        content_text = content_elem.get_text()
+        for pattern in CONTENT_DATE_PATTERNS:
+            match = pattern.search(content_text)
+            if match:
+                year, month, day = match.groups()
+                return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    return None
+
+
+def extract_date_enhanced(soup, url):
+    """강화된 날짜 추출 (사이트별 선택자 → 메타 태그 → 본문 패턴)
+
+    Returns:
+        tuple: (날짜 또는 None, 추출 방식)
+    """
+    # 1단계: 사이트별 특화 선택자
+    for selector in get_site_specific_date_selectors(url):
+        try:
+            date_elem = soup.select_one(selector)
+        except Exception:
+            continue
+        if date_elem:
+            parsed_date = parse_date_from_text(date_elem.get_text(strip=True))
+            if parsed_date:
+                return parsed_date, f"selector:{selector}"
+
+    # 2단계: 메타 태그
+    meta_date = soup.find('meta', property='article:published_time')
+    if meta_date:
+        parsed_date = parse_date_from_text(meta_date.get('content', ''))
+        if parsed_date:
+            return parsed_date, "meta"
+
+    # 3단계: 본문 날짜 패턴
+    content_date = extract_date_from_content(soup, url)
+    if content_date:
+        return content_date, "content"
+
+    return None, None
+
+
+def extract_date_from_soup(soup, url):
+    """페이지 공통 선택자 → 강화된 추출 순으로 날짜 추출
+
+    Returns:
+        tuple: (날짜 또는 None, 추출 방식)
+    """
+    for selector in BASIC_DATE_SELECTORS:
+        date_elem = soup.select_one(selector)
+        if date_elem:
+            date_text = date_elem.get_text(strip=True)
+            if date_text:
+                # 기존 동작 유지: 첫 번째로 찾은 날짜 요소의 결과를 그대로 사용
+                return parse_date_from_text(date_text), f"selector:{selector}"
+    return extract_date_enhanced(soup, url)
+
+
+def extract_content_from_soup(soup):
+    """노이즈 제거 후 본문 추출 (본문 선택자 → 메타 태그 → p 태그 → 제목)
+
+    Returns:
+        tuple: (본문, 추출 방식)
+    """
+    # 1. 불필요한 요소 미리 제거 (전역)
+    for selector in NOISE_SELECTORS:
+        for elem in soup.select(selector):
+            elem.decompose()
+
+    # 2. 본문 선택자
+    content = ""
+    source = None
+    for selector in CONTENT_SELECTORS:
+        content_elem = soup.select_one(selector)
+        if content_elem:
+            # 선택된 요소 내에서도 노이즈 다시 한번 제거
+            for elem in content_elem.select('.ad, .advertisement, .banner, .related'):
+                elem.decompose()
+
+            cleaned_text = clean_news_content(content_elem.get_text(separator='\n', strip=True))
+            if len(cleaned_text) > 100:
+                content = cleaned_text
+                source = f"selector:{selector}"
+                break
+
+    # 3. 본문이 없거나 너무 짧으면 메타 태그에서 추출 (Fallback 1)
+    if not content or len(content) < 100:
+        meta_desc = ""
+        og_desc = soup.select_one('meta[property="og:description"]')
+        if og_desc and og_desc.get('content'):
+            meta_desc = og_desc.get('content')
+        if not meta_desc:
+            desc = soup.select_one('meta[name="description"]')
+            if desc and desc.get('content'):
+                meta_desc = desc.get('content')
+        if meta_desc and len(meta_desc) > 50:
+            content = meta_desc
+            source = "meta"
+
+    # 4. 그래도 없으면 p 태그들을 모두 긁어모음 (Fallback 2)
+    if not content or len(content) < 100:
+        paragraphs = [p.get_text(strip=True) for p in soup.select('p')]
+        p_text = clean_news_content("\n".join([text for text in paragraphs if len(text) > 30]))
+        if len(p_text) > 100:
+            content = p_text
+            source = "paragraphs"
+
+    # 5. 최후의 수단: 제목이라도 반환
+    if not content:
+        title_elem = soup.select_one('h1, .title, .headline')
+        content = title_elem.get_text(strip=True) if title_elem else ""
+        source = "title" if content else None
+
+    return content, source
+
+
+def extract_links_from_soup(soup, base_url, limit=MAX_LINKS):
+    """페이지 내 링크를 절대 URL로 변환하여 중복 없이 반환"""
+    links = []
+    seen = set()
+    for anchor in soup.find_all('a', href=True):
+        href = anchor['href'].strip()
+        if not href or href.startswith(('#', 'javascript:', 'mailto:')):
+            continue
+        absolute = urljoin(base_url, href)
+        if absolute in seen:
+            continue
+        seen.add(absolute)
+        links.append(absolute)
+        if len(links) >= limit:
+            break
+    return links
+
+
+_TAG_RE = re.compile(r'^\w+$')
+_ATTR_RE = re.compile(r"""^(\w+)?\[([\w-]+)(?:\*=['"]?([^'"\]]+)['"]?)?\]$""")
+_CLASS_RE = re.compile(r'^(\w+)?\.([\w-]+)$')
+_RELATIVE_TIME_RE = re.compile(r'(\d+)\s*(초|분|시간|일)\s*전')
+
+
+def _selector_matcher(selector):
+    """단순 CSS 선택자(tag, tag[attr], tag[attr*='값'], tag.class, .class)를 (태그명, 속성) 검사 함수로 변환 (그 외 형식은 None)"""
+    selector = (selector or '').strip()
+    if _TAG_RE.match(selector):
+        return lambda name, attrs: name == selector
+    match = _ATTR_RE.match(selector)
+    if match:
+        tag, attr, value = match.groups()
+        if value is None:
+            return lambda name, attrs: (not tag or name == tag) and attr in attrs
+        return lambda name, attrs: (not tag or name == tag) and value in (attrs.get(attr) or '')
+    match = _CLASS_RE.match(selector)
+    if match:
+        tag, class_name = match.groups()
+
+        def matches_class(name, attrs):
+            classes = attrs.get('class') or []
+            if isinstance(classes, str):
+                classes = classes.split()
+            return (not tag or name == tag) and class_name in classes
+        return matches_class
+    return None
+
+
+class _SearchResultFilter(ElementFilter):
+    """parse_only용 필터 - 최상위에서 선택자와 일치하는 태그만 생성하고 그 하위는 그대로 유지
+
+    bs4 4.13의 SoupStrainer는 함수 조건에 태그명만 넘기므로 속성까지 보려면 ElementFilter를 직접 구현한다.
+    """
+
+    def __init__(self, matchers):
+        self.matchers = matchers
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return any(matcher(name, attrs or {}) for matcher in self.matchers)
+
+    def allow_string_creation(self, string):
+        # 일치 요소 바깥의 텍스트는 버림 (일치 요소 내부 텍스트는 필터를 거치지 않음)
+        return False
+
+
+def build_search_strainer(*selectors):
+    """검색 결과 페이지용 부분 파싱 필터 (선택자 중 하나라도 일치하는 요소와 그 하위만 DOM으로 생성)
+
+    Returns:
+        ElementFilter 또는 None (지원하지 않는 선택자가 있으면 전체 파싱)
+    """
+    matchers = [_selector_matcher(selector) for selector in selectors if selector]
+    if not matchers or any(matcher is None for matcher in matchers):
+        return None
+    return _SearchResultFilter(matchers)
+
+
+def parse_date_text(text, now=None):
+    """검색 결과 날짜 문자열 파싱 (절대 날짜 + '3시간 전' 같은 상대 시간)"""
+    parsed = parse_date_from_text(text)
+    if parsed or not text:
+        return parsed
+    match = _RELATIVE_TIME_RE.search(text)
+    if not match:
+        return None
+    amount, unit = int(match.group(1)), match.group(2)
+    delta = {'초': timedelta(seconds=amount), '분': timedelta(minutes=amount),
+             '시간': timedelta(hours=amount), '일': timedelta(days=amount)}[unit]
+    return ((now or datetime.now()) - delta).strftime('%Y-%m-%d')
+
+
+def find_date_near(link_elem, date_selector, link_selector=None, max_depth=3):
+    """링크 요소 주변의 날짜 텍스트 탐색 (상위 요소 내부 → 문서 순서상 다음 날짜 요소)"""
+    parent = link_elem.parent
+    for _ in range(max_depth):
+        if parent is None or parent.name == '[document]':
+            break
+        # 여러 결과를 감싸는 목록까지 올라가면 다른 결과의 날짜를 가져오므로 중단
+        if link_selector and len(parent.select(link_selector, limit=2)) > 1:
+            break
+        date_elem = parent.select_one(date_selector)
+        if date_elem:
+            return date_elem.get_text(strip=True)
+        parent = parent.parent
+
+    # 부분 파싱 DOM에는 상위 요소가 없으므로 문서 순서상 다음 날짜 요소 사용 (다음 결과 링크가 먼저 나오면 중단)
+    date_matcher = _selector_matcher(date_selector)
+    link_matcher = _selector_matcher(link_selector)
+    if date_matcher is None:
+        return None
+    for elem in link_elem.find_all_next(True, limit=50):
+        if date_matcher(elem.name, elem.attrs):
+            return elem.get_text(strip=True)
+        if link_matcher and link_matcher(elem.name, elem.attrs):
+            break
+    return None
+
+
+def parse_search_results(raw, encoding, page_url, link_selector, date_selector, limit=50, partial=True):
+    """검색 결과 페이지에서 (제목, 링크, 날짜)만 추출하는 워커 진입점
+
+    partial=True면 link_selector/date_selector에 일치하는 요소만 DOM으로 만든다.
+
+    Returns:
+        dict: {'items': [{'title', 'link', 'date_text', 'date'}], 'elements': 생성된 태그 수, 'partial': 부분 파싱 여부}
+    """
+    strainer = build_search_strainer(link_selector, date_selector) if partial else None
+    markup = raw if isinstance(raw, bytes) and encoding else decode_html(raw, encoding)
+    kwargs = {'from_encoding': encoding} if isinstance(markup, bytes) else {}
+    if strainer is not None:
+        kwargs['parse_only'] = strainer
+    soup = BeautifulSoup(markup, 'html.parser', **kwargs)
+
+    items = []
+    for link_elem in soup.select(link_selector)[:limit]:
+        href = link_elem.get('href', '')
+        date_text = find_date_near(link_elem, date_selector, link_selector) if date_selector else None
+        items.append({
+            'title': link_elem.get_text(strip=True),
+            'link': urljoin(page_url, href) if href else '',
+            'date_text': date_text,
+            'date': parse_date_text(date_text),
+        })
+    return {'items': items, 'elements': len(soup.find_all(True)), 'partial': strainer is not None}
+
+
+def decode_html(raw, encoding=None):
+    """원본 바이트를 문자열로 디코딩 (인코딩 미지정 시 내용 기반 감지)"""
+    if isinstance(raw, str):
+        return raw
+    if not encoding:
+        try:
+            from charset_normalizer import detect
+            encoding = detect(raw).get('encoding')
+        except Exception:
+            encoding = None
+    try:
+        return raw.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return raw.decode('utf-8', errors='replace')
+
+
+def extract_article(raw, url, encoding=None, want=('content', 'date', 'links')):
+    """HTML에서 본문/날짜/링크를 추출하는 워커 진입점
+
+    Args:
+        raw (bytes|str): 응답 원본
+        url (str): 페이지 URL (사이트별 선택자, 상대 링크 변환용)
+        encoding (str): CharsetResolver로 판별된 인코딩 (없으면 감지)
+        want (tuple): 추출 항목 ('content', 'date', 'links')
+
+    Returns:
+        dict: {'content', 'content_source', 'date', 'date_source', 'links'}
+    """
+    if isinstance(raw, bytes) and encoding:
+        # 판별된 인코딩과 원본 바이트를 파서에 직접 전달 (중간 디코딩 문자열 복사본을 만들지 않음)
+        soup = BeautifulSoup(raw, 'html.parser', from_encoding=encoding)
+    else:
+        soup = BeautifulSoup(decode_html(raw, encoding), 'html.parser')
+    result = {'content': "", 'content_source': None, 'date': None, 'date_source': None, 'links': []}
+
+    # 날짜/링크는 header/nav 등 노이즈 제거 전에 추출
+    if 'date' in want:
+        result['date'], result['date_source'] = extract_date_from_soup(soup, url)
+    if 'links' in want:
+        result['links'] = extract_links_from_soup(soup, url)
+    if 'content' in want:
+        result['content'], result['content_source'] = extract_content_from_soup(soup)
+    return result
+
+
+class ParseLimitError(Exception):
+    """파싱 작업이 CPU 시간/메모리/대기 시간 제한을 넘어 강제 중단됨
+
+    Attributes:
+        reason (str): 'cpu_time' | 'memory' | 'timeout' | 'crashed'
+    """
+
+    def __init__(self, reason, detail=""):
+        super().__init__(reason, detail)
+        self.reason = reason
+        self.detail = detail
+
+    def __str__(self):
+        return f"{self.reason}: {self.detail}" if self.detail else self.reason
+
+
+def _raise_cpu_limit(signum, frame):
+    raise ParseLimitError('cpu_time', "CPU 시간 제한 초과")
+
+
+def _init_worker(memory_limit_mb):
+    """워커 프로세스 초기화: 주소 공간 상한 설정 및 CPU 시간 초과 시그널 처리 (resource 미지원 OS는 생략)"""
+    try:
+        import resource
+        import signal
+    except ImportError:
+        return
+    signal.signal(signal.SIGXCPU, _raise_cpu_limit)
+    if memory_limit_mb:
+        limit = int(memory_limit_mb) * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _probe_worker():
+    """워커 기동 확인용 빈 작업"""
+    return True
+
+
+def run_limited(func, cpu_seconds, *args):
+    """CPU 시간 제한을 걸고 func 실행 (워커 프로세스 안에서 호출)
+
+    RLIMIT_CPU는 프로세스 누적 시간 기준이므로 현재 사용량 + cpu_seconds를 soft 한도로 설정하고
+    작업이 끝나면 원래 값으로 되돌린다. hard 한도는 낮추면 다시 올릴 수 없으므로 건드리지 않는다.
+    """
+    try:
+        import resource
+    except ImportError:
+        resource = None
+
+    previous = None
+    if resource is not None and cpu_seconds:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = usage.ru_utime + usage.ru_stime
+        previous = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = int(used + cpu_seconds) + 1
+        if previous[1] != resource.RLIM_INFINITY:
+            soft = min(soft, previous[1])
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, previous[1]))
+    try:
+        return func(*args)
+    except MemoryError:
+        raise ParseLimitError('memory', "메모리 제한 초과")
+    finally:
+        if previous is not None:
+            resource.setrlimit(resource.RLIMIT_CPU, previous)
+
+
+class ParseWorkerPool:
+    """파싱 전용 프로세스 풀 (병적인 페이지 격리)
+
+    - 대기 작업 수를 BoundedSemaphore로 제한하여 다운로드가 파싱보다 빠를 때 메모리가 쌓이지 않도록 함
+    - 워커마다 주소 공간(PARSE_MEMORY_LIMIT_MB), 작업마다 CPU 시간(PARSE_CPU_LIMIT_SECONDS) 제한
+    - 대기 시간(PARSE_TASK_TIMEOUT)을 넘기면 워커 프로세스를 강제 종료하고 풀을 재생성
+    - PARSE_WORKERS=0 이거나 exe(frozen) 실행 등 프로세스 풀을 쓸 수 없으면 현재 스레드에서 직접 파싱 (제한 없음)
+    """
+
+    def __init__(self, max_workers=None, max_pending=None, task_timeout=None,
+                 cpu_limit_seconds=None, memory_limit_mb=None):
+        if max_workers is None:
+            max_workers = int(os.getenv('PARSE_WORKERS', str(min(4, os.cpu_count() or 1))))
+        self.max_workers = max_workers
+        self.max_pending = max_pending or max(1, max_workers) * 2
+        self.task_timeout = task_timeout or float(os.getenv('PARSE_TASK_TIMEOUT', '30'))
+        self.cpu_limit_seconds = cpu_limit_seconds if cpu_limit_seconds is not None else float(os.getenv('PARSE_CPU_LIMIT_SECONDS', '10'))
+        self.memory_limit_mb = memory_limit_mb if memory_limit_mb is not None else int(os.getenv('PARSE_MEMORY_LIMIT_MB', '1024'))
+        self._slots = BoundedSemaphore(self.max_pending)
+        self._executor = None
+        self._executor_lock = Lock()
+        self._has_succeeded = False
+        self.inline = max_workers <= 0 or getattr(sys, 'frozen', False)
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                # fork는 스레드가 떠 있는 수집기 프로세스에서 교착 위험이 있으므로 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.memory_limit_mb,)
+                )
+            return self._executor
+
+    def _restart(self, executor, kill=False):
+        """지정한 풀이 아직 현재 풀이면 종료 (kill=True면 실행 중인 워커 프로세스를 강제 종료)"""
+        with self._executor_lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        if kill:
+            for process in list((getattr(executor, '_processes', None) or {}).values()):
+                try:
+                    process.kill()
+                except Exception:
+                    pass
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, func, *args, **kwargs):
+        """작업 제출 (대기 작업이 max_pending개면 슬롯이 빌 때까지 대기)"""
+        self._slots.acquire()
+        try:
+            future = self._get_executor().submit(func, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, func, *args, label=""):
+        """모듈 최상위 함수 func를 제한이 걸린 워커에서 실행하고 결과를 기다림
+
+        Raises:
+            ParseLimitError: CPU 시간/메모리/대기 시간 제한 초과 또는 워커 비정상 종료
+        """
+        if self.inline:
+            return func(*args)
+
+        for attempt in range(2):
+            try:
+                executor = self._get_executor()
+                future = self.submit(run_limited, func, self.cpu_limit_seconds, *args)
+            except Exception as e:
+                # 풀 생성/제출 실패 시 현재 스레드에서 처리
+                logger.warning(f"파싱 워커 사용 불가, 직접 파싱으로 전환: {e}")
+                self.inline = True
+                return func(*args)
+
+            try:
+                result = future.result(timeout=self.task_timeout)
+                self._has_succeeded = True
+                return result
+            except FutureTimeoutError:
+                # 협조적 중단(SIGXCPU)이 통하지 않는 경우: 워커를 강제 종료하고 풀 재생성
+                self._restart(executor, kill=True)
+                raise ParseLimitError('timeout', f"{self.task_timeout:.0f}초 내 파싱 미완료: {label}")
+            except BrokenProcessPool as e:
+                if self._executor is not executor and attempt == 0:
+                    # 다른 작업의 강제 종료로 풀이 재생성된 경우 새 풀에서 한 번 더 시도
+                    continue
+                self._restart(executor)
+                if not self._has_succeeded and not self._probe_workers():
+                    # 빈 작업도 실행하지 못하는 풀은 페이지가 아니라 실행 환경 문제로 보고 직접 파싱
+                    logger.warning(f"파싱 워커를 시작할 수 없어 직접 파싱으로 전환: {e}")
+                    self.inline = True
+                    return func(*args)
+                # 워커는 정상이므로 이 페이지가 제한을 넘겨 워커를 죽인 것 (직접 파싱하지 않음)
+                raise ParseLimitError('crashed', f"워커 비정상 종료: {label}")
+        raise ParseLimitError('crashed', f"워커 비정상 종료: {label}")
+
+    def _probe_workers(self):
+        """새 풀에서 빈 작업을 실행하여 워커 프로세스를 시작할 수 있는지 확인"""
+        executor = None
+        try:
+            executor = self._get_executor()
+            executor.submit(_probe_worker).result(timeout=self.task_timeout)
+            self._has_succeeded = True
+            return True
+        except Exception as e:
+            logger.debug(f"파싱 워커 확인 작업 실패: {e}")
+            if executor is not None:
+                self._restart(executor, kill=True)
+            return False
+
+    def extract(self, raw, url, encoding=None, want=('content', 'date', 'links')):
+        """extract_article을 제한이 걸린 워커에서 실행 (ParseLimitError 발생 가능)"""
+        return self.run(extract_article, raw, url, encoding, want, label=url)
+
+    def close(self):
+        """워커 프로세스 종료"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,110 @@
+"""
+프롬프트 패커 - 카테고리별 입력 토큰 예산 안에서 어떤 기사를 얼마나 길게 넣을지 결정
+
+- 기사별 토큰 비용은 한글을 고려한 추정치(fetch_budget.estimate_tokens)로 계산
+- 관련도(키워드가 제목/본문에 나오는 정도)와 최신성으로 순위를 매김
+- 1차: 순위대로 최소 발췌(min_chars)로 기사를 담고, 2차: 남은 예산으로 상위 기사부터 발췌를 max_chars까지 늘림
+  (짧은 기사는 실제 길이만큼만 예산을 씀)
+- condense_sentences를 주면 발췌 원문을 본문 앞부분 대신 text_condenser의 핵심 문장으로 만듦
+"""
+import math
+
+from fetch_budget import estimate_tokens
+from news_item import NewsItem, parse_news_date, body_preview
+from text_condenser import condense
+
+
+def news_excerpt_source(news, max_chars, condense_sentences=0):
+    """발췌 원문 (본문 앞부분 또는 핵심 문장 condense_sentences개를 max_chars자까지, 본문이 없으면 미리보기)"""
+    if condense_sentences:
+        condensed = condense(news.get('full_content') or '', news.get('title', ''), condense_sentences)
+        if condensed:
+            return condensed[:max_chars]
+    return body_preview(news, max_chars) or (news.get('content_preview') or '')[:max_chars]
+
+
+def entry_tokens(news, excerpt, news_id=999):
+    """프롬프트에 들어갈 기사 1건의 토큰 추정치 (summarize_all_news의 입력 형식 기준)"""
+    return estimate_tokens(f"[{news_id}]\n제목: {news.get('title', '')}\n링크: {news.get('link', '')}\n본문: {excerpt}\n\n")
+
+
+def relevance_score(news, excerpt):
+    """키워드 관련도 (제목에 있으면 2점, 본문 등장 횟수는 로그 스케일로 최대 1점)"""
+    keyword = (news.get('source_keyword') or news.get('keyword') or '').lower()
+    if not keyword:
+        return 0.0
+    score = 2.0 if keyword in (news.get('title') or '').lower() else 0.0
+    return score + min(math.log1p(excerpt.lower().count(keyword)) / math.log(6), 1.0)
+
+
+def rank_news(news_list, excerpts, scores=None):
+    """관련도 + 최신성(가장 최근 기사 기준 경과 일수) 순 정렬, 점수가 같으면 수집 순서 유지
+
+    Args:
+        excerpts: 기사별 발췌 원문 (news_list와 같은 순서)
+        scores: 기사별 관련도 점수 목록 (news_list와 같은 순서, 없으면 relevance_score 사용)
+
+    Returns:
+        list: 순위순 인덱스
+    """
+    dates = [news.published if isinstance(news, NewsItem) else parse_news_date(news.get('date')) for news in news_list]
+    newest = max((value for value in dates if value), default=None)
+    keys = []
+    for index, news in enumerate(news_list):
+        relevance = scores[index] if scores is not None else relevance_score(news, excerpts[index])
+        recency = 1.0 / (1 + (newest - dates[index]).days) if newest and dates[index] else 0.0
+        keys.append((-(relevance + recency), index))
+    return [index for _, index in sorted(keys)]
+
+
+def pack_news(news_list, budget_tokens, max_items=15, min_chars=200, max_chars=1500, scores=None, condense_sentences=0):
+    """토큰 예산 안에 들어가도록 기사와 발췌 길이 선택
+
+    Args:
+        budget_tokens: 입력 토큰 예산 (0 이하이면 제한 없이 max_items개를 max_chars로)
+        condense_sentences: 0보다 크면 본문을 핵심 문장 N개로 압축하여 발췌
+
+    Returns:
+        (list, int): ([{'news', 'excerpt', 'tokens'}] 순위순, 사용 토큰)
+    """
+    unlimited = not budget_tokens or budget_tokens <= 0
+    chosen = []
+    used = 0
+    sources = [news_excerpt_source(news, max_chars, condense_sentences) for news in news_list]
+    for index in rank_news(news_list, sources, scores):
+        if len(chosen) >= max_items:
+            break
+        news = news_list[index]
+        source = sources[index]
+        excerpt = source if unlimited else source[:min_chars]
+        tokens = entry_tokens(news, excerpt)
+        if not unlimited and used + tokens > budget_tokens:
+            continue  # 더 짧은 기사는 들어갈 수 있음
+        chosen.append({'news': news, 'excerpt': excerpt, 'tokens': tokens, '_source': source})
+        used += tokens
+
+    # 남은 예산으로 상위 기사부터 발췌 확장
+    if not unlimited:
+        for entry in chosen:
+            remaining = budget_tokens - used
+            if remaining <= 0:
+                break
+            source = entry['_source']
+            if len(source) <= len(entry['excerpt']):
+                continue
+            full_tokens = entry_tokens(entry['news'], source)
+            if full_tokens - entry['tokens'] <= remaining:
+                excerpt = source
+            else:
+                extra = len(source) - len(entry['excerpt'])
+                excerpt = source[:len(entry['excerpt']) + int(extra * remaining / (full_tokens - entry['tokens']))]
+                while entry_tokens(entry['news'], excerpt) - entry['tokens'] > remaining and len(excerpt) > len(entry['excerpt']):
+                    excerpt = excerpt[:max(len(entry['excerpt']), len(excerpt) - 20)]
+            tokens = entry_tokens(entry['news'], excerpt)
+            used += tokens - entry['tokens']
+            entry['excerpt'] = excerpt
+            entry['tokens'] = tokens
+
+    for entry in chosen:
+        del entry['_source']
+    return chosen, used
@@ -0,0 +1,62 @@
+"""
+키워드 검색 계획 - OR 연산자를 지원하는 소스는 여러 키워드를 하나의 검색 요청으로 묶고,
+결과는 제목 기준 관련성 판정으로 각 키워드에 다시 배분한다.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 소스별 OR 연산자 (문서화된 OR 연산자가 없는 소스는 키워드별로 검색)
+OR_OPERATORS = {
+    'google_news_rss': ' OR ',
+}
+
+
+def build_or_query(keywords, operator=' OR '):
+    """키워드 묶음을 OR 검색어로 변환 (공백이 있는 키워드는 따옴표로 묶어 구문 검색)"""
+    terms = [f'"{keyword}"' if ' ' in keyword else keyword for keyword in keywords]
+    return operator.join(terms)
+
+
+def plan_query_groups(keywords, max_keywords=4, max_query_length=120, operator=' OR '):
+    """키워드를 검색 요청 묶음으로 분할 (중복 제거, 입력 순서 유지)
+
+    Args:
+        max_keywords: 한 요청에 묶을 최대 키워드 수 (결과 개수 상한 때문에 너무 많이 묶지 않음)
+        max_query_length: OR 검색어의 최대 길이
+
+    Returns:
+        list: 키워드 목록의 목록
+    """
+    groups = []
+    current = []
+    for keyword in dict.fromkeys(keyword.strip() for keyword in keywords if keyword and keyword.strip()):
+        candidate = current + [keyword]
+        if current and (len(candidate) > max_keywords or len(build_or_query(candidate, operator)) > max_query_length):
+            groups.append(current)
+            candidate = [keyword]
+        current = candidate
+    if current:
+        groups.append(current)
+    return groups
+
+
+def attribute_results(items, keywords, matcher, title_key='title'):
+    """묶음 검색 결과를 키워드별로 배분 (여러 키워드와 관련된 기사는 각 키워드에 모두 포함)
+
+    Args:
+        matcher: (제목, 키워드) -> bool 관련성 판정 함수
+
+    Returns:
+        dict: {키워드: [결과 항목, ...]} (검색 결과 순서 유지)
+    """
+    attributed = {keyword: [] for keyword in keywords}
+    for item in items:
+        title = item.get(title_key) or ''
+        for keyword in keywords:
+            try:
+                if matcher(title, keyword):
+                    attributed[keyword].append(item)
+            except Exception as e:
+                logger.debug(f"키워드 배분 판정 실패 ({keyword}): {e}")
+    return attributed
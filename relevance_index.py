@@ -0,0 +1,103 @@
+"""
+관련도 색인 - 실행마다 수집된 기사 제목+본문으로 BM25 색인을 만들고 주제 키워드 집합으로 순위를 매김
+
+- 토큰화는 text_condenser.tokenize (한글 조사/어미를 떼어 "야놀자가", "야놀자는"을 같은 단어로 취급)
+- 제목은 본문보다 중요하므로 TITLE_WEIGHT번 반복하여 색인 (BM25F 간이 적용)
+- 한글 키워드는 접두 일치도 인정 ("구글" -> "구글코리아"), 영문은 정확히 일치할 때만 ("ai"가 "air"에 걸리지 않도록)
+- "야 놀자"처럼 키워드가 띄어 쓰인 오탐 기사는 키워드 토큰이 없어 0점이 되므로 패킹 전에 걸러진다
+"""
+import re
+import math
+
+from news_item import body_preview
+from text_condenser import tokenize
+
+TITLE_WEIGHT = 2
+BODY_CHARS = 3000  # 본문은 앞부분만 색인 (핵심 내용은 앞에 있고 압축 해제 비용 제한)
+_HANGUL_TERM = re.compile(r'^[가-힣]+$')
+
+
+def keyword_terms(keywords):
+    """키워드 목록 -> 질의 단어 집합 ("에이전틱 AI" -> {"에이전틱", "ai"})"""
+    terms = set()
+    for keyword in keywords or []:
+        terms.update(tokenize(keyword))
+    return terms
+
+
+def news_tokens(news, body_chars=BODY_CHARS):
+    """색인할 기사 토큰 (제목 TITLE_WEIGHT번 + 본문 앞부분, 본문이 없으면 미리보기)"""
+    body = body_preview(news, body_chars) or (news.get('content_preview') or '')[:body_chars]
+    return tokenize(news.get('title') or '') * TITLE_WEIGHT + tokenize(body)
+
+
+class BM25Index:
+    """기사 목록 BM25 색인 (실행 중에만 메모리에 유지)"""
+
+    def __init__(self, token_lists, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.term_counts = []
+        self.lengths = []
+        self.document_frequency = {}
+        for tokens in token_lists:
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            self.term_counts.append(counts)
+            self.lengths.append(len(tokens))
+            for token in counts:
+                self.document_frequency[token] = self.document_frequency.get(token, 0) + 1
+        self.document_count = len(token_lists)
+        self.average_length = (sum(self.lengths) / self.document_count) if self.document_count else 0.0
+
+    @classmethod
+    def from_news(cls, news_list, body_chars=BODY_CHARS):
+        return cls([news_tokens(news, body_chars) for news in news_list])
+
+    def _idf(self, term):
+        frequency = self.document_frequency.get(term, 0)
+        return math.log(1 + (self.document_count - frequency + 0.5) / (frequency + 0.5))
+
+    def expand_terms(self, terms):
+        """질의 단어 -> 색인 단어 목록 (한글은 접두 일치 포함)"""
+        expanded = set()
+        for term in terms:
+            if term in self.document_frequency:
+                expanded.add(term)
+            if _HANGUL_TERM.match(term):
+                expanded.update(token for token in self.document_frequency if token.startswith(term))
+        return expanded
+
+    def score(self, index, terms):
+        """문서 1건의 BM25 점수 (terms는 expand_terms 결과)"""
+        counts = self.term_counts[index]
+        norm = self.k1 * (1 - self.b + self.b * self.lengths[index] / (self.average_length or 1.0))
+        total = 0.0
+        for term in terms:
+            frequency = counts.get(term, 0)
+            if frequency:
+                total += self._idf(term) * frequency * (self.k1 + 1) / (frequency + norm)
+        return total
+
+    def scores(self, keywords, indices=None):
+        """키워드 목록으로 문서별 점수 (indices를 주면 해당 문서만, 그 순서대로)"""
+        terms = self.expand_terms(keyword_terms(keywords))
+        indices = range(self.document_count) if indices is None else indices
+        return [self.score(index, terms) for index in indices]
+
+
+def select_relevant(scores, min_ratio=0.1):
+    """관련도 미달 기사 제외
+
+    0점(키워드 토큰이 하나도 없음)이거나 최고 점수의 min_ratio 미만이면 제외한다.
+    모든 기사가 0점이면 키워드 표기가 달라 색인이 못 잡은 것으로 보고 전부 유지한다.
+
+    Returns:
+        (list, list): (남길 인덱스, 남긴 기사의 0~3 정규화 점수 - prompt_packer.relevance_score와 같은 범위)
+    """
+    top = max(scores, default=0.0)
+    if top <= 0:
+        return list(range(len(scores))), None
+    kept = [index for index, value in enumerate(scores) if value > 0 and value >= top * min_ratio]
+    return kept, [3.0 * scores[index] / top for index in kept]
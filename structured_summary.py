@@ -0,0 +1,199 @@
+"""
+구조화 요약 - 전체 요약을 JSON 스키마로 받아 줄 단위 정규식 파싱 없이 카드로 렌더링
+
+- Gemini에 response_mime_type="application/json"과 summary_response_schema()를 주어 형식을 강제
+- 카드는 링크 대신 프롬프트 뉴스 번호(id, 요약기 manifest의 키)를 돌려주고, 링크/원본 기사는 manifest에서 찾음
+- 파싱에 실패하면 None을 돌려주어 호출 측이 기존 텍스트 파서로 처리
+- 스트리밍 응답은 StreamingSummaryParser가 조각을 받는 대로 완성된 카드를 하나씩 꺼냄
+  (MAX_TOKENS로 끊긴 응답도 완성된 카드까지는 사용)
+"""
+import copy
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+SECTION_KEYS = ('TECH', 'AI', 'BIZ')
+
+# 응답 키 생성 순서 (참조 번호가 TECH부터 시작하므로 TECH가 먼저 와야 스트리밍 렌더링이 멈추지 않음)
+RESPONSE_KEY_ORDER = ('executive_summary', *SECTION_KEYS)
+_CARD_KEYS = ('id', 'title', 'summary')
+
+_CARD_SCHEMA = {
+    'type': 'OBJECT',
+    'properties': {
+        'id': {'type': 'INTEGER'},
+        'title': {'type': 'STRING'},
+        'summary': {'type': 'STRING'},
+    },
+    'required': list(_CARD_KEYS),
+}
+
+# 기본 응답 스키마 (호출에는 SDK 지원 여부를 반영한 summary_response_schema()를 사용)
+SUMMARY_RESPONSE_SCHEMA = {
+    'type': 'OBJECT',
+    'properties': {
+        'executive_summary': {'type': 'STRING'},
+        **{section: {'type': 'ARRAY', 'items': _CARD_SCHEMA} for section in SECTION_KEYS},
+    },
+    'required': list(RESPONSE_KEY_ORDER),
+}
+
+_property_ordering_supported = None
+
+
+def _supports_property_ordering():
+    """설치된 SDK의 Schema에 property_ordering 필드가 있는지 (google-generativeai 0.8.x의 generativelanguage 0.6.x에는 없음)"""
+    global _property_ordering_supported
+    if _property_ordering_supported is None:
+        try:
+            from google.generativeai import protos
+            protos.Schema(property_ordering=['executive_summary'])
+            _property_ordering_supported = True
+        except Exception:
+            _property_ordering_supported = False
+    return _property_ordering_supported
+
+
+def summary_response_schema():
+    """GenerationConfig(response_schema=...)에 넘길 스키마 (LLM 응답 캐시 키에도 포함됨)
+
+    SDK가 지원하면 키 생성 순서(property_ordering, snake_case만 허용)를 지정하고, 지원하지 않으면 넣지 않는다
+    (모르는 필드는 protos.Schema 변환에서 ValueError). 순서는 프롬프트에서도 요청한다.
+    SDK가 변환 중 스키마 딕셔너리를 수정하므로 매번 복사본을 돌려준다.
+    """
+    schema = copy.deepcopy(SUMMARY_RESPONSE_SCHEMA)
+    if _supports_property_ordering():
+        schema['property_ordering'] = list(RESPONSE_KEY_ORDER)
+        for section in SECTION_KEYS:
+            schema['properties'][section]['items']['property_ordering'] = list(_CARD_KEYS)
+    return schema
+
+
+def parse_structured_summary(text):
+    """JSON 요약 응답 -> {'executive_summary': str, 'TECH': [카드], 'AI': [...], 'BIZ': [...]}
+
+    카드는 {'id': int, 'title': str, 'summary': str}로 정리하고, id가 숫자가 아니거나 제목이 없는 카드는 버린다.
+    JSON이 아니거나 구조가 다르면 None (레거시 텍스트 응답).
+    """
+    if not text or not text.lstrip().startswith('{'):
+        return None
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or 'executive_summary' not in data:
+        return None
+
+    parsed = {'executive_summary': str(data.get('executive_summary') or '').strip()}
+    for section in SECTION_KEYS:
+        cards = [_normalize_card(card, section) for card in data.get(section) or []]
+        parsed[section] = [card for card in cards if card]
+    return parsed
+
+
+def _normalize_card(card, section):
+    """카드 dict 정리 ({'id': int, 'title', 'summary'}), ID가 숫자가 아니거나 제목이 없으면 None"""
+    if not isinstance(card, dict):
+        return None
+    try:
+        news_id = int(card.get('id'))
+    except (TypeError, ValueError):
+        logger.warning(f"구조화 요약 {section} 카드 ID 오류, 건너뜀: {card.get('id')!r}")
+        return None
+    title = str(card.get('title') or '').strip()
+    if not title:
+        return None
+    return {'id': news_id, 'title': title, 'summary': str(card.get('summary') or '').strip()}
+
+
+class StreamingSummaryParser:
+    """스트리밍 JSON 요약 응답의 점진 파서
+
+    feed()로 받은 조각을 이어 붙이며 최상위 키와 중괄호 깊이만 추적하고, 값이 완성될 때마다 이벤트를 돌려준다.
+        ('executive_summary', 문자열)
+        ('card', 섹션, 카드)        - 섹션 배열 안의 카드 객체가 닫힐 때
+        ('section_end', 섹션)       - 섹션 배열이 닫힐 때
+    """
+
+    def __init__(self):
+        self.buffer = ''
+        self.position = 0
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.string_start = None
+        self.expecting_key = False
+        self.key = None
+        self.card_start = None
+        self.parsed = {'executive_summary': '', **{section: [] for section in SECTION_KEYS}}
+
+    def feed(self, text):
+        """응답 조각 추가 후 새로 완성된 이벤트 목록 반환"""
+        self.buffer += text
+        events = []
+        buffer = self.buffer
+        for index in range(self.position, len(buffer)):
+            char = buffer[index]
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == '\\':
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+                    if self.depth == 1:
+                        events.extend(self._end_top_level_string(buffer[self.string_start:index + 1]))
+                continue
+
+            if char == '"':
+                self.in_string = True
+                self.string_start = index
+            elif char in '{[':
+                self.depth += 1
+                if self.depth == 1:
+                    self.expecting_key = True
+                elif self.depth == 3 and char == '{' and self.key in SECTION_KEYS:
+                    self.card_start = index
+            elif char in '}]':
+                if self.depth == 3 and char == '}' and self.card_start is not None:
+                    events.extend(self._end_card(buffer[self.card_start:index + 1]))
+                    self.card_start = None
+                elif self.depth == 2 and char == ']' and self.key in SECTION_KEYS:
+                    events.append(('section_end', self.key))
+                self.depth -= 1
+            elif self.depth == 1 and char == ':':
+                self.expecting_key = False
+            elif self.depth == 1 and char == ',':
+                self.expecting_key = True
+        self.position = len(buffer)
+        return events
+
+    def _end_top_level_string(self, literal):
+        try:
+            value = json.loads(literal)
+        except ValueError:
+            return []
+        if self.expecting_key:
+            self.key = value
+            return []
+        if self.key == 'executive_summary':
+            self.parsed['executive_summary'] = value.strip()
+            return [('executive_summary', self.parsed['executive_summary'])]
+        return []
+
+    def _end_card(self, literal):
+        try:
+            card = _normalize_card(json.loads(literal), self.key)
+        except ValueError:
+            card = None
+        if card is None:
+            return []
+        self.parsed[self.key].append(card)
+        return [('card', self.key, card)]
+
+    def result(self):
+        """지금까지 완성된 부분의 parse_structured_summary() 형식 결과 (카드가 하나도 없고 요약도 없으면 None)"""
+        if not self.parsed['executive_summary'] and not any(self.parsed[section] for section in SECTION_KEYS):
+            return None
+        return {key: (list(value) if isinstance(value, list) else value) for key, value in self.parsed.items()}
@@ -0,0 +1,73 @@
+"""
+본문 저장소 벤치마크 - 문자열 본문을 그대로 들고 있는 dict 대비 압축 저장소를 참조하는 NewsItem
+
+통신사 기사를 여러 언론사가 그대로 게재하는 상황(기사 3건 중 1건은 다른 기사와 같은 본문)을 가정하여
+수집 결과를 들고 있는 동안의 메모리와 일일 아카이브 JSON 크기를 비교한다.
+실행: python tests/bench_body_store.py [항목 수]
+"""
+import sys
+import os
+import json
+import random
+import tracemalloc
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from news_item import to_news_items, to_dicts, body_preview
+
+WORDS = ['하나투어', '여행', '예약', '증가', '일본', '패키지', '항공권', '겨울', '시즌', '고객',
+         '인공지능', '서비스', '출시', '발표', '전년', '대비', '상품', '플랫폼', '확대', '분석']
+
+
+def make_body(rng):
+    sentences = [' '.join(rng.choice(WORDS) for _ in range(12)) + '.' for _ in range(rng.randint(20, 40))]
+    return ' '.join(sentences)
+
+
+def build_dicts(count, seed=42):
+    rng = random.Random(seed)
+    items = []
+    for index in range(count):
+        # 3건 중 1건은 앞서 나온 본문을 그대로 전재
+        body = items[rng.randrange(len(items))]['full_content'] if items and index % 3 == 0 else make_body(rng)
+        items.append({
+            'title': f"기사 제목 {index}",
+            'link': f"https://www.example.com/news/{index}",
+            'press': '예시일보',
+            'date': '2026-10-18',
+            'full_content': body,
+            'keyword': WORDS[index % len(WORDS)],
+        })
+    return items
+
+
+def measure_memory(build):
+    tracemalloc.start()
+    items = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return items, current / 1024 / 1024, peak / 1024 / 1024
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    source = json.dumps(build_dicts(count), ensure_ascii=False)
+
+    # JSON에서 읽어 들이는 것부터 측정 (본문 저장소는 변환 중 원문 문자열이 잠시 남아 최대값에 포함됨)
+    plain, plain_mb, plain_peak = measure_memory(lambda: json.loads(source))
+    stored, stored_mb, stored_peak = measure_memory(lambda: to_news_items(json.loads(source)))
+    assert [dict(news) for news in stored] == plain
+    assert all(body_preview(item, 1000) == news['full_content'][:1000] for item, news in zip(stored[:100], plain))
+
+    plain_bytes = len(json.dumps(plain, ensure_ascii=False).encode('utf-8'))
+    bodies = {}
+    archive = {'raw_news': to_dicts(stored, bodies), 'bodies': bodies}
+    stored_bytes = len(json.dumps(archive, ensure_ascii=False).encode('utf-8'))
+
+    print(f"dict:      {count}건 보유 {plain_mb:6.2f}MB (최대 {plain_peak:6.2f}MB), 아카이브 {plain_bytes / 1024:8.1f}KB")
+    print(f"본문 저장소: {count}건 보유 {stored_mb:6.2f}MB (최대 {stored_peak:6.2f}MB), 아카이브 {stored_bytes / 1024:8.1f}KB (본문 {len(bodies)}개)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+구글 뉴스 수집 경로 벤치마크 - HTML 검색 페이지(DOM + 클래스 선택자) 대비 RSS 피드(점진적 XML 파서)
+
+tests/fixtures의 검색 결과 응답(같은 기사 20건)으로 항목 추출 시간과 최대 메모리를 비교한다.
+실행: python tests/bench_google_news_sources.py [반복 횟수]
+"""
+import sys
+import os
+import time
+import tracemalloc
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+import google_news_rss
+import parse_workers
+from news_collector_working import WorkingNewsCollector
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+# search_google_news_html()과 같은 선택자 순서
+NEWS_SELECTORS = ['article', 'div[data-n-tid]', '.NiLAwe', '.MQsxIb', '.IBr9hb', '.SoaBEf', '.WlydOe', 'div[jslog]']
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+def extract_html(raw, collector):
+    """HTML 경로: 부분 파싱 DOM 생성 → 선택자 순차 시도 → 아이템별 제목/링크 선택자"""
+    strainer = parse_workers.build_search_strainer(*NEWS_SELECTORS, "a[href*='news.google.com']")
+    soup = BeautifulSoup(raw, 'html.parser', from_encoding='utf-8', parse_only=strainer)
+    for selector in NEWS_SELECTORS:
+        items = soup.select(selector)
+        if items:
+            return [collector.select_google_news_item(item) for item in items]
+    return []
+
+
+def extract_rss(raw, collector):
+    """RSS 경로: 점진적 XML 파서로 항목만 추출"""
+    return [(item['title'], item['link']) for item in google_news_rss.parse_feed(raw)]
+
+
+def measure(func, raw, collector, repeat):
+    tracemalloc.start()
+    result = func(raw, collector)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(raw, collector)
+    return result, (time.perf_counter() - start) / repeat * 1000, peak / 1024
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    html_raw = load_fixture('google_news_html_search.html')
+    rss_raw = load_fixture('google_news_rss_search.xml')
+    collector = WorkingNewsCollector()
+    try:
+        html_items, html_ms, html_kb = measure(extract_html, html_raw, collector, repeat)
+        rss_items, rss_ms, rss_kb = measure(extract_rss, rss_raw, collector, repeat)
+    finally:
+        collector.close()
+
+    print(f"HTML 검색 페이지: {len(html_raw) / 1024:5.0f}KB, 항목 {len(html_items)}개, {html_ms:6.2f}ms, 최대 메모리 {html_kb:6.0f}KB")
+    print(f"RSS 피드:        {len(rss_raw) / 1024:5.0f}KB, 항목 {len(rss_items)}개, {rss_ms:6.2f}ms, 최대 메모리 {rss_kb:6.0f}KB")
+    print(f"RSS 경로: 다운로드 x{len(html_raw) / len(rss_raw):.1f} 감소, 파싱 x{html_ms / rss_ms:.1f} 빠름, 메모리 x{html_kb / rss_kb:.1f} 감소")
+
+
+if __name__ == '__main__':
+    main()
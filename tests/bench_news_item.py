@@ -0,0 +1,91 @@
+"""
+뉴스 항목 표현 벤치마크 - dict 대비 __slots__ 기반 NewsItem
+
+1만 건(제목/링크/날짜/수집 정보, 본문은 공유 문자열)의 메모리와
+날짜 필터를 여러 번 적용할 때의 날짜 파싱 시간을 비교한다.
+실행: python tests/bench_news_item.py [항목 수]
+"""
+import sys
+import os
+import time
+import tracemalloc
+from datetime import datetime
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from news_item import to_news_items
+
+# 본문 문자열 자체의 크기는 두 표현에서 같으므로 공유하여 컨테이너 오버헤드만 비교
+BODY = '하나투어 본문 문장입니다. ' * 50
+KEYWORDS = ['하나투어', '모두투어', '구글', '제미나이', '야놀자']
+
+
+def build_dicts(count):
+    items = []
+    for index in range(count):
+        keyword = KEYWORDS[index % len(KEYWORDS)]
+        items.append({
+            'title': f"{keyword} 관련 기사 제목 {index}",
+            'link': f"https://www.example.com/news/articleView.html?idxno={index}&utm_source=google",
+            'press': '예시일보',
+            'date': f"2026-10-{1 + index % 28:02d}",
+            'content_preview': BODY[:100],
+            'full_content': BODY,
+            'keyword': keyword,
+            'source_keyword': keyword,
+            'search_date': '20261018',
+            'source': '구글뉴스',
+            'priority': 1,
+            'category': 'AI Insight',
+            'topic': 'AI Insight',
+        })
+    return items
+
+
+def measure_memory(build):
+    tracemalloc.start()
+    items = build()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return items, current / 1024 / 1024
+
+
+def parse_dates_dict(items, passes):
+    """dict: 필터를 적용할 때마다 날짜 문자열을 다시 파싱"""
+    for _ in range(passes):
+        for news in items:
+            datetime.strptime(news['date'], '%Y-%m-%d')
+
+
+def parse_dates_item(items, passes):
+    """NewsItem: 발행일은 처음 접근할 때 한 번만 파싱"""
+    for _ in range(passes):
+        for news in items:
+            news.published
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    passes = 3
+
+    # 같은 문자열을 공유하는 상태에서 컨테이너(dict / NewsItem)가 새로 할당하는 메모리만 비교
+    source = build_dicts(count)
+    dict_items, dict_mb = measure_memory(lambda: [dict(news) for news in source])
+    news_items, item_mb = measure_memory(lambda: to_news_items(source))
+    assert [news.to_dict() for news in news_items] == source
+
+    start = time.perf_counter()
+    parse_dates_dict(dict_items, passes)
+    dict_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    parse_dates_item(news_items, passes)
+    item_ms = (time.perf_counter() - start) * 1000
+
+    print(f"dict:     {count}건 {dict_mb:6.2f}MB, 날짜 파싱 {passes}회 {dict_ms:7.1f}ms")
+    print(f"NewsItem: {count}건 {item_mb:6.2f}MB, 날짜 파싱 {passes}회 {item_ms:7.1f}ms")
+    print(f"항목당 컨테이너: dict {sys.getsizeof(dict_items[0])}B, NewsItem {sys.getsizeof(news_items[0])}B")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+파싱 워커 벤치마크 - 합성 기사 코퍼스로 스레드 직접 파싱 대비 프로세스 풀 확장성 측정
+
+실행: python tests/bench_parse_workers.py [기사 수] [문단 수]
+"""
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parse_workers import ParseWorkerPool, extract_article
+
+
+def build_corpus(count, paragraphs):
+    """언론사 기사와 비슷한 구조(노이즈 영역 + 본문 + 링크)의 합성 HTML 코퍼스"""
+    corpus = []
+    for index in range(count):
+        noise = "".join(f"<li><a href='/related/{index}/{i}'>관련 기사 {i}</a></li>" for i in range(50))
+        body = "".join(
+            f"<p>{index}번 기사 {i}번째 문단입니다. 하나투어와 모두투어의 해외여행 예약이 전년 대비 증가했다. "
+            f"김기자 기자 reporter{i}@news.co.kr 공유하기 좋아요</p>"
+            for i in range(paragraphs)
+        )
+        html = (
+            "<html><head><meta charset='utf-8'>"
+            "<meta property='article:published_time' content='2026-10-18T09:00:00+09:00'>"
+            "<script>var x = 1;</script></head><body>"
+            f"<header><nav><ul>{noise}</ul></nav></header>"
+            f"<div class='article_body'>{body}</div>"
+            f"<aside class='related'><ul>{noise}</ul></aside>"
+            "<footer>ⓒ 무단 전재 및 재배포 금지</footer></body></html>"
+        )
+        corpus.append((html.encode('utf-8'), f'https://www.hani.co.kr/arti/{index}.html'))
+    return corpus
+
+
+def run_threads(corpus, threads):
+    """기존 방식: ThreadPoolExecutor 안에서 직접 파싱 (GIL 제약)"""
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda item: extract_article(item[0], item[1], 'utf-8'), corpus))
+
+
+def run_process_pool(corpus, workers):
+    """워커 프로세스 풀에 파싱 위임 (수집 스레드는 workers개)"""
+    pool = ParseWorkerPool(max_workers=workers)
+    try:
+        # 워커 프로세스 기동 시간은 측정에서 제외
+        warmup = [pool.submit(extract_article, corpus[0][0], corpus[0][1], 'utf-8') for _ in range(workers)]
+        for future in warmup:
+            future.result()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda item: pool.extract(item[0], item[1], 'utf-8'), corpus))
+        return time.perf_counter() - start
+    finally:
+        pool.close()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 80
+    paragraphs = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    corpus = build_corpus(count, paragraphs)
+    size_mb = sum(len(raw) for raw, _ in corpus) / 1024 / 1024
+    print(f"코퍼스: 기사 {count}개, {size_mb:.1f}MB, CPU {os.cpu_count()}코어")
+
+    start = time.perf_counter()
+    run_threads(corpus, 1)
+    baseline = time.perf_counter() - start
+    print(f"스레드 1개 직접 파싱: {baseline:.2f}s (기준)")
+
+    for workers in (2, 4, 8):
+        if workers > (os.cpu_count() or 1) * 2:
+            break
+        start = time.perf_counter()
+        run_threads(corpus, workers)
+        elapsed = time.perf_counter() - start
+        print(f"스레드 {workers}개 직접 파싱: {elapsed:.2f}s (x{baseline / elapsed:.2f})")
+
+        elapsed = run_process_pool(corpus, workers)
+        print(f"프로세스 워커 {workers}개:     {elapsed:.2f}s (x{baseline / elapsed:.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+검색 결과 페이지 파싱 벤치마크 - 전체 DOM 파싱 대비 부분 파싱(링크/날짜 요소만)의 시간과 최대 메모리 측정
+
+실행: python tests/bench_search_parse.py [결과 수] [반복 횟수]
+"""
+import sys
+import os
+import time
+import tracemalloc
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parse_workers import parse_search_results
+
+SITES = [
+    ('연합뉴스', 'https://www.yna.co.kr/search/index', "a[href*='/view/']", '.date', '/view/AKR2026101800{0:02d}'),
+    ('한국경제', 'https://search.hankyung.com/search/news', "a[href*='/article/']", '.txt_date', '/article/2026101800{0:02d}'),
+    ('매일경제', 'https://www.mk.co.kr/search', "a[href*='/news/']", '.date', '/news/economy/110{0:02d}'),
+]
+
+
+def build_search_page(href_pattern, date_class, results):
+    """메뉴/스크립트/광고 등 노이즈가 많은 언론사 검색 결과 페이지와 비슷한 합성 HTML"""
+    menu = "".join(f"<li><a href='/section/{i}'>섹션 {i}</a><ul>" + "<li><a href='#'>하위 메뉴</a></li>" * 10 + "</ul></li>" for i in range(40))
+    rows = "".join(
+        f"<li class='item'><div class='thumb'><img src='/img/{i}.jpg'></div><div class='cont'>"
+        f"<a href='{href_pattern.format(i)}'>하나투어 해외여행 예약 증가 관련 {i}번째 기사 제목</a>"
+        f"<p class='lead'>{'요약 문장입니다. ' * 30}</p>"
+        f"<span class='{date_class.lstrip('.')}'>2026.10.18 09:{i % 60:02d}</span></div></li>"
+        for i in range(results)
+    )
+    ads = "".join(f"<div class='ad'><iframe src='/ad/{i}'></iframe><span>광고</span></div>" for i in range(50))
+    return (
+        "<html><head><meta charset='utf-8'>" + "<script>var config = {a: 1};</script>" * 30 + "</head><body>"
+        f"<header><nav><ul>{menu}</ul></nav></header><main><ul class='list'>{rows}</ul></main>"
+        f"<aside>{ads}</aside><footer>{'<p>회사 소개 | 이용약관</p>' * 100}</footer></body></html>"
+    ).encode('utf-8')
+
+
+def measure(raw, url, link_selector, date_selector, partial, repeat):
+    """평균 파싱 시간(ms)과 1회 파싱의 최대 메모리(KB)"""
+    tracemalloc.start()
+    result = parse_search_results(raw, 'utf-8', url, link_selector, date_selector, partial=partial)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_search_results(raw, 'utf-8', url, link_selector, date_selector, partial=partial)
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    return result, elapsed, peak / 1024
+
+
+def main():
+    results = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    for name, url, link_selector, date_selector, href_pattern in SITES:
+        raw = build_search_page(href_pattern, date_selector, results)
+        full, full_ms, full_kb = measure(raw, url, link_selector, date_selector, False, repeat)
+        partial, partial_ms, partial_kb = measure(raw, url, link_selector, date_selector, True, repeat)
+        assert full['items'] == partial['items']
+
+        print(f"[{name}] 페이지 {len(raw) / 1024:.0f}KB, 결과 {len(partial['items'])}개")
+        print(f"  전체 파싱: {full_ms:7.1f}ms, 최대 메모리 {full_kb:8.0f}KB, 요소 {full['elements']}개")
+        print(f"  부분 파싱: {partial_ms:7.1f}ms, 최대 메모리 {partial_kb:8.0f}KB, 요소 {partial['elements']}개 "
+              f"(시간 x{full_ms / partial_ms:.1f}, 메모리 x{full_kb / partial_kb:.1f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+본문 압축 벤치마크 - 현재 방식(정제된 본문 앞 1000자)과 핵심 문장 추출(text_condenser)의 비교
+
+기사 픽스처(tests/fixtures/condenser_articles.json)마다 입력 토큰(추정)과
+품질 지표를 출력한다.
+- 사실 보존율: 현재 발췌에 있던 수치와 제목 단어 중 압축본에도 남은 비율
+- 노이즈: 바이라인/사진 설명/저작권 문구가 남은 개수
+실행: python tests/bench_text_condenser.py [핵심 문장 수]
+"""
+import sys
+import os
+import re
+import json
+import time
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetch_budget import estimate_tokens
+from parse_workers import clean_news_content
+from text_condenser import condense, tokenize
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'condenser_articles.json')
+NOISE_PATTERN = re.compile(r'사진\s*=|자료\s*:|그래픽\s*=|▲|▶|■|구독하기|기사\s*제보|all rights reserved|무단\s*전재|\[[^\]]*\s\]', re.IGNORECASE)
+
+
+def facts(text, title):
+    """수치와 제목 단어 (사실 보존율 계산용)"""
+    numbers = set(re.findall(r'\d+(?:\.\d+)?%?', text))
+    title_words = set(tokenize(title)) & set(tokenize(text))
+    return numbers | title_words
+
+
+def fact_recall(current, condensed, title):
+    expected = facts(current, title)
+    if not expected:
+        return 1.0
+    kept = set(re.findall(r'\d+(?:\.\d+)?%?', condensed)) | set(tokenize(condensed))
+    return len(expected & kept) / len(expected)
+
+
+def main():
+    max_sentences = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with open(FIXTURE_PATH, 'r', encoding='utf-8') as f:
+        articles = json.load(f)
+
+    total_current = total_condensed = 0
+    for article in articles:
+        cleaned = clean_news_content(article['content'])
+        current = cleaned[:1000]
+        started = time.perf_counter()
+        condensed = condense(cleaned, article['title'], max_sentences)[:1500]
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        current_tokens, condensed_tokens = estimate_tokens(current), estimate_tokens(condensed)
+        total_current += current_tokens
+        total_condensed += condensed_tokens
+        print(f"{article['title'][:24]:<24} 토큰 {current_tokens:4d} -> {condensed_tokens:4d} "
+              f"({(1 - condensed_tokens / current_tokens) * 100:5.1f}% 감소), "
+              f"사실 보존 {fact_recall(current, condensed, article['title']) * 100:5.1f}%, "
+              f"노이즈 {len(NOISE_PATTERN.findall(current))} -> {len(NOISE_PATTERN.findall(condensed))}, {elapsed_ms:.1f}ms")
+    print(f"합계 토큰 {total_current} -> {total_condensed} ({(1 - total_condensed / total_current) * 100:.1f}% 감소)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import sys
+import os
+from types import SimpleNamespace
+
+import pytest
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import llm_client
+import news_summarizer_v2
+from news_summarizer_v2 import NewsSummarizerV2
+
+# 테스트 요약기 기본 설정 (환경변수로 __init__에 전달)
+SUMMARIZER_TEST_ENV = {
+    'SUMMARY_MODE': 'single',
+    'SUMMARY_OUTPUT': 'text',
+    'SUMMARY_STREAM': 'false',
+    'PROMPT_CATEGORY_INPUT_TOKENS': '6000',
+    'PROMPT_MAX_ITEMS_PER_CATEGORY': '15',
+    'PROMPT_EXCERPT_MIN_CHARS': '200',
+    'PROMPT_EXCERPT_MAX_CHARS': '1500',
+    'PROMPT_CONDENSE_SENTENCES': '0',
+    'RELEVANCE_MIN_RATIO': '0.1',
+    'LLM_CACHE_ENABLED': 'false',
+    'LLM_CACHE_TTL_HOURS': '24',
+    'LLM_RPM': '0',
+    'LLM_TPM': '0',
+}
+
+
+@pytest.fixture
+def make_summarizer(tmp_path, monkeypatch):
+    """NewsSummarizerV2를 __init__으로 생성하는 함수
+
+    설정은 환경변수(SUMMARIZER_TEST_ENV + 인자)로 주고, Gemini 초기화(setup_gemini)만 가짜 모델로 대체한다.
+    google.generativeai 없이 GenerationConfig 인자를 dict로 확인한다.
+
+    사용 예: make_summarizer(model, SUMMARY_OUTPUT='json')
+    """
+    monkeypatch.setattr(news_summarizer_v2, 'genai', SimpleNamespace(types=SimpleNamespace(GenerationConfig=dict)))
+
+    def factory(model, **env):
+        settings = dict(SUMMARIZER_TEST_ENV, LLM_CACHE_PATH=str(tmp_path / 'llm.json'), **env)
+        for name, value in settings.items():
+            monkeypatch.setenv(name, str(value))
+
+        def setup_gemini(self):
+            self.model, self.model_name = model, 'gemini-test'
+
+        monkeypatch.setattr(NewsSummarizerV2, 'setup_gemini', setup_gemini)
+        # 공유 LLM 클라이언트도 위 환경변수로 새로 생성 (테스트 종료 후 원래 클라이언트 복원)
+        monkeypatch.setattr(llm_client, '_default_client', None)
+        return NewsSummarizerV2()
+
+    return factory
@@ -0,0 +1,71 @@
+import sys
+import os
+import json
+import logging
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from article_summaries import ArticleSummaryStore, article_key, compact_for_curation
+from news_item import NewsItem, to_dicts
+
+BODY = '하나투어가 겨울 시즌 일본 패키지 예약이 전년 대비 크게 늘었다고 밝혔다. ' * 30
+
+
+def make_news(count):
+    return [
+        NewsItem(
+            title=f'하나투어 기사 {index}', link=f'https://example.com/news/{index}', press='예시일보',
+            date='2026-10-18', content_preview=f'{index}번 기사 미리보기 ' + BODY[:300], full_content=f'{index} ' + BODY,
+            category='Travel & Business'
+        )
+        for index in range(count)
+    ]
+
+
+def make_summary_text(news_list):
+    lines = ['[Executive Summary]', '이번 주 여행 수요가 늘었습니다.', '[BIZ]']
+    for index, news in enumerate(news_list, 1):
+        lines += [f'번호: {index}', f'ID: {index}', f'제목: {news["title"]} 요약 카드',
+                  f'요약: {index}번 기사는 겨울 시즌 일본 패키지 예약 증가를 다룹니다.', f'링크: {news["link"]}']
+    return '\n'.join(lines)
+
+
+def test_daily_cards_recorded_and_reused_by_archive_key(tmp_path):
+    from newsletter_system import NewsletterSystem
+    system = NewsletterSystem.__new__(NewsletterSystem)
+    system.logger = logging.getLogger(__name__)
+    system.article_summaries = ArticleSummaryStore(path=str(tmp_path / 'summaries.json'))
+
+    news_list = make_news(6)
+    html = system.generate_newsletter_content_v3(
+        make_summary_text(news_list[:5]), {'Travel & Business': news_list}, news_list
+    )
+    assert html and len(system.article_summaries) == 5
+
+    # 아카이브(본문은 full_content_ref)에서 읽은 기사도 같은 키로 조회
+    bodies = {}
+    archived = json.loads(json.dumps(to_dicts(news_list, bodies), ensure_ascii=False))
+    assert article_key(archived[0]) == news_list[0].body_digest
+    reloaded = ArticleSummaryStore(path=str(tmp_path / 'summaries.json'))
+    assert reloaded.get(archived[0])['summary'].startswith('1번 기사')
+    assert reloaded.get(archived[5]) is None
+
+
+def test_compact_for_curation_shrinks_prompt(tmp_path):
+    store = ArticleSummaryStore(path=str(tmp_path / 'summaries.json'))
+    news_list = make_news(40)
+    for news in news_list[:12]:
+        store.record(news, f"{news['title']} 핵심 요약 한 문장.")
+    archived = to_dicts(news_list, {})
+    # 같은 기사가 여러 날 아카이브에 있어도 1건
+    compact = compact_for_curation(archived + archived[:5], store)
+    assert len(compact) == 12 and all(item['summary'].endswith('핵심 요약 한 문장.') for item in compact)
+
+    def prompt_text(items):
+        return ''.join(f"제목: {news['title']}\n요약: {news.get('summary', news.get('content_preview', ''))}\n" for news in items)
+    assert len(prompt_text(compact)) * 10 < len(prompt_text(archived))
+
+    # 요약된 기사가 부족하면 요약 없는 기사를 짧은 미리보기로 보충
+    few = compact_for_curation(archived[10:20], store, min_items=10)
+    assert len(few) == 10 and max(len(item['summary']) for item in few) <= 150
@@ -0,0 +1,63 @@
+import sys
+import os
+import gc
+import json
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from body_store import BodyStore, body_digest, default_store
+from news_item import NewsItem, to_dicts, body_preview
+
+BODY = '하나투어가 겨울 시즌 일본 패키지 예약이 전년 대비 늘었다고 밝혔다. ' * 40
+
+
+def test_identical_bodies_stored_once():
+    store = BodyStore()
+    first = store.put(BODY)
+    second = store.put(BODY)
+    assert first == second == body_digest(BODY) and first is second
+    assert store.summary()['bodies'] == 1 and store.stats['deduplicated'] == 1
+    assert store.get(first) == BODY
+    assert store.get_prefix(first, 10) == BODY[:10]
+    store.release(first)
+    assert store.get(first) == BODY
+    store.release(first)
+    assert store.get(first) is None and store.summary()['bodies'] == 0
+
+
+def test_news_items_reference_shared_body():
+    before = default_store.summary()['bodies']
+    items = [NewsItem(title=f'기사 {index}', link=f'https://example.com/{index}', full_content=BODY) for index in range(3)]
+    assert default_store.summary()['bodies'] == before + 1
+    assert items[0].body_digest is items[1].body_digest
+    assert items[0]['full_content'] == BODY and 'full_content' in items[0]
+    assert body_preview(items[0], 1000) == BODY[:1000] and body_preview({'full_content': BODY}, 5) == BODY[:5]
+
+    copied = items[0].copy()
+    assert copied == items[0] and copied.body_digest == items[0].body_digest
+    # 빈 본문은 저장소를 거치지 않음
+    assert NewsItem(full_content='').body_digest is None
+
+    del items, copied
+    gc.collect()
+    assert default_store.summary()['bodies'] == before
+
+
+def test_archive_round_trip_dedupes_bodies():
+    items = [
+        NewsItem(title='연합뉴스 기사', link='https://yna.co.kr/1', full_content=BODY),
+        NewsItem(title='같은 기사 전재', link='https://example.com/2', full_content=BODY),
+        {'title': '본문 없는 dict', 'link': 'https://example.com/3'},
+    ]
+    bodies = {}
+    archived = json.loads(json.dumps({'raw_news': to_dicts(items, bodies), 'bodies': bodies}, ensure_ascii=False))
+    assert len(archived['bodies']) == 1
+    assert 'full_content' not in archived['raw_news'][0] and archived['raw_news'][0]['full_content_ref'] == body_digest(BODY)
+
+    restored = [NewsItem.from_dict(news, archived['bodies']) for news in archived['raw_news']]
+    assert [dict(news) for news in restored] == [dict(news) for news in items]
+
+    plain_bytes = len(json.dumps(to_dicts(items), ensure_ascii=False).encode('utf-8'))
+    stored_bytes = len(json.dumps(archived, ensure_ascii=False).encode('utf-8'))
+    assert stored_bytes < plain_bytes
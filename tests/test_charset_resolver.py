@@ -0,0 +1,49 @@
+import sys
+import os
+import codecs
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from charset_resolver import CharsetResolver
+from parse_workers import extract_article
+
+KOREAN_BODY = "<div class='article_body'>" + "<p>하나투어 해외여행 예약이 전년 대비 크게 늘었다. 똠방각하 뷁 햏</p>" * 20 + "</div>"
+
+
+def test_resolution_order():
+    resolver = CharsetResolver()
+    html = f"<html><head><meta charset='euc-kr'></head><body>{KOREAN_BODY}</body></html>"
+    raw = html.encode('cp949')
+
+    # 헤더에 명시된 charset이 최우선
+    assert resolver.resolve('https://a.co.kr/1', {'Content-Type': 'text/html; charset=UTF-8'}, raw) == ('utf-8', 'header')
+    # charset 없는 헤더 → <meta charset>, EUC-KR은 CP949로 치환
+    assert resolver.resolve('https://a.co.kr/1', {'Content-Type': 'text/html'}, raw) == ('cp949', 'meta')
+    # http-equiv 형식
+    raw_equiv = b"<html><head><meta http-equiv='Content-Type' content='text/html; charset=utf-8'></head></html>"
+    assert resolver.resolve('https://b.co.kr/1', {}, raw_equiv) == ('utf-8', 'meta')
+    # BOM
+    assert resolver.resolve('https://c.co.kr/1', {}, codecs.BOM_UTF8 + "<html>본문</html>".encode('utf-8')) == ('utf-8-sig', 'bom')
+
+
+def test_host_cache_skips_detection():
+    resolver = CharsetResolver()
+    with_meta = f"<html><head><meta charset='euc-kr'></head><body>{KOREAN_BODY}</body></html>".encode('cp949')
+    without_meta = f"<html><body>{KOREAN_BODY}</body></html>".encode('cp949')
+
+    resolver.resolve('https://news.example.co.kr/a', {'Content-Type': 'text/html'}, with_meta)
+    # 같은 호스트의 메타 없는 페이지는 통계 감지 없이 캐시 사용
+    assert resolver.resolve('https://news.example.co.kr/b', {'Content-Type': 'text/html'}, without_meta) == ('cp949', 'host_cache')
+    assert resolver.stats['detect'] == 0
+
+    # 처음 보는 호스트는 앞부분 샘플로 감지 후 캐시
+    encoding, source = resolver.resolve('https://other.example.co.kr/a', {}, without_meta)
+    assert source == 'detect'
+    assert without_meta.decode(encoding) == without_meta.decode('cp949')
+
+
+def test_parser_receives_bytes_with_encoding():
+    raw = f"<html><body>{KOREAN_BODY}</body></html>".encode('cp949')
+    result = extract_article(raw, 'https://news.example.co.kr/a', 'cp949', want=('content',))
+    assert '하나투어 해외여행' in result['content'] and '똠방각하' in result['content']
@@ -0,0 +1,199 @@
+import sys
+import os
+import logging
+import tempfile
+from types import SimpleNamespace
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetch_budget import RunBudget, KeywordYieldStats, split_by_weight, estimate_tokens
+from http_session_pool import FetchResult
+
+TOPICS = [
+    {'name': 'Technology Trends', 'keywords': ['AI 인프라', '양자 컴퓨팅'], 'weight': 35},
+    {'name': 'AI Insight', 'keywords': ['구글', '제미나이', '코파일럿'], 'weight': 35},
+    {'name': 'Travel & Business', 'keywords': ['하나투어', '모두투어'], 'weight': 30},
+]
+
+
+def test_split_by_weight_and_keyword_yield():
+    assert split_by_weight(100, {'a': 35, 'b': 35, 'c': 30}) == {'a': 35, 'b': 35, 'c': 30}
+    shares = split_by_weight(10, {'a': 35, 'b': 35, 'c': 30})
+    assert sum(shares.values()) == 10 and shares['c'] == 3
+    # 총량이 작아도 가능하면 항목마다 최소 1
+    assert split_by_weight(3, {'a': 100, 'b': 1, 'c': 1}, minimum=1) == {'a': 1, 'b': 1, 'c': 1}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = KeywordYieldStats(path=os.path.join(tmp, 'yield.json'))
+        stats.record('하나투어', 9)
+        stats.record('모두투어', 1)
+        stats.save()
+        reloaded = KeywordYieldStats(path=os.path.join(tmp, 'yield.json'))
+        assert reloaded.get('하나투어') == 9 and reloaded.get('구글') is None
+
+        budget = RunBudget(TOPICS, {'bodies': 100, 'requests': 20}, reloaded)
+        assert budget.topic_allocations['bodies'] == {'Technology Trends': 35, 'AI Insight': 35, 'Travel & Business': 30}
+        # 주제 안에서는 최소 1개씩 보장 후 과거 수집량(+1) 비례: 하나투어 10 : 모두투어 2
+        assert budget.keyword_allowance('bodies', '하나투어') == 24 and budget.keyword_allowance('bodies', '모두투어') == 6
+        assert budget.articles_for_keyword('하나투어', 20) == 20 and budget.articles_for_keyword('모두투어', 20) == 6
+        # 제한하지 않는 항목
+        assert budget.keyword_allowance('llm_tokens', '하나투어') is None and budget.try_acquire('llm_tokens', amount=10 ** 9)
+
+
+def test_try_acquire_hard_caps():
+    budget = RunBudget(TOPICS, {'requests': 7})
+    allowance = budget.keyword_allowance('requests', '하나투어')
+    assert [budget.try_acquire('requests', '하나투어') for _ in range(allowance + 1)] == [True] * allowance + [False]
+    # 키워드 없는 요청(묶음 검색)은 실행 총량만 확인
+    while budget.try_acquire('requests'):
+        pass
+    assert budget.summary()['requests']['used'] == 7
+    assert not budget.try_acquire('requests', '구글')
+
+
+def test_summarizer_selects_within_token_budget():
+    from news_summarizer_v2 import NewsSummarizerV2
+    news = [{'title': f'하나투어 기사 {index}', 'link': f'https://example.com/{index}', 'full_content': '가' * 300} for index in range(5)]
+    per_article = estimate_tokens(f"제목: {news[0]['title']}\n링크: {news[0]['link']}\n본문: {'가' * 300}\n\n")
+    budget = RunBudget(TOPICS, {'llm_tokens': per_article * 10})
+    summarizer = SimpleNamespace(run_budget=budget, logger=logging.getLogger(__name__))
+    allowance = budget.topic_allowance('llm_tokens', 'Travel & Business')
+    selected = NewsSummarizerV2.select_news_within_budget(summarizer, news, 'Travel & Business')
+    assert len(selected) == allowance // per_article == 3
+    summarizer.run_budget = None
+    assert NewsSummarizerV2.select_news_within_budget(summarizer, news, 'Travel & Business') == news
+
+
+def test_collector_stops_body_downloads_when_exhausted(monkeypatch):
+    from news_collector_working import WorkingNewsCollector
+    collector = WorkingNewsCollector()
+    fetched = []
+    page = ('<html><body><article><p>' + '하나투어 본문 문장입니다. ' * 20 + '</p></article></body></html>').encode('utf-8')
+
+    def fake_fetch(url, **kwargs):
+        fetched.append(url)
+        return FetchResult(200, url, {'Content-Type': 'text/html; charset=utf-8'}, page, 'utf-8')
+
+    monkeypatch.setattr(collector.session, 'fetch_limited', fake_fetch)
+    collector.run_budget = RunBudget(TOPICS, {'bodies': 3})
+    try:
+        results = [collector.extract_full_content(f'https://example.com/budget/{index}') for index in range(5)]
+        assert len(fetched) == 3
+        assert all(results[:3]) and results[3:] == ['', '']
+    finally:
+        collector.close()
+
+
+def test_full_refetch_is_charged_to_body_budget(tmp_path, monkeypatch):
+    from news_collector_working import WorkingNewsCollector
+    from negative_cache import NegativeCache
+    collector = WorkingNewsCollector()
+    collector.negative_cache = NegativeCache(path=str(tmp_path / 'negative_cache.json'))
+    fetched = []
+    teaser = '<html><body><div id="articleBody"><p>짧은 티저</p></div></article>'.encode('utf-8')
+    page = ('<html><body><article><p>' + '하나투어 본문 문장입니다. ' * 20 + '</p></article></body></html>').encode('utf-8')
+
+    def fake_fetch(url, **kwargs):
+        # 조기 종료된 첫 응답은 티저만, 전체 재요청(stop_markers 없음)은 본문 포함
+        fetched.append(url)
+        stopped = bool(kwargs.get('stop_markers'))
+        result = FetchResult(200, url, {'Content-Type': 'text/html; charset=utf-8'}, teaser if stopped else page, 'utf-8')
+        result.stopped_early = stopped
+        return result
+
+    monkeypatch.setattr(collector.session, 'fetch_limited', fake_fetch)
+    try:
+        # 전체 재요청도 본문 예산에서 차감: 예산이 1건이면 재요청하지 않음
+        collector.run_budget = RunBudget(TOPICS, {'bodies': 1})
+        assert len(collector.extract_full_content('https://example.com/teaser/0')) < 100
+        assert len(fetched) == 1 and collector.run_budget.summary()['bodies']['used'] == 1
+
+        collector.run_budget = RunBudget(TOPICS, {'bodies': 2})
+        assert '하나투어 본문' in collector.extract_full_content('https://example.com/teaser/1')
+        assert len(fetched) == 3 and collector.run_budget.summary()['bodies']['used'] == 2
+    finally:
+        collector.close()
+
+
+def test_topic_collection_keeps_retry_and_fallback(monkeypatch):
+    import error_recovery
+    from newsletter_system import NewsletterSystem
+
+    class BrokenCollector:
+        def __init__(self):
+            self.calls = 0
+
+        def get_target_search_date(self):
+            self.calls += 1
+            raise ConnectionError('수집기 연결 실패')
+
+        def cleanup(self):
+            pass
+
+    monkeypatch.setattr(error_recovery.time, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(error_recovery.fallback_manager, 'error_counts', {})
+    system = NewsletterSystem.__new__(NewsletterSystem)
+    system.logger = logging.getLogger(__name__)
+    system._news_collector = BrokenCollector()
+
+    # 예산 배분/검색 계획 메서드가 아니라 주제별 수집에 재시도(3회)와 Fallback이 적용되어야 함
+    news = system.collect_news_for_topic(TOPICS[2])
+    assert system._news_collector.calls == 3
+    assert [item['title'] for item in news] == ['Travel & Business 관련 최신 동향 - 하나투어', 'Travel & Business 관련 최신 동향 - 모두투어']
+    assert not hasattr(NewsletterSystem.start_run_budget, '__wrapped__')
+    assert not hasattr(NewsletterSystem.plan_news_queries, '__wrapped__')
+
+
+def test_run_test_applies_run_budget(monkeypatch):
+    from newsletter_system import NewsletterSystem
+
+    class FakeCollector:
+        def __init__(self):
+            self.run_budget = None
+            self.fetch_counts = {}
+            self.budget_during_search = []
+            self.negative_cache_saved = False
+
+        def get_target_search_date(self):
+            return '2026-10-18'
+
+        def plan_keyword_queries(self, keywords, limit, target_date):
+            pass
+
+        def clear_planned_queries(self):
+            pass
+
+        def search_naver_news_with_retry(self, keyword, max_results, target_date):
+            self.fetch_counts[keyword] = max_results
+            self.budget_during_search.append(self.run_budget)
+            return [{'title': f'{keyword} 기사 {index}', 'link': f'https://example.com/{keyword}/{index}'} for index in range(2)]
+
+        def save_negative_cache(self):
+            self.negative_cache_saved = True
+
+        def cleanup(self):
+            pass
+
+    monkeypatch.setenv('RUN_BUDGET_BODIES', '10')
+    with tempfile.TemporaryDirectory() as tmp:
+        system = NewsletterSystem.__new__(NewsletterSystem)
+        system.logger = logging.getLogger(__name__)
+        system.keyword_manager = SimpleNamespace(get_topics=lambda: TOPICS[2:])
+        system.staging_store = SimpleNamespace(get_items=lambda target_date, keyword: ([], None))
+        system.keyword_yield = KeywordYieldStats(path=os.path.join(tmp, 'yield.json'))
+        system.run_budget = None
+        system._news_collector = FakeCollector()
+        # 요약 단계는 이 테스트의 대상이 아니므로 실패로 건너뜀
+        system._news_summarizer = SimpleNamespace(run_budget=None, topic_keywords={}, last_manifest=None)
+        monkeypatch.setattr(system, 'summarize_news_v3', lambda news, raw: (None, None))
+
+        assert system.run_test()
+        collector = system._news_collector
+        # 테스트 실행에도 본문 예산(10개, 키워드 5개씩)이 적용되고 수집 종료 시 해제
+        assert collector.fetch_counts == {'하나투어': 5, '모두투어': 5}
+        assert all(budget is system.run_budget for budget in collector.budget_during_search)
+        assert collector.run_budget is None and collector.negative_cache_saved
+        assert system._news_summarizer.run_budget is system.run_budget
+        # 키워드별 수집량이 다음 실행의 배분 기준으로 저장
+        assert KeywordYieldStats(path=os.path.join(tmp, 'yield.json')).get('하나투어') == 2
@@ -0,0 +1,98 @@
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_session_pool import SessionPool
+
+ARTICLE_PAGE = (
+    "<html><head><meta property='article:published_time' content='2026-10-18'></head><body>"
+    "<article>" + "<p>하나투어 신규 상품 기사 본문입니다.</p>" * 50 + "</article>"
+    + "<div class='related'>" + "관련 기사 목록 " * 200000 + "</div></body></html>"
+).encode('utf-8')
+
+# 본문 앞에 사이드바 <article>이 있는 페이지
+SIDEBAR_PAGE = (
+    "<html><body><aside><article>많이 본 뉴스</article></aside>"
+    '<div id="articleBody">' + "<p>모두투어 기획전 기사 본문입니다.</p>" * 50 + "</div></article>"
+    + "<div class='related'>" + "관련 기사 목록 " * 200000 + "</div></body></html>"
+).encode('utf-8')
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path == '/article':
+            self._send(ARTICLE_PAGE, 'text/html; charset=utf-8')
+        elif self.path == '/sidebar':
+            self._send(SIDEBAR_PAGE, 'text/html; charset=utf-8')
+        elif self.path == '/video':
+            self._send(b'\x00' * 500000, 'video/mp4')
+        elif self.path == '/redirect':
+            self.send_response(302)
+            self.send_header('Location', '/article')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        else:
+            self._send(b'', 'text/html')
+
+    def _send(self, body, content_type):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_fetch_limited_stops_early_and_rejects():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    pool = SessionPool(max_workers=1)
+    pool.max_bytes = len(ARTICLE_PAGE) * 2
+    try:
+        # 1. </article>를 만나면 나머지(관련 기사 수 MB)는 받지 않음
+        result = pool.fetch_limited(f"{base}/article", stop_markers=[(b'</article>',)])
+        assert result.stopped_early
+        assert b'</article>' in result.content
+        assert len(result.content) < len(ARTICLE_PAGE) // 10
+        assert '하나투어' in result.text
+
+        # 그룹의 마커는 순서대로: 본문 컨테이너 앞의 사이드바 </article>에서는 멈추지 않음
+        result = pool.fetch_limited(f"{base}/sidebar", stop_markers=[(b'id="articlebody', b'</article>')])
+        assert result.stopped_early and result.text.count('모두투어 기획전') == 50
+        assert len(result.content) < len(SIDEBAR_PAGE) // 10
+
+        # 2. 바이트 상한: 상한을 넘는 페이지는 상한까지 받아 절단, 상한의 몇 배인 페이지만 거부
+        result = pool.fetch_limited(f"{base}/article", max_bytes=len(ARTICLE_PAGE) // 4)
+        assert result.truncated and not result.rejected
+        assert len(result.content) == len(ARTICLE_PAGE) // 4 and '하나투어' in result.text
+        result = pool.fetch_limited(f"{base}/article", max_bytes=64 * 1024, accept_types=None)
+        assert result.rejected == 'too_large' and result.content == b''
+        result = pool.fetch_limited(f"{base}/article")
+        assert not result.truncated and len(result.content) == len(ARTICLE_PAGE)
+
+        # 3. 동영상 등 HTML이 아닌 응답은 헤더만 보고 거부
+        result = pool.fetch_limited(f"{base}/video")
+        assert result.rejected == 'content_type' and result.content == b''
+
+        # 4. 최종 URL만 확인 (본문 미수신)
+        result = pool.fetch_limited(f"{base}/redirect", max_bytes=0)
+        assert result.url.endswith('/article') and result.content == b''
+
+        transfer = pool.get_transfer_stats()
+        assert transfer['stopped_early'] == 2 and transfer['rejected'] == 2 and transfer['truncated'] == 1
+        assert transfer['bytes_downloaded'] < len(ARTICLE_PAGE) * 1.6
+    finally:
+        pool.close()
+        server.shutdown()
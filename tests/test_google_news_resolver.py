@@ -0,0 +1,113 @@
+import sys
+import os
+import base64
+import threading
+import tempfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from google_news_resolver import GoogleNewsResolver, decode_article_id, get_article_id
+from http_session_pool import SessionPool
+from negative_cache import NegativeCache
+
+
+def encode_legacy_id(url):
+    """구형 구글 뉴스 기사 ID(CBMi...) 생성"""
+    raw = b'\x08\x13\x22' + bytes([len(url)]) + url.encode() + b'\xd2\x01\x00'
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+# 원문 리다이렉트 확인용 언론사 페이지 (본문을 받으면 바이트 통계에 드러나도록 크게)
+PUBLISHER_PAGE = ("<html><body><article>원문 기사</article>" + "<p>관련 기사</p>" * 20000 + "</body></html>").encode('utf-8')
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    hits = []
+
+    def do_GET(self):
+        FixtureHandler.hits.append(self.path)
+        if self.path.endswith('/AU_redirect'):
+            self.send_response(302)
+            self.send_header('Location', '/publisher/news/1')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self.path.endswith('/AU_attribute'):
+            self._send(200, b"<html><body><c-wiz><div data-n-au=\"https://www.hankyung.com/article/2026101800\"></div></c-wiz></body></html>")
+        elif self.path.startswith('/publisher/'):
+            self._send(200, PUBLISHER_PAGE)
+        else:
+            self._send(404, b'not found')
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_decode_legacy_article_id():
+    publisher_url = 'https://www.yna.co.kr/view/AKR20261018000100030'
+    article_id = encode_legacy_id(publisher_url)
+    assert article_id.startswith('CBMi')
+    link = f"https://news.google.com/rss/articles/{article_id}?oc=5&hl=ko&gl=KR"
+    assert get_article_id(link) == article_id
+    assert decode_article_id(article_id) == publisher_url
+    # 신형 ID는 URL을 포함하지 않음
+    assert decode_article_id('AU_yqLOcXk1b2Zz') is None
+
+
+def test_resolve_many_with_persistent_cache():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/news.google.com/rss/articles"
+    legacy = f"https://news.google.com/rss/articles/{encode_legacy_id('https://www.mk.co.kr/news/economy/11000001')}"
+    links = [f"{base}/AU_redirect", f"{base}/AU_attribute", f"{base}/AU_gone", legacy]
+    pool = SessionPool(max_workers=2)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = os.path.join(tmp, 'google_news_links.json')
+            negative_cache = NegativeCache(path=os.path.join(tmp, 'negative_cache.json'))
+            resolver = GoogleNewsResolver(pool, cache_path=cache_path, max_workers=4, negative_cache=negative_cache)
+
+            FixtureHandler.hits.clear()
+            resolved = resolver.resolve_many(links)
+            assert resolved[links[0]].endswith('/publisher/news/1')
+            assert resolved[links[1]] == 'https://www.hankyung.com/article/2026101800'
+            assert resolved[links[2]] is None and negative_cache.is_dead(links[2])
+            assert resolved[links[3]] == 'https://www.mk.co.kr/news/economy/11000001'  # 네트워크 없이 디코딩
+            assert resolver.stats['decode'] == 1 and resolver.stats['failed'] == 1
+            # 리다이렉트로 원문 URL을 알게 되면 언론사 페이지 본문은 받지 않음
+            assert FixtureHandler.hits.count('/publisher/news/1') == 1
+            assert pool.get_transfer_stats()['bytes_downloaded'] < len(PUBLISHER_PAGE) // 10
+
+            # 다음 실행: 캐시에서 바로 반환 (요청 없음)
+            hits = len(FixtureHandler.hits)
+            reloaded = GoogleNewsResolver(pool, cache_path=cache_path, negative_cache=negative_cache)
+            assert reloaded.resolve_many(links) == resolved
+            assert reloaded.stats['cache'] == 4 and len(FixtureHandler.hits) == hits
+    finally:
+        pool.close()
+        server.shutdown()
+
+
+def test_remove_duplicate_urls_keeps_higher_priority():
+    from news_collector_working import WorkingNewsCollector
+    collector = WorkingNewsCollector()
+    try:
+        news_list = [
+            {'title': '일반 뉴스 제목', 'link': 'https://m.yna.co.kr/view/AKR1?utm_source=google', 'priority': 3},
+            {'title': '다른 기사', 'link': 'https://www.hani.co.kr/arti/1.html', 'priority': 3},
+            {'title': '구글 뉴스 제목', 'link': 'https://www.yna.co.kr/view/AKR1/', 'priority': 1},
+        ]
+        unique = collector.remove_duplicate_urls(news_list)
+        assert [news['title'] for news in unique] == ['구글 뉴스 제목', '다른 기사']
+    finally:
+        collector.close()
@@ -0,0 +1,85 @@
+import sys
+import os
+import tempfile
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from xml.etree.ElementTree import ParseError
+
+import google_news_rss
+from http_session_pool import FetchResult
+from keyword_manager import KeywordManager
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+def test_parse_feed_fields_and_limit():
+    raw = load_fixture('google_news_rss_search.xml')
+    items = google_news_rss.parse_feed(raw)
+    assert len(items) == 20
+
+    first = items[0]
+    # 제목 끝의 ' - 언론사' 제거, 언론사는 <source>에서
+    assert first['title'] == '하나투어, 겨울 시즌 일본 패키지 예약 전년 대비 40% 증가'
+    assert first['source'] == '연합뉴스' and first['source_url'] == 'https://www.yna.co.kr'
+    assert first['link'].startswith('https://news.google.com/rss/articles/CBMi')
+    # pubDate(GMT 전날 15시)는 한국 시간 날짜로 변환
+    assert first['pub_date'].startswith('Sat, 17 Oct 2026 15:15')
+    assert {item['date'] for item in items} == {'2026-10-18'}
+
+    assert len(google_news_rss.parse_feed(raw, limit=5)) == 5
+    # 바이트 상한으로 잘린 피드는 완성된 항목까지만
+    assert 0 < len(google_news_rss.parse_feed(raw[:len(raw) // 2])) < 20
+    with pytest.raises(ParseError):
+        google_news_rss.parse_feed(b'<html><body>not a feed')
+
+
+def test_search_url():
+    url = google_news_rss.build_search_url('하나투어', '2026-10-18', '2026-10-19')
+    assert url.startswith('https://news.google.com/rss/search?q=')
+    assert 'after%3A2026-10-18+before%3A2026-10-19' in url and 'ceid=KR%3Ako' in url
+
+
+def test_collector_rss_mode_per_keyword(monkeypatch):
+    from news_collector_working import WorkingNewsCollector
+    collector = WorkingNewsCollector()
+    raw = load_fixture('google_news_rss_search.xml')
+    requested = []
+
+    def fake_fetch(url, **kwargs):
+        requested.append(url)
+        return FetchResult(200, url, {'Content-Type': 'application/xml; charset=utf-8'}, raw, 'utf-8')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        keyword_manager = KeywordManager(config_file=os.path.join(tmp, 'keywords_config.json'))
+        keyword_manager.set_google_news_mode('html', keyword='모두투어')
+        collector.keyword_manager = keyword_manager
+        collector.google_resolver.cache_path = os.path.join(tmp, 'google_news_links.json')
+        monkeypatch.setattr(collector.session, 'fetch_limited', fake_fetch)
+        monkeypatch.setattr(collector, 'extract_full_content', lambda link: f"{link} 본문")
+        monkeypatch.setattr(collector, 'search_google_news_html', lambda *args: ['html'])
+        try:
+            assert collector.get_google_news_mode('하나투어') == 'auto'
+            # 키워드 설정이 없으면 GOOGLE_NEWS_MODE 환경변수 적용
+            monkeypatch.setenv('GOOGLE_NEWS_MODE', 'html')
+            assert collector.get_google_news_mode('하나투어') == 'html'
+            monkeypatch.setenv('GOOGLE_NEWS_MODE', 'auto')
+            news_list = collector.search_google_news('하나투어', 3, '20261018')
+            assert len(news_list) == 3
+            # 원문 URL(기사 ID 디코딩), 언론사명, 발행일이 피드에서 바로 채워짐
+            assert news_list[0]['link'] == 'https://www.yna.co.kr/view/AKR20261018000000'
+            assert news_list[0]['press'] == '연합뉴스' and news_list[0]['date'] == '2026-10-18'
+            assert news_list[0]['full_content'] == 'https://www.yna.co.kr/view/AKR20261018000000 본문'
+            assert requested[0].startswith('https://news.google.com/rss/search')
+
+            # 키워드별로 HTML 경로 선택
+            assert collector.search_google_news('모두투어', 3, '20261018') == ['html']
+        finally:
+            collector.close()
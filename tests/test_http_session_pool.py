@@ -0,0 +1,66 @@
+import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_session_pool import SessionPool
+
+
+class EchoUserAgentHandler(BaseHTTPRequestHandler):
+    """User-Agent를 그대로 돌려주는 keep-alive 서버"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = (self.headers.get('User-Agent') or '').encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), EchoUserAgentHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def test_per_request_headers_do_not_leak():
+    server, url = start_server()
+    pool = SessionPool(default_headers={'User-Agent': 'default-agent'}, max_workers=3)
+    try:
+        assert pool.get(url, headers={'User-Agent': 'google-agent'}, timeout=5).text == 'google-agent'
+        assert pool.get(url, timeout=5).text == 'default-agent'
+
+        # 워커마다 다른 User-Agent를 동시에 지정해도 서로 섞이지 않아야 함
+        agents = [f'agent-{i}' for i in range(30)]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(lambda agent: pool.get(url, headers={'User-Agent': agent}, timeout=5).text, agents))
+        assert results == agents
+    finally:
+        pool.close()
+        server.shutdown()
+
+
+def test_keep_alive_stats_and_bounded_sessions():
+    server, url = start_server()
+    pool = SessionPool(max_workers=3)
+    try:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: pool.get(url, timeout=5).status_code, range(30)))
+
+        stats = pool.get_stats()['127.0.0.1']
+        assert stats['requests'] == 30
+        # 세션은 동시 실행 수만큼만 만들어지고, 나머지 요청은 기존 연결을 재사용
+        assert len(pool._all_sessions) <= 3
+        assert stats['new_connections'] <= 3
+        assert stats['reused'] == 30 - stats['new_connections']
+    finally:
+        pool.close()
+        server.shutdown()
@@ -0,0 +1,67 @@
+import sys
+import os
+import subprocess
+import importlib.util
+import logging
+
+import pytest
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 첫 사용 시점까지 import가 지연되어야 하는 무거운 모듈
+HEAVY_MODULES = ['bs4', 'requests', 'google.generativeai', 'smtplib']
+
+# 콜드 스타트 누적 import 시간 상한 (마이크로초, CI 편차를 고려해 넉넉하게)
+IMPORT_BUDGET_US = 1_500_000
+
+
+def measure_import(module_name):
+    """`python -X importtime`으로 모듈 import 시 로드된 모듈과 누적 시간(us)을 측정"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, encoding='utf-8', errors='replace'
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    imported = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # 형식: "import time: <self us> | <cumulative us> | <들여쓰기된 모듈명>"
+        _, cumulative_us, name = [part.strip() for part in line[len('import time:'):].split('|')]
+        imported[name] = int(cumulative_us)
+    return imported
+
+
+requires_flask = pytest.mark.skipif(importlib.util.find_spec('flask') is None, reason="flask 미설치 (웹 UI 의존성)")
+
+
+@pytest.mark.parametrize('module_name', ['newsletter_system', 'main', pytest.param('web_app', marks=requires_flask)])
+def test_cold_import_is_light(module_name):
+    imported = measure_import(module_name)
+    total_us = imported.get(module_name, 0)
+    logger.info(f"{module_name} 콜드 import: {total_us / 1000:.1f}ms")
+
+    loaded_heavy = [name for name in HEAVY_MODULES if name in imported]
+    assert not loaded_heavy, f"{module_name} import 시 무거운 모듈이 로드됨: {loaded_heavy}"
+    assert total_us < IMPORT_BUDGET_US
+
+
+def test_components_are_lazy():
+    from newsletter_system import NewsletterSystem
+
+    system = NewsletterSystem()
+    assert system._news_collector is None
+    assert system._news_summarizer is None
+    assert system._email_sender is None
+    assert system._archiver is None
+
+    # 키워드 조회와 정리는 무거운 컴포넌트를 생성하지 않아야 함
+    assert system.keyword_manager.get_topics() is not None
+    system.cleanup()
+    assert system._news_collector is None
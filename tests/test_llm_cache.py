@@ -0,0 +1,72 @@
+import sys
+import os
+import json
+from types import SimpleNamespace
+from datetime import datetime, timedelta
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_cache import LLMResponseCache, make_cache_key
+
+
+class FakeModel:
+    """호출 수를 세는 Gemini 모델 대역"""
+
+    def __init__(self, text='요약 결과', finish_reason=1):
+        self.calls = 0
+        self.text = text
+        self.finish_reason = finish_reason
+
+    def generate_content(self, prompt, generation_config=None):
+        self.calls += 1
+        candidate = SimpleNamespace(finish_reason=self.finish_reason, content=SimpleNamespace(parts=[]))
+        return SimpleNamespace(candidates=[candidate], text=f"{self.text} {self.calls}")
+
+
+def test_repeated_prompt_served_from_cache(make_summarizer):
+    model = FakeModel()
+    summarizer = make_summarizer(model, LLM_CACHE_ENABLED='true')
+    config = {'max_output_tokens': 100, 'temperature': 0.5}
+    assert summarizer._generate_text('프롬프트', config, '테스트') == '요약 결과 1'
+    assert summarizer._generate_text('프롬프트', dict(config), '테스트') == '요약 결과 1'
+    assert model.calls == 1 and summarizer.llm_cache.stats['hits'] == 1
+
+    # 프롬프트·설정·모델이 다르면 새로 호출
+    summarizer._generate_text('다른 프롬프트', config, '테스트')
+    summarizer._generate_text('프롬프트', dict(config, temperature=0.3), '테스트')
+    assert model.calls == 3
+
+    # 다음 실행(새 인스턴스)에서도 파일 캐시 사용
+    rerun = make_summarizer(FakeModel(), LLM_CACHE_ENABLED='true')
+    assert rerun._generate_text('프롬프트', config, '테스트') == '요약 결과 1' and rerun.model.calls == 0
+
+
+def test_truncated_response_not_cached(make_summarizer):
+    model = FakeModel(finish_reason=2)
+    summarizer = make_summarizer(model, LLM_CACHE_ENABLED='true')
+    summarizer._generate_text('프롬프트', {'max_output_tokens': 10}, '테스트')
+    summarizer._generate_text('프롬프트', {'max_output_tokens': 10}, '테스트')
+    assert model.calls == 2 and len(summarizer.llm_cache) == 0
+
+
+def test_ttl_size_limit_and_opt_out(tmp_path):
+    path = str(tmp_path / 'llm.json')
+    cache = LLMResponseCache(path=path, ttl_hours=1, max_entries=2, enabled=True)
+    keys = [make_cache_key('gemini-test', {}, f'프롬프트 {index}') for index in range(3)]
+    for key in keys:
+        cache.put(key, 'gemini-test', '응답')
+    # 오래된 항목부터 삭제
+    assert len(cache) == 2 and cache.get(keys[0]) is None and cache.get(keys[2])['text'] == '응답'
+
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    entries[keys[2]]['cached_at'] = (datetime.now() - timedelta(hours=2)).isoformat()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f)
+    reloaded = LLMResponseCache(path=path, ttl_hours=1, enabled=True)
+    assert reloaded.get(keys[2]) is None and reloaded.get(keys[1]) is not None
+
+    disabled = LLMResponseCache(path=path, enabled=False)
+    disabled.put(keys[0], 'gemini-test', '응답')
+    assert disabled.get(keys[1]) is None and len(disabled) == 0
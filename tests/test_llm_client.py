@@ -0,0 +1,150 @@
+import sys
+import os
+import time
+import threading
+from types import SimpleNamespace
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from llm_client import LLMClient, TokenBucket, is_retryable, retry_after_seconds
+
+
+class ResourceExhausted(Exception):
+    """google.api_core.exceptions.ResourceExhausted 대역 (HTTP 429)"""
+    code = 429
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_waits_when_minute_budget_is_used():
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock)
+    assert all(bucket.reserve(1) == 0 for _ in range(60))
+    assert bucket.reserve(1) == pytest.approx(1.0)
+    clock.now += 30
+    assert bucket.reserve(10) == 0
+    assert TokenBucket(0, clock).reserve(10 ** 9) == 0
+
+
+def test_rpm_and_tpm_buckets_delay_calls():
+    clock = FakeClock()
+    client = LLMClient(max_concurrency=2, rpm=2, tpm=1000, max_retries=0, sleep=clock.sleep, clock=clock)
+    for _ in range(3):
+        client.call(lambda: 'ok', 'rpm', input_tokens=10)
+    # 분당 2회 -> 세 번째 호출은 30초 대기
+    assert clock.sleeps == [pytest.approx(30.0)]
+
+    # 분당 1000토큰 -> 600 + 600토큰이면 초과분 200토큰이 채워질 때까지 12초 대기
+    clock.sleeps = []
+    client = LLMClient(max_concurrency=2, rpm=0, tpm=1000, max_retries=0, sleep=clock.sleep, clock=clock)
+    client.call(lambda: 'ok', 'tpm', input_tokens=600, output_tokens=lambda _: 0)
+    client.call(lambda: 'ok', 'tpm', input_tokens=600, output_tokens=lambda _: 0)
+    assert clock.sleeps == [pytest.approx(12.0)] and client.last_metric()['wait_seconds'] == pytest.approx(12.0)
+
+
+def test_429_retry_honours_retry_after():
+    clock = FakeClock()
+    client = LLMClient(max_concurrency=1, rpm=0, tpm=0, max_retries=3, base_delay=2, sleep=clock.sleep, clock=clock)
+    errors = [ResourceExhausted('Quota exceeded. Please retry in 7s.')]
+
+    def request():
+        if errors:
+            raise errors.pop()
+        return SimpleNamespace(text='응답', usage_metadata=SimpleNamespace(candidates_token_count=42))
+
+    result = client.call(request, '요약', input_tokens=100)
+    assert result.text == '응답'
+    assert 7.0 <= clock.sleeps[0] <= 7.0 + 2
+    metric = client.last_metric()
+    assert metric['attempts'] == 2 and metric['output_tokens'] == 42 and metric['error'] is None
+    assert client.summary()['retries'] == 1
+
+
+def test_backoff_is_jittered_exponential_and_capped():
+    client = LLMClient(rpm=0, tpm=0, base_delay=2, max_delay=10)
+    for attempt in range(6):
+        delays = [client.backoff_delay(attempt) for _ in range(50)]
+        assert all(0 <= delay <= min(10, 2 * 2 ** attempt) for delay in delays)
+        assert len(set(delays)) > 1
+
+
+def test_non_retryable_errors_and_interrupted_streams_are_raised():
+    clock = FakeClock()
+    client = LLMClient(rpm=0, tpm=0, max_retries=3, sleep=clock.sleep, clock=clock)
+
+    def invalid():
+        raise ValueError('잘못된 요청')
+
+    with pytest.raises(ValueError):
+        client.call(invalid, 'invalid')
+    assert client.last_metric()['attempts'] == 1
+
+    def rate_limited():
+        raise ResourceExhausted('429')
+
+    with pytest.raises(ResourceExhausted):
+        client.call(rate_limited, 'stream', can_retry=lambda: False)
+    assert client.last_metric()['attempts'] == 1 and clock.sleeps == []
+
+    assert is_retryable(ResourceExhausted()) and not is_retryable(ValueError())
+    error = Exception('limited')
+    error.response = SimpleNamespace(status_code=429, headers={'Retry-After': '3'})
+    assert is_retryable(error) and retry_after_seconds(error) == 3.0
+
+
+def test_concurrency_limit():
+    client = LLMClient(max_concurrency=2, rpm=0, tpm=0)
+    lock = threading.Lock()
+    state = {'running': 0, 'peak': 0}
+
+    def request():
+        with lock:
+            state['running'] += 1
+            state['peak'] = max(state['peak'], state['running'])
+        time.sleep(0.05)
+        with lock:
+            state['running'] -= 1
+        return 'ok'
+
+    threads = [threading.Thread(target=client.call, args=(request, f'call {index}')) for index in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert state['peak'] == 2 and client.summary()['calls'] == 6
+
+
+def test_summarizer_retries_through_shared_client(make_summarizer):
+    class FlakyModel:
+        def __init__(self):
+            self.calls = 0
+
+        def generate_content(self, prompt, generation_config=None):
+            self.calls += 1
+            if self.calls == 1:
+                raise ResourceExhausted('Resource has been exhausted. Please retry in 1s.')
+            candidate = SimpleNamespace(finish_reason=1, content=SimpleNamespace(parts=[]))
+            return SimpleNamespace(candidates=[candidate], text='주간 큐레이션 결과')
+
+    clock = FakeClock()
+    summarizer = make_summarizer(FlakyModel())
+    # 재시도 대기는 가짜 시계로 확인
+    summarizer.llm_client = LLMClient(rpm=0, tpm=0, sleep=clock.sleep, clock=clock)
+
+    assert summarizer._timed_generate('프롬프트', {'max_output_tokens': 100}, '주간 큐레이션') == '주간 큐레이션 결과'
+    assert summarizer.model.calls == 2
+    assert summarizer.last_call_metrics[0]['attempts'] == 2 and summarizer.last_call_metrics[0]['wait_seconds'] >= 1.0
@@ -0,0 +1,131 @@
+import sys
+import os
+import json
+import threading
+import tempfile
+from datetime import datetime, timedelta, date
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import naver_news_api
+from naver_news_api import NaverNewsAPI
+from http_session_pool import SessionPool
+from fetch_budget import RunBudget
+
+TARGET = datetime(2026, 10, 18, 12, 0)
+
+
+def build_item(index):
+    """최신순 결과: 30개마다 하루씩 과거"""
+    published = TARGET - timedelta(days=index // 30, minutes=index)
+    return {
+        'title': f"<b>하나투어</b> 여행 소식 {index}번째 &quot;기사&quot;",
+        'originallink': f"https://www.yna.co.kr/view/AKR{index:05d}",
+        'link': f"https://n.news.naver.com/mnews/article/001/{index:010d}",
+        'description': f"<b>하나투어</b> 관련 {index}번째 기사 요약입니다.",
+        'pubDate': format_datetime(published.replace(tzinfo=None)) + ' +0900',
+    }
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    starts = []
+
+    def do_GET(self):
+        params = parse_qs(urlparse(self.path).query)
+        start, display = int(params['start'][0]), int(params['display'][0])
+        FixtureHandler.starts.append(start)
+        items = [build_item(index) for index in range(start - 1, min(start - 1 + display, 1000))]
+        body = json.dumps({'total': 1000, 'start': start, 'display': display, 'items': items}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(naver_news_api, 'NAVER_NEWS_API_URL', f"http://127.0.0.1:{server.server_address[1]}/v1/search/news.json")
+    return server
+
+
+def create_api(tmp, pool, **kwargs):
+    return NaverNewsAPI(pool, client_id='id', client_secret='secret', max_pages=5,
+                        cache_path=os.path.join(tmp, 'responses.json'), quota_path=os.path.join(tmp, 'quota.json'), **kwargs)
+
+
+def test_paging_cache_and_quota(monkeypatch):
+    server = start_server(monkeypatch)
+    pool = SessionPool(max_workers=3)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            FixtureHandler.starts.clear()
+            api = create_api(tmp, pool)
+            # 하루 전(17일)까지 필요: 첫 페이지(0~3일 전 포함)에서 중단 조건 충족, 나머지 페이지는 요청하지 않음
+            items = api.search('하나투어', date_key='2026-10-18', oldest_date=date(2026, 10, 17))
+            assert FixtureHandler.starts == [1]
+            assert len(items) == 100
+            assert api.stats['api_calls'] == 1
+
+            # 첫 페이지가 가득 차고 기간 안이면 나머지를 동시 요청 수(3)만큼 한 묶음으로 요청, 다음 묶음은 요청하지 않음
+            wide = api.search('모두투어', date_key='2026-10-18', oldest_date=date(2026, 10, 14))
+            assert FixtureHandler.starts[:2] == [1, 1] and sorted(FixtureHandler.starts[2:]) == [101, 201, 301]
+            assert len(wide) == 200 and api.stats['api_calls'] == 5
+
+            # 같은 (검색어, start, 날짜)는 다음 실행에서도 캐시 사용
+            reloaded = create_api(tmp, pool)
+            assert reloaded.search('하나투어', date_key='2026-10-18', oldest_date=date(2026, 10, 17)) == items
+            assert reloaded.stats['cache_hits'] == 1 and len(FixtureHandler.starts) == 5
+            assert reloaded.quota.remaining() == 25000 - 5
+
+            # 실행 예산은 실제 호출마다 차감, 소진되면 그 페이지부터 호출하지 않음
+            charges = []
+            budgeted = create_api(tmp, pool, cache_minutes=0)
+            budgeted.search('여행', date_key='2026-10-18', oldest_date=date(2026, 10, 14),
+                            acquire=lambda: charges.append(1) or len(charges) <= 2)
+            assert budgeted.stats['api_calls'] == 2 and len(charges) == 4
+
+            # 일일 한도에 도달하면 호출하지 않음
+            limited = create_api(tmp, pool, daily_quota=8, cache_minutes=0)
+            limited.search('모두투어', date_key='2026-10-18', oldest_date=date(2026, 10, 14))
+            assert limited.stats['api_calls'] == 1 and limited.stats['quota_exceeded'] >= 1
+    finally:
+        pool.close()
+        server.shutdown()
+
+
+def test_collector_fetches_bodies_lazily(monkeypatch):
+    from news_collector_working import WorkingNewsCollector
+    server = start_server(monkeypatch)
+    collector = WorkingNewsCollector()
+    fetched = []
+    with tempfile.TemporaryDirectory() as tmp:
+        collector.naver_api = create_api(tmp, collector.session)
+        monkeypatch.setattr(collector, 'extract_full_content', lambda link: fetched.append(link) or f"{link} 본문")
+        try:
+            news_list = collector.search_real_naver_news('하나투어', max_articles=4, search_date='20261018')
+            assert len(news_list) == 4
+            # 필터를 통과한 후보 중 채택할 4개의 본문만 요청
+            assert fetched == [news['link'] for news in news_list]
+            first = news_list[0]
+            assert first['title'] == '하나투어 여행 소식 0번째 "기사"'
+            assert first['press'] == collector.extract_press_from_url('https://www.yna.co.kr/view/AKR00000')
+            assert first['date'] == '2026-10-18' and first['source'] == '네이버뉴스'
+
+            # 요청 예산은 실제 API 호출 수만큼 차감 (캐시 적중은 차감 없음)
+            collector.run_budget = RunBudget([{'name': '여행', 'keywords': ['하나투어'], 'weight': 100}], {'requests': 5})
+            collector.naver_api = create_api(tmp, collector.session, cache_minutes=0)
+            collector.search_real_naver_news('하나투어', max_articles=4, search_date='20261018')
+            assert collector.run_budget.summary()['requests']['used'] == collector.naver_api.stats['api_calls'] == 1
+        finally:
+            collector.close()
+            server.shutdown()
@@ -0,0 +1,104 @@
+import sys
+import os
+import threading
+import tempfile
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from negative_cache import NegativeCache, SearchEndpointHealth
+
+SHORT_PAGE = "<html><head><title>제목</title></head><body><h1>하나투어 기사 제목만 있는 페이지</h1></body></html>".encode('utf-8')
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    hits = []
+
+    def do_GET(self):
+        FixtureHandler.hits.append(self.path)
+        status, body = (200, SHORT_PAGE) if self.path == '/short' else (404, b'not found')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_ttl_per_failure_class():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = NegativeCache(path=os.path.join(tmp, 'negative_cache.json'), ttl_days=7)
+        cache.add('https://a.co.kr/deleted', 'not_found', 'HTTP 404', 404)
+        cache.add('https://a.co.kr/slow', 'timeout', 'read timeout')
+        cache.add('https://a.co.kr/short', 'too_short', '20자 (title)', 200)
+
+        # 삭제된 기사만 후보 단계에서 제외, 나머지는 본문 재시도만 막음
+        assert cache.is_dead('https://a.co.kr/deleted')
+        assert not cache.is_dead('https://a.co.kr/slow') and cache.is_blocked('https://a.co.kr/slow')
+
+        # 이틀 뒤: 일시적 실패(시간 초과)는 만료, 404는 유지
+        for entry in cache.entries.values():
+            entry['added_at'] = (datetime.now() - timedelta(days=2)).isoformat()
+        assert not cache.is_blocked('https://a.co.kr/slow')
+        assert cache.is_blocked('https://a.co.kr/short')
+        assert cache.get('https://a.co.kr/deleted')['status'] == 404
+
+
+def test_search_endpoint_demotion():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'search_endpoints.json')
+        health = SearchEndpointHealth(path=path, threshold=3, demote_days=1)
+        assert not health.record_failure('연합뉴스', 'redirect', 200)
+        health.record_success('연합뉴스')  # 성공하면 초기화
+        assert not health.record_failure('연합뉴스', 'redirect', 200)
+        assert not health.record_failure('연합뉴스', 'not_found', 404)
+        assert health.record_failure('연합뉴스', 'not_found', 404)
+
+        # 다음 실행에서도 강등 유지, 기간이 지나면 다시 시도
+        reloaded = SearchEndpointHealth(path=path, threshold=3, demote_days=1)
+        assert reloaded.is_demoted('연합뉴스')
+        assert not reloaded.is_demoted('한겨레')
+        assert not reloaded.is_demoted('연합뉴스', now=datetime.now() + timedelta(days=1, minutes=1))
+
+        # 재시도에서도 실패하면 바로 다시 강등되고 기간은 두 배
+        assert reloaded.record_failure('연합뉴스', 'not_found', 404)
+        assert reloaded.is_demoted('연합뉴스', now=datetime.now() + timedelta(days=1, minutes=1))
+
+
+def test_collector_records_and_skips_failed_urls():
+    from news_collector_working import WorkingNewsCollector
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    collector = WorkingNewsCollector()
+    with tempfile.TemporaryDirectory() as tmp:
+        collector.negative_cache = NegativeCache(path=os.path.join(tmp, 'negative_cache.json'))
+        try:
+            FixtureHandler.hits.clear()
+            assert collector.extract_full_content(f"{base}/deleted") == ""
+            assert collector.negative_cache.get(f"{base}/deleted")['reason'] == 'not_found'
+            assert collector.is_dead_link(f"{base}/deleted")
+
+            # 제목만 추출된 결과는 이번에는 사용하되 다음 키워드에서는 다시 받지 않음
+            assert '하나투어' in collector.extract_full_content(f"{base}/short")
+            assert collector.negative_cache.get(f"{base}/short")['reason'] == 'too_short'
+            assert not collector.is_dead_link(f"{base}/short")
+
+            # 같은 실행 안에서는 다시 받지 않고 처음과 같은 짧은 본문 사용
+            short_content = collector.extract_full_content(f"{base}/short")
+            assert collector.extract_full_content(f"{base}/deleted") == ""
+            assert collector.extract_full_content(f"{base}/short") == short_content and '하나투어' in short_content
+            assert FixtureHandler.hits == ['/deleted', '/short']
+
+            # 실패할 때마다 파일을 다시 쓰지 않고 수집기 종료 시 한 번 저장
+            assert not os.path.exists(collector.negative_cache.path)
+            collector.close()
+            assert NegativeCache(path=collector.negative_cache.path).is_dead(f"{base}/deleted")
+        finally:
+            collector.close()
+            server.shutdown()
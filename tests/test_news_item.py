@@ -0,0 +1,70 @@
+import sys
+import os
+import json
+from datetime import date
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from news_item import NewsItem, to_news_items, to_dicts, canonicalize_url
+
+SAMPLE = {
+    'title': '하나투어, 겨울 시즌 일본 패키지 예약 증가',
+    'link': 'https://m.yna.co.kr/view/AKR20261018?utm_source=google&page=2#top',
+    'press': '연합뉴스',
+    'date': '2026-10-18',
+    'full_content': '본문',
+    'keyword': '하나투어',
+    'priority': 1,
+    'staged_at': '2026-10-18T07:00:00',  # 모델에 없는 키도 보존
+}
+
+
+def test_dict_compatible_and_lossless():
+    news = NewsItem.from_dict(SAMPLE)
+    assert not hasattr(news, '__dict__')
+    assert news == SAMPLE and news.to_dict() == SAMPLE
+    assert list(news) == list(SAMPLE)  # 키 순서: 모델 필드 순서 후 추가 키
+    assert news['title'] == SAMPLE['title'] and news.get('category') is None and news.get('priority', 999) == 1
+    assert 'category' not in news and 'staged_at' in news
+
+    news['source'] = '구글뉴스'
+    news['search_date'] = '20261018'
+    assert dict(news)['source'] == '구글뉴스' and len(news) == len(SAMPLE) + 2
+    del news['source']
+    assert 'source' not in news
+
+    restored = to_news_items(json.loads(json.dumps(to_dicts([news]))))[0]
+    assert restored == news and NewsItem.from_dict(restored) is restored
+
+
+def test_derived_values_computed_once():
+    news = NewsItem(SAMPLE)
+    assert news.published == date(2026, 10, 18)
+    assert news.canonical_link == canonicalize_url(SAMPLE['link']) == 'yna.co.kr/view/AKR20261018?page=2'
+    # 원본 필드가 바뀌면 다시 계산
+    news['date'] = '20261017'
+    news['link'] = 'https://www.yna.co.kr/view/OTHER'
+    assert news.published == date(2026, 10, 17) and news.canonical_link == 'yna.co.kr/view/OTHER'
+    assert NewsItem(title='제목', date='어제').published is None
+
+
+def test_collector_filters_news_items():
+    from news_collector_working import WorkingNewsCollector
+    collector = WorkingNewsCollector()
+    try:
+        items = [
+            dict(SAMPLE, priority=2),
+            dict(SAMPLE, link='https://www.yna.co.kr/view/AKR20261018?page=2', priority=1),
+            dict(SAMPLE, title='오래된 기사', link='https://example.com/old', date='2026-09-01'),
+            dict(SAMPLE, title='날짜 없는 기사', link='https://example.com/none', date=''),
+        ]
+        filtered = collector.filter_invalid_dates(items, '2026-10-18')
+        assert all(isinstance(news, NewsItem) for news in filtered)
+        assert [news['title'] for news in filtered] == [SAMPLE['title'], SAMPLE['title'], '날짜 없는 기사']
+        # 정규화 URL이 같은 기사는 우선순위가 높은 1개만
+        deduped = collector.remove_duplicate_urls(filtered)
+        assert len(deduped) == 2 and deduped[0]['priority'] == 1
+        assert collector.normalize_article_url(SAMPLE['link']) == filtered[0].canonical_link
+    finally:
+        collector.close()
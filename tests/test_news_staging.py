@@ -0,0 +1,85 @@
+import sys
+import os
+import tempfile
+from datetime import datetime
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from news_staging import NewsStagingStore, NewsPreCollector
+
+
+class FakeCollector:
+    """네트워크 없이 사전 수집 흐름을 확인하기 위한 수집기"""
+
+    def __init__(self):
+        self.content_cache = None
+        self.calls = []
+        self.planned = []
+
+    def get_target_search_date(self, base_time=None):
+        return (base_time or datetime.now()).strftime('%Y%m%d')
+
+    def plan_keyword_queries(self, keywords, max_articles, search_date):
+        self.planned.append((tuple(keywords), search_date))
+        return 0
+
+    def clear_planned_queries(self):
+        pass
+
+    def save_negative_cache(self):
+        pass
+
+    def search_naver_news_with_retry(self, keyword, max_count, target_date):
+        self.calls.append((keyword, target_date))
+        return [
+            {'title': f'{keyword} 뉴스 1', 'link': f'https://example.com/{keyword}/1', 'full_content': '본문 1'},
+            {'title': f'{keyword} 뉴스 2', 'link': f'https://example.com/{keyword}/2', 'full_content': '본문 2'},
+        ]
+
+
+class FakeKeywordManager:
+    def get_weighted_topics(self):
+        return [{'name': '여행', 'keywords': ['하나투어', '모두투어'], 'weight': 100}]
+
+
+def test_staging_append_dedup():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = NewsStagingStore(base_dir=tmp)
+        news = [
+            {'title': '하나투어, 신규 패키지 출시', 'link': 'https://a.com/1'},
+            {'title': '하나투어 신규 패키지 출시!', 'link': 'https://b.com/2'},  # 제목 정규화 후 중복
+            {'title': '다른 뉴스', 'link': 'https://a.com/1'},  # 링크 중복
+        ]
+        assert store.append('20261018', '하나투어', news) == 1
+        assert store.append('20261018', '하나투어', [{'title': '새 뉴스', 'link': 'https://c.com/3'}]) == 1
+
+        items, last_collected = store.get_items('20261018', '하나투어')
+        assert [item['title'] for item in items] == ['하나투어, 신규 패키지 출시', '새 뉴스']
+        assert last_collected is not None
+
+        # 주말 범위 키도 파일명으로 안전하게 변환
+        store.append('20261017~20261018', '하나투어', news[:1])
+        assert store.get_items('20261017~20261018', '하나투어')[0]
+
+
+def test_precollector_targets_next_send():
+    with tempfile.TemporaryDirectory() as tmp:
+        collector = FakeCollector()
+        pre_collector = NewsPreCollector(
+            news_collector=collector,
+            keyword_manager=FakeKeywordManager(),
+            staging_store=NewsStagingStore(base_dir=tmp)
+        )
+
+        # 전날 오후 실행 -> 다음날 09:00 발송분
+        now = datetime(2026, 10, 19, 15, 0)
+        assert pre_collector.get_next_send_time(now) == datetime(2026, 10, 20, 9, 0)
+        assert pre_collector.run_once(now) == 4
+        assert collector.calls[0] == ('하나투어', '20261020')
+
+        # 재실행 시 중복은 적재되지 않고 본문 캐시가 주입됨
+        assert pre_collector.run_once(now) == 0
+        content_map = pre_collector.staging_store.get_content_map('20261020')
+        assert content_map['https://example.com/하나투어/1'] == '본문 1'
+        assert collector.content_cache is None
@@ -0,0 +1,86 @@
+import sys
+import os
+import re
+import time
+import logging
+import threading
+from types import SimpleNamespace
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from article_summaries import ArticleSummaryStore
+from news_summarizer_v2 import merge_section_outputs
+
+CATEGORIES = ['Technology Trends', 'AI Insight', 'Travel & Business']
+
+
+class CardModel:
+    """프롬프트의 뉴스 데이터로 카드를 만들어 돌려주는 Gemini 모델 대역 (호출마다 delay초 소요)"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.prompts = []
+
+    def generate_content(self, prompt, generation_config=None):
+        with self.lock:
+            self.prompts.append(prompt)
+        time.sleep(self.delay)
+        if '[뉴스 데이터]' in prompt and '링크:' not in prompt:
+            text = '[Executive Summary]\n세 분야 모두 AI 도입이 빨라지고 있습니다.'
+        else:
+            cards = []
+            for number, (news_id, title, link) in enumerate(re.findall(r'\[(\d+)\]\n제목: (.+)\n링크: (.+)', prompt)[:5], 1):
+                cards.append(f"- 번호: {number}\n- ID: {news_id}\n- 제목: {title[:20]} 요약\n"
+                             f"- 요약: {title} 기사에서 발표한 구체적인 수치와 전략을 정리했습니다.\n- 링크: {link}")
+            # 모델이 섹션 헤더를 덧붙이는 경우
+            text = '[AI]\n' + '\n'.join(cards)
+        candidate = SimpleNamespace(finish_reason=1, content=SimpleNamespace(parts=[]))
+        return SimpleNamespace(candidates=[candidate], text=text)
+
+
+def make_news():
+    return [
+        {'title': f'{category} 기사 {index}', 'link': f'https://example.com/{category_index}/{index}',
+         'full_content': f'{category} {index}번 기사 본문입니다. ' * 20, 'category': category}
+        for category_index, category in enumerate(CATEGORIES) for index in range(6)
+    ]
+
+
+def test_parallel_summary_merges_into_v3_sections(tmp_path, make_summarizer):
+    model = CardModel(delay=0.3)
+    summarizer = make_summarizer(model, SUMMARY_MODE='parallel')
+    all_news = make_news()
+
+    started = time.perf_counter()
+    result = summarizer.summarize_all_news(all_news)
+    elapsed = time.perf_counter() - started
+
+    # 섹션 3개 + Executive Summary 동시 호출
+    assert len(model.prompts) == 4 and elapsed < 0.3 * 4 * 0.6
+    assert [metric['label'] for metric in summarizer.last_call_metrics]
+    assert all(metric['seconds'] >= 0.3 and metric['input_tokens'] > 0 for metric in summarizer.last_call_metrics)
+    headers = [line for line in result.split('\n') if line.startswith('[') and line.endswith(']')]
+    assert headers == ['[Executive Summary]', '[TECH]', '[AI]', '[BIZ]']
+    # 뉴스 번호는 통합 요약과 같은 전체 순번 (BIZ는 13번부터)
+    assert '- ID: 13' in result.split('[BIZ]')[1]
+
+    from newsletter_system import NewsletterSystem
+    system = NewsletterSystem.__new__(NewsletterSystem)
+    system.logger = logging.getLogger(__name__)
+    system.article_summaries = ArticleSummaryStore(path=str(tmp_path / 'summaries.json'))
+    raw_news = {category: [news for news in all_news if news['category'] == category] for category in CATEGORIES}
+    html = system.generate_newsletter_content_v3(result, raw_news, all_news, summarizer.last_manifest)
+    assert html and html.count('class="news-item"') == 15 and 'https://example.com/2/0' in html
+    assert len(system.article_summaries) == 15
+
+
+def test_merge_is_deterministic_and_single_mode_unchanged(make_summarizer):
+    merged = merge_section_outputs('요약', {'BIZ': '- 번호: 1', 'TECH': '[TECH]\n- 번호: 1'})
+    assert merged == '[Executive Summary]\n요약\n\n[TECH]\n- 번호: 1\n\n[BIZ]\n- 번호: 1'
+
+    model = CardModel(delay=0)
+    summarizer = make_summarizer(model)
+    summarizer.summarize_all_news(make_news())
+    assert len(model.prompts) == 1 and summarizer.last_call_metrics[0]['label'] == '전체 요약'
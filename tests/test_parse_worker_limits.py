@@ -0,0 +1,121 @@
+import sys
+import os
+import time
+import importlib.util
+import multiprocessing
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parse_workers import ParseWorkerPool, ParseLimitError, extract_article
+from negative_cache import NegativeCache
+
+requires_resource = pytest.mark.skipif(importlib.util.find_spec('resource') is None, reason="resource 모듈 미지원 OS (Windows)")
+
+
+# 워커 프로세스에서 pickle로 호출되므로 모듈 최상위 함수로 정의
+def burn_cpu():
+    while True:
+        pass
+
+
+def sleep_forever():
+    time.sleep(60)
+
+
+def allocate_memory():
+    return len(bytearray(2 * 1024 * 1024 * 1024))
+
+
+def crash_worker():
+    if multiprocessing.parent_process() is None:
+        return 'inline'  # 수집기 프로세스에서 직접 실행됨
+    os._exit(1)
+
+
+@requires_resource
+def test_cpu_time_limit():
+    pool = ParseWorkerPool(max_workers=1, cpu_limit_seconds=1, task_timeout=30)
+    try:
+        with pytest.raises(ParseLimitError) as excinfo:
+            pool.run(burn_cpu, label='cpu')
+        assert excinfo.value.reason == 'cpu_time'
+    finally:
+        pool.close()
+
+
+@requires_resource
+def test_memory_limit():
+    pool = ParseWorkerPool(max_workers=1, memory_limit_mb=512, task_timeout=30)
+    try:
+        with pytest.raises(ParseLimitError) as excinfo:
+            pool.run(allocate_memory, label='memory')
+        assert excinfo.value.reason == 'memory'
+    finally:
+        pool.close()
+
+
+def test_first_task_crash_is_not_reparsed_inline():
+    pool = ParseWorkerPool(max_workers=1, task_timeout=30)
+    try:
+        # 실행 중 첫 페이지가 워커를 죽여도 제한 없는 수집기 프로세스에서 다시 파싱하지 않음
+        with pytest.raises(ParseLimitError) as excinfo:
+            pool.run(crash_worker, label='crash')
+        assert excinfo.value.reason == 'crashed' and not pool.inline
+
+        html = b"<html><body><p>after crash</p></body></html>"
+        assert pool.extract(html, 'https://example.com/after') == extract_article(html, 'https://example.com/after')
+    finally:
+        pool.close()
+
+
+@requires_resource
+def test_unstartable_workers_fall_back_to_inline():
+    # 워커 초기화가 실패하는 환경(잘못된 제한 설정)에서는 확인 작업도 실패하므로 직접 파싱으로 전환
+    pool = ParseWorkerPool(max_workers=1, memory_limit_mb='invalid', task_timeout=30)
+    try:
+        assert pool.run(crash_worker, label='inline') == 'inline'
+        assert pool.inline
+    finally:
+        pool.close()
+
+
+def test_wall_clock_timeout_kills_and_recovers():
+    pool = ParseWorkerPool(max_workers=1, task_timeout=3)
+    try:
+        # 워커 기동 시간을 타임아웃에서 제외
+        pool.extract(b"<html><body><p>warmup</p></body></html>", 'https://example.com/warmup')
+
+        start = time.time()
+        with pytest.raises(ParseLimitError) as excinfo:
+            pool.run(sleep_forever, label='sleep')
+        assert excinfo.value.reason == 'timeout'
+        assert time.time() - start < 10
+
+        # 강제 종료 후 새 풀에서 정상 작업 가능
+        html = "<html><body><article>" + "<p>정상 기사 본문입니다. 여행 수요가 늘었다.</p>" * 10 + "</article></body></html>"
+        assert pool.extract(html.encode('utf-8'), 'https://example.com/ok', 'utf-8') == extract_article(html.encode('utf-8'), 'https://example.com/ok', 'utf-8')
+    finally:
+        pool.close()
+
+
+def test_negative_cache_persists_and_expires():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'negative_cache.json')
+        cache = NegativeCache(path=path, ttl_days=7)
+        cache.add('https://slow.example.com/a', 'timeout', '30초 내 파싱 미완료')
+        cache.save()
+
+        # 다음 실행에서도 유지
+        reloaded = NegativeCache(path=path, ttl_days=7)
+        assert reloaded.is_blocked('https://slow.example.com/a')
+        assert reloaded.get('https://slow.example.com/a')['reason'] == 'timeout'
+        assert not reloaded.is_blocked('https://fast.example.com/b')
+
+        # TTL이 지나면 다시 시도 가능
+        reloaded.entries['https://slow.example.com/a']['added_at'] = (datetime.now() - timedelta(days=8)).isoformat()
+        assert not reloaded.is_blocked('https://slow.example.com/a')
@@ -0,0 +1,55 @@
+import sys
+import os
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parse_workers import ParseWorkerPool, extract_article, clean_news_content
+
+
+def make_article_html(index=0, paragraphs=20):
+    body = "".join(
+        f"<p>하나투어가 {index}번째 신규 여행 상품을 출시했다. 홍길동 기자 hong{index}@test.com 여행 수요가 빠르게 늘고 있다.</p>"
+        for _ in range(paragraphs)
+    )
+    return (
+        "<html><head><meta charset='utf-8'>"
+        "<meta property='article:published_time' content='2026-10-18T09:00:00+09:00'></head>"
+        "<body><header>헤더 2026.01.01</header>"
+        f"<div class='article_body'>{body}</div>"
+        "<footer>ⓒ 무단 전재 및 재배포 금지</footer>"
+        f"<a href='/news/{index}'>관련 기사</a><a href='#top'>맨위로</a>"
+        "</body></html>"
+    ).encode('utf-8')
+
+
+def test_extract_article_inline():
+    result = extract_article(make_article_html(1), 'https://www.hani.co.kr/arti/1.html', 'utf-8')
+    assert result['date'] == '2026-10-18'
+    assert result['content_source'] == 'selector:.article_body'
+    assert '하나투어가 1번째' in result['content']
+    assert 'hong1@test.com' not in result['content'] and '기자' not in result['content']
+    assert result['links'] == ['https://www.hani.co.kr/news/1']
+
+
+def test_detects_encoding_when_header_missing():
+    html = "<html><body><div class='article_body'>" + "<p>모두투어 해외여행 예약이 크게 증가했다는 소식입니다.</p>" * 10 + "</div></body></html>"
+    result = extract_article(html.encode('euc-kr'), 'https://example.com/a', None, want=('content',))
+    assert '모두투어 해외여행' in result['content']
+
+
+def test_process_pool_matches_inline():
+    pool = ParseWorkerPool(max_workers=2)
+    try:
+        for index in range(4):
+            raw = make_article_html(index)
+            url = f'https://www.hani.co.kr/arti/{index}.html'
+            assert pool.extract(raw, url, 'utf-8') == extract_article(raw, url, 'utf-8')
+        assert not pool.inline
+    finally:
+        pool.close()
+
+
+def test_clean_news_content():
+    text = "(홍길동 기자) 여행 수요 증가 hong@test.com\n\n\n공유하기 저작권자 (c) 뉴스. 무단 전재 및 재배포 금지"
+    assert clean_news_content(text) == "여행 수요 증가"
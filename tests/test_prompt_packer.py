@@ -0,0 +1,65 @@
+import sys
+import os
+import re
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prompt_packer import pack_news, entry_tokens
+from news_item import NewsItem
+
+LONG_BODY = '하나투어가 겨울 시즌 일본 패키지 예약이 전년 대비 35% 늘었다고 밝혔다. ' * 60
+
+
+def make_item(index, title, body, date='2026-10-18', keyword='하나투어'):
+    return NewsItem(title=title, link=f'https://example.com/{index}', date=date, full_content=body, keyword=keyword)
+
+
+def test_pack_respects_budget_and_favors_relevant_recent_items():
+    news_list = [
+        make_item(0, '여행업계 동향', '관련 없는 내용입니다. ' * 80, date='2026-10-10'),
+        make_item(1, '하나투어 겨울 예약 증가', LONG_BODY),
+        make_item(2, '하나투어 단신', '하나투어가 새 상품을 출시했다.'),
+        make_item(3, '하나투어 지난주 실적', LONG_BODY, date='2026-10-11'),
+    ]
+    entries, used = pack_news(news_list, budget_tokens=900, max_items=15, min_chars=200, max_chars=1500)
+    assert used <= 900 and used == sum(entry['tokens'] for entry in entries)
+    titles = [entry['news']['title'] for entry in entries]
+    # 키워드가 제목에 있고 최신인 기사가 수집 순서보다 우선
+    assert titles[:2] == ['하나투어 겨울 예약 증가', '하나투어 단신']
+    # 짧은 기사는 실제 길이만큼만, 남은 예산은 상위 기사의 발췌를 늘리는 데 사용
+    assert entries[1]['excerpt'] == '하나투어가 새 상품을 출시했다.'
+    assert len(entries[0]['excerpt']) > 200
+    assert all(entry['tokens'] == entry_tokens(entry['news'], entry['excerpt']) for entry in entries)
+
+
+def test_pack_unlimited_and_max_items():
+    news_list = [make_item(index, f'하나투어 기사 {index}', LONG_BODY) for index in range(20)]
+    entries, _ = pack_news(news_list, budget_tokens=0, max_items=15, max_chars=1500)
+    assert len(entries) == 15 and all(len(entry['excerpt']) == 1500 for entry in entries)
+    # 점수가 같으면 수집 순서 유지
+    assert [entry['news']['title'] for entry in entries[:3]] == ['하나투어 기사 0', '하나투어 기사 1', '하나투어 기사 2']
+
+
+def test_summarizer_returns_manifest_matching_prompt_ids(make_summarizer):
+    from types import SimpleNamespace
+
+    prompts = []
+
+    class Model:
+        def generate_content(self, prompt, generation_config=None):
+            prompts.append(prompt)
+            candidate = SimpleNamespace(finish_reason=1, content=SimpleNamespace(parts=[]))
+            return SimpleNamespace(candidates=[candidate], text='[Executive Summary]\n요약')
+
+    summarizer = make_summarizer(Model(), PROMPT_CATEGORY_INPUT_TOKENS=1000)
+
+    news_list = [make_item(index, f'하나투어 기사 {index}', LONG_BODY) for index in range(10)]
+    for news in news_list:
+        news['category'] = 'Travel & Business'
+    summarizer.summarize_all_news(news_list)
+
+    manifest = summarizer.last_manifest
+    prompt_links = re.findall(r'\[(\d+)\]\n제목: .+\n링크: (.+)', prompts[0])
+    assert 0 < len(manifest) < len(news_list)
+    assert [(int(news_id), link) for news_id, link in prompt_links] == [(news_id, news['link']) for news_id, news in manifest.items()]
@@ -0,0 +1,71 @@
+import sys
+import os
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import query_planner
+
+KEYWORDS = ['구글', '제미나이', '코파일럿', 'AI 인프라', '구글', '그록']
+
+# 검색 엔진 역할: 제목에 검색어가 포함된 기사를 최신순으로 반환
+CORPUS = [
+    {'title': f"{keyword}{suffix} 관련 신규 서비스 발표 소식 {index}", 'link': f"https://news.example.com/{keyword}/{index}", 'date': '2026-10-18', 'source': '예시일보'}
+    for keyword, suffix in [('구글', '은'), ('제미나이', '가'), ('코파일럿', ','), ('그록', '')]
+    for index in range(12)
+] + [{'title': '구글·제미나이 동시 업데이트 안내 기사', 'link': 'https://news.example.com/both', 'date': '2026-10-18', 'source': '예시일보'}]
+
+
+def fake_search(query, limit=None):
+    terms = [term.strip('"') for term in query.split(' OR ')]
+    items = [item for item in CORPUS if any(term in item['title'] for term in terms)]
+    return items[:limit] if limit else items
+
+
+def test_plan_groups_and_or_query():
+    groups = query_planner.plan_query_groups(KEYWORDS, max_keywords=3)
+    # 중복 제거, 순서 유지, 묶음당 최대 3개
+    assert groups == [['구글', '제미나이', '코파일럿'], ['AI 인프라', '그록']]
+    assert query_planner.build_or_query(groups[1]) == '"AI 인프라" OR 그록'
+    # 검색어 길이 제한
+    assert all(len(group) == 1 for group in query_planner.plan_query_groups(KEYWORDS, max_keywords=4, max_query_length=8))
+
+
+def test_collector_uses_grouped_results(monkeypatch):
+    from news_collector_working import WorkingNewsCollector
+    collector = WorkingNewsCollector()
+    queries = []
+
+    def fake_fetch(query, date_range, limit=None):
+        queries.append(query)
+        return fake_search(query, limit)
+
+    monkeypatch.setattr(collector, 'fetch_google_news_feed', fake_fetch)
+    monkeypatch.setattr(collector.google_resolver, 'resolve_many', lambda urls, headers=None: {})
+    monkeypatch.setattr(collector, 'extract_full_content', lambda link: f"{link} 본문")
+    keywords = ['구글', '제미나이', '코파일럿', '그록']
+    try:
+        # 기준: 키워드별 검색
+        expected = {keyword: collector.search_google_news_rss(keyword, 5, '20261018') for keyword in keywords}
+        assert len(queries) == 4
+
+        queries.clear()
+        assert collector.plan_keyword_queries(keywords, 5, '20261018') == 3
+        assert queries == ['구글 OR 제미나이 OR 코파일럿 OR 그록']
+        planned = {keyword: collector.search_google_news_rss(keyword, 5, '20261018') for keyword in keywords}
+        assert len(queries) == 1  # 키워드별 요청 생략
+        assert planned == expected
+
+        # 묶음 결과가 상한(20개)에 걸려 배분이 부족한 키워드는 키워드별로 다시 검색
+        collector.clear_planned_queries()
+        monkeypatch.setattr(WorkingNewsCollector, 'GOOGLE_NEWS_RSS_MAX_ITEMS', 20)
+        monkeypatch.setattr(collector, 'fetch_google_news_feed', lambda query, date_range, limit=None: queries.append(query) or fake_search(query, limit or 20))
+        expected = {keyword: collector.search_google_news_rss(keyword, 10, '20261018') for keyword in keywords}
+        queries.clear()
+        collector.plan_keyword_queries(keywords, 10, '20261018')
+        planned = {keyword: collector.search_google_news_rss(keyword, 10, '20261018') for keyword in keywords}
+        # 첫 20개 중 구글 12개(배분), 제미나이 8개·나머지 0개(키워드별 재검색)
+        assert queries == ['구글 OR 제미나이 OR 코파일럿 OR 그록', '제미나이', '코파일럿', '그록']
+        assert planned == expected
+    finally:
+        collector.close()
@@ -0,0 +1,77 @@
+import sys
+import os
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from relevance_index import BM25Index, keyword_terms, select_relevant
+from news_item import NewsItem
+
+FILLER = '여행 시장 전반의 수요 회복과 항공 공급 확대가 이어지고 있다. '
+
+
+def make_item(index, title, body, keyword='야놀자', category='Travel & Business'):
+    return NewsItem(title=title, link=f'https://example.com/{index}', date='2026-10-18',
+                    full_content=body, keyword=keyword, category=category)
+
+
+def sample_news():
+    return [
+        make_item(0, '주말에 야 놀자, 가을 축제 총정리', '가을 축제에서 야 놀자는 분들을 위한 안내입니다. ' + FILLER * 5),
+        make_item(1, '여행업계 3분기 실적', FILLER * 5 + '야놀자도 해외 숙박 거래액이 늘었다.'),
+        make_item(2, '야놀자, 글로벌 숙박 예약 30% 성장', '야놀자가 3분기 글로벌 숙박 예약이 30% 늘었다고 밝혔다. ' + FILLER * 3),
+        make_item(3, '항공권 가격 동향', FILLER * 6),
+    ]
+
+
+def test_keyword_terms_strip_particles_and_split_phrases():
+    assert keyword_terms(['에이전틱 AI', '야놀자']) == {'에이전틱', 'ai', '야놀자'}
+
+
+def test_bm25_ranks_title_match_first_and_drops_false_positives():
+    news_list = sample_news()
+    index = BM25Index.from_news(news_list)
+    scores = index.scores(['야놀자'])
+    # 제목+본문에 나오는 기사 > 본문에만 한 번 나오는 기사, 띄어 쓴 "야 놀자"와 무관한 기사는 0점
+    assert scores[2] > scores[1] > 0
+    assert scores[0] == 0 and scores[3] == 0
+
+    kept, normalized = select_relevant(scores, min_ratio=0.1)
+    assert kept == [1, 2]
+    assert max(normalized) == 3.0
+
+
+def test_prefix_match_only_for_hangul_terms():
+    news_list = [
+        make_item(0, '구글코리아 새 검색 기능 공개', FILLER, keyword='구글'),
+        make_item(1, '에어쇼 관람 안내', 'air show 일정 안내 ' + FILLER, keyword='ai'),
+    ]
+    index = BM25Index.from_news(news_list)
+    assert index.scores(['구글'])[0] > 0
+    assert index.scores(['AI'])[1] == 0
+
+
+def test_select_relevant_keeps_all_when_no_keyword_matched():
+    kept, normalized = select_relevant([0.0, 0.0, 0.0])
+    assert kept == [0, 1, 2] and normalized is None
+
+
+def test_summarizer_filters_irrelevant_items_before_prompt(make_summarizer):
+    from types import SimpleNamespace
+
+    prompts = []
+
+    class Model:
+        def generate_content(self, prompt, generation_config=None):
+            prompts.append(prompt)
+            candidate = SimpleNamespace(finish_reason=1, content=SimpleNamespace(parts=[]))
+            return SimpleNamespace(candidates=[candidate], text='[Executive Summary]\n요약')
+
+    summarizer = make_summarizer(Model())
+    summarizer.topic_keywords = {'Travel & Business': ['야놀자', '하나투어']}  # NewsletterSystem이 주입하는 값
+
+    summarizer.summarize_all_news(sample_news())
+
+    titles = [news['title'] for news in summarizer.last_manifest.values()]
+    assert titles == ['야놀자, 글로벌 숙박 예약 30% 성장', '여행업계 3분기 실적']
+    assert '야 놀자' not in prompts[0]
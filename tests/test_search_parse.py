@@ -0,0 +1,62 @@
+import sys
+import os
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parse_workers import parse_search_results, build_search_strainer, parse_date_text
+
+SEARCH_PAGE = (
+    "<html><head><meta charset='euc-kr'><script>var a = 1;</script></head><body>"
+    "<nav>" + "<a href='/section/1'>섹션 메뉴</a>" * 50 + "</nav>"
+    "<ul class='list'>"
+    "<li><div class='cont'><a href='/view/AKR001'>하나투어 해외여행 예약 전년 대비 증가</a><span class='date'>2026.10.18 09:00</span></div></li>"
+    "<li><div class='cont'><a href='/view/AKR002'>모두투어 겨울 시즌 신규 상품 출시 소식</a><span class='date'>3시간 전</span></div></li>"
+    "<li><div class='cont'><a href='https://other.co.kr/view/AKR003'>날짜 없는 여행 업계 기사 제목입니다</a></div></li>"
+    "</ul><footer>" + "<p>회사 소개</p>" * 50 + "</footer></body></html>"
+).encode('cp949')
+
+
+def test_partial_parse_matches_full_parse():
+    args = (SEARCH_PAGE, 'cp949', 'https://www.yna.co.kr/search/index?query=하나투어', "a[href*='/view/']", '.date')
+    full = parse_search_results(*args, partial=False)
+    partial = parse_search_results(*args)
+
+    assert partial['partial'] and not full['partial']
+    assert partial['items'] == full['items']
+    assert partial['elements'] < full['elements'] // 10
+
+    items = partial['items']
+    assert [item['link'] for item in items] == [
+        'https://www.yna.co.kr/view/AKR001', 'https://www.yna.co.kr/view/AKR002', 'https://other.co.kr/view/AKR003'
+    ]
+    assert items[0]['title'] == '하나투어 해외여행 예약 전년 대비 증가' and items[0]['date'] == '2026-10-18'
+    assert items[1]['date_text'] == '3시간 전' and items[1]['date'] is not None
+    # 다음 결과의 날짜를 잘못 가져오지 않음
+    assert items[2]['date'] is None
+
+
+def test_relative_date_and_unsupported_selector():
+    now = datetime(2026, 10, 19, 1, 0)
+    assert parse_date_text('3시간 전', now) == '2026-10-18'
+    assert parse_date_text('2일 전', now) == '2026-10-17'
+    assert parse_date_text('2026.10.18', now) == '2026-10-18'
+    assert parse_date_text('방금', now) is None
+
+    # 지원하지 않는 선택자(하위 결합자 등)는 전체 파싱으로 대체
+    assert build_search_strainer('ul.list a', '.date') is None
+    assert build_search_strainer('article', 'div[jslog]', "a[href*='news.google.com']") is not None
+
+
+def test_collector_extract_date_from_site():
+    from news_collector_working import WorkingNewsCollector
+    collector = WorkingNewsCollector()
+    try:
+        soup = BeautifulSoup(SEARCH_PAGE, 'html.parser', from_encoding='cp949')
+        link_elem = soup.select("a[href*='/view/']")[0]
+        assert collector.extract_date_from_site(soup, link_elem, '.date', 'https://www.yna.co.kr') == '2026-10-18'
+    finally:
+        collector.close()
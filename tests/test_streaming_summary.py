@@ -0,0 +1,154 @@
+import sys
+import os
+import re
+import json
+import logging
+from types import SimpleNamespace
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from article_summaries import ArticleSummaryStore
+from structured_summary import RESPONSE_KEY_ORDER, StreamingSummaryParser, parse_structured_summary
+
+CATEGORIES = {'Technology Trends': 'TECH', 'AI Insight': 'AI', 'Travel & Business': 'BIZ'}
+
+
+class StreamModel:
+    """JSON 응답을 chunk_size자씩 스트리밍하는 Gemini 모델 대역 (cut_at을 주면 그 위치에서 MAX_TOKENS로 끊김)"""
+
+    def __init__(self, section_order=('TECH', 'AI', 'BIZ'), chunk_size=40, cut_at=None):
+        self.section_order = section_order
+        self.chunk_size = chunk_size
+        self.cut_at = cut_at
+        self.calls = []
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        self.calls.append(stream)
+        ids = [int(news_id) for news_id in re.findall(r'\[(\d+)\]\n제목: ', prompt)]
+        data = {}
+        for section in self.section_order:
+            offset = list(CATEGORIES.values()).index(section)
+            data[section] = [
+                {'id': news_id, 'title': f'{section} 카드 {news_id}',
+                 'summary': f'{news_id}번 기사의 "핵심" 수치와 전략을 정리했습니다.'}
+                for news_id in ids[offset * 6:offset * 6 + 5]
+            ]
+        data['executive_summary'] = '세 분야 모두 AI 도입이 빨라지고 있습니다.'
+        text = json.dumps(data, ensure_ascii=False)
+        finish_reason = 1
+        if self.cut_at is not None:
+            text, finish_reason = text[:int(len(text) * self.cut_at)], 2
+        chunks = [text[index:index + self.chunk_size] for index in range(0, len(text), self.chunk_size)]
+        return (
+            SimpleNamespace(text=chunk, candidates=[SimpleNamespace(
+                finish_reason=finish_reason if index == len(chunks) - 1 else 0, content=SimpleNamespace(parts=[]))])
+            for index, chunk in enumerate(chunks)
+        )
+
+
+def make_system(tmp_path, make_summarizer, model):
+    summarizer = make_summarizer(model, SUMMARY_OUTPUT='json', SUMMARY_STREAM='true')
+
+    from newsletter_system import NewsletterSystem
+    system = NewsletterSystem.__new__(NewsletterSystem)
+    system.logger = logging.getLogger(__name__)
+    system.article_summaries = ArticleSummaryStore(path=str(tmp_path / 'summaries.json'))
+    system._news_summarizer = summarizer
+    return system
+
+
+def make_news():
+    return [
+        {'title': f'{category} 기사 {index}', 'link': f'https://example.com/{section}/{index}',
+         'full_content': f'{category} {index}번 기사 본문입니다. ' * 20, 'category': category}
+        for category, section in CATEGORIES.items() for index in range(6)
+    ]
+
+
+def test_parser_emits_cards_as_they_complete():
+    text = json.dumps({
+        'TECH': [{'id': 1, 'title': '괄호 } 와 "따옴표"', 'summary': '역슬래시 \\ 포함'}, {'id': 2, 'title': '둘째', 'summary': '요약'}],
+        'executive_summary': '요약 ]',
+    }, ensure_ascii=False)
+    parser = StreamingSummaryParser()
+    events = []
+    for index in range(0, len(text), 5):
+        events.extend(parser.feed(text[index:index + 5]))
+    assert [event[0] for event in events] == ['card', 'card', 'section_end', 'executive_summary']
+    assert parser.result() == parse_structured_summary(text)
+
+    # 두 번째 카드 도중에 끊긴 스트림은 첫 카드까지만
+    parser = StreamingSummaryParser()
+    parser.feed(text[:text.index('둘째')])
+    assert [card['id'] for card in parser.result()['TECH']] == [1]
+
+
+def test_stream_renders_sections_in_reference_order(tmp_path, make_summarizer):
+    # 모델이 섹션을 알파벳 순으로 내보내도 참조 번호는 TECH -> AI -> BIZ 순
+    model = StreamModel(section_order=('AI', 'BIZ', 'TECH'))
+    system = make_system(tmp_path, make_summarizer, model)
+    all_news = make_news()
+    raw_news = {category: [news for news in all_news if news['category'] == category] for category in CATEGORIES}
+
+    full_summary_text, rendered = system.summarize_news_v3(all_news, raw_news)
+    assert model.calls == [True]
+    assert [len(rendered[section][1]) for section in ('TECH', 'AI', 'BIZ')] == [5, 5, 5]
+    assert [item['global_index'] for section in ('TECH', 'AI', 'BIZ') for item in rendered[section][1]] == list(range(1, 16))
+    assert system.news_summarizer.last_call_metrics[0]['first_card_seconds'] is not None
+
+    html = system.generate_newsletter_content_v3(full_summary_text, raw_news, all_news, system.news_summarizer.last_manifest, rendered)
+    assert html.count('class="news-item"') == 15 and 'https://example.com/BIZ/0' in html
+    assert '세 분야 모두 AI 도입이 빨라지고 있습니다.' in html
+
+
+def test_stream_cut_by_max_tokens_keeps_completed_cards(tmp_path, make_summarizer):
+    model = StreamModel(cut_at=0.5)
+    system = make_system(tmp_path, make_summarizer, model)
+    all_news = make_news()
+    raw_news = {category: [news for news in all_news if news['category'] == category] for category in CATEGORIES}
+
+    full_summary_text, rendered = system.summarize_news_v3(all_news, raw_news)
+    # 재요청 없이 완성된 카드만 사용 (TECH 5개 + AI 일부)
+    assert model.calls == [True]
+    parsed = parse_structured_summary(full_summary_text)
+    assert len(parsed['TECH']) == 5 and 0 < len(parsed['AI']) < 5 and parsed['BIZ'] == []
+
+    # 끊긴 섹션은 AI 카드를 유지한 채 원본 뉴스로 보충
+    ai_items = rendered['AI'][1]
+    assert len(ai_items) == 5 and [item['generated'] for item in ai_items].count(True) == len(parsed['AI'])
+    html = system.generate_newsletter_content_v3(full_summary_text, raw_news, all_news, system.news_summarizer.last_manifest, rendered)
+    assert html.count('class="news-item"') == 15
+
+
+def test_key_order_puts_tech_first_so_cards_render_during_stream(tmp_path, make_summarizer):
+    from newsletter_system import StreamingCardRenderer
+    assert RESPONSE_KEY_ORDER == ('executive_summary', 'TECH', 'AI', 'BIZ')
+
+    system = make_system(tmp_path, make_summarizer, StreamModel())
+    all_news = make_news()
+    manifest = {index + 1: news for index, news in enumerate(all_news)}
+
+    def first_tech_render(keys):
+        """keys 순서의 응답을 조각내어 넣을 때 첫 TECH 카드가 렌더링되는 시점 (응답 길이 대비 비율)"""
+        data = {}
+        for key in keys:
+            if key == 'executive_summary':
+                data[key] = '세 분야 모두 AI 도입이 빨라지고 있습니다.'
+            else:
+                offset = ['TECH', 'AI', 'BIZ'].index(key) * 6
+                data[key] = [{'id': offset + index + 1, 'title': f'{key} 카드 {index}', 'summary': '요약'} for index in range(5)]
+        text = json.dumps(data, ensure_ascii=False)
+        parser = StreamingSummaryParser()
+        renderer = StreamingCardRenderer(system, {}, lambda: manifest)
+        for end in range(20, len(text) + 20, 20):
+            for event in parser.feed(text[end - 20:end]):
+                renderer(event)
+            if renderer.states.get('TECH', {}).get('items'):
+                return min(end, len(text)) / len(text)
+        return None
+
+    # 알파벳 순이면 TECH가 마지막이라 앞 섹션 카드까지 모두 보관하다 응답 끝 무렵에야 렌더링
+    assert first_tech_render(['AI', 'BIZ', 'TECH', 'executive_summary']) > 0.7
+    # 지정한 순서(스키마 property_ordering/프롬프트)면 첫 TECH 카드가 닫히는 즉시 렌더링
+    assert first_tech_render(RESPONSE_KEY_ORDER) < 0.2
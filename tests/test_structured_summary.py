@@ -0,0 +1,118 @@
+import sys
+import os
+import re
+import json
+import logging
+from types import SimpleNamespace
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from article_summaries import ArticleSummaryStore
+from structured_summary import parse_structured_summary, summary_response_schema
+
+CATEGORIES = {'Technology Trends': 'TECH', 'AI Insight': 'AI', 'Travel & Business': 'BIZ'}
+
+
+class JsonModel:
+    """JSON 모드 요청이면 프롬프트의 뉴스 번호로 구조화 응답을 만드는 Gemini 모델 대역"""
+
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.configs = []
+
+    def generate_content(self, prompt, generation_config=None):
+        self.configs.append(generation_config)
+        if generation_config.get('response_mime_type') == 'application/json':
+            ids = [int(news_id) for news_id in re.findall(r'\[(\d+)\]\n제목: ', prompt)]
+            data = {'executive_summary': '세 분야 모두 AI 도입이 빨라지고 있습니다.'}
+            for offset, section in enumerate(['TECH', 'AI', 'BIZ']):
+                data[section] = [
+                    {'id': news_id, 'title': f'{section} 카드 {news_id}',
+                     'summary': f'{news_id}번 기사에서 발표한 구체적인 수치와 전략을 정리했습니다.'}
+                    for news_id in ids[offset * 6:offset * 6 + 5]
+                ]
+            text = json.dumps(data, ensure_ascii=False)
+            finish_reason = 1
+            if self.broken:
+                text, finish_reason = text[:len(text) // 2], 2  # MAX_TOKENS로 잘린 JSON
+        else:
+            text = '[Executive Summary]\n텍스트 요약'
+            finish_reason = 1
+        candidate = SimpleNamespace(finish_reason=finish_reason, content=SimpleNamespace(parts=[]))
+        return SimpleNamespace(candidates=[candidate], text=text)
+
+
+def make_news():
+    return [
+        {'title': f'{category} 기사 {index}', 'link': f'https://example.com/{section}/{index}',
+         'full_content': f'{category} {index}번 기사 본문입니다. ' * 20, 'category': category}
+        for category, section in CATEGORIES.items() for index in range(6)
+    ]
+
+
+def test_parse_structured_summary_validates_cards():
+    text = json.dumps({
+        'executive_summary': ' 요약 ',
+        'TECH': [{'id': '3', 'title': '카드', 'summary': '내용'}, {'id': 'x', 'title': '잘못된 ID'}, {'id': 4, 'title': ''}],
+        'AI': [],
+    }, ensure_ascii=False)
+    parsed = parse_structured_summary(text)
+    assert parsed == {'executive_summary': '요약', 'TECH': [{'id': 3, 'title': '카드', 'summary': '내용'}], 'AI': [], 'BIZ': []}
+    assert parse_structured_summary('[Executive Summary]\n요약') is None
+    assert parse_structured_summary('{"executive_summary": "잘린') is None
+
+
+def test_json_mode_renders_cards_from_manifest_ids(tmp_path, make_summarizer):
+    model = JsonModel()
+    summarizer = make_summarizer(model, SUMMARY_OUTPUT='json')
+    all_news = make_news()
+    result = summarizer.summarize_all_news(all_news)
+
+    assert len(model.configs) == 1 and 'response_schema' in model.configs[0]
+    parsed = parse_structured_summary(result)
+    assert [card['id'] for card in parsed['BIZ']] == [13, 14, 15, 16, 17]
+
+    # 모델이 지어낸 ID는 건너뛰고 원본 뉴스로 5개까지 보충
+    parsed['TECH'][0]['id'] = 999
+
+    from newsletter_system import NewsletterSystem
+    system = NewsletterSystem.__new__(NewsletterSystem)
+    system.logger = logging.getLogger(__name__)
+    system.article_summaries = ArticleSummaryStore(path=str(tmp_path / 'summaries.json'))
+    raw_news = {category: [news for news in all_news if news['category'] == category] for category in CATEGORIES}
+    html = system.generate_newsletter_content_v3(json.dumps(parsed, ensure_ascii=False), raw_news, all_news, summarizer.last_manifest)
+
+    assert html and html.count('class="news-item"') == 15
+    assert '세 분야 모두 AI 도입이 빨라지고 있습니다.' in html
+    # 링크는 응답이 아니라 manifest에서 (BIZ 13번 = 세 번째 카테고리의 첫 기사)
+    assert 'BIZ 카드 13' in html and 'https://example.com/BIZ/0' in html
+    # TECH: AI 카드 4개 + 쓰지 않은 원본 기사 1개
+    assert 'Technology Trends 기사 0' in html and 'TECH 카드 1<' not in html
+    assert len(system.article_summaries) == 14
+
+
+def test_truncated_json_falls_back_to_text_request(make_summarizer):
+    model = JsonModel(broken=True)
+    summarizer = make_summarizer(model, SUMMARY_OUTPUT='json')
+    result = summarizer.summarize_all_news(make_news())
+
+    assert len(model.configs) == 2 and 'response_schema' not in model.configs[1]
+    assert result == '[Executive Summary]\n텍스트 요약'
+    assert [metric['label'] for metric in summarizer.last_call_metrics] == ['전체 요약 (JSON)', '전체 요약']
+
+
+def test_response_schema_passes_real_sdk_conversion():
+    # GenerationConfig 대역(dict)을 쓰는 다른 테스트와 달리 실제 SDK 변환(protos.Schema)을 거침
+    pytest.importorskip('google.generativeai')
+    from google.generativeai import protos
+    from google.generativeai.types import generation_types
+
+    config = generation_types.to_generation_config_dict(
+        {'response_mime_type': 'application/json', 'response_schema': summary_response_schema()}
+    )
+    config = protos.GenerationConfig(config)
+    assert set(config.response_schema.properties) == {'executive_summary', 'TECH', 'AI', 'BIZ'}
+    assert set(config.response_schema.properties['TECH'].items.properties) == {'id', 'title', 'summary'}
@@ -0,0 +1,53 @@
+import sys
+import os
+import json
+
+# 부모 디렉토리를 sys.path에 추가하여 모듈 import 가능하게 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetch_budget import estimate_tokens
+from parse_workers import clean_news_content
+from prompt_packer import pack_news
+from text_condenser import condense, split_sentences
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'condenser_articles.json')
+
+
+def load_articles():
+    with open(FIXTURE_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_noise_sentences_removed():
+    sentences = split_sentences('[서울=뉴시스] 하나투어가 예약 증가를 밝혔다. ▲ 본사 전경 (사진=하나투어 제공). '
+                                '회사는 전세기를 늘린다. 저작권자 © 뉴시스 무단전재 재배포 금지.')
+    assert sentences == ['하나투어가 예약 증가를 밝혔다.', '회사는 전세기를 늘린다.']
+    # 문장이 적으면 노이즈만 제거하고 그대로
+    assert condense('구독 서비스 가입자가 20% 늘었다. 회사는 요금제를 개편한다.', max_sentences=5) == \
+        '구독 서비스 가입자가 20% 늘었다. 회사는 요금제를 개편한다.'
+
+
+def test_condense_keeps_order_and_key_facts():
+    for article in load_articles():
+        cleaned = clean_news_content(article['content'])
+        condensed = condense(cleaned, article['title'], 5)
+        sentences = split_sentences(condensed)
+        assert len(sentences) == 5
+        # 원래 순서 유지, 첫 문장(리드) 포함
+        positions = [cleaned.index(sentence) for sentence in sentences]
+        assert positions == sorted(positions) and sentences[0] == split_sentences(cleaned)[0]
+        assert estimate_tokens(condensed) < estimate_tokens(cleaned[:1000]) * 0.6
+        # 본문에도 있는 제목의 수치는 남음
+        for token in article['title'].replace(',', ' ').split():
+            if any(char.isdigit() for char in token) and token in cleaned:
+                assert token in condensed
+
+
+def test_packer_uses_condensed_excerpt():
+    article = load_articles()[0]
+    news = {'title': article['title'], 'link': 'https://example.com/1',
+            'full_content': clean_news_content(article['content']), 'keyword': '하나투어'}
+    plain, plain_tokens = pack_news([news], 0, max_chars=1000)
+    condensed, condensed_tokens = pack_news([news], 0, max_chars=1000, condense_sentences=5)
+    assert condensed[0]['excerpt'] == condense(news['full_content'], news['title'], 5)
+    assert condensed_tokens < plain_tokens
@@ -0,0 +1,123 @@
+"""
+본문 압축기 - 네트워크 없이 문장 단위 추출 요약(TF-IDF 유사도 기반 TextRank)으로 기사 본문을 핵심 문장 N개로 줄임
+
+clean_news_content() 뒤에도 남는 바이라인, 사진 설명, 저작권 문구를 문장 단위로 걸러낸 뒤
+제목과 겹치는 단어가 많고 다른 문장과 내용이 많이 겹치는 문장을 원래 순서대로 고른다.
+"""
+import re
+import math
+
+# 문장 경계: 마침표/물음표/느낌표 뒤 공백 (3.5% 같은 소수점은 공백이 없어 분리되지 않음)
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?。])\s+|\n+')
+_TOKEN_PATTERN = re.compile(r'[가-힣]{2,}|[a-z][a-z0-9]+|\d+(?:\.\d+)?%?')
+
+# 문장 안에서 지울 부분 (사진/출처 표기, 통신사 머리말)
+_INLINE_NOISE = [
+    re.compile(r'[\[(<]\s*(?:사진|자료|그래픽|영상|출처)\s*[=:][^\])>]*[\])>]'),
+    re.compile(r'/\s*(?:사진|자료)\s*=\s*\S+'),
+    re.compile(r'\[[가-힣]{2,6}\s*=\s*[가-힣A-Za-z]{2,10}\]'),  # [서울=뉴시스]
+    re.compile(r'\[[가-힣A-Za-z]{2,10}\s+[가-힣]{2,4}\s*기자\]'),  # [예시일보 홍길동 기자]
+    re.compile(r'\[[가-힣A-Za-z]{2,10}\s*\]'),  # clean_news_content가 기자 이름만 지우고 남긴 [예시일보 ]
+]
+# 통째로 버릴 문장 (사진 설명, 저작권, 구독/제보 안내)
+_NOISE_SENTENCE = re.compile(
+    r'^[▲△▶■□◆◇]|저작권자|무단\s*전재|copyright|all rights reserved|재배포\s*금지|재판매\s*및\s*DB|'
+    r'기사\s*제보|카카오톡\s*(?:@|제보)|구독하기|구독\s*신청|제공\s*[.)]?$|^\(?사진\)?|기자\s*$',
+    re.IGNORECASE
+)
+# 한글 단어 끝에서 떼어낼 조사/어미 (긴 것부터)
+_SUFFIXES = sorted([
+    '으로부터', '에서는', '으로는', '에게서', '까지는', '이라고', '라고', '에서', '으로', '에게', '까지', '부터',
+    '보다', '처럼', '이며', '이고', '했다', '한다', '하는', '했고', '하며', '된다', '됐다',
+    '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '도', '로', '만',
+], key=len, reverse=True)
+
+MAX_SENTENCES_SCORED = 60  # 긴 기사는 앞부분 60문장만 점수 계산 (문장 수 제곱에 비례하는 비용 제한)
+
+
+def split_sentences(text):
+    """문장 분리 후 문장 안의 사진/출처 표기를 지우고 노이즈 문장은 제외"""
+    sentences = []
+    for raw in _SENTENCE_SPLIT.split(text or ''):
+        sentence = raw
+        for pattern in _INLINE_NOISE:
+            sentence = pattern.sub('', sentence)
+        sentence = re.sub(r'\s+', ' ', sentence).strip()
+        if len(sentence) < 10 or _NOISE_SENTENCE.search(sentence):
+            continue
+        sentences.append(sentence)
+    return sentences
+
+
+def tokenize(text):
+    """단어 추출 (한글은 조사/어미를 떼어 같은 단어로 취급)"""
+    tokens = []
+    for word in _TOKEN_PATTERN.findall(text.lower()):
+        for suffix in _SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+                word = word[:-len(suffix)]
+                break
+        tokens.append(word)
+    return tokens
+
+
+def _tfidf_vectors(token_lists):
+    document_count = len(token_lists)
+    document_frequency = {}
+    for tokens in token_lists:
+        for token in set(tokens):
+            document_frequency[token] = document_frequency.get(token, 0) + 1
+    vectors = []
+    for tokens in token_lists:
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        vector = {token: count * (math.log((1 + document_count) / (1 + document_frequency[token])) + 1)
+                  for token, count in counts.items()}
+        norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+        vectors.append({token: value / norm for token, value in vector.items()})
+    return vectors
+
+
+def _cosine(left, right):
+    if len(left) > len(right):
+        left, right = right, left
+    return sum(value * right.get(token, 0.0) for token, value in left.items())
+
+
+def score_sentences(sentences, title='', damping=0.85, iterations=30):
+    """TextRank 점수 (문장 간 TF-IDF 코사인 유사도 그래프) + 제목 단어 겹침·첫 문장·수치 포함 가산점
+
+    요약 프롬프트가 구체적인 수치를 요구하므로 숫자가 있는 문장을 조금 우대한다.
+    """
+    token_lists = [tokenize(sentence) for sentence in sentences]
+    vectors = _tfidf_vectors(token_lists)
+    count = len(sentences)
+    weights = [[_cosine(vectors[i], vectors[j]) if i != j else 0.0 for j in range(count)] for i in range(count)]
+    out_sums = [sum(row) or 1.0 for row in weights]
+
+    ranks = [1.0 / count] * count
+    for _ in range(iterations):
+        ranks = [
+            (1 - damping) / count + damping * sum(weights[j][i] * ranks[j] / out_sums[j] for j in range(count))
+            for i in range(count)
+        ]
+
+    title_tokens = set(tokenize(title))
+    scores = []
+    for index, tokens in enumerate(token_lists):
+        overlap = len(title_tokens & set(tokens)) / len(title_tokens) if title_tokens else 0.0
+        lead = 0.5 if index == 0 else 0.0
+        numeric = 0.3 if any(token[0].isdigit() for token in tokens) else 0.0
+        scores.append(ranks[index] * count * (1 + overlap + lead + numeric))
+    return scores
+
+
+def condense(text, title='', max_sentences=5):
+    """본문을 핵심 문장 max_sentences개로 압축 (원래 문장 순서 유지, 문장이 적으면 노이즈만 제거)"""
+    sentences = split_sentences(text)[:MAX_SENTENCES_SCORED]
+    if len(sentences) <= max_sentences:
+        return ' '.join(sentences)
+    scores = score_sentences(sentences, title)
+    chosen = sorted(sorted(range(len(sentences)), key=lambda index: scores[index], reverse=True)[:max_sentences])
+    return ' '.join(sentences[index] for index in chosen)
@@ -12,22 +12,18 @@ import time
 import webbrowser
 import subprocess
 
-from newsletter_system import NewsletterSystem
 from logging_config import setup_utf8_logging
 from security_config import SecurityConfig, validate_and_setup_security
 
-# 보안 설정 초기화
-security_valid, security_config = validate_and_setup_security()
-if not security_valid:
-    print("⚠️ 보안 설정이 올바르지 않습니다. .env 파일을 확인하세요.")
-
+# 뉴스레터 시스템과 보안 검증은 콜드 스타트를 가볍게 하기 위해 import 시점이 아니라 사용 시점에 처리
 app = Flask(__name__)
 # 동적으로 생성된 보안 Secret Key 사용
-app.secret_key = security_config.generate_flask_secret_key()
+app.secret_key = SecurityConfig().generate_flask_secret_key()
 CORS(app)
 
 # 전역 변수
 newsletter_system = None
+newsletter_system_lock = threading.Lock()
 system_status = {
     'is_running': False,
     'last_run': None,
@@ -49,15 +45,21 @@ def setup_logging():
 logger = setup_logging()
 
 def initialize_system():
-    """뉴스레터 시스템 초기화"""
+    """뉴스레터 시스템 초기화 (첫 API 요청 시 호출, 이미 초기화되었으면 그대로 사용)"""
     global newsletter_system
-    try:
-        newsletter_system = NewsletterSystem()
-        logger.info("뉴스레터 시스템 초기화 완료")
+    if newsletter_system is not None:
         return True
-    except Exception as e:
-        logger.error(f"시스템 초기화 실패: {e}")
-        return False
+    with newsletter_system_lock:
+        if newsletter_system is not None:
+            return True
+        try:
+            from newsletter_system import NewsletterSystem
+            newsletter_system = NewsletterSystem()
+            logger.info("뉴스레터 시스템 초기화 완료")
+            return True
+        except Exception as e:
+            logger.error(f"시스템 초기화 실패: {e}")
+            return False
 
 def open_browser():
     """크롬 브라우저로 웹 페이지 열기"""
@@ -101,7 +103,7 @@ def get_status():
     """시스템 상태 확인"""
     global newsletter_system, system_status
     
-    if newsletter_system is None:
+    if not initialize_system():
         return jsonify({
             'status': 'error',
             'message': '시스템이 초기화되지 않았습니다.'
@@ -124,7 +126,7 @@ def get_keywords():
     """키워드 설정 가져오기"""
     global newsletter_system
     
-    if newsletter_system is None:
+    if not initialize_system():
         return jsonify({'status': 'error', 'message': '시스템이 초기화되지 않았습니다.'})
     
     topics = newsletter_system.keyword_manager.get_topics()
@@ -135,7 +137,7 @@ def update_keywords():
     """키워드 설정 업데이트"""
     global newsletter_system
     
-    if newsletter_system is None:
+    if not initialize_system():
         return jsonify({'status': 'error', 'message': '시스템이 초기화되지 않았습니다.'})
     
     try:
@@ -220,7 +222,7 @@ def run_test():
     
     logger.info("테스트 실행 API 호출됨")
     
-    if newsletter_system is None:
+    if not initialize_system():
         logger.error("시스템이 초기화되지 않았습니다.")
         return jsonify({'status': 'error', 'message': '시스템이 초기화되지 않았습니다.'})
     
@@ -268,7 +270,7 @@ def generate_newsletter():
     
     logger.info("뉴스레터 생성 API 호출됨")
     
-    if newsletter_system is None:
+    if not initialize_system():
         logger.error("시스템이 초기화되지 않았습니다.")
         return jsonify({'status': 'error', 'message': '시스템이 초기화되지 않았습니다.'})
     
@@ -324,7 +326,7 @@ def preview_newsletter():
     
     logger.info("뉴스레터 미리보기 API 호출됨")
     
-    if newsletter_system is None:
+    if not initialize_system():
         return jsonify({'status': 'error', 'message': '시스템이 초기화되지 않았습니다.'})
     
     try:
@@ -568,18 +570,22 @@ def recipients_page():
     """수신자 관리 페이지"""
     return render_template('recipients.html')
 
+def validate_security():
+    """서버 시작 시 보안 설정 검증 (환경변수, 민감 정보 로그 필터)"""
+    security_valid, _ = validate_and_setup_security()
+    if not security_valid:
+        print("⚠️ 보안 설정이 올바르지 않습니다. .env 파일을 확인하세요.")
+    return security_valid
+
 if __name__ == '__main__':
-    # 시스템 초기화
-    if initialize_system():
-        print("뉴스레터 웹 시스템이 시작되었습니다!")
-        print("웹 브라우저에서 http://localhost:5000 으로 접속하세요.")
-        
-        # 백그라운드에서 브라우저 열기
-        browser_thread = threading.Thread(target=open_browser)
-        browser_thread.daemon = True
-        browser_thread.start()
-        
-        app.run(debug=False, host='0.0.0.0', port=5000, use_reloader=False)
-    else:
-        print("시스템 초기화에 실패했습니다.")
-        print(".env 파일과 설정을 확인해주세요.") 
\ No newline at end of file
+    # 보안 설정 검증 후 바로 서버 시작 (뉴스레터 시스템은 첫 API 요청 시 초기화)
+    validate_security()
+    print("뉴스레터 웹 시스템이 시작되었습니다!")
+    print("웹 브라우저에서 http://localhost:5000 으로 접속하세요.")
+    
+    # 백그라운드에서 브라우저 열기
+    browser_thread = threading.Thread(target=open_browser)
+    browser_thread.daemon = True
+    browser_thread.start()
+    
+    app.run(debug=False, host='0.0.0.0', port=5000, use_reloader=False)
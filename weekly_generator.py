@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from date_utils import get_last_week_range, get_newsletter_title_date, get_date_range_str
 from news_summarizer_v2 import NewsSummarizerV2
 from email_sender import EmailSender
+from article_summaries import ArticleSummaryStore, compact_for_curation
 
 class WeeklyNewsletterGenerator:
     """주간 뉴스레터 생성기"""
@@ -13,6 +14,7 @@ class WeeklyNewsletterGenerator:
         self.setup_logging()
         self.news_summarizer = NewsSummarizerV2()
         self.email_sender = EmailSender()
+        self.article_summaries = ArticleSummaryStore()
         self.base_dir = 'archives/daily'
         
     def setup_logging(self):
@@ -88,9 +90,13 @@ class WeeklyNewsletterGenerator:
                 all_news_list.extend(news_list)
                 
             self.logger.info(f"총 {len(all_news_list)}개의 뉴스 수집됨")
+            
+            # 일간 뉴스레터에서 만든 기사별 요약으로 입력 축소 (원문 미리보기 대신)
+            all_news_list = compact_for_curation(all_news_list, self.article_summaries)
                 
             # 2. AI 큐레이션 (Top 10 및 인사이트)
             curated_result = self.news_summarizer.curate_weekly_top_10(all_news_list)
+            self.logger.info(f"LLM 호출 현황: {self.news_summarizer.llm_client.summary()}")
             if not curated_result:
                 self.logger.error("AI 큐레이션 실패")
                 return False